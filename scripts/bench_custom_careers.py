@@ -0,0 +1,264 @@
+#!/usr/bin/env python3
+"""Benchmark the unified custom careers crawler against both old paths.
+
+Serves the recorded careers pages in scripts/fixtures/custom_careers/ from a
+fake session with a fixed per-request latency, spread over N synthetic firms
+(half JSON-LD landing pages, half link lists, every fifth firm returning 403).
+It then times three crawlers:
+
+- legacy serial: the old `sources.custom_careers_search`, one request at a
+  time with hub and detail pages and its 0.15s/0.2s politeness sleeps;
+- legacy direct: the old `custom_careers.py` path, landing pages only, on a
+  10-worker pool;
+- unified: today's `custom_careers.custom_careers_search`, run cold, then
+  again with its detail-page cache warm (fresh entries cost no request),
+  then with every entry due for revalidation (304s, nothing re-parsed).
+  The cache lives in a temporary file, never under DIGEST_DIR.
+
+    python scripts/bench_custom_careers.py --targets 10 --latency 0.05
+"""
+from __future__ import annotations
+
+import argparse
+import concurrent.futures
+import json
+import re
+import sys
+import tempfile
+import threading
+import time
+from html import unescape
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+from urllib.parse import urljoin, urlparse
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from bs4 import BeautifulSoup  # noqa: E402
+
+from scripts.job_digest import config, custom_careers, detail_cache  # noqa: E402
+from scripts.job_digest.disk_cache import JsonTtlCache  # noqa: E402
+from scripts.job_digest.sources import (  # noqa: E402
+    discover_custom_job_hubs,
+    extract_job_links,
+    extract_jobpostings_from_jsonld,
+    is_obvious_non_uk_custom_link,
+    parse_job_detail_fallback,
+    parse_job_detail_jsonld,
+    reset_source_runtime_events,
+    should_skip_custom_careers_page,
+)
+
+FIXTURE_DIR = Path(__file__).resolve().parent / "fixtures" / "custom_careers"
+
+
+def fixture_pages() -> Dict[str, str]:
+    return {path.stem: path.read_text(encoding="utf-8") for path in sorted(FIXTURE_DIR.glob("*.html"))}
+
+
+def fixture_targets(count: int) -> List[Dict[str, str]]:
+    """Targets shaped like `load_custom_careers_targets` rows."""
+    targets = []
+    for idx in range(count):
+        path = "/careers" if idx % 2 == 0 else "/company/careers"
+        targets.append(
+            {
+                "firm": f"Fixture Firm {idx}",
+                "careers_url": f"https://firm{idx}.example{path}",
+                "primary_category": "Bank" if idx % 2 == 0 else "Fintech",
+            }
+        )
+    return targets
+
+
+class FixtureResponse:
+    def __init__(self, status_code: int, text: str = "", etag: str = "") -> None:
+        self.status_code = status_code
+        self.text = text
+        self.headers = {"ETag": etag} if etag else {}
+
+
+class FixtureSession:
+    """Routes URLs to fixture pages by path, sleeping `latency` per request.
+
+    Pages carry an ETag, and a matching If-None-Match is answered with 304.
+    """
+
+    def __init__(self, latency: float) -> None:
+        self.latency = latency
+        self.pages = fixture_pages()
+        self.requests = 0
+        self.lock = threading.Lock()
+        self.headers: Dict[str, str] = {}
+
+    def route(self, url: str) -> Optional[str]:
+        parsed = urlparse(url)
+        if int(parsed.netloc.split(".")[0][4:] or 0) % 5 == 4:
+            return None
+        path = parsed.path + ("?" + parsed.query if parsed.query else "")
+        if path in {"/careers", "/careers/"}:
+            return self.pages["landing_jsonld"]
+        if path in {"/company/careers", "/company/careers/"}:
+            return self.pages["landing_links"]
+        if path.startswith("/careers/search") or path.startswith("/company/careers/vacancies?"):
+            return self.pages["hub_page"]
+        if path.startswith("/careers/jobs/"):
+            return self.pages["detail_jsonld"]
+        if path.startswith("/company/careers/vacancies/"):
+            return self.pages["detail_plain"]
+        return ""
+
+    def get(self, url, timeout=None, headers=None, **kwargs):  # noqa: ANN001
+        with self.lock:
+            self.requests += 1
+        time.sleep(self.latency)
+        page = self.route(url)
+        if page is None:
+            return FixtureResponse(403)
+        if not page:
+            return FixtureResponse(404)
+        etag = f'"{hash(page) & 0xFFFFFFFF:x}"'
+        if (headers or {}).get("If-None-Match") == etag:
+            return FixtureResponse(304, etag=etag)
+        return FixtureResponse(200, page, etag)
+
+
+def legacy_serial_crawl(session: FixtureSession, targets: List[Dict[str, str]]) -> List[Dict[str, str]]:
+    """The pre-pool `sources.custom_careers_search`, minus runtime-event bookkeeping."""
+    jobs: List[Dict[str, str]] = []
+    for target in targets:
+        careers_url = target["careers_url"]
+        resp = session.get(careers_url, timeout=25)
+        if resp.status_code != 200:
+            continue
+        pages_to_visit = [careers_url] + discover_custom_job_hubs(resp.text, careers_url)
+        job_map: Dict[str, Dict[str, str]] = {}
+        for payload in extract_jobpostings_from_jsonld(resp.text, careers_url, target["firm"]):
+            if not should_skip_custom_careers_page(payload.get("title", ""), payload.get("link", ""), payload.get("summary", "")):
+                job_map.setdefault(payload["link"], {**payload, "target_firm": target["firm"]})
+        for page_url in pages_to_visit[:3]:
+            page_resp = session.get(page_url, timeout=25)
+            if page_resp.status_code != 200:
+                continue
+            for payload in extract_jobpostings_from_jsonld(page_resp.text, page_url, target["firm"]):
+                if not should_skip_custom_careers_page(payload.get("title", ""), payload.get("link", ""), payload.get("summary", "")):
+                    job_map.setdefault(payload["link"], {**payload, "target_firm": target["firm"]})
+            for link, title in extract_job_links(page_resp.text, page_url):
+                if should_skip_custom_careers_page(title, link, "") or is_obvious_non_uk_custom_link(link):
+                    continue
+                job_map.setdefault(link, {"title": title, "company": target["firm"], "link": link, "target_firm": target["firm"]})
+            time.sleep(0.15)
+        for link, job in list(job_map.items())[:10]:
+            if is_obvious_non_uk_custom_link(link):
+                job_map.pop(link, None)
+                continue
+            detail_resp = session.get(link, timeout=25)
+            if detail_resp.status_code != 200:
+                continue
+            details = parse_job_detail_jsonld(detail_resp.text, job.get("title", "")) or parse_job_detail_fallback(detail_resp.text)
+            job.update({key: value for key, value in details.items() if value})
+            if should_skip_custom_careers_page(job.get("title", ""), link, job.get("summary", "")):
+                job_map.pop(link, None)
+                continue
+            time.sleep(0.15)
+        jobs.extend(job_map.values())
+        time.sleep(0.2)
+    return jobs
+
+
+def _walk_jsonld(node: Any):
+    if isinstance(node, list):
+        for item in node:
+            yield from _walk_jsonld(item)
+        return
+    if not isinstance(node, dict):
+        return
+    type_field = node.get("@type")
+    if type_field == "JobPosting" or (isinstance(type_field, list) and "JobPosting" in type_field):
+        yield node
+    if "@graph" in node:
+        yield from _walk_jsonld(node["@graph"])
+
+
+def _legacy_direct_scrape(target: Dict[str, str], session: FixtureSession) -> List[Dict[str, str]]:
+    resp = session.get(target["careers_url"], timeout=12)
+    if resp.status_code >= 400:
+        return []
+    source_url = target["careers_url"]
+    soup = BeautifulSoup(resp.text, "html.parser")
+    jobs: List[Dict[str, str]] = []
+    for script in soup.find_all("script", attrs={"type": "application/ld+json"}):
+        try:
+            payload = json.loads(script.string or "")
+        except json.JSONDecodeError:
+            continue
+        for block in _walk_jsonld(payload):
+            if block.get("title") and (block.get("url") or block.get("@id")):
+                desc = block.get("description") if isinstance(block.get("description"), str) else ""
+                jobs.append(
+                    {
+                        "title": str(block["title"]).strip(),
+                        "company": target["firm"],
+                        "link": urljoin(source_url, str(block.get("url") or block.get("@id"))),
+                        "posted_date": str(block.get("datePosted") or ""),
+                        "summary": unescape(re.sub(r"<[^>]+>", " ", desc)).strip()[:600],
+                    }
+                )
+    if jobs:
+        return jobs[:30]
+    slugs = re.compile(r"/(jobs?|careers?|openings?|positions?|role|roles|opportunities)/[^/?#]+", re.IGNORECASE)
+    seen: set = set()
+    for anchor in BeautifulSoup(resp.text, "html.parser").find_all("a", href=True):
+        url = urljoin(source_url, anchor["href"])
+        title = " ".join(anchor.get_text().split())
+        if slugs.search(anchor["href"]) and url not in seen and 5 <= len(title) <= 200:
+            seen.add(url)
+            jobs.append({"title": title, "company": target["firm"], "link": url, "posted_date": "", "summary": ""})
+    return jobs[:30]
+
+
+def legacy_direct_crawl(session: FixtureSession, targets: List[Dict[str, str]]) -> List[Dict[str, str]]:
+    """The old standalone `custom_careers.py`: landing pages only, 10 workers."""
+    jobs: List[Dict[str, str]] = []
+    with concurrent.futures.ThreadPoolExecutor(max_workers=10) as pool:
+        for found in pool.map(lambda target: _legacy_direct_scrape(target, session), targets):
+            jobs.extend(found)
+    return jobs
+
+
+def unified_crawl(session: FixtureSession, targets: List[Dict[str, str]]) -> List[Dict[str, str]]:
+    custom_careers.load_custom_careers_targets = lambda path: [dict(target) for target in targets]
+    reset_source_runtime_events()
+    return custom_careers.custom_careers_search(session)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--targets", type=int, default=10)
+    parser.add_argument("--latency", type=float, default=0.05, help="simulated seconds per request")
+    args = parser.parse_args()
+
+    targets = fixture_targets(args.targets)
+    print(f"{args.targets} targets, {args.latency * 1000:.0f} ms per request")
+    cache_dir = tempfile.TemporaryDirectory()
+    detail_cache.DETAIL_PAGE_CACHE = JsonTtlCache(Path(cache_dir.name) / "detail_pages.json", 21)
+    fresh_hours = config.DETAIL_PAGE_CACHE_FRESH_HOURS
+    for label, crawl, cache_fresh_hours in (
+        ("legacy serial", legacy_serial_crawl, fresh_hours),
+        ("legacy direct", legacy_direct_crawl, fresh_hours),
+        ("unified cold", unified_crawl, fresh_hours),
+        ("unified warm", unified_crawl, fresh_hours),
+        ("unified reval", unified_crawl, 0.0),
+    ):
+        config.DETAIL_PAGE_CACHE_FRESH_HOURS = cache_fresh_hours
+        session = FixtureSession(args.latency)
+        started = time.perf_counter()
+        jobs = crawl(session, targets)
+        elapsed = time.perf_counter() - started
+        enriched = sum(1 for job in jobs if job.get("summary"))
+        print(f"{label:<14} {elapsed:7.2f} s  {session.requests:4d} requests  {len(jobs):4d} jobs  {enriched:4d} with summary")
+    cache_dir.cleanup()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,150 @@
+#!/usr/bin/env python3
+"""Benchmark records.dedupe_records on a synthetic multi-source feed.
+
+Builds N records shaped like a real run (a few hundred companies, titles with
+seniority/punctuation variants, the same posting arriving from several
+sources) and times the indexed dedupe. The pre-index quadratic scan is timed
+on a smaller prefix (it is O(n^2) regex work, so 20k rows takes far too long)
+and its merges are checked against the indexed engine on that prefix.
+
+    python scripts/bench_dedupe_records.py --records 20000 --legacy-records 2000
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import random
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from scripts.job_digest.config import dedupe_keep_order  # noqa: E402
+from scripts.job_digest.models import JobRecord  # noqa: E402
+from scripts.job_digest.records import (  # noqa: E402
+    dedupe_records,
+    merge_records,
+    normalise_company,
+    normalise_title,
+    record_richness,
+)
+
+COMPANIES = [f"{name} {suffix}" for name in (
+    "Monzo", "Revolut", "Barclays", "HSBC", "Wise", "Starling", "Tide", "Zopa", "Klarna", "Checkout.com",
+    "Fenergo", "Quantexa", "Napier", "ComplyAdvantage", "Lloyds", "NatWest", "Santander", "Citi", "JPMorgan",
+    "Deutsche Bank",
+) for suffix in ("", "Ltd", "UK", "Group", "Bank", "Labs", "Technologies", "Holdings", "Services", "Digital",
+                 "Payments", "Europe", "Capital", "Markets", "Solutions")]
+TITLE_CORES = [
+    "Product Manager KYC", "Product Owner Onboarding", "Financial Crime Product Manager",
+    "Sanctions Screening Product Lead", "CLM Business Analyst", "AML Transformation Manager",
+    "Customer Due Diligence Product Owner", "RegTech Product Manager", "Fraud Strategy Manager",
+    "Compliance Operations Lead", "Client Lifecycle Product Manager", "Screening Platform Owner",
+]
+SENIORITY = ["", "Senior", "Sr.", "Lead", "Principal", "Head of", "Junior"]
+SUFFIXES = ["", "- London", "(Hybrid)", "- Contract", "II", "EMEA", "UK", "- Remote"]
+SOURCES = [("LinkedIn", "Aggregator"), ("Greenhouse", "ATS"), ("IndeedUK", "JobBoard"), ("Lever", "ATS")]
+
+
+def synthetic_records(count: int, seed: int = 7) -> list[JobRecord]:
+    rng = random.Random(seed)
+    records: list[JobRecord] = []
+    for idx in range(count):
+        company = rng.choice(COMPANIES)
+        title = " ".join(part for part in (rng.choice(SENIORITY), rng.choice(TITLE_CORES), rng.choice(SUFFIXES)) if part)
+        source, family = rng.choice(SOURCES)
+        records.append(
+            JobRecord(
+                role=title,
+                company=company.upper() if rng.random() < 0.1 else company,
+                location=rng.choice(["London", "", "Remote UK"]),
+                link=f"https://jobs.example/{source.lower()}/{idx}",
+                posted=rng.choice(["", "1 day ago", "3 hours ago"]),
+                source=source,
+                source_family=family,
+                fit_score=rng.randint(40, 95),
+                preference_match="",
+                why_fit="",
+                cv_gap="",
+                notes="x" * rng.randint(0, 300),
+            )
+        )
+    return records
+
+
+def legacy_dedupe_records(records: list[JobRecord]) -> list[JobRecord]:
+    """The pre-index implementation, kept verbatim for comparison."""
+    deduped: list[JobRecord] = []
+    for record in records:
+        matched_index = None
+        record_company = normalise_company(record.company)
+        record_title = normalise_title(record.role)
+        for idx, existing in enumerate(deduped):
+            existing_company = normalise_company(existing.company)
+            if existing_company != record_company:
+                continue
+            existing_title = normalise_title(existing.role)
+            similarity = 0.0
+            if existing_title and record_title:
+                similarity = (
+                    1.0
+                    - (
+                        len(set(record_title.split()) ^ set(existing_title.split()))
+                        / max(1, len(set(record_title.split()) | set(existing_title.split())))
+                    )
+                )
+            if similarity >= 0.85:
+                matched_index = idx
+                break
+        if matched_index is None:
+            deduped.append(record)
+            continue
+        existing = deduped[matched_index]
+        primary, secondary = existing, record
+        if record_richness(record) > record_richness(existing):
+            primary, secondary = record, existing
+        elif record_richness(record) == record_richness(existing) and record.fit_score > existing.fit_score:
+            primary, secondary = record, existing
+        merged = merge_records(primary, secondary)
+        if existing is not merged:
+            merged.alternate_links.extend(existing.alternate_links)
+        merged.alternate_links = dedupe_keep_order([json.dumps(link, sort_keys=True) for link in merged.alternate_links])
+        merged.alternate_links = [json.loads(item) for item in merged.alternate_links]
+        deduped[matched_index] = merged
+    return deduped
+
+
+def fingerprint(records: list[JobRecord]) -> list[tuple]:
+    return [(r.link, r.role, r.company, tuple(json.dumps(a, sort_keys=True) for a in r.alternate_links)) for r in records]
+
+
+def timed(fn, records: list[JobRecord]) -> tuple[list[JobRecord], float]:
+    started = time.perf_counter()
+    result = fn(records)
+    return result, time.perf_counter() - started
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--records", type=int, default=20000)
+    parser.add_argument("--legacy-records", type=int, default=2000)
+    args = parser.parse_args()
+
+    indexed, indexed_seconds = timed(dedupe_records, synthetic_records(args.records))
+    print(f"indexed  n={args.records:>6}  kept={len(indexed):>6}  {indexed_seconds * 1000:8.1f} ms")
+
+    if args.legacy_records > 0:
+        sample = min(args.legacy_records, args.records)
+        fast, fast_seconds = timed(dedupe_records, synthetic_records(sample))
+        slow, slow_seconds = timed(legacy_dedupe_records, synthetic_records(sample))
+        same = fingerprint(fast) == fingerprint(slow)
+        print(f"indexed  n={sample:>6}  kept={len(fast):>6}  {fast_seconds * 1000:8.1f} ms")
+        print(f"legacy   n={sample:>6}  kept={len(slow):>6}  {slow_seconds * 1000:8.1f} ms")
+        print(f"speed-up x{slow_seconds / max(fast_seconds, 1e-9):.1f} on n={sample}; identical merges: {same}")
+        if not same:
+            raise SystemExit(1)
+
+
+if __name__ == "__main__":
+    main()
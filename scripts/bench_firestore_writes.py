@@ -0,0 +1,70 @@
+#!/usr/bin/env python3
+"""Benchmark the Firestore job upsert against the local emulator.
+
+Starts nothing itself: run `firebase emulators:start --only firestore` and
+point FIRESTORE_EMULATOR_HOST at it, then
+
+    FIRESTORE_EMULATOR_HOST=127.0.0.1:8080 python scripts/bench_firestore_writes.py --records 2000
+
+Times client construction (cold) against the cached provider (warm), then
+upserts a synthetic feed twice into a scratch collection: once as new docs,
+once as updates of the same docs, which is the shape of a daily run.
+"""
+from __future__ import annotations
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from scripts.job_digest import config, firestore  # noqa: E402
+from scripts.job_digest.models import JobRecord  # noqa: E402
+
+
+def synthetic_records(count: int) -> list[JobRecord]:
+    return [
+        JobRecord(
+            role=f"Product Manager {idx}", company=f"Company {idx % 50}", location="London",
+            link=f"https://jobs.example/bench/{idx}", posted="1 day ago", source="Greenhouse",
+            fit_score=30 + idx % 60, preference_match="", why_fit="", cv_gap="", notes="",
+            applicant_count=f"{idx % 200} applicants",
+        )
+        for idx in range(count)
+    ]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--records", type=int, default=1000)
+    parser.add_argument("--collection", default="bench_jobs")
+    args = parser.parse_args()
+
+    if not config.FIRESTORE_EMULATOR_HOST:
+        raise SystemExit("Set FIRESTORE_EMULATOR_HOST to a running Firestore emulator (never benchmarks production).")
+    if firestore.firestore is None:
+        raise SystemExit("firebase-admin / google-cloud-firestore are not installed.")
+
+    started = time.perf_counter()
+    client = firestore.init_firestore_client()
+    cold = time.perf_counter() - started
+    if client is None:
+        raise SystemExit(f"Could not build an emulator client for {config.FIRESTORE_EMULATOR_HOST}.")
+    started = time.perf_counter()
+    for _ in range(100):
+        firestore.init_firestore_client()
+    warm = (time.perf_counter() - started) / 100
+    print(f"client   cold {cold * 1000:8.2f} ms   cached {warm * 1e6:8.2f} us")
+
+    config.FIREBASE_COLLECTION = args.collection
+    records = synthetic_records(args.records)
+    for label in ("insert", "update"):
+        started = time.perf_counter()
+        firestore.write_records_to_firestore(records)
+        seconds = time.perf_counter() - started
+        print(f"{label:<8} n={args.records:>6}  {args.records / seconds:10.0f} records/s  {seconds * 1000:9.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+"""Benchmark LinkedIn search-card parsing against the BeautifulSoup version.
+
+Every LinkedIn guest-API search page used to go through
+`BeautifulSoup(html, "html.parser")` and five `select_one` CSS queries per
+card. `_parse_linkedin_cards` now walks the tags with a single regex tag
+scanner instead, without building a tree. This parses saved fixture pages
+both ways, checks the cards are identical and reports the parse time per
+card emitted.
+
+    python scripts/bench_linkedin_cards.py --pages 200
+"""
+from __future__ import annotations
+
+import argparse
+import sys
+import time
+from pathlib import Path
+from typing import Dict, List
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from bs4 import BeautifulSoup  # noqa: E402
+
+from scripts.job_digest.config import EXCLUDE_COMPANIES  # noqa: E402
+from scripts.job_digest.sources import _parse_linkedin_cards  # noqa: E402
+from scripts.job_digest.utils import clean_link, normalize_text  # noqa: E402
+
+FIXTURES = Path(__file__).resolve().parent / "fixtures"
+
+
+def soup_parse_linkedin_cards(html: str) -> List[Dict[str, str]]:
+    """The BeautifulSoup card extractor `_parse_linkedin_cards` replaced."""
+    soup = BeautifulSoup(html, "html.parser")
+    cards: List[Dict[str, str]] = []
+    for card in soup.select("div.base-search-card"):
+        job_urn = card.get("data-entity-urn", "")
+        job_id = job_urn.split(":")[-1]
+        if not job_id:
+            continue
+
+        title_el = card.select_one("h3.base-search-card__title")
+        company_el = card.select_one("h4.base-search-card__subtitle")
+        location_el = card.select_one("span.job-search-card__location")
+        time_el = card.select_one("time")
+        link_el = card.select_one("a.base-card__full-link")
+
+        title = normalize_text(title_el.get_text()) if title_el else ""
+        company = normalize_text(company_el.get_text()) if company_el else ""
+        location_text = normalize_text(location_el.get_text()) if location_el else ""
+        posted_text = normalize_text(time_el.get_text()) if time_el else ""
+        posted_date = time_el.get("datetime") if time_el else ""
+        link = link_el.get("href") if link_el else ""
+
+        if not title or not company:
+            continue
+        if company.lower() in EXCLUDE_COMPANIES:
+            continue
+
+        cards.append({
+            "job_id": job_id,
+            "title": title,
+            "company": company,
+            "location": location_text,
+            "posted_text": posted_text,
+            "posted_date": posted_date,
+            "link": clean_link(link),
+        })
+    return cards
+
+
+def fixture_pages() -> List[str]:
+    return [path.read_text(encoding="utf-8") for path in sorted(FIXTURES.glob("linkedin_search_*.html"))]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--pages", type=int, default=200, help="pages to parse (fixtures are cycled)")
+    args = parser.parse_args()
+
+    fixtures = fixture_pages()
+    if not fixtures:
+        raise SystemExit(f"no linkedin_search_*.html fixtures in {FIXTURES}")
+    pages = [fixtures[idx % len(fixtures)] for idx in range(args.pages)]
+
+    timings = {}
+    outputs = {}
+    for label, parse in (("BeautifulSoup", soup_parse_linkedin_cards), ("_parse_linkedin_cards", _parse_linkedin_cards)):
+        start = time.perf_counter()
+        outputs[label] = [parse(page) for page in pages]
+        timings[label] = time.perf_counter() - start
+    if outputs["BeautifulSoup"] != outputs["_parse_linkedin_cards"]:
+        raise SystemExit("card output differs between parsers")
+    card_count = sum(len(cards) for cards in outputs["_parse_linkedin_cards"])
+    for label, elapsed in timings.items():
+        print(f"{label:<22} {elapsed * 1000:8.1f} ms  {elapsed / card_count * 1e6:7.1f} us/card")
+    print(f"{len(pages)} pages, {card_count} cards, speedup x{timings['BeautifulSoup'] / timings['_parse_linkedin_cards']:.1f}")
+
+
+if __name__ == "__main__":
+    main()
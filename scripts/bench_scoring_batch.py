@@ -0,0 +1,115 @@
+#!/usr/bin/env python3
+"""Benchmark scoring throughput: per-job calls against assess_fit_batch.
+
+Collectors used to call assess_fit, build_preference_match, build_reasons and
+build_gaps one after another on the same posting, each lowering and scanning
+the full text again. This times that path against `assess_fit_batch` (one
+scan per field, shared scans for repeated titles/companies/locations) on a
+synthetic feed, checks both produce identical columns and reports jobs/sec.
+
+    python scripts/bench_scoring_batch.py --jobs 5000
+"""
+from __future__ import annotations
+
+import argparse
+import random
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from scripts.job_digest.scoring import (  # noqa: E402
+    BATCH_COLUMNS,
+    assess_fit,
+    assess_fit_batch,
+    build_gaps,
+    build_preference_match,
+    build_reasons,
+    reset_scoring_cache,
+)
+
+TITLES = [
+    "Senior Product Manager - Financial Crime", "Product Owner, KYC Onboarding", "CLM Business Analyst",
+    "Head of Sanctions Screening Product", "Data Product Manager", "AML Transformation Lead (Contract)",
+    "Compliance Analyst", "Principal Product Manager, Payments Platform", "Implementation Manager - RegTech",
+    "Marketing Risk Manager",
+]
+COMPANIES = ["Monzo", "Fenergo", "Barclays", "ComplyAdvantage", "Acme Recruitment", "Google", "Wise", "Quantexa"]
+LOCATIONS = ["London", "Remote UK", "Hybrid - London", "United Kingdom", "Dublin", ""]
+SENTENCES = [
+    "You will own the customer onboarding journey and KYC/KYB controls end to end.",
+    "Partner with compliance, operations and engineering to deliver screening workflows.",
+    "Experience with sanctions, transaction monitoring or fraud platforms is a plus.",
+    "We are a fast-growing fintech building APIs for banks and payment firms.",
+    "Drive process transformation across client lifecycle management (CLM).",
+    "Stakeholder management, roadmap ownership and data-driven prioritisation.",
+    "This is a 6 month day rate contract inside IR35.",
+    "Our benefits include pension, private healthcare and flexible working.",
+]
+SOURCES = [("ATS", "Greenhouse"), ("Aggregator", "LinkedIn"), ("JobBoard", "IndeedUK")]
+
+
+def synthetic_jobs(count: int, seed: int = 11) -> list[dict[str, str]]:
+    rng = random.Random(seed)
+    jobs = []
+    for _ in range(count):
+        family, source = rng.choice(SOURCES)
+        jobs.append(
+            {
+                "title": rng.choice(TITLES),
+                "company": rng.choice(COMPANIES),
+                "location": rng.choice(LOCATIONS),
+                "summary": " ".join(rng.choice(SENTENCES) for _ in range(rng.randint(4, 30))),
+                "source_family": family,
+                "source": source,
+            }
+        )
+    return jobs
+
+
+def per_job_columns(jobs: list[dict[str, str]]) -> dict[str, list[object]]:
+    columns: dict[str, list[object]] = {name: [] for name in BATCH_COLUMNS}
+    for job in jobs:
+        full_text = f"{job['title']} {job['company']} {job['summary']}"
+        fit = assess_fit(full_text, job["company"], job["source_family"], job["source"], title=job["title"])
+        row = {
+            "score": int(fit["score"]),
+            "fit_verdict": str(fit["fit_verdict"]),
+            "role_family": str(fit["role_family"]),
+            "role_bucket": str(fit["role_bucket"]),
+            "preference_match": build_preference_match(full_text, job["company"], job["location"]),
+            "why_fit": build_reasons(full_text),
+            "cv_gap": build_gaps(full_text),
+            "fit": fit,
+        }
+        for name in BATCH_COLUMNS:
+            columns[name].append(row[name])
+    return columns
+
+
+def timed(fn, jobs):
+    reset_scoring_cache()  # time the scoring itself, not memo hits from the other path
+    started = time.perf_counter()
+    result = fn(jobs)
+    return result, time.perf_counter() - started
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--jobs", type=int, default=5000)
+    args = parser.parse_args()
+
+    jobs = synthetic_jobs(args.jobs)
+    slow, slow_seconds = timed(per_job_columns, jobs)
+    fast, fast_seconds = timed(assess_fit_batch, jobs)
+    same = slow == fast
+    print(f"per-job  n={args.jobs:>6}  {args.jobs / slow_seconds:10.0f} jobs/s  {slow_seconds * 1000:8.1f} ms")
+    print(f"batch    n={args.jobs:>6}  {args.jobs / fast_seconds:10.0f} jobs/s  {fast_seconds * 1000:8.1f} ms")
+    print(f"speed-up x{slow_seconds / max(fast_seconds, 1e-9):.1f}; identical columns: {same}")
+    if not same:
+        raise SystemExit(1)
+
+
+if __name__ == "__main__":
+    main()
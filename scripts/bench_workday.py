@@ -0,0 +1,151 @@
+#!/usr/bin/env python3
+"""Benchmark the coalesced Workday engine against the old per-term loop.
+
+A fake CXS endpoint holds a synthetic posting pool per tenant: titles are
+board terms or generic roles, each with an age. How real CXS matches a
+multi-word `searchText` is not known, so `--match` picks the model: "all"
+(every word in the title) or "any" (at least one word, most overlapping
+first). Results come 20 per page and each request sleeps `latency`.
+
+- legacy: the old `sources.workday_search`, one POST per board term per
+  tenant (first page only), serially, with its 0.2s sleep;
+- engine: `workday.workday_search`, coalesced queries paged by `offset`,
+  tenants and queries on the shared pool.
+
+"target" counts unique postings inside the window whose title contains
+every word of some board term: what either crawler is meant to find.
+
+    python scripts/bench_workday.py --tenants 10 --latency 0.05 --match all
+"""
+from __future__ import annotations
+
+import argparse
+import random
+import sys
+import threading
+import time
+from pathlib import Path
+from typing import Dict, List
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from scripts.job_digest import config, workday  # noqa: E402
+from scripts.job_digest.sources import financial_services_board_search_terms, reset_source_runtime_events  # noqa: E402
+from scripts.job_digest.workday import parse_workday_entry  # noqa: E402
+
+
+BOARD_TERMS = financial_services_board_search_terms()[:12]
+GENERIC_TITLES = [
+    "Growth Product Manager",
+    "Data Product Manager",
+    "Product Owner",
+    "Compliance Analyst",
+    "Risk Manager",
+    "Software Engineer",
+    "Operations Lead",
+    "Customer Service Advisor",
+]
+
+
+class FakeResponse:
+    def __init__(self, payload: dict) -> None:
+        self.status_code = 200
+        self.payload = payload
+
+    def json(self) -> dict:
+        return self.payload
+
+
+class FakeCxs:
+    """Searchable synthetic posting pools, one per tenant host."""
+
+    def __init__(self, tenants: int, postings: int, latency: float, match: str, seed: int = 7) -> None:
+        rng = random.Random(seed)
+        titles = [term.title() for term in BOARD_TERMS] + GENERIC_TITLES
+        self.latency = latency
+        self.match = match
+        self.requests = 0
+        self.lock = threading.Lock()
+        self.pools: Dict[str, List[dict]] = {}
+        for idx in range(tenants):
+            pool = []
+            for job in range(postings):
+                days = rng.choice([0, 1, 3, 5, 12, 30])
+                pool.append(
+                    {
+                        "title": rng.choice(titles),
+                        "externalPath": f"/job/London/role-{idx}-{job}",
+                        "locationsText": "London",
+                        "postedOn": "Posted Today" if days == 0 else ("Posted 30+ Days Ago" if days == 30 else f"Posted {days} Days Ago"),
+                    }
+                )
+            self.pools[f"tenant{idx}"] = pool
+
+    def post(self, url, json=None, timeout=None, **kwargs):  # noqa: ANN001
+        with self.lock:
+            self.requests += 1
+        time.sleep(self.latency)
+        query = set(json["searchText"].lower().split())
+        pool = self.pools.get(url.split("/")[2].split(".")[0], [])
+        overlap = [(len(query & set(item["title"].lower().split())), item) for item in pool]
+        needed = len(query) if self.match == "all" else 1
+        hits = [item for count, item in sorted(overlap, key=lambda pair: -pair[0]) if count >= needed]
+        page = hits[json["offset"] : json["offset"] + json["limit"]]
+        return FakeResponse({"total": len(hits) if json["offset"] == 0 else 0, "jobPostings": page})
+
+
+def legacy_search(session: FakeCxs, sites: List[str]) -> List[Dict[str, str]]:
+    """The pre-engine loop, reduced to the postings it collected."""
+    jobs: List[Dict[str, str]] = []
+    for entry in sites:
+        scheme, host, tenant, site, company_name = parse_workday_entry(entry)
+        api_url = f"{scheme}://{host}/wday/cxs/{tenant}/{site}/jobs"
+        for keyword in BOARD_TERMS:
+            resp = session.post(api_url, json={"limit": 20, "offset": 0, "searchText": keyword}, timeout=30)
+            for posting in resp.json().get("jobPostings") or []:
+                jobs.append(
+                    {"title": posting["title"], "link": f"{scheme}://{host}{posting['externalPath']}", "posted_date": posting["postedOn"]}
+                )
+            time.sleep(0.2)
+    return jobs
+
+
+def engine_search(session: FakeCxs, sites: List[str]) -> List[Dict[str, str]]:
+    workday.WORKDAY_SITES = sites
+    reset_source_runtime_events()
+    return workday.workday_search(session)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--tenants", type=int, default=10)
+    parser.add_argument("--postings", type=int, default=80, help="synthetic postings per tenant")
+    parser.add_argument("--latency", type=float, default=0.05, help="simulated seconds per request")
+    parser.add_argument("--match", choices=("all", "any"), default="all", help="how searchText words match titles")
+    args = parser.parse_args()
+
+    sites = [f"Tenant {idx}|https://tenant{idx}.wd3.myworkdayjobs.com/External" for idx in range(args.tenants)]
+    print(
+        f"{args.tenants} tenants, {args.postings} postings each, {args.latency * 1000:.0f} ms per request, "
+        f"searchText matches {args.match} words"
+    )
+    for label, search in (("legacy", legacy_search), ("engine", engine_search)):
+        session = FakeCxs(args.tenants, args.postings, args.latency, args.match)
+        started = time.perf_counter()
+        jobs = search(session, sites)
+        elapsed = time.perf_counter() - started
+        unique = {job["link"] for job in jobs}
+        target = {
+            job["link"]
+            for job in jobs
+            if workday.parse_posted_within_window(job["posted_date"], "", config.WINDOW_HOURS)
+            and any(set(term.split()) <= set(job["title"].lower().split()) for term in BOARD_TERMS)
+        }
+        print(
+            f"{label:<7} {elapsed:7.2f} s  {session.requests:4d} requests  {len(jobs):5d} dicts  "
+            f"{len(unique):4d} unique  {len(target):4d} target"
+        )
+
+
+if __name__ == "__main__":
+    main()
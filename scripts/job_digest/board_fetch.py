@@ -0,0 +1,255 @@
+"""Parallel fetch engine for public ATS board APIs.
+
+Greenhouse, Lever, Ashby and Workable expose one JSON document per company
+board, and the board lists in `boards.py` run to 100+ entries each. Fetching
+them one at a time makes the ATS stages the sum of every board's network
+wait. This engine fans the boards out over a small thread pool instead:
+
+- board slugs are deduped case-insensitively before any request is made;
+- a per-host semaphore keeps the number of in-flight requests to any one API
+  host polite (every Greenhouse board lives on boards-api.greenhouse.io);
+- results are returned in board-list order, so the normalised job dicts are
+  exactly what the serial loop produced, in the same sequence.
+
+Boards are also fetched conditionally. Each board URL remembers its ETag /
+Last-Modified validators and a hash of the body in `ATS_BOARD_CACHE_PATH`.
+A 304, or a 200 whose body hashes the same as last time, means the board is
+unchanged: its previously parsed jobs are reused without touching the JSON,
+or, inside `board_cache_scope(..., skip_unchanged=True)` (the hot scan), the
+board short-circuits to "no new postings".
+"""
+from __future__ import annotations
+
+import hashlib
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Sequence, Union
+from urllib.parse import urlparse
+
+import requests
+
+from . import config
+from .disk_cache import JsonTtlCache
+
+BOARD_FETCH_WORKERS = int(os.getenv("JOB_DIGEST_BOARD_FETCH_WORKERS", "12") or "12")
+BOARD_FETCH_PER_HOST = int(os.getenv("JOB_DIGEST_BOARD_FETCH_PER_HOST", "6") or "6")
+BOARD_FETCH_TIMEOUT_SECONDS = int(os.getenv("JOB_DIGEST_BOARD_FETCH_TIMEOUT", "20") or "20")
+
+BoardParser = Callable[[str, object], List[Dict[str, str]]]
+BoardUrls = Callable[[str], Union[str, Sequence[str]]]
+
+UNCHANGED = object()
+
+
+class HostLimiter:
+    """Caps concurrent requests per host across every thread sharing it."""
+
+    def __init__(self, per_host: int) -> None:
+        self.per_host = max(1, per_host)
+        self._lock = threading.Lock()
+        self._semaphores: Dict[str, threading.BoundedSemaphore] = {}
+
+    def for_url(self, url: str) -> threading.BoundedSemaphore:
+        host = (urlparse(url).hostname or "").lower()
+        with self._lock:
+            semaphore = self._semaphores.get(host)
+            if semaphore is None:
+                semaphore = threading.BoundedSemaphore(self.per_host)
+                self._semaphores[host] = semaphore
+            return semaphore
+
+
+HOST_LIMITER = HostLimiter(BOARD_FETCH_PER_HOST)
+
+
+class BoardValidatorCache(JsonTtlCache):
+    """Persistent ETag / Last-Modified / content-hash store for board URLs.
+
+    Entries are namespaced by scope so the digest run refreshing a board's
+    validators never hides a change from the hot scan, which compares against
+    what *it* last saw.
+    """
+
+    def forget_board(self, board: str) -> int:
+        target = (board or "").strip().lower()
+        with self._lock:
+            entries = self._load()
+            stale = [key for key, entry in entries.items() if str(entry.get("board", "")).lower() == target]
+            for key in stale:
+                entries.pop(key, None)
+            if stale:
+                self._dirty = True
+            return len(stale)
+
+
+BOARD_CACHE = BoardValidatorCache(config.ATS_BOARD_CACHE_PATH, config.ATS_BOARD_CACHE_DAYS)
+BOARD_CACHE_MODE: Dict[str, object] = {"scope": "digest", "skip_unchanged": False, "defer_save": False}
+BOARD_CACHE_STATS: Dict[str, Dict[str, int]] = {}
+_STATS_LOCK = threading.Lock()
+
+
+@contextmanager
+def board_cache_scope(scope: str, *, skip_unchanged: bool, defer_save: bool = False) -> Iterator[None]:
+    """Route board fetches in the block to `scope`'s validators.
+
+    With `defer_save`, fetches only stage their validators in memory and the
+    caller decides when `BOARD_CACHE.save()` commits them.
+    """
+    previous = dict(BOARD_CACHE_MODE)
+    BOARD_CACHE_MODE.update({"scope": scope, "skip_unchanged": skip_unchanged, "defer_save": defer_save})
+    try:
+        yield
+    finally:
+        BOARD_CACHE_MODE.clear()
+        BOARD_CACHE_MODE.update(previous)
+
+
+def reset_board_cache_stats() -> None:
+    with _STATS_LOCK:
+        BOARD_CACHE_STATS.clear()
+
+
+def _count(source_name: str, outcome: str) -> None:
+    if not source_name:
+        return
+    with _STATS_LOCK:
+        stats = BOARD_CACHE_STATS.setdefault(source_name, {"changed": 0, "not_modified": 0, "same_hash": 0, "failed": 0})
+        stats[outcome] = stats.get(outcome, 0) + 1
+
+
+def board_cache_note(source_name: str) -> str:
+    stats = BOARD_CACHE_STATS.get(source_name)
+    if not stats:
+        return ""
+    unchanged = stats.get("not_modified", 0) + stats.get("same_hash", 0)
+    return (
+        f"board cache: {unchanged} unchanged ({stats.get('not_modified', 0)} via 304), "
+        f"{stats.get('changed', 0)} changed, {stats.get('failed', 0)} failed"
+    )
+
+
+def unique_boards(boards: Iterable[str]) -> List[str]:
+    seen: set[str] = set()
+    unique: List[str] = []
+    for board in boards:
+        cleaned = (board or "").strip()
+        key = cleaned.lower()
+        if not cleaned or key in seen:
+            continue
+        seen.add(key)
+        unique.append(cleaned)
+    return unique
+
+
+def _fetch_board_payload(session: requests.Session, url: str, timeout: int, cached: Optional[Dict[str, object]]):
+    """Return the decoded JSON, `UNCHANGED` when the cached copy is current, or None on failure."""
+    headers: Dict[str, str] = {}
+    if cached:
+        if cached.get("etag"):
+            headers["If-None-Match"] = str(cached["etag"])
+        if cached.get("last_modified"):
+            headers["If-Modified-Since"] = str(cached["last_modified"])
+    with HOST_LIMITER.for_url(url):
+        try:
+            if headers:
+                resp = session.get(url, timeout=timeout, headers=headers)
+            else:
+                resp = session.get(url, timeout=timeout)
+        except requests.RequestException:
+            return None, {}
+    if resp.status_code == 304 and cached:
+        return UNCHANGED, {"outcome": "not_modified"}
+    if resp.status_code != 200:
+        return None, {}
+    content_hash = hashlib.sha256(resp.content or b"").hexdigest()
+    validators = {
+        "etag": resp.headers.get("ETag", ""),
+        "last_modified": resp.headers.get("Last-Modified", ""),
+        "content_hash": content_hash,
+    }
+    if cached and cached.get("content_hash") == content_hash:
+        return UNCHANGED, {**validators, "outcome": "same_hash"}
+    try:
+        return resp.json(), {**validators, "outcome": "changed"}
+    except ValueError:
+        return None, {}
+
+
+def fetch_board_jobs(
+    session: requests.Session,
+    boards: Iterable[str],
+    url_for: BoardUrls,
+    parse: BoardParser,
+    *,
+    source_name: str = "",
+    max_workers: int | None = None,
+    timeout: int | None = None,
+) -> List[Dict[str, str]]:
+    """Fetch every board's JSON in parallel and parse it with `parse(board, data)`.
+
+    `url_for` may return several candidate URLs for a board; they are tried in
+    order until one yields a payload. Boards that fail to respond, return a
+    non-200 status or invalid JSON are skipped, as the serial loops did. An
+    empty board (`[]` or `{}`) is a valid answer: its validators are stored
+    like any other, so it is not downloaded in full again next run.
+    Anything else (for example the stage deadline firing on a
+    `DeadlineSession`) propagates to the caller.
+    """
+    board_list = unique_boards(boards)
+    if not board_list:
+        return []
+    workers = max(1, min(max_workers or BOARD_FETCH_WORKERS, len(board_list)))
+    request_timeout = timeout or BOARD_FETCH_TIMEOUT_SECONDS
+    use_cache = config.ATS_BOARD_CACHE_ENABLED
+    scope = str(BOARD_CACHE_MODE.get("scope") or "digest")
+    skip_unchanged = bool(BOARD_CACHE_MODE.get("skip_unchanged"))
+    defer_save = bool(BOARD_CACHE_MODE.get("defer_save"))
+
+    def run(board: str) -> List[Dict[str, str]]:
+        urls = url_for(board)
+        for url in [urls] if isinstance(urls, str) else list(urls):
+            key = f"{scope}|{url}"
+            cached = BOARD_CACHE.get(key) if use_cache else None
+            data, meta = _fetch_board_payload(session, url, request_timeout, cached)
+            if data is UNCHANGED:
+                _count(source_name, str(meta.get("outcome", "not_modified")))
+                BOARD_CACHE.touch(key)
+                if skip_unchanged:
+                    return []
+                return [dict(job) for job in (cached or {}).get("jobs", []) or []]
+            if data is None:
+                continue
+            jobs = parse(board, data)
+            _count(source_name, "changed")
+            if use_cache:
+                BOARD_CACHE.put(
+                    key,
+                    {
+                        "board": board,
+                        "etag": meta.get("etag", ""),
+                        "last_modified": meta.get("last_modified", ""),
+                        "content_hash": meta.get("content_hash", ""),
+                        "jobs": jobs,
+                    },
+                )
+            return jobs
+        _count(source_name, "failed")
+        return []
+
+    try:
+        if workers == 1:
+            return [job for board in board_list for job in run(board)]
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="board-fetch") as executor:
+            futures = [executor.submit(run, board) for board in board_list]
+            try:
+                per_board = [future.result() for future in futures]
+            except BaseException:
+                for future in futures:
+                    future.cancel()
+                raise
+        return [job for jobs in per_board for job in jobs]
+    finally:
+        if use_cache and not defer_save:
+            BOARD_CACHE.save()
@@ -69,6 +69,15 @@ LINKEDIN_EXPLORATORY_QUERY_BUDGET = int(os.getenv("JOB_DIGEST_LINKEDIN_EXPLORATO
 LINKEDIN_MAX_GENERIC_TERMS = int(os.getenv("JOB_DIGEST_LINKEDIN_MAX_GENERIC_TERMS", "60"))
 LINKEDIN_COMPANY_LIMIT = int(os.getenv("JOB_DIGEST_LINKEDIN_COMPANY_LIMIT", "18"))
 LINKEDIN_COMPANY_TERM_LIMIT = int(os.getenv("JOB_DIGEST_LINKEDIN_COMPANY_TERM_LIMIT", "16"))
+# LinkedIn guest search runs on a small pool sharing one adaptive pacer:
+# requests start at least INTERVAL seconds apart, the gap widens on 429/999
+# and throttled queries are retried up to THROTTLE_RETRIES times. Only the
+# first PAGINATED_TERMS generic terms ask for a second page, and only when
+# their first page turned up job IDs not seen yet.
+LINKEDIN_SEARCH_WORKERS = int(os.getenv("JOB_DIGEST_LINKEDIN_SEARCH_WORKERS", "3") or "3")
+LINKEDIN_SEARCH_INTERVAL_SECONDS = float(os.getenv("JOB_DIGEST_LINKEDIN_SEARCH_INTERVAL", "0.3") or "0.3")
+LINKEDIN_THROTTLE_RETRIES = int(os.getenv("JOB_DIGEST_LINKEDIN_THROTTLE_RETRIES", "2") or "2")
+LINKEDIN_PAGINATED_TERMS = int(os.getenv("JOB_DIGEST_LINKEDIN_PAGINATED_TERMS", "12") or "12")
 LINKEDIN_INCLUDED_COMPANIES = {
     item.strip().lower()
     for item in os.getenv(
@@ -185,6 +194,21 @@ TELEGRAM_BOT_TOKEN = os.getenv("TELEGRAM_BOT_TOKEN", "")
 TELEGRAM_CHAT_ID = os.getenv("TELEGRAM_CHAT_ID", "")
 SITE_URL = os.getenv("SITE_URL", "").rstrip("/")
 
+# --- ATS board validator cache ---
+# Greenhouse/Lever/Ashby/Workable boards rarely change between runs. Each
+# board URL keeps its ETag/Last-Modified (plus a content hash for hosts that
+# send neither) so unchanged boards skip JSON parsing; the hot scan treats
+# them as "no new postings". Entries unseen for ATS_BOARD_CACHE_DAYS drop out.
+ATS_BOARD_CACHE_ENABLED = _env_bool("JOB_DIGEST_ATS_BOARD_CACHE_ENABLED", True)
+ATS_BOARD_CACHE_PATH = Path(
+    os.getenv("JOB_DIGEST_ATS_BOARD_CACHE", str(DIGEST_DIR / "ats_board_cache.json"))
+)
+ATS_BOARD_CACHE_DAYS = _env_int("JOB_DIGEST_ATS_BOARD_CACHE_DAYS", 7)
+# Per-run memo for assess_fit / build_reasons / build_gaps / score_posting.
+# The same posting often arrives from LinkedIn, a job board and its own ATS;
+# entries are keyed by a hash of the inputs and evicted least-recently-used.
+SCORING_CACHE_SIZE = _env_int("JOB_DIGEST_SCORING_CACHE_SIZE", 4096)
+
 EMAIL_ENABLED = os.getenv("JOB_DIGEST_EMAIL_ENABLED", "true").lower() == "true"
 SMTP_HOST = os.getenv("SMTP_HOST", "")
 SMTP_PORT = int(os.getenv("SMTP_PORT", "587"))
@@ -193,10 +217,39 @@ SMTP_PASS = os.getenv("SMTP_PASS", "")
 FROM_EMAIL = os.getenv("FROM_EMAIL", "")
 TO_EMAIL = os.getenv("TO_EMAIL", "ademolaomosanya@gmail.com")
 
+# Inbox tracker: local copy of the jobs index used for reconciliation,
+# refreshed from Firestore by `updated_at` instead of streaming every doc.
+# A full reload still happens every INBOX_JOBS_INDEX_FULL_REFRESH_DAYS.
+INBOX_JOBS_INDEX_ENABLED = _env_bool("JOB_DIGEST_INBOX_JOBS_INDEX_ENABLED", True)
+INBOX_JOBS_INDEX_PATH = Path(
+    os.getenv("JOB_DIGEST_INBOX_JOBS_INDEX", str(DIGEST_DIR / "inbox_jobs_index.json"))
+)
+INBOX_JOBS_INDEX_FULL_REFRESH_DAYS = _env_int("JOB_DIGEST_INBOX_JOBS_INDEX_FULL_REFRESH_DAYS", 7)
+# Message bodies are fetched as text parts only, this many messages per IMAP
+# command, each part capped at INBOX_BODY_MAX_BYTES (attachments are skipped).
+INBOX_BODY_FETCH_BATCH = _env_int("JOB_DIGEST_INBOX_BODY_FETCH_BATCH", 50)
+INBOX_BODY_MAX_BYTES = _env_int("JOB_DIGEST_INBOX_BODY_MAX_BYTES", 262144)
+# Per-folder UIDVALIDITY + highest processed UID, so a run only searches mail
+# that arrived since the last committed run. Kept in Firestore beside the
+# events it covers; runs without a client always rescan.
+INBOX_SYNC_COLLECTION = os.getenv("FIREBASE_INBOX_SYNC_COLLECTION", "inbox_sync_state")
+# Rule, extraction and LLM results per Message-ID, each stamped with a hash of
+# the code/vocabulary that produced it, so re-runs skip the LLM and a rule
+# change only recomputes the component it touched.
+INBOX_CLASSIFICATION_CACHE_ENABLED = _env_bool("JOB_DIGEST_INBOX_CLASSIFICATION_CACHE_ENABLED", True)
+INBOX_CLASSIFICATION_CACHE_PATH = Path(
+    os.getenv("JOB_DIGEST_INBOX_CLASSIFICATION_CACHE", str(DIGEST_DIR / "inbox_classification_cache.json"))
+)
+INBOX_CLASSIFICATION_CACHE_DAYS = _env_int("JOB_DIGEST_INBOX_CLASSIFICATION_CACHE_DAYS", 180)
+# Ambiguous messages go to the LLM on a pool this wide, paced by the
+# OpenRouter token bucket (OPENROUTER_RATE_LIMIT_RPM).
+INBOX_LLM_WORKERS = _env_int("JOB_DIGEST_INBOX_LLM_WORKERS", 4)
+
 GEMINI_API_KEY = os.getenv("GEMINI_API_KEY", "") or os.getenv("JOB_DIGEST_GEMINI_KEY", "")
 GEMINI_MODEL = os.getenv("JOB_DIGEST_GEMINI_MODEL", "gemini-1.5-flash")
 GEMINI_MAX_JOBS = int(os.getenv("JOB_DIGEST_GEMINI_MAX_JOBS", "20"))
 GEMINI_TIMEOUT_SECONDS = int(os.getenv("JOB_DIGEST_GEMINI_TIMEOUT", "45"))
+GEMINI_RATE_LIMIT_RPM = int(os.getenv("JOB_DIGEST_GEMINI_RPM", "15"))
 GEMINI_FALLBACK_MODELS = [
     model.strip()
     for model in os.getenv(
@@ -212,6 +265,28 @@ GROQ_RATE_LIMIT_RPM = int(os.getenv("JOB_DIGEST_GROQ_RPM", "30"))
 GROQ_DAILY_TOKEN_LIMIT = int(os.getenv("JOB_DIGEST_GROQ_DAILY_TOKEN_LIMIT", "14400"))
 GROQ_TOKEN_WARN_RATIO = float(os.getenv("JOB_DIGEST_GROQ_TOKEN_WARN_RATIO", "0.8"))
 GROQ_USAGE = {"tokens": 0, "calls": 0, "retries": 0}
+# Enrichment runs job-text fetches and LLM calls on separate pools so page
+# downloads overlap with generation; each provider is paced by its RPM.
+ENRICH_LLM_WORKERS = _env_int("JOB_DIGEST_ENRICH_WORKERS", 4)
+ENRICH_FETCH_WORKERS = _env_int("JOB_DIGEST_ENRICH_FETCH_WORKERS", 6)
+# Parsed enrichment payloads, keyed by posting content + profile + prompt
+# version, so a re-seen role does not pay for another LLM call.
+ENRICH_CACHE_ENABLED = _env_bool("JOB_DIGEST_ENRICH_CACHE_ENABLED", True)
+ENRICH_CACHE_PATH = Path(os.getenv("JOB_DIGEST_ENRICH_CACHE", str(DIGEST_DIR / "enrichment_cache.json")))
+ENRICH_CACHE_DAYS = _env_int("JOB_DIGEST_ENRICH_CACHE_DAYS", 14)
+# Extracted job-description text by canonical link (see job_text.py).
+JOB_TEXT_CACHE_ENABLED = _env_bool("JOB_DIGEST_JOB_TEXT_CACHE_ENABLED", True)
+JOB_TEXT_CACHE_PATH = Path(os.getenv("JOB_DIGEST_JOB_TEXT_CACHE", str(DIGEST_DIR / "job_text_cache.json")))
+JOB_TEXT_CACHE_DAYS = _env_int("JOB_DIGEST_JOB_TEXT_CACHE_DAYS", 7)
+JOB_TEXT_FETCH_DEADLINE_SECONDS = _env_int("JOB_DIGEST_JOB_TEXT_DEADLINE", 20)
+# Parsed custom careers / recruiter detail pages by canonical link (see
+# detail_cache.py). Within DETAIL_PAGE_CACHE_FRESH_HOURS a cached page costs no
+# request; after that it is revalidated with its ETag/Last-Modified or body
+# hash. Entries unused for DETAIL_PAGE_CACHE_DAYS drop out.
+DETAIL_PAGE_CACHE_ENABLED = _env_bool("JOB_DIGEST_DETAIL_PAGE_CACHE_ENABLED", True)
+DETAIL_PAGE_CACHE_PATH = Path(os.getenv("JOB_DIGEST_DETAIL_PAGE_CACHE", str(DIGEST_DIR / "detail_page_cache.json")))
+DETAIL_PAGE_CACHE_FRESH_HOURS = _env_float("JOB_DIGEST_DETAIL_PAGE_CACHE_FRESH_HOURS", 72.0)
+DETAIL_PAGE_CACHE_DAYS = _env_int("JOB_DIGEST_DETAIL_PAGE_CACHE_DAYS", 21)
 
 OPENAI_API_KEY = os.getenv("OPENAI_API_KEY", "")
 OPENAI_MODEL = os.getenv("JOB_DIGEST_OPENAI_MODEL", "gpt-4o-mini")
@@ -220,6 +295,7 @@ OPENAI_CV_MAX_JOBS = int(os.getenv("JOB_DIGEST_OPENAI_CV_MAX_JOBS", "20"))
 OPENROUTER_API_KEY = os.getenv("OPENROUTER_API_KEY", "")
 OPENROUTER_MODEL = os.getenv("JOB_DIGEST_OPENROUTER_MODEL", "meta-llama/llama-3.3-70b-instruct:free")
 OPENROUTER_BASE_URL = "https://openrouter.ai/api/v1"
+OPENROUTER_RATE_LIMIT_RPM = int(os.getenv("JOB_DIGEST_OPENROUTER_RPM", "20"))
 
 JOB_DIGEST_CV_PATH = os.getenv(
     "JOB_DIGEST_CV_PATH",
@@ -270,15 +346,42 @@ WORKDAY_SITES = [
     if entry.strip()
 ]
 WORKDAY_SITES_FILE = Path(os.getenv("JOB_DIGEST_WORKDAY_FILE", str(BASE_DIR / "workday_sites.txt")))
+# Workday CXS search: board terms sharing a role suffix are searched as the
+# suffix and filtered locally; each query pages with `offset` until a page has
+# nothing inside WINDOW_HOURS or it has read PAGES_PER_TERM pages per merged
+# term. Query chains run on a shared pool, at most PER_HOST in flight per
+# tenant host.
+WORKDAY_WORKERS = _env_int("JOB_DIGEST_WORKDAY_WORKERS", 8)
+WORKDAY_PER_HOST = _env_int("JOB_DIGEST_WORKDAY_PER_HOST", 2)
+WORKDAY_PAGE_SIZE = _env_int("JOB_DIGEST_WORKDAY_PAGE_SIZE", 20)
+WORKDAY_PAGES_PER_TERM = _env_int("JOB_DIGEST_WORKDAY_PAGES_PER_TERM", 2)
+WORKDAY_TIMEOUT_SECONDS = _env_int("JOB_DIGEST_WORKDAY_TIMEOUT_SECONDS", 30)
 COMPANY_TARGETS_PATH = Path(
     os.getenv("JOB_DIGEST_COMPANY_TARGETS", str(BASE_DIR / "company_targets_uk.txt"))
 )
 UK_FEEDS_PATH = Path(os.getenv("JOB_DIGEST_UK_FEEDS", str(BASE_DIR / "uk_firm_feeds.csv")))
+# Custom careers crawl: worker threads shared round-robin across targets, and
+# the most requests any one careers host sees at once.
+CUSTOM_CAREERS_WORKERS = _env_int("JOB_DIGEST_CUSTOM_CAREERS_WORKERS", 8)
+CUSTOM_CAREERS_PER_HOST = _env_int("JOB_DIGEST_CUSTOM_CAREERS_PER_HOST", 2)
+# Custom careers health: a target that fails (blocked/broken/timed out) this
+# many runs in a row, or yields no kept role for the dry-run count, is skipped
+# for BACKOFF_HOURS, doubling per further miss up to MAX_BACKOFF_HOURS. The last
+# HEALTH_WINDOW runs of kept counts rank targets by recent yield.
+CUSTOM_CAREERS_FAILURES_BEFORE_BACKOFF = _env_int("JOB_DIGEST_CUSTOM_CAREERS_FAILURES_BEFORE_BACKOFF", 2)
+CUSTOM_CAREERS_DRY_RUNS_BEFORE_BACKOFF = _env_int("JOB_DIGEST_CUSTOM_CAREERS_DRY_RUNS_BEFORE_BACKOFF", 6)
+CUSTOM_CAREERS_BACKOFF_HOURS = _env_float("JOB_DIGEST_CUSTOM_CAREERS_BACKOFF_HOURS", 8.0)
+CUSTOM_CAREERS_MAX_BACKOFF_HOURS = _env_float("JOB_DIGEST_CUSTOM_CAREERS_MAX_BACKOFF_HOURS", 168.0)
+CUSTOM_CAREERS_HEALTH_WINDOW = _env_int("JOB_DIGEST_CUSTOM_CAREERS_HEALTH_WINDOW", 5)
 
 FIREBASE_SERVICE_ACCOUNT_JSON = os.getenv("FIREBASE_SERVICE_ACCOUNT_JSON", "")
 FIREBASE_SERVICE_ACCOUNT_B64 = os.getenv("FIREBASE_SERVICE_ACCOUNT_B64", "")
 FIREBASE_SERVICE_ACCOUNT_PATH = os.getenv("FIREBASE_SERVICE_ACCOUNT_PATH", "")
 FIREBASE_COLLECTION = os.getenv("FIREBASE_COLLECTION", "jobs")
+# When set (host:port of `firebase emulators:start --only firestore`), every
+# Firestore call goes to the local emulator with anonymous credentials.
+FIRESTORE_EMULATOR_HOST = os.getenv("FIRESTORE_EMULATOR_HOST", "")
+FIRESTORE_EMULATOR_PROJECT = os.getenv("JOB_DIGEST_FIRESTORE_PROJECT", "job-digest-local")
 
 USER_AGENT = os.getenv(
     "JOB_DIGEST_USER_AGENT",
@@ -1,247 +1,375 @@
-"""Scrape bespoke careers pages for firms not on a known ATS.
+"""Crawl bespoke careers pages for firms not on a known ATS.
 
-The 196 rows in `uk_firm_feeds.csv` with platform="Custom" represent target
-firms whose careers pages are bespoke HTML, not a polled ATS endpoint. Most
-publish job listings via schema.org JSON-LD blocks (`@type=JobPosting`)
-because Google for Jobs requires it for indexed careers pages. This module
-fetches each careers URL, parses JSON-LD, and returns a list of job dicts
-compatible with the existing scraper pipeline.
+Rows in `uk_firm_feeds.csv` with platform="Custom" are target firms whose
+careers pages are bespoke HTML rather than a polled ATS endpoint. This is the
+one crawler for them; `runner.collect_custom_careers_records` and the
+"CustomCareers" job-board entry both call `custom_careers_search`.
 
-If a page returns no JSON-LD, we fall back to a generic href-pattern scan
-that looks for common job-link slugs (`/jobs/`, `/careers/`, `/role/`,
-`/opening/`, `/position/`). These produce title + link but no posted date,
-so the post-fetch window filter is lenient (treats missing date as ok).
+Per target the crawl runs in three stages:
+- Landing page: JSON-LD `JobPosting` blocks (including `@graph`), plus
+  discovery of up to six same-site job hub pages.
+- Hub pages: the landing page doubles as the first hub. Each hub yields
+  JSON-LD postings and then job-detail links.
+- Detail pages: up to N per target, enriched from their JSON-LD (or from
+  og:/meta tags) and then re-filtered.
 
 Design choices:
-- Parallel fetch with a small ThreadPoolExecutor (default 10 workers) so
-  196 firms complete in ~30-60 seconds inside the CI watchdog window.
-- 12 second timeout per request, with 1 retry on transient failure.
-- Polite User-Agent identifying the scraper so site owners can block if
-  needed.
-- Respects HTTP 429 with exponential backoff; gives up after 2 retries.
+- Every request of every target goes onto one shared worker pool, taken
+  round-robin across targets so that one slow firm cannot starve the rest.
+  A per-host semaphore stands in for the old fixed politeness sleeps.
+- Each page is parsed once and shared by the hub, JSON-LD and link
+  extractors.
+- Targets come from `sources.load_custom_careers_targets`, which ranks them
+  and skips them using their health history. Each target keeps a time slice,
+  measured in seconds of its own requests, and the whole crawl stops at a
+  global deadline.
+- Per-target outcomes (ok/blocked/broken/timed_out) are recorded so that the
+  runner can roll them into the health file, including targets that never
+  yield a job.
 """
 from __future__ import annotations
 
-import concurrent.futures
-import csv
-import json
-import re
-from html import unescape
-from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple
-from urllib.parse import urljoin
+import os
+import threading
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional, Tuple
 
 import requests
 from bs4 import BeautifulSoup
 
 from . import config
+from .board_fetch import HostLimiter
+from .detail_cache import cached_job_details, detail_cache_note, job_details_from_response, save_detail_page_cache
+from .sources import (
+    ABANDONED_SOURCES,
+    CUSTOM_CAREERS_CRAWL_OUTCOMES,
+    SOURCE_RUNTIME_EVENTS_LOCK,
+    as_soup,
+    discover_custom_job_hubs,
+    extract_job_links,
+    extract_jobpostings_from_jsonld,
+    is_obvious_non_uk_custom_link,
+    load_custom_careers_targets,
+    mark_source_runtime_event,
+    parse_job_detail_fallback,
+    parse_job_detail_jsonld,
+    should_skip_custom_careers_page,
+)
 
 
 USER_AGENT = "Mozilla/5.0 (compatible; job-digest/1.0; +https://github.com/MEMAtest/job-digest-portal)"
-REQUEST_TIMEOUT_SECONDS = 12
-MAX_WORKERS = 10
-MAX_JOBS_PER_FIRM = 30  # cap per careers page to bound noise
-
-
-def load_custom_targets(path: Optional[Path] = None) -> List[Dict[str, str]]:
-    """Return the list of firms whose platform is 'Custom' (i.e. dormant)."""
-    if path is None:
-        path = config.UK_FEEDS_PATH
-    if not path.exists():
-        return []
-    targets: List[Dict[str, str]] = []
-    with path.open(newline="", encoding="utf-8") as handle:
-        reader = csv.DictReader(handle)
-        for row in reader:
-            platform = (row.get("platform") or "").strip()
-            careers_url = (row.get("careers_url") or "").strip()
-            firm = (row.get("firm") or "").strip()
-            if platform != "Custom":
-                continue
-            if not careers_url or not firm:
-                continue
-            category = (row.get("category") or "").strip()
-            targets.append({
-                "firm": firm,
-                "category": category,
-                "careers_url": careers_url,
-            })
-    return targets
-
-
-def _fetch(url: str, session: Optional[requests.Session] = None) -> Optional[str]:
-    sess = session or requests
-    for attempt in range(2):
-        try:
-            resp = sess.get(
-                url,
-                headers={"User-Agent": USER_AGENT, "Accept": "text/html,application/json"},
-                timeout=REQUEST_TIMEOUT_SECONDS,
-                allow_redirects=True,
-            )
-        except requests.RequestException:
-            return None
-        if resp.status_code == 429 and attempt == 0:
-            continue
-        if resp.status_code >= 400:
-            return None
-        return resp.text
-    return None
+HOST_LIMITER = HostLimiter(config.CUSTOM_CAREERS_PER_HOST)
 
 
-def _extract_jsonld_jobs(html: str, source_url: str) -> List[Dict[str, str]]:
-    """Find all JobPosting JSON-LD blocks and convert to job dicts."""
-    jobs: List[Dict[str, str]] = []
-    soup = BeautifulSoup(html, "html.parser")
-    for script in soup.find_all("script", attrs={"type": "application/ld+json"}):
-        if not script.string:
+def _page_jobs(
+    soup: BeautifulSoup, page_url: str, target: Dict[str, str]
+) -> Tuple[List[Dict[str, str]], List[Dict[str, str]]]:
+    """(JSON-LD postings, job links) found on one careers page, each in page order."""
+    careers_url = target["careers_url"]
+    postings: List[Dict[str, str]] = []
+    for payload in extract_jobpostings_from_jsonld(soup, page_url, target["firm"]):
+        if should_skip_custom_careers_page(payload.get("title", ""), payload.get("link", ""), payload.get("summary", "")):
             continue
-        try:
-            payload: Any = json.loads(script.string)
-        except json.JSONDecodeError:
+        payload["target_firm"] = target["firm"]
+        payload["target_careers_url"] = careers_url
+        payload["target_category"] = target.get("primary_category", "")
+        postings.append(payload)
+    found: List[Dict[str, str]] = []
+    for link, title in extract_job_links(soup, page_url):
+        if should_skip_custom_careers_page(title, link, ""):
             continue
-        for block in _walk_jsonld(payload):
-            job = _jsonld_to_job(block, source_url)
-            if job:
-                jobs.append(job)
-            if len(jobs) >= MAX_JOBS_PER_FIRM:
-                return jobs
-    return jobs
+        if is_obvious_non_uk_custom_link(link):
+            continue
+        found.append(
+            {
+                "title": title,
+                "company": target["firm"],
+                "location": "",
+                "link": link,
+                "posted_text": "",
+                "posted_date": "",
+                "summary": "",
+                "source": "CustomCareers",
+                "target_firm": target["firm"],
+                "target_careers_url": careers_url,
+                "target_category": target.get("primary_category", ""),
+            }
+        )
+    return postings, found
 
 
-def _walk_jsonld(node: Any):
-    """Walk JSON-LD payload yielding any JobPosting nodes (incl. @graph)."""
-    if isinstance(node, list):
-        for item in node:
-            yield from _walk_jsonld(item)
-        return
-    if not isinstance(node, dict):
-        return
-    type_field = node.get("@type")
-    if type_field == "JobPosting" or (isinstance(type_field, list) and "JobPosting" in type_field):
-        yield node
-    if "@graph" in node:
-        yield from _walk_jsonld(node["@graph"])
-
-
-def _jsonld_to_job(block: Dict[str, Any], source_url: str) -> Optional[Dict[str, str]]:
-    title = str(block.get("title") or "").strip()
-    if not title:
-        return None
-    url = str(block.get("url") or block.get("@id") or "").strip()
-    if not url:
-        return None
-    url = urljoin(source_url, url)
-    posted_date = str(block.get("datePosted") or "").strip()
-    hiring_org = block.get("hiringOrganization") or {}
-    if isinstance(hiring_org, dict):
-        company = str(hiring_org.get("name") or "").strip()
-    else:
-        company = ""
-    location = ""
-    job_location = block.get("jobLocation")
-    if isinstance(job_location, list):
-        job_location = job_location[0] if job_location else None
-    if isinstance(job_location, dict):
-        addr = job_location.get("address") or {}
-        if isinstance(addr, dict):
-            parts = [
-                str(addr.get("addressLocality") or "").strip(),
-                str(addr.get("addressRegion") or "").strip(),
-                str(addr.get("addressCountry") or "").strip(),
-            ]
-            location = ", ".join([p for p in parts if p])
-    summary = ""
-    desc = block.get("description")
-    if isinstance(desc, str):
-        summary = unescape(re.sub(r"<[^>]+>", " ", desc)).strip()[:600]
-    return {
-        "title": title,
-        "company": company,
-        "location": location,
-        "link": url,
-        "posted_date": posted_date,
-        "summary": summary,
-    }
+def _apply_job_details(job: Dict[str, str], details: Dict[str, str]) -> None:
+    if details.get("title"):
+        job["title"] = details["title"]
+    if details.get("company"):
+        job["company"] = details["company"]
+    if details.get("location"):
+        job["location"] = details["location"]
+    if details.get("posted_date"):
+        job["posted_date"] = details["posted_date"]
+    elif details.get("posted_text"):
+        job["posted_text"] = details["posted_text"]
+    if details.get("summary"):
+        job["summary"] = details["summary"]
 
 
-# Common URL slugs that indicate a job-detail page
-_JOB_LINK_SLUGS = re.compile(
-    r"/(jobs?|careers?|openings?|positions?|role|roles|opportunities)/[^/?#]+",
-    re.IGNORECASE,
-)
+class _CrawlTarget:
+    """Crawl state for one custom careers target.
 
+    A target moves through three stages, each a batch of single-request tasks:
+    the landing page, its hub pages (the landing page doubles as the first
+    hub), then up to `max_details` detail pages. Results are buffered and
+    folded into `job_map` in page order once a stage's batch is complete, so
+    the output matches a serial crawl whatever order the requests finish in.
+    `spent` counts seconds inside this target's own requests: its time slice.
+    `cut_off` marks a target stopped by the global deadline instead.
+    """
 
-def _extract_generic_links(html: str, source_url: str) -> List[Dict[str, str]]:
-    """Fallback: scan anchor hrefs for job-detail patterns."""
-    soup = BeautifulSoup(html, "html.parser")
-    seen: set[str] = set()
-    jobs: List[Dict[str, str]] = []
-    for anchor in soup.find_all("a", href=True):
-        href = anchor["href"]
-        if not _JOB_LINK_SLUGS.search(href):
-            continue
-        url = urljoin(source_url, href)
-        if url in seen:
-            continue
-        seen.add(url)
-        title = " ".join((anchor.get_text() or "").split()).strip()
-        if not title or len(title) < 5 or len(title) > 200:
-            continue
-        jobs.append({
-            "title": title,
-            "company": "",
-            "location": "",
-            "link": url,
-            "posted_date": "",
-            "summary": "",
-        })
-        if len(jobs) >= MAX_JOBS_PER_FIRM:
-            break
-    return jobs
+    def __init__(self, target: Dict[str, str], max_pages: int, max_details: int) -> None:
+        self.target = target
+        self.max_pages = max_pages
+        self.max_details = max_details
+        self.stage = "landing"
+        self.tasks: deque = deque([target["careers_url"]])
+        self.in_flight = 0
+        self.spent = 0.0
+        self.visited = False
+        self.sliced = False
+        self.cut_off = False
+        self.done = False
+        self.status = ""
+        self.job_map: Dict[str, Dict[str, str]] = {}
+        self.pages: List[str] = []
+        self.page_jobs: Dict[str, List[Dict[str, str]]] = {}
+        self.detail_links: List[str] = []
+        self.details: Dict[str, Dict[str, str]] = {}
 
+    def exhaust_slice(self) -> None:
+        self.sliced = True
+        self.tasks.clear()
 
-def _scrape_one(target: Dict[str, str], session: requests.Session) -> Tuple[Dict[str, str], List[Dict[str, str]]]:
-    html = _fetch(target["careers_url"], session)
-    if not html:
-        return target, []
-    jobs = _extract_jsonld_jobs(html, target["careers_url"])
-    if not jobs:
-        jobs = _extract_generic_links(html, target["careers_url"])
-    for job in jobs:
-        if not job.get("company"):
-            job["company"] = target["firm"]
-    return target, jobs
+    def apply(self, url: str, result: object) -> None:
+        """Record one finished request; advance the stage when its batch is done."""
+        if self.stage == "landing":
+            self.visited = True
+            if not isinstance(result, tuple):
+                self.status = result if isinstance(result, str) else "broken"
+                self.done = True
+                return
+            hubs, (postings, links) = result
+            for payload in postings:
+                self.job_map.setdefault(payload["link"], payload)
+            # The landing page is also the first hub; its parse is reused.
+            self.pages = ([url] + hubs)[: self.max_pages]
+            self.page_jobs[url] = postings + links
+            self.stage = "pages"
+            self.tasks.extend(self.pages[1:])
+        elif self.stage == "pages":
+            if isinstance(result, tuple):
+                self.page_jobs[url] = result[0] + result[1]
+        elif isinstance(result, dict):
+            self.details[url] = result
+        if not self.tasks and not self.in_flight:
+            self.advance()
+
+    def advance(self) -> None:
+        if self.stage == "pages":
+            for page in self.pages:
+                for payload in self.page_jobs.get(page, []):
+                    self.job_map.setdefault(payload["link"], payload)
+            self.stage = "details"
+            if not self.sliced:
+                for link in list(self.job_map)[: self.max_details]:
+                    if is_obvious_non_uk_custom_link(link):
+                        self.job_map.pop(link, None)
+                        continue
+                    self.detail_links.append(link)
+                self.tasks.extend(self.detail_links)
+            if self.tasks:
+                return
+        if self.stage == "details":
+            for link in self.detail_links:
+                job = self.job_map.get(link)
+                if job is None or link not in self.details:
+                    continue
+                _apply_job_details(job, self.details[link])
+                if should_skip_custom_careers_page(job.get("title", ""), link, job.get("summary", "")):
+                    self.job_map.pop(link, None)
+        self.done = True
+
+
+def _fetch_task(
+    session: requests.Session, state: _CrawlTarget, url: str, timeout: int
+) -> Tuple[object, float]:
+    """Run one crawl request for `state` and parse it; return (result, request seconds)."""
+    headers: Dict[str, str] = {}
+    if state.stage == "details":
+        cached, headers = cached_job_details(url, "CustomCareers")
+        if cached is not None:
+            return cached, 0.0
+    with HOST_LIMITER.for_url(url):
+        started = time.monotonic()
+        try:
+            if headers:
+                resp = session.get(url, timeout=timeout, headers=headers)
+            else:
+                resp = session.get(url, timeout=timeout)
+        except requests.RequestException:
+            resp = None
+        elapsed = time.monotonic() - started
+    target = state.target
+    if state.stage == "landing":
+        if resp is None:
+            mark_source_runtime_event("CustomCareers", failed=1, note=f"request failed for {target['firm']}")
+            return "broken", elapsed
+        if resp.status_code != 200:
+            if resp.status_code in {403, 429}:
+                mark_source_runtime_event("CustomCareers", blocked=1, note=f"{target['firm']} returned {resp.status_code}")
+                return "blocked", elapsed
+            mark_source_runtime_event("CustomCareers", failed=1, note=f"{target['firm']} returned {resp.status_code}")
+            return "broken", elapsed
+        soup = as_soup(resp.text)
+        return (discover_custom_job_hubs(soup, url), _page_jobs(soup, url, target)), elapsed
+    if resp is None:
+        return None, elapsed
+    if state.stage == "pages":
+        if resp.status_code != 200:
+            return None, elapsed
+        return _page_jobs(as_soup(resp.text), url, target), elapsed
+    fallback_title = state.job_map.get(url, {}).get("title", "")
+
+    def parse(html: str) -> Dict[str, str]:
+        soup = as_soup(html)
+        return parse_job_detail_jsonld(soup, fallback_title) or parse_job_detail_fallback(soup)
+
+    return job_details_from_response(url, resp, parse, "CustomCareers"), elapsed
 
 
 def custom_careers_search(session: Optional[requests.Session] = None) -> List[Dict[str, str]]:
-    """Scrape all Custom-platform firms' careers pages in parallel.
+    """Crawl every custom careers target concurrently.
 
-    Returns a flat list of job dicts with keys: title, company, location,
-    link, posted_date, summary, plus 'source_firm' for diagnostics.
+    Workers take requests round-robin across targets, so one slow firm with
+    many hubs cannot starve the rest, and a per-host semaphore keeps any one
+    site from seeing more than a couple of requests at once. Each target keeps
+    its time slice (seconds spent in its own requests), and everything stops
+    at the global deadline; targets are returned in priority order with
+    whatever they had gathered. Coverage is recorded in the runtime events.
     """
-    targets = load_custom_targets()
+    jobs: List[Dict[str, str]] = []
+    targets = load_custom_careers_targets(config.UK_FEEDS_PATH)
     if not targets:
-        return []
-    sess = session or requests.Session()
-    sess.headers.update({"User-Agent": USER_AGENT})
-    all_jobs: List[Dict[str, str]] = []
-    yields: Dict[str, int] = {}
-    with concurrent.futures.ThreadPoolExecutor(max_workers=MAX_WORKERS) as pool:
-        futures = {pool.submit(_scrape_one, t, sess): t for t in targets}
-        for future in concurrent.futures.as_completed(futures):
+        return jobs
+    if session is None:
+        session = requests.Session()
+        session.headers.update({"User-Agent": USER_AGENT})
+    deadline_seconds = int(os.getenv("JOB_DIGEST_CUSTOM_CAREERS_DEADLINE_SECONDS", "60") or "60")
+    target_timeout_seconds = int(os.getenv("JOB_DIGEST_CUSTOM_CAREERS_TARGET_TIMEOUT_SECONDS", "8") or "8")
+    max_pages_per_target = int(os.getenv("JOB_DIGEST_CUSTOM_CAREERS_MAX_PAGES_PER_TARGET", "3") or "3")
+    max_detail_links_per_target = int(os.getenv("JOB_DIGEST_CUSTOM_CAREERS_MAX_DETAIL_LINKS_PER_TARGET", "10") or "10")
+    started = time.monotonic()
+
+    def deadline_reached() -> bool:
+        return deadline_seconds > 0 and (time.monotonic() - started) >= deadline_seconds
+
+    def request_timeout() -> int:
+        if deadline_seconds <= 0:
+            return 25
+        remaining = deadline_seconds - int(time.monotonic() - started)
+        return max(5, min(25, remaining))
+
+    states = [_CrawlTarget(target, max_pages_per_target, max_detail_links_per_target) for target in targets]
+    ready = threading.Condition()
+    cursor = [0]
+    errors: List[BaseException] = []
+
+    def next_task() -> Optional[Tuple[_CrawlTarget, str]]:
+        with ready:
+            while not errors and not deadline_reached():
+                for offset in range(len(states)):
+                    state = states[(cursor[0] + offset) % len(states)]
+                    if not state.tasks:
+                        continue
+                    if target_timeout_seconds > 0 and state.spent >= target_timeout_seconds:
+                        mark_source_runtime_event(
+                            "CustomCareers", timed_out=1, note=f"{state.target['firm']} target time slice exhausted"
+                        )
+                        state.exhaust_slice()
+                        if not state.in_flight:
+                            state.advance()
+                        continue
+                    cursor[0] = (cursor[0] + offset + 1) % len(states)
+                    state.in_flight += 1
+                    return state, state.tasks.popleft()
+                if not any(state.in_flight for state in states):
+                    return None
+                ready.wait(0.5)
+            return None
+
+    def worker() -> None:
+        while True:
+            task = next_task()
+            if task is None:
+                return
+            state, url = task
+            result: object = None
+            elapsed = 0.0
             try:
-                target, jobs = future.result()
-            except Exception:  # noqa: BLE001
-                continue
-            yields[target["firm"]] = len(jobs)
-            for job in jobs:
-                job["source_firm"] = target["firm"]
-            all_jobs.extend(jobs)
-    # Brief diagnostic line for the runner log
-    healthy = sum(1 for n in yields.values() if n > 0)
-    print(
-        f"[CustomCareers] {len(targets)} firms polled, {healthy} yielded jobs, "
-        f"{len(all_jobs)} raw roles before filtering"
+                result, elapsed = _fetch_task(session, state, url, request_timeout())
+            except BaseException as exc:  # noqa: BLE001 - re-raised on the calling thread
+                with ready:
+                    errors.append(exc)
+            with ready:
+                state.in_flight -= 1
+                state.spent += elapsed
+                state.apply(url, result)
+                ready.notify_all()
+
+    workers = max(1, min(config.CUSTOM_CAREERS_WORKERS, len(states)))
+    if workers == 1:
+        worker()
+    else:
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="custom-careers") as executor:
+            for _ in range(workers):
+                executor.submit(worker)
+    if errors:
+        raise errors[0]
+
+    if deadline_reached() and not all(state.done for state in states):
+        mark_source_runtime_event("CustomCareers", timed_out=1, note="custom careers deadline reached")
+    for state in states:
+        if not state.done and state.stage != "landing":
+            # Cut off by the deadline: keep what the finished requests found.
+            state.cut_off = True
+            state.exhaust_slice()
+            state.advance()
+        jobs.extend(state.job_map.values())
+    # A target the deadline cut off before it found anything did nothing
+    # wrong (it was just ranked late), so it gets no outcome and its health
+    # history is left as it was. Only its own slice running out is timed_out.
+    outcomes = {
+        state.target["careers_url"]: {
+            "firm": state.target["firm"],
+            "primary_category": state.target.get("primary_category", ""),
+            "status": state.status or ("timed_out" if state.sliced and not state.job_map else "ok"),
+            "raw": len(state.job_map),
+        }
+        for state in states
+        if state.visited and not (state.cut_off and not state.job_map)
+    }
+    with SOURCE_RUNTIME_EVENTS_LOCK:
+        if "CustomCareers" not in ABANDONED_SOURCES:
+            CUSTOM_CAREERS_CRAWL_OUTCOMES.update(outcomes)
+    visited = sum(1 for state in states if state.visited)
+    save_detail_page_cache()
+    cache_note = detail_cache_note("CustomCareers")
+    if cache_note:
+        mark_source_runtime_event("CustomCareers", note=cache_note)
+    mark_source_runtime_event(
+        "CustomCareers",
+        raw=len(jobs),
+        query_count=len(states),
+        note=f"coverage: {visited}/{len(states)} targets visited",
     )
-    return all_jobs
+    return jobs
@@ -0,0 +1,132 @@
+"""Parsed job-detail pages, cached on disk by canonical link.
+
+The custom careers crawler and the recruiter-page scraper both fetch up to
+ten detail pages per target and parse them (JSON-LD first, og:/meta tags as
+the fallback) for title, company, location, posted date and summary. The
+same postings stay listed for weeks, so this module keeps the parsed fields
+in `DETAIL_PAGE_CACHE_PATH`:
+
+- within `DETAIL_PAGE_CACHE_FRESH_HOURS` of the last check a cached page is
+  served without any request;
+- after that it is revalidated: a conditional GET with the stored ETag /
+  Last-Modified, and a 304, or a 200 whose body hashes the same as before,
+  reuses the parsed fields without re-parsing;
+- network errors and non-200 answers are not cached, so they retry next run.
+
+Callers do the request themselves (inside their own host limits):
+`cached_job_details` says whether one is needed and with which validator
+headers, and `job_details_from_response` turns the answer into fields.
+"""
+from __future__ import annotations
+
+import hashlib
+import threading
+from datetime import datetime, timedelta, timezone
+from typing import Callable, Dict, Optional, Tuple
+
+import requests
+
+from . import config
+from .disk_cache import JsonTtlCache
+from .utils import canonical_job_link
+
+DETAIL_FIELDS = ("title", "company", "location", "posted_date", "posted_text", "summary")
+
+DETAIL_PAGE_CACHE = JsonTtlCache(config.DETAIL_PAGE_CACHE_PATH, config.DETAIL_PAGE_CACHE_DAYS)
+DETAIL_CACHE_STATS: Dict[str, Dict[str, int]] = {}
+_STATS_LOCK = threading.Lock()
+
+
+def reset_detail_cache_stats() -> None:
+    with _STATS_LOCK:
+        DETAIL_CACHE_STATS.clear()
+
+
+def _count(source_name: str, outcome: str) -> None:
+    if not source_name:
+        return
+    with _STATS_LOCK:
+        stats = DETAIL_CACHE_STATS.setdefault(source_name, {"fresh": 0, "not_modified": 0, "same_hash": 0, "fetched": 0})
+        stats[outcome] = stats.get(outcome, 0) + 1
+
+
+def detail_cache_note(source_name: str) -> str:
+    stats = DETAIL_CACHE_STATS.get(source_name)
+    if not stats:
+        return ""
+    return (
+        f"detail cache: {stats.get('fresh', 0)} fresh, {stats.get('not_modified', 0)} not modified, "
+        f"{stats.get('same_hash', 0)} unchanged, {stats.get('fetched', 0)} fetched"
+    )
+
+
+def cached_job_details(url: str, source_name: str = "") -> Tuple[Optional[Dict[str, str]], Dict[str, str]]:
+    """(details, headers): details when the cached copy is still fresh, else the
+    conditional-request headers to send (empty when nothing is cached)."""
+    if not config.DETAIL_PAGE_CACHE_ENABLED or not url:
+        return None, {}
+    key = canonical_job_link(url)
+    cached = DETAIL_PAGE_CACHE.get(key)
+    if not cached:
+        return None, {}
+    try:
+        checked_at = datetime.fromisoformat(str(cached.get("checked_at", "")))
+    except ValueError:
+        checked_at = None
+    if checked_at and datetime.now(timezone.utc) - checked_at < timedelta(hours=config.DETAIL_PAGE_CACHE_FRESH_HOURS):
+        DETAIL_PAGE_CACHE.touch(key)
+        _count(source_name, "fresh")
+        return dict(cached.get("details") or {}), {}
+    headers: Dict[str, str] = {}
+    if cached.get("etag"):
+        headers["If-None-Match"] = str(cached["etag"])
+    if cached.get("last_modified"):
+        headers["If-Modified-Since"] = str(cached["last_modified"])
+    return None, headers
+
+
+def job_details_from_response(
+    url: str,
+    resp: requests.Response,
+    parse: Callable[[str], Dict[str, str]],
+    source_name: str = "",
+) -> Optional[Dict[str, str]]:
+    """Parsed details for a detail-page response, or None when it failed.
+
+    `parse(html)` runs only when the page is new or its body changed.
+    """
+    key = canonical_job_link(url)
+    cached = DETAIL_PAGE_CACHE.get(key) if config.DETAIL_PAGE_CACHE_ENABLED else None
+    now = datetime.now(timezone.utc).isoformat()
+    if resp.status_code == 304 and cached:
+        DETAIL_PAGE_CACHE.put(key, {**cached, "checked_at": now})
+        _count(source_name, "not_modified")
+        return dict(cached.get("details") or {})
+    if resp.status_code != 200:
+        return None
+    content_hash = hashlib.sha256((resp.text or "").encode("utf-8", "replace")).hexdigest()
+    if cached and cached.get("content_hash") == content_hash:
+        details = dict(cached.get("details") or {})
+        outcome = "same_hash"
+    else:
+        parsed = parse(resp.text)
+        details = {field: str(parsed.get(field, "") or "") for field in DETAIL_FIELDS}
+        outcome = "fetched"
+    if config.DETAIL_PAGE_CACHE_ENABLED:
+        headers = getattr(resp, "headers", None) or {}
+        DETAIL_PAGE_CACHE.put(
+            key,
+            {
+                "details": details,
+                "etag": headers.get("ETag", ""),
+                "last_modified": headers.get("Last-Modified", ""),
+                "content_hash": content_hash,
+                "checked_at": now,
+            },
+        )
+    _count(source_name, outcome)
+    return details
+
+
+def save_detail_page_cache() -> None:
+    DETAIL_PAGE_CACHE.save()
@@ -0,0 +1,83 @@
+"""Small JSON-file caches with age-based eviction.
+
+Several stages remember things between runs (board validators, enrichment
+payloads, ...). They share the same needs: a dict persisted as one JSON file
+under `DIGEST_DIR`, entries dropped once they have not been written or
+touched for `max_age_days`, thread-safe access from worker pools, and a
+corrupt or missing file treated as an empty cache rather than an error.
+"""
+from __future__ import annotations
+
+import json
+import threading
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import Dict, Optional
+
+
+class JsonTtlCache:
+    """Dict of JSON-serialisable entries stamped with `seen_at` on write/touch."""
+
+    def __init__(self, path: Path, max_age_days: float) -> None:
+        self.path = path
+        self.max_age_days = max_age_days
+        self._lock = threading.Lock()
+        self._entries: Optional[Dict[str, Dict[str, object]]] = None
+        self._dirty = False
+
+    def _load(self) -> Dict[str, Dict[str, object]]:
+        # Callers hold self._lock.
+        if self._entries is None:
+            entries: Dict[str, Dict[str, object]] = {}
+            try:
+                if self.path.exists():
+                    payload = json.loads(self.path.read_text(encoding="utf-8"))
+                    if isinstance(payload, dict):
+                        entries = payload
+            except Exception:
+                entries = {}
+            cutoff = datetime.now(timezone.utc) - timedelta(days=self.max_age_days)
+            fresh: Dict[str, Dict[str, object]] = {}
+            for key, entry in entries.items():
+                if not isinstance(entry, dict):
+                    continue
+                try:
+                    seen_at = datetime.fromisoformat(str(entry.get("seen_at", "")))
+                except ValueError:
+                    continue
+                if seen_at >= cutoff:
+                    fresh[key] = entry
+            self._dirty = len(fresh) != len(entries)
+            self._entries = fresh
+        return self._entries
+
+    def get(self, key: str) -> Optional[Dict[str, object]]:
+        with self._lock:
+            entry = self._load().get(key)
+            return dict(entry) if entry else None
+
+    def put(self, key: str, entry: Dict[str, object]) -> None:
+        with self._lock:
+            self._load()[key] = {**entry, "seen_at": datetime.now(timezone.utc).isoformat()}
+            self._dirty = True
+
+    def touch(self, key: str) -> None:
+        with self._lock:
+            entry = self._load().get(key)
+            if entry is not None:
+                entry["seen_at"] = datetime.now(timezone.utc).isoformat()
+                self._dirty = True
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._load())
+
+    def save(self) -> None:
+        with self._lock:
+            if not self._dirty or self._entries is None:
+                return
+            try:
+                self.path.write_text(json.dumps(self._entries, ensure_ascii=False), encoding="utf-8")
+                self._dirty = False
+            except Exception:
+                return
@@ -3,22 +3,29 @@ from __future__ import annotations
 import base64
 import hashlib
 import json
+import os
 import re
+import threading
 from collections import Counter
 from datetime import datetime, timedelta, timezone
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 
 import requests
 
 from . import config
 from .llm import (
+    ENRICHMENT_CACHE,
     build_enhancement_prompt,
+    cached_enrichment,
+    enrichment_cache_key,
     fetch_job_text,
     generate_gemini_text,
     generate_gemini_text_with_timeout,
     generate_groq_text,
     generate_openrouter_text,
     parse_gemini_payload,
+    save_job_text_cache,
+    store_enrichment,
 )
 from .company_coverage import compute_coverage_summary, read_registry
 from .models import JobRecord
@@ -46,7 +53,15 @@ except ImportError:
     GroqClient = None
 
 
-def init_firestore_client() -> Optional["firestore.Client"]:
+def _build_firestore_client() -> Optional["firestore.Client"]:
+    if firestore is not None and config.FIRESTORE_EMULATOR_HOST:
+        # google-cloud-firestore reads FIRESTORE_EMULATOR_HOST itself and
+        # skips credential lookup, so no service account is needed offline.
+        os.environ.setdefault("FIRESTORE_EMULATOR_HOST", config.FIRESTORE_EMULATOR_HOST)
+        try:
+            return firestore.Client(project=config.FIRESTORE_EMULATOR_PROJECT)
+        except Exception:
+            return None
     if firebase_admin is None or credentials is None or firestore is None:
         return None
     if not config.FIREBASE_SERVICE_ACCOUNT_JSON and not config.FIREBASE_SERVICE_ACCOUNT_B64 and not config.FIREBASE_SERVICE_ACCOUNT_PATH:
@@ -72,132 +87,230 @@ def init_firestore_client() -> Optional["firestore.Client"]:
         return None
 
 
+_CLIENT_LOCK = threading.Lock()
+_CLIENT: Optional["firestore.Client"] = None
+
+
+def init_firestore_client() -> Optional["firestore.Client"]:
+    """The process-wide Firestore client, built on first use; None when Firestore is not configured.
+
+    Every writer and the inbox tracker call this, so the service account is
+    decoded and the gRPC channel opened once per process rather than per
+    call. A failed build is not remembered, so a later call can retry.
+    """
+    global _CLIENT
+    with _CLIENT_LOCK:
+        if _CLIENT is None:
+            _CLIENT = _build_firestore_client()
+        return _CLIENT
+
+
+def reset_firestore_client() -> None:
+    """Drop the cached client (tests, or after switching to/from the emulator)."""
+    global _CLIENT
+    with _CLIENT_LOCK:
+        _CLIENT = None
+
+
 def record_document_id(record: JobRecord) -> str:
     seed = record.link or f"{record.company}-{record.role}-{record.location}"
     digest = hashlib.sha256(seed.encode("utf-8")).hexdigest()
     return digest[:24]
 
 
+# Firestore caps a WriteBatch (and a sensible get_all) at 500 documents.
+FIRESTORE_BATCH_LIMIT = 500
+
+
+def _record_upsert_payload(
+    record: JobRecord, existing_data: Dict[str, object], now_iso: str
+) -> Tuple[Dict[str, object], Optional[Tuple[str, Dict[str, object]]]]:
+    """Build the merge payload for one record, plus its applicant_history entry if the count moved."""
+    ats_family = record.ats_family or infer_ats_family(record.source)
+    source_family = record.source_family or infer_source_family(record.source)
+    created_at = existing_data.get("created_at") or now_iso
+    data = {
+        "role": record.role,
+        "company": record.company,
+        "location": record.location,
+        "link": record.link,
+        "posted": record.posted,
+        "posted_raw": record.posted_raw or record.posted,
+        "posted_date": record.posted_date,
+        "source": record.source,
+        "source_family": source_family,
+        "ats_family": ats_family,
+        "ats_account": record.ats_account,
+        "employment_type": record.employment_type,
+        "verification_status": record.verification_status,
+        "source_quality": record.source_quality,
+        "why_in_feed": record.why_in_feed,
+        "email_bucket": record.email_bucket,
+        "role_bucket": record.role_bucket,
+        "freshness_bucket": record.freshness_bucket,
+        "digest_section": record.digest_section,
+        "fit_score": record.fit_score,
+        "preference_match": record.preference_match,
+        "why_fit": record.why_fit,
+        "cv_gap": record.cv_gap,
+        "notes": record.notes,
+        "prep_questions": record.prep_questions,
+        "apply_tips": record.apply_tips,
+        "updated_at": now_iso,
+        "created_at": created_at,
+        "last_seen_at": now_iso,
+    }
+    is_new_doc = not existing_data
+    effective_threshold = min(config.AUTO_DISMISS_BELOW, 70) if config.AUTO_DISMISS_BELOW > 0 else 0
+    existing_status = (existing_data.get("application_status") or "").lower()
+    if record.source == "Manual":
+        data["manual_link"] = True
+    if is_new_doc and effective_threshold and record.fit_score < effective_threshold:
+        data["application_status"] = "dismissed"
+        data["dismiss_reason"] = f"auto_low_fit_{effective_threshold}"
+    elif record.source == "Manual" and (not existing_status or existing_status in {"saved", "new"}):
+        data["application_status"] = "shortlisted"
+    elif not existing_status:
+        data["application_status"] = "saved"
+    if record.salary_min:
+        data["salary_min"] = record.salary_min
+    if record.salary_max:
+        data["salary_max"] = record.salary_max
+    optional_fields = {
+        "role_summary": record.role_summary,
+        "tailored_summary": record.tailored_summary,
+        "tailored_cv_bullets": record.tailored_cv_bullets,
+        "key_requirements": record.key_requirements,
+        "match_notes": record.match_notes,
+        "company_insights": record.company_insights,
+        "cover_letter": record.cover_letter,
+        "key_talking_points": record.key_talking_points,
+        "star_stories": record.star_stories,
+        "quick_pitch": record.quick_pitch,
+        "interview_focus": record.interview_focus,
+        "prep_answers": record.prep_answers,
+        "scorecard": record.scorecard,
+        "tailored_cv_sections": record.tailored_cv_sections,
+        "applicant_count": record.applicant_count,
+        "job_status": record.job_status,
+        "alternate_links": record.alternate_links,
+        "fit_verdict": record.fit_verdict,
+    }
+    for key, value in optional_fields.items():
+        if isinstance(value, list):
+            if value:
+                data[key] = value
+        elif value:
+            data[key] = value
+    history: Optional[Tuple[str, Dict[str, object]]] = None
+    current_applicant_count = parse_applicant_count(record.applicant_count)
+    if current_applicant_count is not None:
+        data["applicant_count_numeric"] = current_applicant_count
+        previous_count = existing_data.get("applicant_count_numeric")
+        if previous_count is None:
+            previous_count = parse_applicant_count(str(existing_data.get("applicant_count", "")))
+        if isinstance(previous_count, int) and previous_count != current_applicant_count:
+            data["applicant_count_prev"] = previous_count
+            data["applicant_count_prev_date"] = now_iso
+            history = (
+                f"{now_iso[:10]}_{current_applicant_count}",
+                {
+                    "date": now_iso[:10],
+                    "count": current_applicant_count,
+                    "raw_text": record.applicant_count,
+                    "updated_at": now_iso,
+                },
+            )
+    return data, history
+
+
+def _chunks(items: List, size: int) -> List[List]:
+    return [items[start : start + size] for start in range(0, len(items), size)]
+
+
+def _prefetch_existing(client: "firestore.Client", doc_refs: List) -> Tuple[Dict[str, Dict[str, object]], int]:
+    """Existing job docs by id via get_all, falling back to per-doc reads if that fails."""
+    existing: Dict[str, Dict[str, object]] = {}
+    round_trips = 0
+    for chunk in _chunks(doc_refs, FIRESTORE_BATCH_LIMIT):
+        try:
+            round_trips += 1
+            for snapshot in client.get_all(chunk):
+                if snapshot.exists:
+                    existing[snapshot.id] = snapshot.to_dict() or {}
+            continue
+        except Exception:
+            pass
+        # get_all failed: an empty map here would reset created_at and the
+        # application status of every doc in the chunk, so read one by one.
+        for doc_ref in chunk:
+            try:
+                round_trips += 1
+                snapshot = doc_ref.get()
+                if snapshot.exists:
+                    existing[doc_ref.id] = snapshot.to_dict() or {}
+            except Exception:
+                continue
+    return existing, round_trips
+
+
 def write_records_to_firestore(records: List[JobRecord]) -> None:
+    """Upsert the run's records: one get_all per 500 docs, WriteBatch commits of up to 500 writes.
+
+    Semantics match the old per-record get + set(merge=True): created_at is
+    preserved, new low-fit docs are auto-dismissed, and a changed applicant
+    count writes an applicant_history entry. A record seen twice in one run
+    sees its own earlier write, as it did when writes were sequential.
+    """
     client = init_firestore_client()
-    if client is None:
+    if client is None or not records:
         return
 
-    for record in records:
-        ats_family = record.ats_family or infer_ats_family(record.source)
-        source_family = record.source_family or infer_source_family(record.source)
-        doc_id = record_document_id(record)
-        doc_ref = client.collection(config.FIREBASE_COLLECTION).document(doc_id)
-        existing_data: Dict[str, object] = {}
-        try:
-            snapshot = doc_ref.get()
-            if snapshot.exists:
-                existing_data = snapshot.to_dict() or {}
-        except Exception:
-            existing_data = {}
+    collection = client.collection(config.FIREBASE_COLLECTION)
+    doc_ids = [record_document_id(record) for record in records]
+    unique_ids = list(dict.fromkeys(doc_ids))
+    refs = {doc_id: collection.document(doc_id) for doc_id in unique_ids}
+    existing_by_id, read_trips = _prefetch_existing(client, [refs[doc_id] for doc_id in unique_ids])
+
+    writes: List[Tuple[object, Dict[str, object]]] = []
+    history_count = 0
+    for record, doc_id in zip(records, doc_ids):
+        existing_data = existing_by_id.get(doc_id, {})
         now_iso = datetime.now(timezone.utc).isoformat()
-        created_at = existing_data.get("created_at") or now_iso
-        data = {
-            "role": record.role,
-            "company": record.company,
-            "location": record.location,
-            "link": record.link,
-            "posted": record.posted,
-            "posted_raw": record.posted_raw or record.posted,
-            "posted_date": record.posted_date,
-            "source": record.source,
-            "source_family": source_family,
-            "ats_family": ats_family,
-            "ats_account": record.ats_account,
-            "employment_type": record.employment_type,
-            "verification_status": record.verification_status,
-            "source_quality": record.source_quality,
-            "why_in_feed": record.why_in_feed,
-            "email_bucket": record.email_bucket,
-            "role_bucket": record.role_bucket,
-            "freshness_bucket": record.freshness_bucket,
-            "digest_section": record.digest_section,
-            "fit_score": record.fit_score,
-            "preference_match": record.preference_match,
-            "why_fit": record.why_fit,
-            "cv_gap": record.cv_gap,
-            "notes": record.notes,
-            "prep_questions": record.prep_questions,
-            "apply_tips": record.apply_tips,
-            "updated_at": now_iso,
-            "created_at": created_at,
-            "last_seen_at": now_iso,
-        }
-        is_new_doc = not existing_data
-        effective_threshold = min(config.AUTO_DISMISS_BELOW, 70) if config.AUTO_DISMISS_BELOW > 0 else 0
-        existing_status = (existing_data.get("application_status") or "").lower()
-        if record.source == "Manual":
-            data["manual_link"] = True
-        if is_new_doc and effective_threshold and record.fit_score < effective_threshold:
-            data["application_status"] = "dismissed"
-            data["dismiss_reason"] = f"auto_low_fit_{effective_threshold}"
-        elif record.source == "Manual" and (not existing_status or existing_status in {"saved", "new"}):
-            data["application_status"] = "shortlisted"
-        elif not existing_status:
-            data["application_status"] = "saved"
-        if record.salary_min:
-            data["salary_min"] = record.salary_min
-        if record.salary_max:
-            data["salary_max"] = record.salary_max
-        optional_fields = {
-            "role_summary": record.role_summary,
-            "tailored_summary": record.tailored_summary,
-            "tailored_cv_bullets": record.tailored_cv_bullets,
-            "key_requirements": record.key_requirements,
-            "match_notes": record.match_notes,
-            "company_insights": record.company_insights,
-            "cover_letter": record.cover_letter,
-            "key_talking_points": record.key_talking_points,
-            "star_stories": record.star_stories,
-            "quick_pitch": record.quick_pitch,
-            "interview_focus": record.interview_focus,
-            "prep_answers": record.prep_answers,
-            "scorecard": record.scorecard,
-            "tailored_cv_sections": record.tailored_cv_sections,
-            "applicant_count": record.applicant_count,
-            "job_status": record.job_status,
-            "alternate_links": record.alternate_links,
-            "fit_verdict": record.fit_verdict,
-        }
-        for key, value in optional_fields.items():
-            if isinstance(value, list):
-                if value:
-                    data[key] = value
-            elif value:
-                data[key] = value
-        current_applicant_count = parse_applicant_count(record.applicant_count)
-        if current_applicant_count is not None:
-            data["applicant_count_numeric"] = current_applicant_count
-            previous_count = existing_data.get("applicant_count_numeric")
-            if previous_count is None:
-                previous_count = parse_applicant_count(str(existing_data.get("applicant_count", "")))
-            if isinstance(previous_count, int) and previous_count != current_applicant_count:
-                data["applicant_count_prev"] = previous_count
-                data["applicant_count_prev_date"] = now_iso
-                try:
-                    history_doc = doc_ref.collection("applicant_history").document(
-                        f"{now_iso[:10]}_{current_applicant_count}"
-                    )
-                    history_doc.set(
-                        {
-                            "date": now_iso[:10],
-                            "count": current_applicant_count,
-                            "raw_text": record.applicant_count,
-                            "updated_at": now_iso,
-                        },
-                        merge=True,
-                    )
-                except Exception:
-                    pass
+        data, history = _record_upsert_payload(record, existing_data, now_iso)
+        doc_ref = refs[doc_id]
+        if history is not None:
+            history_id, history_payload = history
+            writes.append((doc_ref.collection("applicant_history").document(history_id), history_payload))
+            history_count += 1
+        writes.append((doc_ref, data))
+        existing_by_id[doc_id] = {**existing_data, **data}
+
+    write_trips = 0
+    for chunk in _chunks(writes, FIRESTORE_BATCH_LIMIT):
+        batch = client.batch()
+        for ref, payload in chunk:
+            batch.set(ref, payload, merge=True)
         try:
-            doc_ref.set(data, merge=True)
-        except Exception:
+            write_trips += 1
+            batch.commit()
             continue
+        except Exception:
+            pass
+        # A batch is all-or-nothing; retry its writes singly so one bad
+        # document does not drop the other 499, as the per-record loop allowed.
+        for ref, payload in chunk:
+            try:
+                write_trips += 1
+                ref.set(payload, merge=True)
+            except Exception:
+                continue
+
+    sequential_trips = 2 * len(records) + history_count
+    print(
+        f"Firestore upsert: {len(records)} records, {history_count} applicant_history entries in "
+        f"{read_trips + write_trips} round-trips (sequential writes would take {sequential_trips})."
+    )
 
 
 def write_source_stats(records: List[JobRecord]) -> None:
@@ -468,29 +581,36 @@ def backfill_role_summaries(limit: Optional[int] = None) -> None:
         if not job_text and record.link:
             print(f"  Fetching job text from {record.link}")
             job_text = fetch_job_text(record.link)
-        prompt = build_enhancement_prompt(record, job_text=job_text)
-        text: Optional[str] = None
-        try:
-            text = generate_openrouter_text(prompt) if config.OPENROUTER_API_KEY else None
-            if not text and config.GEMINI_API_KEY and genai is not None:
-                text = generate_gemini_text_with_timeout(prompt, config.GEMINI_TIMEOUT_SECONDS)
-            if not text and config.GROQ_API_KEY and GroqClient is not None:
-                text = generate_groq_text(prompt)
-        except Exception as exc:
-            errors += 1
-            print(f"Backfill error: LLM call failed ({type(exc).__name__}: {exc})")
-            continue
+        cache_key = enrichment_cache_key(record, job_text)
+        cached = cached_enrichment(cache_key)
+        if cached:
+            print("  Using cached enrichment")
+            data = dict(cached["payload"])
+        else:
+            prompt = build_enhancement_prompt(record, job_text=job_text)
+            text: Optional[str] = None
+            try:
+                text = generate_openrouter_text(prompt) if config.OPENROUTER_API_KEY else None
+                if not text and config.GEMINI_API_KEY and genai is not None:
+                    text = generate_gemini_text_with_timeout(prompt, config.GEMINI_TIMEOUT_SECONDS)
+                if not text and config.GROQ_API_KEY and GroqClient is not None:
+                    text = generate_groq_text(prompt)
+            except Exception as exc:
+                errors += 1
+                print(f"Backfill error: LLM call failed ({type(exc).__name__}: {exc})")
+                continue
 
-        if not text:
-            errors += 1
-            print("Backfill error: empty response.")
-            continue
+            if not text:
+                errors += 1
+                print("Backfill error: empty response.")
+                continue
 
-        data = parse_gemini_payload(text)
-        if not data:
-            errors += 1
-            print("Backfill error: could not parse LLM response.")
-            continue
+            data = parse_gemini_payload(text)
+            if not data:
+                errors += 1
+                print("Backfill error: could not parse LLM response.")
+                continue
+            store_enrichment(cache_key, data, (len(prompt) + len(text)) // 4)
 
         update_payload: Dict[str, object] = {"updated_at": now_iso}
         for key in ("role_summary", "key_requirements", "why_fit", "cv_gap", "company_insights", "fit_score"):
@@ -513,8 +633,12 @@ def backfill_role_summaries(limit: Optional[int] = None) -> None:
             continue
 
         if idx % 5 == 0 or idx == total:
+            ENRICHMENT_CACHE.save()
+            save_job_text_cache()
             print(f"Backfill progress: {idx}/{total} processed, {updated} updated, {errors} errors.")
 
+    ENRICHMENT_CACHE.save()
+    save_job_text_cache()
     print(f"Backfill complete: updated {updated} role summaries, {errors} errors.")
 
 
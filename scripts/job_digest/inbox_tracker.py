@@ -10,22 +10,30 @@ Entry point: scripts/run_inbox_tracker.py.
 
 from __future__ import annotations
 
+import base64
+import binascii
 import email
 import email.utils
 import hashlib
+import html as html_lib
 import imaplib
+import inspect
 import json
 import os
+import quopri
 import re
 import sys
 import time
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import asdict, dataclass, field
-from datetime import datetime, timezone
+from datetime import date, datetime, timedelta, timezone
 from email.header import decode_header
-from typing import Dict, List, Optional, Tuple
+from functools import lru_cache
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
 
 from . import config
-from .firestore import init_firestore_client
+from .disk_cache import JsonTtlCache
+from .firestore import FieldFilter, init_firestore_client
 from .llm import generate_openrouter_text, parse_gemini_payload
 
 
@@ -263,6 +271,9 @@ def _decode(value) -> str:
     return "".join(out).strip()
 
 
+_LIST_NAME_RE = re.compile(r'"([^"]+)"\s*$')
+
+
 def _find_all_mail_folder(imap: imaplib.IMAP4_SSL) -> str:
     """Return the quoted folder name for All Mail (locale-aware)."""
     typ, data = imap.list()
@@ -272,7 +283,7 @@ def _find_all_mail_folder(imap: imaplib.IMAP4_SSL) -> str:
     for raw in data or []:
         line = raw.decode("utf-8", errors="ignore") if isinstance(raw, bytes) else str(raw)
         if "\\All" in line:
-            m = re.search(r'"([^"]+)"\s*$', line)
+            m = _LIST_NAME_RE.search(line)
             if m:
                 candidates.append(m.group(1))
     if candidates:
@@ -280,12 +291,18 @@ def _find_all_mail_folder(imap: imaplib.IMAP4_SSL) -> str:
     return '"[Gmail]/All Mail"'
 
 
-def _x_gm_search(imap: imaplib.IMAP4_SSL, raw_query: str) -> List[bytes]:
-    """Execute a Gmail X-GM-RAW search and return list of UID bytes."""
+def _x_gm_search(imap: imaplib.IMAP4_SSL, raw_query: str, min_uid: int = 0) -> List[bytes]:
+    """Execute a Gmail X-GM-RAW search and return list of UID bytes.
+
+    With `min_uid`, only messages with UID >= min_uid are searched.
+    """
     # IMAP requires the literal-syntax-friendly form. Send as a quoted string
     # since our queries fit in well under the 2KB line limit.
     quoted = '"' + raw_query.replace("\\", "\\\\").replace('"', '\\"') + '"'
-    typ, data = imap.uid("SEARCH", "X-GM-RAW", quoted)
+    if min_uid:
+        typ, data = imap.uid("SEARCH", "UID", f"{min_uid}:*", "X-GM-RAW", quoted)
+    else:
+        typ, data = imap.uid("SEARCH", "X-GM-RAW", quoted)
     if typ != "OK" or not data:
         return []
     uids: List[bytes] = []
@@ -296,9 +313,82 @@ def _x_gm_search(imap: imaplib.IMAP4_SSL, raw_query: str) -> List[bytes]:
             uids.extend(chunk.split())
         else:
             uids.extend(str(chunk).encode().split())
+    if min_uid:
+        # "n:*" always includes the highest UID, even when it is below n.
+        uids = [u for u in uids if u.isdigit() and int(u) >= min_uid]
     return uids
 
 
+def _uid_validity(imap: imaplib.IMAP4_SSL) -> str:
+    """UIDVALIDITY of the selected folder ("" if the server did not report it)."""
+    try:
+        _, data = imap.response("UIDVALIDITY")
+    except Exception:
+        return ""
+    for value in data or []:
+        if value:
+            return value.decode("ascii", errors="replace") if isinstance(value, bytes) else str(value)
+    return ""
+
+
+def _sync_state_doc_id(folder: str) -> str:
+    return hashlib.sha256(f"{config.SMTP_USER}|{folder}".encode("utf-8")).hexdigest()[:24]
+
+
+def _load_sync_state(client, folder: str) -> Dict[str, object]:
+    """{uidvalidity, last_uid} from the previous committed run for this folder, or {}.
+
+    The mark lives next to the events it covers, so without a Firestore client
+    there is none and every run is a full rescan.
+    """
+    if client is None:
+        return {}
+    try:
+        snap = client.collection(config.INBOX_SYNC_COLLECTION).document(_sync_state_doc_id(folder)).get()
+        return (snap.to_dict() or {}) if snap.exists else {}
+    except Exception:
+        return {}
+
+
+def _save_sync_state(client, folder: str, state: Dict[str, object]) -> None:
+    try:
+        client.collection(config.INBOX_SYNC_COLLECTION).document(_sync_state_doc_id(folder)).set(state)
+    except Exception as exc:
+        print(f"inbox sync state save failed: {exc}", file=sys.stderr)
+
+
+def _sync_start_uid(state: Dict[str, object], uid_validity: str, full_rescan: bool) -> Tuple[int, str]:
+    """First UID to search (0 = everything since `since`) and why."""
+    if full_rescan:
+        return 0, "full rescan requested"
+    if not state:
+        return 0, "full rescan: no sync state yet"
+    if not uid_validity or str(state.get("uidvalidity", "")) != uid_validity:
+        return 0, "full rescan: UIDVALIDITY changed"
+    try:
+        last_uid = int(state.get("last_uid") or 0)
+    except (TypeError, ValueError):
+        return 0, "full rescan: unreadable sync state"
+    return last_uid + 1, f"incremental: UIDs above {last_uid}"
+
+
+def _select_uids(uids: List[bytes], min_uid: int, max_messages: int) -> Tuple[List[bytes], Optional[int]]:
+    """UIDs to fetch this run, oldest first, and the UID the sync state may advance to.
+
+    Under `max_messages` an incremental run takes the oldest UIDs above the
+    mark, so the rest are picked up next run; a full rescan keeps the newest
+    and leaves the mark where it was (None), since the dropped older mail
+    must not end up behind it.
+    """
+    ordered = sorted((u for u in uids if u.isdigit()), key=int)
+    if max_messages and len(ordered) > max_messages:
+        if min_uid > 0:
+            ordered = ordered[:max_messages]
+        else:
+            return ordered[-max_messages:], None
+    return ordered, max((int(u) for u in ordered), default=max(min_uid - 1, 0))
+
+
 def _build_search_batches(since_yyyy_mm_dd: str) -> List[str]:
     """Return a list of X-GM-RAW queries that together cover all candidate mail.
 
@@ -338,7 +428,7 @@ def _fetch_headers(imap: imaplib.IMAP4_SSL, uids: List[bytes]) -> Dict[bytes, Di
         for item in data:
             if isinstance(item, tuple) and len(item) == 2:
                 meta, body = item
-                m = re.search(rb"UID (\d+)", meta or b"")
+                m = _IMAP_UID_RE.search(meta or b"")
                 if m:
                     current_uid = m.group(1)
                 try:
@@ -358,6 +448,31 @@ def _fetch_headers(imap: imaplib.IMAP4_SSL, uids: List[bytes]) -> Dict[bytes, Di
     return out
 
 
+# Unrolled "<tag ...>.*?</tag>": the same shortest match, but the engine jumps
+# between "<" characters instead of testing for the close tag at every offset
+# of a multi-KB inlined stylesheet.
+_HTML_DROP_BLOCK_RES = tuple(
+    re.compile(rf"<{tag}\b[^>]*>[^<]*(?:<(?!/{tag}>)[^<]*)*</{tag}>", re.IGNORECASE) for tag in ("style", "script", "head")
+)
+_HTML_COMMENT_RE = re.compile(r"<!--[^-]*(?:-(?!->)[^-]*)*-->")
+_HTML_BREAK_RE = re.compile(r"<(br|/p|/tr|/td|/li|/h\d)[^>]*>", re.IGNORECASE)
+_HTML_TAG_RE = re.compile(r"<[^>]+>")
+_HTML_ENTITY_RE = re.compile(r"&(?:#[0-9]+|#[xX][0-9a-fA-F]+|[A-Za-z][A-Za-z0-9]*);")
+_INLINE_SPACE_RE = re.compile(r"[ \t]+")
+_BLANK_LINES_RE = re.compile(r"\n[ \t]*\n+")
+# Entities the extraction patterns expect as plain ASCII (curly quotes would
+# break the [\w&'.\-] company/role character classes); everything else goes
+# through html.unescape.
+_ASCII_ENTITIES = {
+    "&nbsp;": " ", "&#160;": " ", "&#39;": "'", "&rsquo;": "'", "&lsquo;": "'", "&ldquo;": '"', "&rdquo;": '"',
+}
+
+
+def _decode_entity(match: "re.Match[str]") -> str:
+    entity = match.group(0)
+    return _ASCII_ENTITIES.get(entity) or html_lib.unescape(entity)
+
+
 def _strip_html(html: str) -> str:
     """Strip HTML to plain text, removing style/script/head content first.
 
@@ -369,27 +484,20 @@ def _strip_html(html: str) -> str:
         return ""
     h = html
     # Drop style, script, head — these never carry user-visible content
-    for tag in ("style", "script", "head"):
-        h = re.sub(rf"<{tag}\b[^>]*>.*?</{tag}>", " ", h, flags=re.IGNORECASE | re.DOTALL)
+    for block_re in _HTML_DROP_BLOCK_RES:
+        h = block_re.sub(" ", h)
     # Drop HTML comments (often contain CSS or tracking pixels)
-    h = re.sub(r"<!--.*?-->", " ", h, flags=re.DOTALL)
+    h = _HTML_COMMENT_RE.sub(" ", h)
     # Replace <br>, <p>, </p>, </tr>, </td> with newlines so paragraphs survive
-    h = re.sub(r"<(br|/p|/tr|/td|/li|/h\d)[^>]*>", "\n", h, flags=re.IGNORECASE)
+    h = _HTML_BREAK_RE.sub("\n", h)
     # Strip the rest of the tags
-    h = re.sub(r"<[^>]+>", " ", h)
-    # HTML entity decode (cheap)
-    h = (h.replace("&nbsp;", " ")
-           .replace("&amp;", "&")
-           .replace("&#39;", "'")
-           .replace("&rsquo;", "'")
-           .replace("&lsquo;", "'")
-           .replace("&ldquo;", '"')
-           .replace("&rdquo;", '"')
-           .replace("&mdash;", "—")
-           .replace("&ndash;", "–"))
+    h = _HTML_TAG_RE.sub(" ", h)
+    # HTML entity decode — one pass over the text
+    if "&" in h:
+        h = _HTML_ENTITY_RE.sub(_decode_entity, h)
     # Collapse whitespace, but keep newlines for paragraph boundaries
-    h = re.sub(r"[ \t]+", " ", h)
-    h = re.sub(r"\n[ \t]*\n+", "\n\n", h)
+    h = _INLINE_SPACE_RE.sub(" ", h)
+    h = _BLANK_LINES_RE.sub("\n\n", h)
     return h.strip()
 
 
@@ -437,22 +545,241 @@ def _fetch_body_text(imap: imaplib.IMAP4_SSL, uid: bytes) -> str:
                             text = decoded_text
                 except Exception:
                     pass
-            # Prefer text/plain when it has real content; otherwise strip HTML
-            if text and len(text.strip()) > 40:
-                return text[:20000]
-            if html:
-                stripped = _strip_html(html)
-                if stripped:
-                    return stripped[:20000]
-            if text:
-                return text[:20000]
+            return _choose_body_text(text, html)
+    return ""
+
+
+def _choose_body_text(text: str, html: str) -> str:
+    # Prefer text/plain when it has real content; otherwise strip HTML
+    if text and len(text.strip()) > 40:
+        return text[:20000]
+    if html:
+        stripped = _strip_html(html)
+        if stripped:
+            return stripped[:20000]
+    if text:
+        return text[:20000]
     return ""
 
 
+# ---------- Batched body fetch ----------
+#
+# `_fetch_body_text` downloads each whole message (attachments included) in
+# its own round-trip. The batched path asks for BODYSTRUCTURE of up to
+# INBOX_BODY_FETCH_BATCH messages in one command, picks the first text/plain
+# and text/html part of each (the parts `msg.walk()` would have used), and
+# fetches just those sections, capped at INBOX_BODY_MAX_BYTES, grouping
+# messages whose sections share a part number into one command.
+
+_IMAP_LITERAL_RE = re.compile(rb"\{(\d+)\}\r\n")
+_IMAP_UID_RE = re.compile(rb"UID (\d+)")
+_FETCH_SECTION_RE = re.compile(r"^BODY\[([0-9.]+)\]")
+_QP_PARTIAL_ESCAPE_RE = re.compile(rb"=[0-9A-Fa-f]?$")
+_BASE64_JUNK_RE = re.compile(rb"[^A-Za-z0-9+/=]")
+
+
+def _imap_response_bytes(data: List[object]) -> bytes:
+    """Reassemble imaplib FETCH data (bytes lines and (prefix, literal) tuples) into one stream."""
+    out: List[bytes] = []
+    after_literal = False
+    for item in data or []:
+        if isinstance(item, tuple) and len(item) == 2:
+            prefix, literal = item
+            if not after_literal and out:
+                out.append(b"\r\n")
+            out.extend((prefix or b"", b"\r\n", literal or b""))
+            after_literal = True
+        elif isinstance(item, bytes):
+            if not after_literal and out:
+                out.append(b"\r\n")
+            out.append(item)
+            after_literal = False
+    return b"".join(out)
+
+
+def _parse_imap_values(raw: bytes) -> List[object]:
+    """Parse IMAP response data into nested lists of bytes (atoms, strings, literals) and None (NIL)."""
+    stack: List[List[object]] = [[]]
+    pos, end = 0, len(raw)
+    while pos < end:
+        ch = raw[pos : pos + 1]
+        if ch in (b" ", b"\r", b"\n"):
+            pos += 1
+        elif ch == b"(":
+            stack.append([])
+            pos += 1
+        elif ch == b")":
+            pos += 1
+            if len(stack) > 1:
+                done = stack.pop()
+                stack[-1].append(done)
+        elif ch == b'"':
+            pos += 1
+            chunk = bytearray()
+            while pos < end and raw[pos : pos + 1] != b'"':
+                if raw[pos : pos + 1] == b"\\":
+                    pos += 1
+                chunk += raw[pos : pos + 1]
+                pos += 1
+            pos += 1
+            stack[-1].append(bytes(chunk))
+        elif ch == b"{" and _IMAP_LITERAL_RE.match(raw, pos):
+            m = _IMAP_LITERAL_RE.match(raw, pos)
+            size = int(m.group(1))
+            stack[-1].append(raw[m.end() : m.end() + size])
+            pos = m.end() + size
+        else:
+            start = pos
+            depth = 0
+            while pos < end:
+                ch = raw[pos : pos + 1]
+                if ch == b"[":
+                    depth += 1
+                elif ch == b"]":
+                    depth -= 1
+                elif depth <= 0 and ch in (b" ", b"(", b")", b"\r", b"\n"):
+                    break
+                pos += 1
+            atom = raw[start:pos]
+            stack[-1].append(None if atom.upper() == b"NIL" else atom)
+    while len(stack) > 1:  # unbalanced (truncated) response: keep what parsed
+        done = stack.pop()
+        stack[-1].append(done)
+    return stack[0]
+
+
+def _fetch_items(data: List[object]) -> List[Dict[str, object]]:
+    """One {ITEM: value} dict per message in a FETCH response."""
+    messages: List[Dict[str, object]] = []
+    for value in _parse_imap_values(_imap_response_bytes(data)):
+        if not isinstance(value, list):
+            continue
+        items: Dict[str, object] = {}
+        for key, item in zip(value[0::2], value[1::2]):
+            if isinstance(key, bytes):
+                items[key.decode("ascii", errors="replace").upper()] = item
+        messages.append(items)
+    return messages
+
+
+def _imap_str(value: object) -> str:
+    return value.decode("utf-8", errors="replace") if isinstance(value, bytes) else ""
+
+
+def _structure_text_parts(node: object, section: str = "") -> Iterator[Tuple[str, str, str, str]]:
+    """Yield (section, content_type, charset, transfer_encoding) for single parts, in walk order."""
+    if not isinstance(node, list) or not node:
+        return
+    if isinstance(node[0], list):  # multipart: child bodies, then the subtype
+        for idx, child in enumerate((c for c in node if isinstance(c, list)), start=1):
+            yield from _structure_text_parts(child, f"{section}.{idx}" if section else str(idx))
+        return
+    part = section or "1"
+    ctype = f"{_imap_str(node[0])}/{_imap_str(node[1] if len(node) > 1 else b'')}".lower()
+    charset = ""
+    params = node[2] if len(node) > 2 else None
+    if isinstance(params, list):
+        for key, value in zip(params[0::2], params[1::2]):
+            if _imap_str(key).lower() == "charset":
+                charset = _imap_str(value)
+    encoding = _imap_str(node[5] if len(node) > 5 else b"").lower()
+    yield part, ctype, charset, encoding
+    if ctype == "message/rfc822" and len(node) > 8 and isinstance(node[8], list):
+        nested = node[8]
+        yield from _structure_text_parts(nested, part if isinstance(nested[0], list) else f"{part}.1")
+
+
+def _decode_part(raw: bytes, encoding: str, charset: str) -> str:
+    if encoding == "base64":
+        compact = _BASE64_JUNK_RE.sub(b"", raw)
+        compact = compact[: len(compact) // 4 * 4]
+        try:
+            raw = base64.b64decode(compact)
+        except (binascii.Error, ValueError):
+            return ""
+    elif encoding == "quoted-printable":
+        raw = quopri.decodestring(_QP_PARTIAL_ESCAPE_RE.sub(b"", raw))
+    try:
+        return raw.decode(charset or "utf-8", errors="replace")
+    except LookupError:
+        return raw.decode("utf-8", errors="replace")
+
+
+def _fetch_body_texts(imap: imaplib.IMAP4_SSL, uids: List[bytes]) -> Tuple[Dict[bytes, str], int]:
+    """Body text for many UIDs, fetching only their text parts.
+
+    Returns ({uid: text}, IMAP commands issued). Messages whose structure
+    cannot be read fall back to `_fetch_body_text`.
+    """
+    bodies: Dict[bytes, str] = {}
+    commands = 0
+    cap = max(1, config.INBOX_BODY_MAX_BYTES)
+    batch_size = max(1, config.INBOX_BODY_FETCH_BATCH)
+    for start in range(0, len(uids), batch_size):
+        batch = uids[start : start + batch_size]
+        # uid -> (plain section, html section) with their charset/encoding
+        chosen: Dict[bytes, Dict[str, Tuple[str, str, str]]] = {}
+        commands += 1
+        try:
+            typ, data = imap.uid("FETCH", b",".join(batch), "(BODYSTRUCTURE)")
+        except imaplib.IMAP4.error:
+            typ, data = "NO", []
+        if typ == "OK":
+            for items in _fetch_items(data):
+                uid = items.get("UID")
+                if not isinstance(uid, bytes) or "BODYSTRUCTURE" not in items:
+                    continue
+                parts: Dict[str, Tuple[str, str, str]] = {}
+                for section, ctype, charset, encoding in _structure_text_parts(items["BODYSTRUCTURE"]):
+                    if ctype in ("text/plain", "text/html") and ctype not in parts:
+                        parts[ctype] = (section, charset, encoding)
+                chosen[uid] = parts
+
+        groups: Dict[Tuple[str, ...], List[bytes]] = {}
+        for uid in batch:
+            if uid not in chosen:
+                commands += 1
+                bodies[uid] = _fetch_body_text(imap, uid)
+            elif not chosen[uid]:
+                bodies[uid] = ""  # no text part at all (e.g. a bare PDF)
+            else:
+                sections = tuple(sorted(section for section, _, _ in chosen[uid].values()))
+                groups.setdefault(sections, []).append(uid)
+
+        for sections, group in groups.items():
+            fetch_spec = "(" + " ".join(f"BODY.PEEK[{section}]<0.{cap}>" for section in sections) + ")"
+            commands += 1
+            try:
+                typ, data = imap.uid("FETCH", b",".join(group), fetch_spec)
+            except imaplib.IMAP4.error:
+                typ, data = "NO", []
+            fetched: Dict[bytes, Dict[str, bytes]] = {}
+            if typ == "OK":
+                for items in _fetch_items(data):
+                    uid = items.get("UID")
+                    if not isinstance(uid, bytes):
+                        continue
+                    for key, value in items.items():
+                        m = _FETCH_SECTION_RE.match(key)
+                        if m and isinstance(value, bytes):
+                            fetched.setdefault(uid, {})[m.group(1)] = value
+            for uid in group:
+                texts = {"text/plain": "", "text/html": ""}
+                for ctype, (section, charset, encoding) in chosen[uid].items():
+                    raw = fetched.get(uid, {}).get(section)
+                    if raw:
+                        texts[ctype] = _decode_part(raw, encoding, charset)
+                bodies[uid] = _choose_body_text(texts["text/plain"], texts["text/html"])
+    return bodies, commands
+
+
 # ---------- Classification ----------
 
+_SENDER_DOMAIN_RE = re.compile(r"[\w.-]+@([\w.-]+)")
+
+
 def _sender_domain(sender_field: str) -> str:
-    m = re.search(r"[\w.-]+@([\w.-]+)", sender_field or "")
+    m = _SENDER_DOMAIN_RE.search(sender_field or "")
     return (m.group(1).lower() if m else "")
 
 
@@ -627,11 +954,14 @@ def _classify_by_rules(subject: str, body: str, sender: str = "") -> Tuple[str,
     return "noise", 0.0
 
 
+_URL_RE = re.compile(r"https?://[^\s)>\]\"']+")
+
+
 def _extract_job_url(body: str) -> str:
     """Pull the first plausible job-posting URL from the body."""
     if not body:
         return ""
-    urls = re.findall(r"https?://[^\s)>\]\"']+", body)
+    urls = _URL_RE.findall(body)
     for url in urls:
         u = url.lower()
         for marker in (
@@ -652,6 +982,8 @@ _STOP_WORDS = {
     "confirmed", "review", "and", "or", "of", "on", "we", "you", "are",
     "been", "team", "regarding", "update", "application", "thank", "thanks",
 }
+_WHITESPACE_RE = re.compile(r"\s+")
+_SENTENCE_BREAK_RE = re.compile(r"\.\s+(?=[A-Z])")
 
 
 def _clean_token_tail(text: str) -> str:
@@ -660,9 +992,9 @@ def _clean_token_tail(text: str) -> str:
     Also split on sentence boundaries ("Lendable. Unfortunately" -> "Lendable")
     while preserving inside-token periods like "Checkout.com".
     """
-    cleaned = re.sub(r"\s+", " ", (text or "")).strip(" -—|:;.,!?")
+    cleaned = _WHITESPACE_RE.sub(" ", (text or "")).strip(" -—|:;.,!?")
     # Split on ". <Capital>" (sentence boundary) — keep first chunk only
-    cleaned = re.split(r"\.\s+(?=[A-Z])", cleaned)[0]
+    cleaned = _SENTENCE_BREAK_RE.split(cleaned, 1)[0]
     # Drop trailing stop-words ("Hawk has been received" -> "Hawk")
     parts = cleaned.split(" ")
     while parts and parts[-1].lower().strip(".,;:!?") in _STOP_WORDS:
@@ -670,6 +1002,58 @@ def _clean_token_tail(text: str) -> str:
     return " ".join(parts).strip(" -—|:;.,!?")
 
 
+# Extraction patterns, compiled once at import rather than looked up in the
+# re module's cache on every call.
+_JOBSERVE_CODE_RE = re.compile(r"\bJS[-_ ]?([A-Z0-9 \-]+)$")
+_TO_JOIN_RE = re.compile(r"\bto\s+join\s+", re.IGNORECASE)
+_PRECISE_ROLE_WITH_RE = re.compile(r"(?:role|position|opportunity|opening)\s+(?:of|with|at)\s+(?:the\s+)?(?:[\w '&.\-]{1,80}?\s+)?(?:with|at|for)\s+([A-Z][\w&'.\-]+(?:\s+[A-Z][\w&'.\-]+){0,4})")
+_PRECISE_WITH_RE = re.compile(r"\bwith\s+([A-Z][\w&'.\-]+(?:\s+[A-Z][\w&'.\-]+){0,3})\s+(?:Global|Group|Limited|Ltd|UK)?")
+_INTERVIEW_JOB_AT_RE = re.compile(r"(?:interview|reminder)[^|]{0,40}for\s+(.+?)\s+(?:job|role|position)\s+at\s+([A-Z][\w&'.\-]+(?:\s+[A-Z][\w&'.\-]+){0,4})", re.IGNORECASE)
+_INTERVIEW_WITH_RE = re.compile(r"interview\s+with\s+([A-Z][\w&'.\-]+(?:\s+[A-Z][\w&'.\-]+){0,4})", re.IGNORECASE)
+_INTERVIEW_REMINDER_RE = re.compile(r"reminder[: ]+your upcoming interview with\s+([A-Z][\w&'.\-]+(?:\s+[A-Z][\w&'.\-]+){0,4})", re.IGNORECASE)
+_APPLICATION_AT_RE = re.compile(r"application (?:for|to)\s+(.+?)\s+at\s+([A-Z][\w&'.\-]+(?:\s+[A-Z][\w&'.\-]+){0,4})", re.IGNORECASE)
+_ROLE_AT_COMPANY_RE = re.compile(r"^([A-Z][^|:—\-]{2,80})\s+at\s+([A-Z][\w&'.\-]+(?:\s+[A-Z][\w&'.\-]+){0,4})")
+_APPLICATION_TO_RE = re.compile(r"(?:application (?:to|with)|applying (?:to|with))\s+([A-Z][\w&'.\-]+(?:\s+[A-Z][\w&'.\-]+){0,4})", re.IGNORECASE)
+_LINKEDIN_SENT_TO_RE = re.compile(r"your application was sent to\s+(.+?)(?:[:\-—|]|$)", re.IGNORECASE)
+_APPLICATION_FOR_RE = re.compile(r"application for\s+(.+?)(?:\s+at\s+|[:\-—|]|$)", re.IGNORECASE)
+_POSITION_WITH_RE = re.compile(r"in application for the position of\s+(.+?)\s+with\s+([A-Z][\w&'.\-]+(?:\s+[A-Z][\w&'.\-]+){0,4})", re.IGNORECASE)
+_AT_COMPANY_RE = re.compile(r"\bat\s+([A-Z][\w&'.\-]+(?:\s+[A-Z][\w&'.\-]+){0,3})\b")
+_BODY_ROLE_RES = tuple(re.compile(pattern, re.IGNORECASE) for pattern in (
+    r"\b(?:Position|Role|Job title|Job)\s*[:\-]\s*([^.\n\r<]{3,120})",
+    r"\bapplied (?:for|to) the\s+([^.\n\r<]{3,120}?)\s+(?:position|role|opportunity|opening)",
+    r"\bapplication (?:for|to)\s+the\s+([^.\n\r<]{3,120}?)\s+(?:position|role|opportunity|opening)",
+    r"\bthank you for applying (?:to|for) the\s+([^.\n\r<]{3,120}?)\s+(?:position|role|opportunity|opening)",
+    r"\byour application (?:for|to) (?:the )?([^.\n\r<]{3,120}?)\s+(?:position|role|opportunity|opening|at)",
+    r"\bfor the\s+([A-Z][^.\n\r<]{3,120}?)\s+(?:position|role|opportunity|opening)",
+    r"<title>([^<]{3,120})</title>",  # last-resort: HTML <title>
+))
+_BODY_COMPANY_RES = tuple(re.compile(pattern) for pattern in (
+    r"\b(?:Company|Employer|Organization|Organisation)\s*[:\-]\s*([^\n\r<]{2,80})",
+    r"applied (?:for|to) [^.<\n]{3,120} at\s+([A-Z][\w&'.\-]+(?:\s+[A-Z][\w&'.\-]+){0,4})",
+    r"position at\s+([A-Z][\w&'.\-]+(?:\s+[A-Z][\w&'.\-]+){0,4})",
+    r"role at\s+([A-Z][\w&'.\-]+(?:\s+[A-Z][\w&'.\-]+){0,4})",
+    r"team at\s+([A-Z][\w&'.\-]+(?:\s+[A-Z][\w&'.\-]+){0,4})",
+    r"opportunity at\s+([A-Z][\w&'.\-]+(?:\s+[A-Z][\w&'.\-]+){0,4})",
+))
+_BODY_INTEREST_RES = tuple(re.compile(pattern) for pattern in (
+    r"interest in\s+([A-Z][\w&'.\-]+(?:\s+[A-Z][\w&'.\-]+){0,4})",
+    r"appreciate your interest in\s+([A-Z][\w&'.\-]+(?:\s+[A-Z][\w&'.\-]+){0,4})",
+    r"applying (?:to|for) (?:the |a |an )?[\w &'.\-]{0,80}?(?:role|position|opportunity|opening|job)\s+(?:at|with)\s+([A-Z][\w&'.\-]+(?:\s+[A-Z][\w&'.\-]+){0,4})",
+    r"applied (?:to|for)\s+(?:the |a |an )?[\w &'.\-]{0,80}?(?:role|position|opportunity|opening|job)\s+(?:at|with)\s+([A-Z][\w&'.\-]+(?:\s+[A-Z][\w&'.\-]+){0,4})",
+    r"applying (?:to|for)\s+([A-Z][\w&'.\-]+(?:\s+[A-Z][\w&'.\-]+){0,4})",
+    r"Dear[\w \-,]{1,40}Thank you for applying to\s+([A-Z][\w&'.\-]+(?:\s+[A-Z][\w&'.\-]+){0,4})",
+    r"Thank you for applying to\s+([A-Z][\w&'.\-]+(?:\s+[A-Z][\w&'.\-]+){0,4})",
+))
+# Hashed into the "extract" classification version alongside the function source.
+_EXTRACTION_PATTERNS = (
+    _JOBSERVE_CODE_RE, _TO_JOIN_RE, _PRECISE_ROLE_WITH_RE, _PRECISE_WITH_RE, _INTERVIEW_JOB_AT_RE,
+    _INTERVIEW_WITH_RE, _INTERVIEW_REMINDER_RE, _APPLICATION_AT_RE, _ROLE_AT_COMPANY_RE, _APPLICATION_TO_RE,
+    _LINKEDIN_SENT_TO_RE, _APPLICATION_FOR_RE, _POSITION_WITH_RE, _AT_COMPANY_RE,
+    _BODY_ROLE_RES, _BODY_COMPANY_RES, _BODY_INTEREST_RES, _WHITESPACE_RE, _SENTENCE_BREAK_RE, _URL_RE,
+    _SENDER_DOMAIN_RE,
+)
+
+
 def _extract_company_role(subject: str, body: str, sender: str) -> Tuple[str, str]:
     """Best-effort company + role extraction from subject, body, sender."""
     s = subject or ""
@@ -680,7 +1064,7 @@ def _extract_company_role(subject: str, body: str, sender: str) -> Tuple[str, st
     # job code like "JS117867" or "JSPRODUCT ANALYST". Role text after JS- /
     # JS<digits> is the recoverable signal. Company stays "JobServe (recruiter)".
     if "jobserve.com" in (sender or "").lower() and "application confirmation" in s.lower():
-        m_js = re.search(r"\bJS[-_ ]?([A-Z0-9 \-]+)$", s)
+        m_js = _JOBSERVE_CODE_RE.search(s)
         if m_js:
             candidate = m_js.group(1).strip(" -_")
             # If it's pure digits it's just a job-ID; leave role empty
@@ -689,7 +1073,7 @@ def _extract_company_role(subject: str, body: str, sender: str) -> Tuple[str, st
         return "JobServe (recruiter)", role
 
     # 0b) Strip "join " when subject is "Thank you for your application to join X"
-    s_clean = re.sub(r"\bto\s+join\s+", "to ", s, flags=re.IGNORECASE)
+    s_clean = _TO_JOIN_RE.sub("to ", s)
     s = s_clean
 
     # 0b2) PrecisePlace / Precise Placements agency emails: the firm is in the
@@ -697,70 +1081,58 @@ def _extract_company_role(subject: str, body: str, sender: str) -> Tuple[str, st
     sender_lower = (sender or "").lower()
     if "preciseplace" in sender_lower or "precise placements" in (body or "").lower()[:1500]:
         b1 = (body or "")[:3000]
-        m_pp = re.search(
-            r"(?:role|position|opportunity|opening)\s+(?:of|with|at)\s+(?:the\s+)?(?:[\w '&.\-]{1,80}?\s+)?(?:with|at|for)\s+([A-Z][\w&'.\-]+(?:\s+[A-Z][\w&'.\-]+){0,4})",
-            b1,
-        )
+        m_pp = _PRECISE_ROLE_WITH_RE.search(b1)
         if m_pp:
             company = m_pp.group(1).strip()
         if not company:
-            m_with = re.search(r"\bwith\s+([A-Z][\w&'.\-]+(?:\s+[A-Z][\w&'.\-]+){0,3})\s+(?:Global|Group|Limited|Ltd|UK)?", b1)
+            m_with = _PRECISE_WITH_RE.search(b1)
             if m_with:
                 company = m_with.group(1).strip()
 
     # 0c) "Interview for <Role> job at <Company>" (Workable reminder) and
     # "Interview with <Company>" / "Reminder: Your Upcoming Interview with <Company>"
-    m_jat = re.search(r"(?:interview|reminder)[^|]{0,40}for\s+(.+?)\s+(?:job|role|position)\s+at\s+([A-Z][\w&'.\-]+(?:\s+[A-Z][\w&'.\-]+){0,4})", s, re.IGNORECASE)
+    m_jat = _INTERVIEW_JOB_AT_RE.search(s)
     if m_jat:
         role = role or m_jat.group(1).strip()
         company = company or m_jat.group(2).strip()
     if not company:
-        m_with = re.search(r"interview\s+with\s+([A-Z][\w&'.\-]+(?:\s+[A-Z][\w&'.\-]+){0,4})", s, re.IGNORECASE)
+        m_with = _INTERVIEW_WITH_RE.search(s)
         if m_with:
             company = m_with.group(1).strip()
     if not company:
-        m_rem = re.search(r"reminder[: ]+your upcoming interview with\s+([A-Z][\w&'.\-]+(?:\s+[A-Z][\w&'.\-]+){0,4})", s, re.IGNORECASE)
+        m_rem = _INTERVIEW_REMINDER_RE.search(s)
         if m_rem:
             company = m_rem.group(1).strip()
 
     # 1) Strong subject patterns — bounded, NOT greedy.
     # "Your application for <Role> at <Company>" / "...has been received"
-    m = re.search(
-        r"application (?:for|to)\s+(.+?)\s+at\s+([A-Z][\w&'.\-]+(?:\s+[A-Z][\w&'.\-]+){0,4})",
-        s, re.IGNORECASE,
-    )
+    m = _APPLICATION_AT_RE.search(s)
     if m:
         role = role or m.group(1).strip()
         company = company or m.group(2).strip()
 
     # "<Role> at <Company> — has been received" style
     if not company:
-        m2 = re.search(
-            r"^([A-Z][^|:—\-]{2,80})\s+at\s+([A-Z][\w&'.\-]+(?:\s+[A-Z][\w&'.\-]+){0,4})",
-            s,
-        )
+        m2 = _ROLE_AT_COMPANY_RE.search(s)
         if m2:
             role = role or m2.group(1).strip()
             company = m2.group(2).strip()
 
     # "Your application to <Company> ..." — company is single proper-noun phrase
     if not company:
-        m3 = re.search(
-            r"(?:application (?:to|with)|applying (?:to|with))\s+([A-Z][\w&'.\-]+(?:\s+[A-Z][\w&'.\-]+){0,4})",
-            s, re.IGNORECASE,
-        )
+        m3 = _APPLICATION_TO_RE.search(s)
         if m3:
             company = m3.group(1).strip()
 
     # LinkedIn: "Your application was sent to <Company>"
     if not company:
-        m4 = re.search(r"your application was sent to\s+(.+?)(?:[:\-—|]|$)", s, re.IGNORECASE)
+        m4 = _LINKEDIN_SENT_TO_RE.search(s)
         if m4:
             company = m4.group(1).strip()
 
     # "Update on your application for <Role>" / "Update on your application" (rejection)
     if not role:
-        m5 = re.search(r"application for\s+(.+?)(?:\s+at\s+|[:\-—|]|$)", s, re.IGNORECASE)
+        m5 = _APPLICATION_FOR_RE.search(s)
         if m5:
             role = m5.group(1).strip()
 
@@ -768,10 +1140,7 @@ def _extract_company_role(subject: str, body: str, sender: str) -> Tuple[str, st
     #     "in application for the position of <Role> with <Company>"
     if not role or not company:
         b = body[:4000] if body else ""
-        m_pos = re.search(
-            r"in application for the position of\s+(.+?)\s+with\s+([A-Z][\w&'.\-]+(?:\s+[A-Z][\w&'.\-]+){0,4})",
-            b, re.IGNORECASE,
-        )
+        m_pos = _POSITION_WITH_RE.search(b)
         if m_pos:
             if not role:
                 role = m_pos.group(1).strip()
@@ -784,16 +1153,8 @@ def _extract_company_role(subject: str, body: str, sender: str) -> Tuple[str, st
     # support from the other te...").
     if not role and body:
         b = body[:4000]
-        for pattern in (
-            r"\b(?:Position|Role|Job title|Job)\s*[:\-]\s*([^.\n\r<]{3,120})",
-            r"\bapplied (?:for|to) the\s+([^.\n\r<]{3,120}?)\s+(?:position|role|opportunity|opening)",
-            r"\bapplication (?:for|to)\s+the\s+([^.\n\r<]{3,120}?)\s+(?:position|role|opportunity|opening)",
-            r"\bthank you for applying (?:to|for) the\s+([^.\n\r<]{3,120}?)\s+(?:position|role|opportunity|opening)",
-            r"\byour application (?:for|to) (?:the )?([^.\n\r<]{3,120}?)\s+(?:position|role|opportunity|opening|at)",
-            r"\bfor the\s+([A-Z][^.\n\r<]{3,120}?)\s+(?:position|role|opportunity|opening)",
-            r"<title>([^<]{3,120})</title>",  # last-resort: HTML <title>
-        ):
-            m6 = re.search(pattern, b, re.IGNORECASE)
+        for pattern in _BODY_ROLE_RES:
+            m6 = pattern.search(b)
             if m6:
                 candidate = m6.group(1).strip()
                 # Reject candidates that look like sentence fragments
@@ -808,15 +1169,8 @@ def _extract_company_role(subject: str, body: str, sender: str) -> Tuple[str, st
     # 3) Body fallback for company — structured fields or "at <Company>"
     if not company and body:
         b = body[:4000]
-        for pattern in (
-            r"\b(?:Company|Employer|Organization|Organisation)\s*[:\-]\s*([^\n\r<]{2,80})",
-            r"applied (?:for|to) [^.<\n]{3,120} at\s+([A-Z][\w&'.\-]+(?:\s+[A-Z][\w&'.\-]+){0,4})",
-            r"position at\s+([A-Z][\w&'.\-]+(?:\s+[A-Z][\w&'.\-]+){0,4})",
-            r"role at\s+([A-Z][\w&'.\-]+(?:\s+[A-Z][\w&'.\-]+){0,4})",
-            r"team at\s+([A-Z][\w&'.\-]+(?:\s+[A-Z][\w&'.\-]+){0,4})",
-            r"opportunity at\s+([A-Z][\w&'.\-]+(?:\s+[A-Z][\w&'.\-]+){0,4})",
-        ):
-            m7 = re.search(pattern, b)
+        for pattern in _BODY_COMPANY_RES:
+            m7 = pattern.search(b)
             if m7:
                 company = m7.group(1).strip()
                 break
@@ -824,16 +1178,8 @@ def _extract_company_role(subject: str, body: str, sender: str) -> Tuple[str, st
     # 3b) Greenhouse/Workday body fallback: "applying for/to <Company>" / "interest in <Company>"
     if not company and body:
         b = body[:6000]
-        for pattern in (
-            r"interest in\s+([A-Z][\w&'.\-]+(?:\s+[A-Z][\w&'.\-]+){0,4})",
-            r"appreciate your interest in\s+([A-Z][\w&'.\-]+(?:\s+[A-Z][\w&'.\-]+){0,4})",
-            r"applying (?:to|for) (?:the |a |an )?[\w &'.\-]{0,80}?(?:role|position|opportunity|opening|job)\s+(?:at|with)\s+([A-Z][\w&'.\-]+(?:\s+[A-Z][\w&'.\-]+){0,4})",
-            r"applied (?:to|for)\s+(?:the |a |an )?[\w &'.\-]{0,80}?(?:role|position|opportunity|opening|job)\s+(?:at|with)\s+([A-Z][\w&'.\-]+(?:\s+[A-Z][\w&'.\-]+){0,4})",
-            r"applying (?:to|for)\s+([A-Z][\w&'.\-]+(?:\s+[A-Z][\w&'.\-]+){0,4})",
-            r"Dear[\w \-,]{1,40}Thank you for applying to\s+([A-Z][\w&'.\-]+(?:\s+[A-Z][\w&'.\-]+){0,4})",
-            r"Thank you for applying to\s+([A-Z][\w&'.\-]+(?:\s+[A-Z][\w&'.\-]+){0,4})",
-        ):
-            m_b = re.search(pattern, b)
+        for pattern in _BODY_INTEREST_RES:
+            m_b = pattern.search(b)
             if m_b:
                 candidate = m_b.group(1).strip()
                 # Reject obvious noise tokens
@@ -867,7 +1213,7 @@ def _extract_company_role(subject: str, body: str, sender: str) -> Tuple[str, st
             if domain.endswith("workablemail.com") or "inbound" in domain.split(".")[:1]:
                 # Try one more body pattern: "at <Company>" near the end
                 if body:
-                    m_at = re.search(r"\bat\s+([A-Z][\w&'.\-]+(?:\s+[A-Z][\w&'.\-]+){0,3})\b", body[:2000])
+                    m_at = _AT_COMPANY_RE.search(body[:2000])
                     if m_at:
                         company = m_at.group(1).strip()
             # generic corporate domain fallback (e.g. careers@monzo.com)
@@ -942,6 +1288,196 @@ def _should_call_llm(
     return False
 
 
+# ---------- Classification cache ----------
+#
+# One entry per Message-ID: {"input": digest of sender/subject/body, "rules":
+# ..., "extract": ..., "llm": ...}. Each component carries the hash of the
+# functions and vocabularies that produced it, so editing, say, the rejection
+# phrases recomputes only "rules" while the stored LLM answer is reused.
+
+INBOX_CLASSIFICATION_CACHE = JsonTtlCache(
+    config.INBOX_CLASSIFICATION_CACHE_PATH, config.INBOX_CLASSIFICATION_CACHE_DAYS
+)
+
+
+def _source_hash(*parts: object) -> str:
+    digest = hashlib.sha256()
+    for part in parts:
+        if callable(part):
+            try:
+                text = inspect.getsource(part)
+            except (OSError, TypeError):
+                text = getattr(part, "__qualname__", repr(part))
+        else:
+            text = json.dumps(part, sort_keys=True, default=str)
+        digest.update(text.encode("utf-8"))
+        digest.update(b"\0")
+    return digest.hexdigest()[:16]
+
+
+@lru_cache(maxsize=1)
+def _classification_versions() -> Dict[str, str]:
+    return {
+        "rules": _source_hash(
+            _classify_by_rules, _is_noise, NOISE_SUBJECT_PATTERNS, NOISE_SENDER_PATTERNS, RECRUITER_SENDER_HINTS,
+        ),
+        "extract": _source_hash(
+            _extract_company_role, _clean_token_tail, _STOP_WORDS, _extract_job_url, _sender_domain,
+            ATS_SENDER_DOMAINS, _EXTRACTION_PATTERNS,
+        ),
+        "llm": _source_hash(_llm_classify, config.OPENROUTER_MODEL),
+    }
+
+
+def _load_classification(msg_id: str, subject: str, body: str, sender: str) -> Optional[Dict[str, object]]:
+    """Cached components for this message, or a fresh entry; None when it cannot be cached."""
+    if not config.INBOX_CLASSIFICATION_CACHE_ENABLED or not msg_id or msg_id.startswith("uid:"):
+        return None  # UIDs are only stable per UIDVALIDITY; only cache real Message-IDs
+    digest = hashlib.sha256(f"{sender}\0{subject}\0{body}".encode("utf-8")).hexdigest()[:16]
+    entry = INBOX_CLASSIFICATION_CACHE.get(msg_id) or {}
+    if entry.get("input") != digest:
+        entry = {"input": digest}
+    return entry
+
+
+def _cached_component(entry: Optional[Dict[str, object]], name: str, compute) -> Tuple[object, bool]:
+    """(value, from_cache). A None result (failed LLM call) is returned but not stored."""
+    version = _classification_versions()[name]
+    part = entry.get(name) if entry is not None else None
+    if isinstance(part, dict) and part.get("v") == version:
+        return part.get("value"), True
+    value = compute()
+    if entry is not None and value is not None:
+        entry[name] = {"v": version, "value": value}
+    return value, False
+
+
+def _store_classification(msg_id: str, entry: Optional[Dict[str, object]]) -> None:
+    if entry is not None:
+        INBOX_CLASSIFICATION_CACHE.put(msg_id, entry)
+
+
+# ---------- Triage ----------
+
+@dataclass
+class _Triage:
+    """One relevant message on its way to an Event: rules first, LLM later."""
+    uid: bytes
+    hdrs: Dict[str, str]
+    msg_id: str
+    subject: str
+    sender: str
+    body: str
+    cached: Optional[Dict[str, object]]
+    rule_type: str
+    rule_conf: float
+    company: str
+    role: str
+    job_url: str
+    needs_llm: bool
+    rules_hit: bool = False
+    extract_hit: bool = False
+    llm: Optional[Dict[str, object]] = None
+    llm_hit: bool = False
+
+
+def _triage_message(uid: bytes, hdrs: Dict[str, str], body: str) -> _Triage:
+    subject = hdrs.get("subject", "")
+    sender = hdrs.get("from", "")
+    msg_id = hdrs.get("message_id") or f"uid:{uid.decode()}"
+    cached = _load_classification(msg_id, subject, body, sender)
+    (rule_type, rule_conf), rules_hit = _cached_component(
+        cached, "rules", lambda: list(_classify_by_rules(subject, body, sender))
+    )
+    (company, role, job_url), extract_hit = _cached_component(
+        cached, "extract", lambda: [*_extract_company_role(subject, body, sender), _extract_job_url(body)]
+    )
+    return _Triage(
+        uid=uid, hdrs=hdrs, msg_id=msg_id, subject=subject, sender=sender, body=body, cached=cached,
+        rule_type=rule_type, rule_conf=rule_conf, company=company, role=role, job_url=job_url,
+        needs_llm=_should_call_llm(rule_type, rule_conf, subject, body, company, role),
+        rules_hit=rules_hit, extract_hit=extract_hit,
+    )
+
+
+def _run_llm_triage(pending: List[_Triage]) -> None:
+    """Classify every LLM candidate on a bounded pool; the OpenRouter token
+    bucket paces the actual requests, and answers are stored back per item."""
+    if not pending:
+        return
+
+    def classify(item: _Triage) -> Tuple[object, bool]:
+        return _cached_component(
+            item.cached, "llm", lambda: _llm_classify(item.subject, item.body, item.sender)
+        )
+
+    workers = max(1, min(config.INBOX_LLM_WORKERS, len(pending)))
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        for item, (llm, hit) in zip(pending, pool.map(classify, pending)):
+            item.llm = llm if isinstance(llm, dict) else None
+            item.llm_hit = hit
+
+
+def _event_from_triage(item: _Triage) -> Optional[Event]:
+    """Merge rules and LLM answers into an Event; None for noise."""
+    rule_type, rule_conf = item.rule_type, item.rule_conf
+    company, role = item.company, item.role
+    ev_type = rule_type
+    ev_conf = rule_conf
+    detection_source = "rules"
+    llm = item.llm
+    if item.needs_llm and llm:
+        # If rules already produced a confident type, keep it but
+        # use LLM only for company/role enrichment. Otherwise let
+        # LLM drive the classification too.
+        if rule_type in {"application_confirmation", "rejection", "interview_invite"} and rule_conf >= 0.9:
+            detection_source = "rules+llm"
+        else:
+            detection_source = "llm"
+            ev_type = llm["event_type"]
+            ev_conf = max(rule_conf, float(llm["confidence"]))
+        llm_company = llm.get("company", "").strip()
+        llm_role = llm.get("role", "").strip()
+        # Reject LLM dupes (Hawk/Hawk problem) and "the company"
+        # type non-answers.
+        if llm_company and llm_role and llm_company.lower() == llm_role.lower():
+            llm_role = ""
+        if llm_company and not company:
+            company = llm_company
+        if llm_role and not role and llm_role.lower() != (company or "").lower():
+            role = llm_role
+
+    # Final guard: company should never equal role
+    if company and role and company.lower() == role.lower():
+        role = ""
+
+    if ev_type == "noise":
+        return None
+
+    # Classify interview stage when applicable — used to set
+    # interview_stage_reached on the matched job doc downstream.
+    interview_stage = ""
+    if ev_type == "interview_invite":
+        interview_stage = _classify_interview_stage(item.subject, item.body)
+
+    domain = _sender_domain(item.sender)
+    return Event(
+        message_id=item.msg_id,
+        received_at=_parse_received_iso(item.hdrs.get("date", "")),
+        event_type=ev_type,
+        confidence=ev_conf,
+        company=company,
+        role=role,
+        job_url=item.job_url,
+        ats_family=_ats_family_from_domain(domain),
+        sender=item.sender,
+        subject_redacted=_redact_subject(item.subject),
+        detection_source=detection_source,
+        body_snippet=(item.body or "")[:400].replace("\r", " ").replace("\n", " "),
+        interview_stage=interview_stage,
+    )
+
+
 # ---------- Reconciliation against existing jobs ----------
 
 _TOKEN_RE = re.compile(r"[A-Za-z0-9]+")
@@ -957,36 +1493,250 @@ def _jaccard(a: set, b: set) -> float:
     return len(a & b) / max(1, len(a | b))
 
 
+_COMPANY_SUFFIX_RE = re.compile(
+    r"\b(ltd|limited|inc|llc|plc|gmbh|ag|bv|nv|sa|sas|group|holdings|holding|global|international|the)\b"
+)
+_NON_ALNUM_RE = re.compile(r"[^a-z0-9]+")
+
+
 def _norm_company(c: str) -> str:
     s = (c or "").lower()
-    s = re.sub(r"\b(ltd|limited|inc|llc|plc|gmbh|ag|bv|nv|sa|sas|group|holdings|holding|global|international|the)\b", "", s)
-    s = re.sub(r"[^a-z0-9]+", " ", s).strip()
+    s = _COMPANY_SUFFIX_RE.sub("", s)
+    s = _NON_ALNUM_RE.sub(" ", s).strip()
     return COMPANY_ALIASES.get(s, s)
 
 
-def _load_jobs_index(client) -> List[Dict[str, object]]:
-    """Pull a minimal index from Firestore: {id, company, role, link,
-    application_status, application_date}."""
-    rows: List[Dict[str, object]] = []
+_INDEX_FIELDS = ("company", "role", "link", "application_status", "application_date")
+_INDEX_STATE_VERSION = 1
+_LINK_TOKEN_RE = re.compile(r"[a-z0-9]+")
+_LINK_DIGITS_RE = re.compile(r"\d{4,}")
+_REQ_ID_RE = re.compile(r"(?:job/|/jobs/|/view/|/openings/|requisition[/=])(\d{4,})")
+# Digit runs up to this length are indexed by every substring of 4+ digits
+# (so a requisition id found anywhere inside them hits); longer runs are rare
+# enough to just check on every req-id lookup.
+_MAX_INDEXED_DIGIT_RUN = 24
+
+
+def _interior_tokens(text: str) -> List[str]:
+    """Alphanumeric runs of `text` with a separator on both sides.
+
+    Wherever `text` occurs inside a longer string, each of these is a whole
+    token of that string too; the runs touching either end may not be.
+    """
+    return [m.group(0) for m in _LINK_TOKEN_RE.finditer(text) if m.start() > 0 and m.end() < len(text)]
+
+
+class JobsIndex:
+    """Reconciliation view of the jobs collection.
+
+    Replaces per-event linear scans with lookups: link tokens and
+    requisition-id digits for the link match, normalised company (with each
+    row's role tokens precomputed) for the fuzzy match, and application day
+    for the JobServe date match. Lookups only narrow the rows; every
+    candidate is still checked with the original predicate, and rows keep
+    Firestore's stream order (document id) so results come back in the same
+    order the linear scans produced.
+    """
+
+    def __init__(self, rows: Iterable[Dict[str, object]], refresh: str = "") -> None:
+        self.rows: List[Dict[str, object]] = sorted(rows, key=lambda row: str(row["id"]))
+        self.by_id: Dict[str, Dict[str, object]] = {str(row["id"]): row for row in self.rows}
+        self.refresh = refresh
+        self._links: List[str] = []
+        self._link_tokens: Dict[str, List[int]] = {}
+        self._link_keys: Dict[str, List[int]] = {}
+        self._unkeyed_links: List[int] = []
+        self._req_digits: Dict[str, List[int]] = {}
+        self._long_digit_links: List[int] = []
+        self._companies: Dict[str, List[Tuple[int, set]]] = {}
+        self._applied_by_day: Dict[date, List[int]] = {}
+        for pos, row in enumerate(self.rows):
+            link = str(row.get("link") or "").lower()
+            self._links.append(link)
+            if link:
+                self._index_link(pos, link)
+            company = _norm_company(str(row.get("company") or ""))
+            if company:
+                self._companies.setdefault(company, []).append((pos, _tokens(str(row.get("role") or ""))))
+            if str(row.get("application_status") or "").lower() == "applied":
+                app_iso = str(row.get("application_date") or "")[:10]
+                try:
+                    self._applied_by_day.setdefault(datetime.fromisoformat(app_iso).date(), []).append(pos)
+                except ValueError:
+                    pass
+
+    def _index_link(self, pos: int, link: str) -> None:
+        for token in set(_LINK_TOKEN_RE.findall(link)):
+            self._link_tokens.setdefault(token, []).append(pos)
+        interior = _interior_tokens(link)
+        if interior:
+            self._link_keys.setdefault(max(interior, key=len), []).append(pos)
+        else:
+            self._unkeyed_links.append(pos)
+        digits: set = set()
+        for run in _LINK_DIGITS_RE.findall(link):
+            if len(run) > _MAX_INDEXED_DIGIT_RUN:
+                self._long_digit_links.append(pos)
+                continue
+            for size in range(4, len(run) + 1):
+                digits.update(run[start : start + size] for start in range(len(run) - size + 1))
+        for run in digits:
+            self._req_digits.setdefault(run, []).append(pos)
+
+    def __len__(self) -> int:
+        return len(self.rows)
+
+    def __iter__(self) -> Iterator[Dict[str, object]]:
+        return iter(self.rows)
+
+    def link_matches(self, url_l: str, req_id: str) -> List[str]:
+        """Ids of rows whose link contains, or is contained in, `url_l`, or contains `req_id`."""
+        positions = set(self._unkeyed_links)
+        interior = _interior_tokens(url_l)
+        if interior:
+            # url_l inside a link: its interior tokens are whole tokens of that link.
+            positions.update(min((self._link_tokens.get(token, []) for token in interior), key=len))
+        else:
+            positions.update(range(len(self.rows)))
+        # A link inside url_l: the link's key token is a whole token of url_l.
+        for token in set(_LINK_TOKEN_RE.findall(url_l)):
+            positions.update(self._link_keys.get(token, ()))
+        if req_id:
+            positions.update(self._req_digits.get(req_id, ()))
+            positions.update(self._long_digit_links)
+        matches: List[str] = []
+        for pos in sorted(positions):
+            link = self._links[pos]
+            if not link:
+                continue
+            if url_l in link or link in url_l or (req_id and req_id in link):
+                matches.append(self.rows[pos]["id"])
+        return matches
+
+    def company_rows(self, company_norm: str) -> List[Tuple[Dict[str, object], set]]:
+        """Rows whose normalised company equals, contains or is contained in `company_norm`."""
+        if not company_norm:
+            return []
+        hits: List[Tuple[int, set]] = []
+        for company, entries in self._companies.items():
+            if company == company_norm or company in company_norm or company_norm in company:
+                hits.extend(entries)
+        hits.sort(key=lambda entry: entry[0])
+        return [(self.rows[pos], role_tokens) for pos, role_tokens in hits]
+
+    def applied_near(self, day: date) -> List[Dict[str, object]]:
+        """`applied` rows whose application_date is within one day of `day`."""
+        positions: List[int] = []
+        for offset in (-1, 0, 1):
+            positions.extend(self._applied_by_day.get(day + timedelta(days=offset), ()))
+        return [self.rows[pos] for pos in sorted(positions)]
+
+
+def _index_row(doc_id: str, d: Dict[str, object]) -> Dict[str, object]:
+    return {
+        "id": doc_id,
+        "company": d.get("company") or "",
+        "role": d.get("role") or "",
+        "link": d.get("link") or "",
+        "application_status": (d.get("application_status") or "").lower(),
+        "application_date": d.get("application_date") or "",
+    }
+
+
+def _read_jobs_index_state() -> Dict[str, object]:
+    try:
+        state = json.loads(config.INBOX_JOBS_INDEX_PATH.read_text(encoding="utf-8"))
+    except Exception:
+        return {}
+    if not isinstance(state, dict) or state.get("version") != _INDEX_STATE_VERSION:
+        return {}
+    if not isinstance(state.get("rows"), dict):
+        return {}
+    return state
+
+
+def _index_cursor(max_updated_at: str) -> str:
+    """`updated_at` lower bound for the next incremental refresh.
+
+    Writers disagree on the format ("...+00:00", "...000Z", bare dates), so
+    the cursor is the day before the newest value seen: any of those formats
+    written since then still compares >= it as a string.
+    """
+    try:
+        newest = datetime.fromisoformat(max_updated_at.replace("Z", "+00:00"))
+    except ValueError:
+        return ""
+    return (newest - timedelta(days=1)).date().isoformat()
+
+
+def _load_jobs_index(client) -> JobsIndex:
+    """Index the jobs collection for reconciliation: {id, company, role, link,
+    application_status, application_date} per doc.
+
+    The rows and an `updated_at` cursor persist at INBOX_JOBS_INDEX_PATH, so
+    a run streams only the docs updated since the last one (projected to the
+    indexed fields). Docs written without `updated_at` are picked up by the
+    full reload every INBOX_JOBS_INDEX_FULL_REFRESH_DAYS.
+    """
     if client is None:
-        return rows
+        return JobsIndex([])
+    state = _read_jobs_index_state() if config.INBOX_JOBS_INDEX_ENABLED else {}
+    rows: Dict[str, Dict[str, object]] = dict(state.get("rows") or {})
+    now = datetime.now(timezone.utc)
     try:
-        for snap in client.collection(config.FIREBASE_COLLECTION).stream():
+        full_at = datetime.fromisoformat(str(state.get("full_refreshed_at", "")))
+    except ValueError:
+        full_at = None
+    cursor = str(state.get("cursor") or "")
+    incremental = bool(
+        rows
+        and cursor
+        and full_at is not None
+        and now - full_at < timedelta(days=config.INBOX_JOBS_INDEX_FULL_REFRESH_DAYS)
+    )
+    max_updated_at = str(state.get("max_updated_at") or "") if incremental else ""
+    fetched: Dict[str, Dict[str, object]] = {}
+    complete = False
+    try:
+        query = client.collection(config.FIREBASE_COLLECTION)
+        if incremental:
+            query = query.where(filter=FieldFilter("updated_at", ">=", cursor))
+        for snap in query.select(list(_INDEX_FIELDS) + ["updated_at"]).stream():
             d = snap.to_dict() or {}
-            rows.append({
-                "id": snap.id,
-                "company": d.get("company") or "",
-                "role": d.get("role") or "",
-                "link": d.get("link") or "",
-                "application_status": (d.get("application_status") or "").lower(),
-                "application_date": d.get("application_date") or "",
-            })
+            fetched[snap.id] = _index_row(snap.id, d)
+            updated_at = d.get("updated_at")
+            if isinstance(updated_at, str) and updated_at > max_updated_at:
+                max_updated_at = updated_at
+        complete = True
     except Exception as exc:
         print(f"Job index load failed: {exc}", file=sys.stderr)
-    return rows
+
+    if incremental:
+        rows.update(fetched)
+        refresh = f"incremental: {len(fetched)} docs updated since {cursor}"
+    elif complete:
+        rows = fetched
+        refresh = "full reload"
+    else:
+        rows.update(fetched)
+        refresh = "full reload failed; cached rows kept"
+
+    if complete and config.INBOX_JOBS_INDEX_ENABLED:
+        new_state = {
+            "version": _INDEX_STATE_VERSION,
+            "cursor": _index_cursor(max_updated_at),
+            "max_updated_at": max_updated_at,
+            "full_refreshed_at": str(state.get("full_refreshed_at")) if incremental else now.isoformat(),
+            "rows": rows,
+        }
+        try:
+            config.INBOX_JOBS_INDEX_PATH.write_text(json.dumps(new_state, ensure_ascii=False), encoding="utf-8")
+        except Exception as exc:
+            print(f"Job index save failed: {exc}", file=sys.stderr)
+    return JobsIndex(rows.values(), refresh=refresh)
 
 
-def _reconcile_jobserve_by_date(event: Event, jobs_index: List[Dict[str, object]]) -> bool:
+def _reconcile_jobserve_by_date(event: Event, jobs_index: JobsIndex) -> bool:
     """JobServe confirmations have empty bodies — the actual hiring firm is in
     the JobServe portal, not the email. Recover by matching against Firestore
     `applied` docs with application_date within ±1 day of the event.
@@ -1002,19 +1752,7 @@ def _reconcile_jobserve_by_date(event: Event, jobs_index: List[Dict[str, object]
         ev_date = datetime.fromisoformat(ev_date_iso).date()
     except Exception:
         return False
-    same_day: List[Dict[str, object]] = []
-    for row in jobs_index:
-        if (row.get("application_status") or "").lower() != "applied":
-            continue
-        app_iso = str(row.get("application_date") or "")[:10]
-        if not app_iso:
-            continue
-        try:
-            app_date = datetime.fromisoformat(app_iso).date()
-        except Exception:
-            continue
-        if abs((app_date - ev_date).days) <= 1:
-            same_day.append(row)
+    same_day = jobs_index.applied_near(ev_date)
     if len(same_day) == 1:
         event.matched_job_id = str(same_day[0]["id"])
         event.match_status = "matched"
@@ -1032,7 +1770,7 @@ def _reconcile_jobserve_by_date(event: Event, jobs_index: List[Dict[str, object]
     return False
 
 
-def _reconcile(event: Event, jobs_index: List[Dict[str, object]]) -> None:
+def _reconcile(event: Event, jobs_index: JobsIndex) -> None:
     """Set matched_job_id / match_status / candidate_doc_ids on the event in place."""
     if not jobs_index:
         return
@@ -1045,18 +1783,10 @@ def _reconcile(event: Event, jobs_index: List[Dict[str, object]]) -> None:
     if event.job_url:
         url_l = event.job_url.lower()
         # try last numeric path segment as req id
-        req_id_match = re.search(r"(?:job/|/jobs/|/view/|/openings/|requisition[/=])(\d{4,})", url_l)
+        req_id_match = _REQ_ID_RE.search(url_l)
         req_id = req_id_match.group(1) if req_id_match else ""
 
-        link_matches = []
-        for row in jobs_index:
-            link = (row["link"] or "").lower()
-            if not link:
-                continue
-            if url_l in link or link in url_l:
-                link_matches.append(row["id"])
-            elif req_id and req_id in link:
-                link_matches.append(row["id"])
+        link_matches = jobs_index.link_matches(url_l, req_id)
         if len(link_matches) == 1:
             event.matched_job_id = link_matches[0]
             event.match_status = "matched"
@@ -1074,17 +1804,13 @@ def _reconcile(event: Event, jobs_index: List[Dict[str, object]]) -> None:
     company_norm = _norm_company(event.company)
     candidates: List[Tuple[str, float]] = []
     role_tokens = _tokens(event.role)
-    for row in jobs_index:
-        rc = _norm_company(row["company"])
-        if not rc or not company_norm:
-            continue
-        # company match: either equal-after-norm or one contains the other
-        if rc == company_norm or rc in company_norm or company_norm in rc:
-            jac = _jaccard(role_tokens, _tokens(row["role"]))
-            # If no role on event, still allow but lower the cap
-            score = jac if role_tokens else 0.5
-            if score >= 0.6 or (not role_tokens and score >= 0.5):
-                candidates.append((row["id"], score))
+    # company match: either equal-after-norm or one contains the other
+    for row, row_role_tokens in jobs_index.company_rows(company_norm):
+        jac = _jaccard(role_tokens, row_role_tokens)
+        # If no role on event, still allow but lower the cap
+        score = jac if role_tokens else 0.5
+        if score >= 0.6 or (not role_tokens and score >= 0.5):
+            candidates.append((row["id"], score))
 
     if not candidates:
         event.match_status = "no_match"
@@ -1103,8 +1829,12 @@ def _reconcile(event: Event, jobs_index: List[Dict[str, object]]) -> None:
 _TERMINAL_STATUSES = {"applied", "interview", "offer", "rejected"}
 
 
-def _write_events(client, events: List[Event], dry_run: bool, changes: List[ChangeRecord]) -> int:
-    """Write events to Firestore; append new-event ChangeRecords to `changes`."""
+def _write_events(client, events: List[Event], dry_run: bool, changes: List[ChangeRecord],
+                  failures: Optional[List[str]] = None) -> int:
+    """Write events to Firestore; append new-event ChangeRecords to `changes`.
+
+    Doc ids whose write raised are appended to `failures`.
+    """
     if dry_run or client is None:
         return 0
     written = 0
@@ -1134,6 +1864,8 @@ def _write_events(client, events: List[Event], dry_run: bool, changes: List[Chan
                 ))
         except Exception as exc:
             print(f"event write failed for {doc_id}: {exc}", file=sys.stderr)
+            if failures is not None:
+                failures.append(doc_id)
     return written
 
 
@@ -1144,8 +1876,9 @@ _STATUS_RANK = {
 }
 
 
-def _update_job_statuses(client, events: List[Event], jobs_index: List[Dict[str, object]],
-                          dry_run: bool, changes: List[ChangeRecord]) -> int:
+def _update_job_statuses(client, events: List[Event], jobs_index: JobsIndex,
+                          dry_run: bool, changes: List[ChangeRecord],
+                          failures: Optional[List[str]] = None) -> int:
     """Advance application_status on matched jobs. Never downgrade.
 
     Also propagates interview_stage onto interview_stage_reached when the
@@ -1153,7 +1886,7 @@ def _update_job_statuses(client, events: List[Event], jobs_index: List[Dict[str,
     """
     if dry_run or client is None:
         return 0
-    by_id = {row["id"]: row for row in jobs_index}
+    by_id = jobs_index.by_id
     updates = 0
     for ev in events:
         if ev.match_status != "matched" or not ev.matched_job_id:
@@ -1228,11 +1961,14 @@ def _update_job_statuses(client, events: List[Event], jobs_index: List[Dict[str,
                 ))
         except Exception as exc:
             print(f"job update failed for {ev.matched_job_id}: {exc}", file=sys.stderr)
+            if failures is not None:
+                failures.append(ev.matched_job_id)
     return updates
 
 
 def _write_unmatched_inserts(client, events: List[Event], dry_run: bool,
-                              changes: List[ChangeRecord]) -> int:
+                              changes: List[ChangeRecord],
+                              failures: Optional[List[str]] = None) -> int:
     """For unmatched events, insert/upsert a new job doc per (firm, role) group.
 
     Uses the FULL event sequence for that group to determine the final
@@ -1355,6 +2091,8 @@ def _write_unmatched_inserts(client, events: List[Event], dry_run: bool,
                 ))
         except Exception as exc:
             print(f"unmatched insert failed for {doc_id}: {exc}", file=sys.stderr)
+            if failures is not None:
+                failures.append(doc_id)
     return inserts
 
 
@@ -1512,7 +2250,14 @@ def run_inbox_tracker(
     out_path: str,
     dry_run: bool = True,
     max_messages: int = 0,
+    full_rescan: bool = False,
 ) -> RunResult:
+    """Scan the mailbox, reconcile events against the jobs collection and write them.
+
+    Unless `full_rescan`, only mail with a UID above the last committed run's
+    high-water mark (same folder, same UIDVALIDITY) is searched; dry runs
+    read that mark but never advance it.
+    """
     started = datetime.now(timezone.utc).isoformat()
     notes: List[str] = []
 
@@ -1530,6 +2275,7 @@ def run_inbox_tracker(
         _write_artefact(out_path, result)
         return result
 
+    client = init_firestore_client()
     imap = imaplib.IMAP4_SSL("imap.gmail.com")
     try:
         imap.login(config.SMTP_USER, config.SMTP_PASS)
@@ -1553,29 +2299,33 @@ def run_inbox_tracker(
         typ, _ = imap.select(folder, readonly=True)
         if typ != "OK":
             notes.append(f"WARN: select {folder} non-OK; falling back to INBOX")
-            imap.select("INBOX", readonly=True)
+            folder = "INBOX"
+            imap.select(folder, readonly=True)
+        uid_validity = _uid_validity(imap)
+        min_uid, sync_mode = _sync_start_uid(_load_sync_state(client, folder), uid_validity, full_rescan)
+        notes.append(f"sync mode: {sync_mode}")
 
         all_uids: List[bytes] = []
         seen: set = set()
         for query in _build_search_batches(since):
-            uids = _x_gm_search(imap, query)
+            uids = _x_gm_search(imap, query, min_uid)
             for u in uids:
                 if u not in seen:
                     seen.add(u)
                     all_uids.append(u)
             notes.append(f"search bucket returned {len(uids)} uids (cumulative dedup {len(all_uids)})")
-        if max_messages and len(all_uids) > max_messages:
-            notes.append(f"truncating from {len(all_uids)} to max_messages={max_messages}")
-            all_uids = all_uids[-max_messages:]  # keep most recent
+        found = len(all_uids)
+        all_uids, high_water = _select_uids(all_uids, min_uid, max_messages)
+        if len(all_uids) < found:
+            notes.append(f"truncating from {found} to max_messages={max_messages}")
 
         headers = _fetch_headers(imap, all_uids)
         notes.append(f"fetched headers for {len(headers)} messages")
 
-        events: List[Event] = []
+        relevant: List[bytes] = []
         for uid, hdrs in headers.items():
             subject = hdrs.get("subject", "")
             sender = hdrs.get("from", "")
-            msg_id = hdrs.get("message_id") or f"uid:{uid.decode()}"
             domain = _sender_domain(sender)
 
             # Cheap pre-check: must look like applications mail in some way.
@@ -1596,68 +2346,30 @@ def run_inbox_tracker(
             )
             if not looks_relevant:
                 continue
+            relevant.append(uid)
 
-            body = _fetch_body_text(imap, uid)
-            rule_type, rule_conf = _classify_by_rules(subject, body, sender)
-            company, role = _extract_company_role(subject, body, sender)
-            job_url = _extract_job_url(body)
-            ev_type = rule_type
-            ev_conf = rule_conf
-            detection_source = "rules"
-
-            if _should_call_llm(rule_type, rule_conf, subject, body, company, role):
-                llm = _llm_classify(subject, body, sender)
-                if llm:
-                    # If rules already produced a confident type, keep it but
-                    # use LLM only for company/role enrichment. Otherwise let
-                    # LLM drive the classification too.
-                    if rule_type in {"application_confirmation", "rejection", "interview_invite"} and rule_conf >= 0.9:
-                        detection_source = "rules+llm"
-                    else:
-                        detection_source = "llm"
-                        ev_type = llm["event_type"]
-                        ev_conf = max(rule_conf, float(llm["confidence"]))
-                    llm_company = llm.get("company", "").strip()
-                    llm_role = llm.get("role", "").strip()
-                    # Reject LLM dupes (Hawk/Hawk problem) and "the company"
-                    # type non-answers.
-                    if llm_company and llm_role and llm_company.lower() == llm_role.lower():
-                        llm_role = ""
-                    if llm_company and not company:
-                        company = llm_company
-                    if llm_role and not role and llm_role.lower() != (company or "").lower():
-                        role = llm_role
-                    # Tiny courtesy delay so we don't slam the LLM
-                    time.sleep(0.15)
-
-            # Final guard: company should never equal role
-            if company and role and company.lower() == role.lower():
-                role = ""
-
-            if ev_type == "noise":
-                continue
+        bodies, body_commands = _fetch_body_texts(imap, relevant)
+        notes.append(
+            f"fetched text parts for {len(relevant)} relevant messages in {body_commands} IMAP commands"
+        )
 
-            # Classify interview stage when applicable — used to set
-            # interview_stage_reached on the matched job doc downstream.
-            interview_stage = ""
-            if ev_type == "interview_invite":
-                interview_stage = _classify_interview_stage(subject, body)
-
-            events.append(Event(
-                message_id=msg_id,
-                received_at=_parse_received_iso(hdrs.get("date", "")),
-                event_type=ev_type,
-                confidence=ev_conf,
-                company=company,
-                role=role,
-                job_url=job_url,
-                ats_family=_ats_family_from_domain(domain),
-                sender=sender,
-                subject_redacted=_redact_subject(subject),
-                detection_source=detection_source,
-                body_snippet=(body or "")[:400].replace("\r", " ").replace("\n", " "),
-                interview_stage=interview_stage,
-            ))
+        triaged = [_triage_message(uid, headers[uid], bodies.get(uid, "")) for uid in relevant]
+        pending = [item for item in triaged if item.needs_llm]
+        llm_started = time.perf_counter()
+        _run_llm_triage(pending)
+        events: List[Event] = []
+        for item in triaged:
+            _store_classification(item.msg_id, item.cached)
+            event = _event_from_triage(item)
+            if event is not None:
+                events.append(event)
+        INBOX_CLASSIFICATION_CACHE.save()
+        notes.append(
+            f"classification cache: rules {sum(t.rules_hit for t in triaged)}/{len(triaged)}, "
+            f"extraction {sum(t.extract_hit for t in triaged)}/{len(triaged)} reused; "
+            f"LLM {sum(t.llm_hit for t in pending)} reused, {sum(not t.llm_hit for t in pending)} called "
+            f"in {time.perf_counter() - llm_started:.1f}s"
+        )
     finally:
         try:
             imap.logout()
@@ -1665,16 +2377,32 @@ def run_inbox_tracker(
             pass
 
     # Reconcile + write
-    client = init_firestore_client()
     jobs_index = _load_jobs_index(client)
-    notes.append(f"loaded {len(jobs_index)} existing job docs for reconciliation")
+    notes.append(f"loaded {len(jobs_index)} existing job docs for reconciliation ({jobs_index.refresh or 'no client'})")
     for ev in events:
         _reconcile(ev, jobs_index)
 
     changes: List[ChangeRecord] = []
-    fs_events = _write_events(client, events, dry_run, changes)
-    fs_updates = _update_job_statuses(client, events, jobs_index, dry_run, changes)
-    fs_inserts = _write_unmatched_inserts(client, events, dry_run, changes)
+    write_failures: List[str] = []
+    fs_events = _write_events(client, events, dry_run, changes, write_failures)
+    fs_updates = _update_job_statuses(client, events, jobs_index, dry_run, changes, write_failures)
+    fs_inserts = _write_unmatched_inserts(client, events, dry_run, changes, write_failures)
+
+    if dry_run:
+        notes.append("dry run: inbox sync state not advanced")
+    elif client is None:
+        notes.append("no Firestore client: events not stored, inbox sync state not advanced")
+    elif write_failures:
+        notes.append(f"{len(write_failures)} Firestore writes failed: inbox sync state not advanced")
+    elif high_water is None:
+        notes.append("full rescan truncated: inbox sync state not advanced")
+    elif uid_validity:
+        _save_sync_state(client, folder, {
+            "uidvalidity": uid_validity,
+            "last_uid": high_water,
+            "updated_at": datetime.now(timezone.utc).isoformat(),
+        })
+        notes.append(f"inbox sync state advanced to UID {high_water}")
 
     if changes and not dry_run:
         try:
@@ -1722,6 +2450,12 @@ def _canonical_display(company: str) -> str:
     return CANONICAL_DISPLAY.get(norm, company)
 
 
+_ROLE_REQ_ROUND_RE = re.compile(r"\s*[-–—]?\s*\d{4,}\s+round\s+\d+\s*$")
+_ROLE_ROUND_RE = re.compile(r"\s*round\s+\d+\s*$")
+_ROLE_REQ_ID_RE = re.compile(r"\s*[-–—]\s*\d{4,}\s*$")
+_ROLE_PAREN_RE = re.compile(r"\s*\([^)]*\)\s*$")
+
+
 def _canonical_role(role: str) -> str:
     """Return a normalised role key for grouping.
 
@@ -1733,13 +2467,13 @@ def _canonical_role(role: str) -> str:
     if not r:
         return ""
     # Drop trailing "Round N" (and preceding em/en/hyphen / req-id)
-    r = re.sub(r"\s*[-–—]?\s*\d{4,}\s+round\s+\d+\s*$", "", r)
-    r = re.sub(r"\s*round\s+\d+\s*$", "", r)
+    r = _ROLE_REQ_ROUND_RE.sub("", r)
+    r = _ROLE_ROUND_RE.sub("", r)
     # Drop trailing requisition IDs ("- 210719366" / "– 210719366")
-    r = re.sub(r"\s*[-–—]\s*\d{4,}\s*$", "", r)
+    r = _ROLE_REQ_ID_RE.sub("", r)
     # Drop parenthetical sub-team qualifiers — e.g. "Product Manager (Central Operations)"
-    r = re.sub(r"\s*\([^)]*\)\s*$", "", r)
-    r = re.sub(r"\s+", " ", r).strip()
+    r = _ROLE_PAREN_RE.sub("", r)
+    r = _WHITESPACE_RE.sub(" ", r).strip()
     return r
 
 
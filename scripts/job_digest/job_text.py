@@ -0,0 +1,197 @@
+"""Job-description text for enrichment: pooled, cached, streamed.
+
+Enrichment needs the plain-text description of up to GROQ_MAX_JOBS postings
+per run, and the same links come back run after run (seen-cache top-ups,
+backfills, the hot scan followed by a digest). This module:
+
+- keeps one pooled `requests.Session` for every fetch instead of a bare
+  `requests.get` (new connection) per posting;
+- stores the extracted text on disk keyed by canonical link, so a re-seen
+  posting costs no request at all;
+- streams the page and stops reading as soon as a JSON-LD `JobPosting` with
+  a description has arrived, rather than downloading the whole document and
+  building a BeautifulSoup tree of it just to find one `<script>` block.
+
+`read_jsonld_node` is the streaming part; `build_manual_record` uses it too.
+"""
+from __future__ import annotations
+
+import codecs
+import html as html_lib
+import json
+import re
+import threading
+import time
+from typing import Callable, Dict, Iterable, Optional, Tuple
+
+import requests
+from bs4 import BeautifulSoup
+from requests.adapters import HTTPAdapter
+
+from . import config
+from .disk_cache import JsonTtlCache
+from .utils import canonical_job_link
+
+JOB_TEXT_MAX_CHARS = 5000
+JOB_TEXT_READ_LIMIT = 3_000_000  # characters of HTML read before giving up on JSON-LD
+JOB_TEXT_TIMEOUT = (8, 15)
+
+BLOCKED_DOMAINS = (
+    "linkedin.com",
+    "facebook.com",
+    "instagram.com",
+    "twitter.com",
+    "x.com",
+    "glassdoor.com",
+    "indeed.com",
+    "reed.co.uk",
+    "totaljobs.com",
+    "cwjobs.co.uk",
+    "jobsite.co.uk",
+)
+
+_JSONLD_RE = re.compile(
+    r"<script\b[^>]*\btype\s*=\s*[\"']?application/ld\+json[\"']?[^>]*>(.*?)</script\s*>",
+    re.IGNORECASE | re.DOTALL,
+)
+_META_TAG_RE = re.compile(r"<meta\b[^>]*>", re.IGNORECASE)
+_ATTR_RE = re.compile(r"([\w:-]+)\s*=\s*(?:\"([^\"]*)\"|'([^']*)'|([^\s\"'>]+))")
+
+JOB_TEXT_CACHE = JsonTtlCache(config.JOB_TEXT_CACHE_PATH, config.JOB_TEXT_CACHE_DAYS)
+
+_SESSION_LOCK = threading.Lock()
+_SESSION: Optional[requests.Session] = None
+
+
+def job_text_session() -> requests.Session:
+    """The shared, connection-pooled session used for description fetches."""
+    global _SESSION
+    with _SESSION_LOCK:
+        if _SESSION is None:
+            session = requests.Session()
+            pool = max(10, config.ENRICH_FETCH_WORKERS)
+            adapter = HTTPAdapter(pool_connections=pool, pool_maxsize=pool)
+            session.mount("https://", adapter)
+            session.mount("http://", adapter)
+            session.headers.update(
+                {
+                    "User-Agent": (
+                        "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) "
+                        "AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0 Safari/537.36"
+                    )
+                }
+            )
+            _SESSION = session
+        return _SESSION
+
+
+def _top_level_nodes(payload: object) -> Iterable[Dict[str, object]]:
+    if isinstance(payload, dict):
+        return [payload]
+    if isinstance(payload, list):
+        return [node for node in payload if isinstance(node, dict)]
+    return []
+
+
+def _has_description(node: Dict[str, object]) -> bool:
+    return node.get("@type") in ("JobPosting", "jobPosting") and bool(node.get("description"))
+
+
+def read_jsonld_node(
+    resp: requests.Response,
+    accept: Callable[[Dict[str, object]], bool],
+    nodes: Callable[[object], Iterable[Dict[str, object]]] = _top_level_nodes,
+    *,
+    deadline: Optional[float] = None,
+) -> Tuple[Optional[Dict[str, object]], str]:
+    """Stream `resp` until a JSON-LD node satisfying `accept` has been read.
+
+    Returns `(node, html)`: `html` is everything read so far, which is the
+    whole document (up to `JOB_TEXT_READ_LIMIT`) when no node matched, so
+    callers can fall back to meta-tag parsing. The response is closed either
+    way.
+    """
+    decoder = codecs.getincrementaldecoder(resp.encoding or "utf-8")(errors="replace")
+    buffer = ""
+    scan_from = 0
+    try:
+        for chunk in resp.iter_content(chunk_size=16384):
+            buffer += decoder.decode(chunk)
+            for match in _JSONLD_RE.finditer(buffer, scan_from):
+                scan_from = match.end()
+                raw = match.group(1).strip()
+                if not raw:
+                    continue
+                try:
+                    payload = json.loads(raw)
+                except ValueError:
+                    continue
+                for node in nodes(payload):
+                    if accept(node):
+                        return node, buffer
+            if len(buffer) >= JOB_TEXT_READ_LIMIT or (deadline is not None and time.monotonic() > deadline):
+                break
+        buffer += decoder.decode(b"", final=True)
+        return None, buffer
+    finally:
+        resp.close()
+
+
+def _meta_content(html: str, attr: str, value: str) -> str:
+    for tag in _META_TAG_RE.findall(html):
+        attrs = {
+            name.lower(): html_lib.unescape(double or single or bare)
+            for name, double, single, bare in _ATTR_RE.findall(tag)
+        }
+        if attrs.get(attr, "").lower() == value and attrs.get("content"):
+            return attrs["content"]
+    return ""
+
+
+def extract_job_text(resp: requests.Response, *, deadline: Optional[float] = None) -> str:
+    node, html = read_jsonld_node(resp, _has_description, deadline=deadline)
+    if node is not None:
+        description = BeautifulSoup(str(node.get("description") or ""), "html.parser")
+        return description.get_text(" ", strip=True)[:JOB_TEXT_MAX_CHARS]
+    return (_meta_content(html, "property", "og:description") or _meta_content(html, "name", "description"))[
+        :JOB_TEXT_MAX_CHARS
+    ]
+
+
+def _download_job_text(url: str) -> str:
+    deadline = time.monotonic() + config.JOB_TEXT_FETCH_DEADLINE_SECONDS
+    resp = job_text_session().get(url, timeout=JOB_TEXT_TIMEOUT, allow_redirects=True, stream=True)
+    try:
+        resp.raise_for_status()
+    except requests.HTTPError:
+        resp.close()
+        raise
+    return extract_job_text(resp, deadline=deadline)
+
+
+def fetch_job_text(url: str) -> str:
+    """Fetch job description text from the posting URL for LLM enrichment."""
+    if not url:
+        return ""
+    # Skip domains that block scraping
+    lower_url = url.lower()
+    if any(domain in lower_url for domain in BLOCKED_DOMAINS):
+        return ""
+    key = canonical_job_link(url)
+    if config.JOB_TEXT_CACHE_ENABLED:
+        cached = JOB_TEXT_CACHE.get(key)
+        if cached is not None:
+            return str(cached.get("text", "") or "")
+    try:
+        text = _download_job_text(url)
+    except Exception:
+        return ""
+    # A page that answered but carries no description is cached too; network
+    # errors are not, so they are retried next run.
+    if config.JOB_TEXT_CACHE_ENABLED:
+        JOB_TEXT_CACHE.put(key, {"text": text})
+    return text
+
+
+def save_job_text_cache() -> None:
+    JOB_TEXT_CACHE.save()
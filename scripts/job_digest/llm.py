@@ -1,13 +1,19 @@
 from __future__ import annotations
 
+import hashlib
 import json
 import re
+import threading
 import time
-from concurrent.futures import ThreadPoolExecutor, TimeoutError as FutureTimeout
+from concurrent.futures import Future, ThreadPoolExecutor, TimeoutError as FutureTimeout
 from typing import Dict, List, Optional
 
 from . import config
+from .disk_cache import JsonTtlCache
+from .job_text import fetch_job_text, save_job_text_cache
 from .models import JobRecord
+from .rate_limit import TokenBucket
+from .utils import canonical_job_link
 
 try:
     import google.generativeai as genai
@@ -37,11 +43,27 @@ def parse_gemini_payload(text: str) -> Optional[Dict[str, object]]:
         return None
 
 
-def _sleep_for_rpm() -> None:
-    if config.GROQ_RATE_LIMIT_RPM <= 0:
+PROVIDER_LIMITERS = {
+    "openrouter": TokenBucket(config.OPENROUTER_RATE_LIMIT_RPM),
+    "groq": TokenBucket(config.GROQ_RATE_LIMIT_RPM),
+    "gemini": TokenBucket(config.GEMINI_RATE_LIMIT_RPM),
+}
+# Rough size of one enrichment completion, reserved against the Groq daily
+# budget while the call is in flight so parallel workers cannot overshoot it.
+GROQ_COMPLETION_TOKEN_ESTIMATE = 2000
+_USAGE_LOCK = threading.Lock()
+
+# Bump whenever build_enhancement_prompt (or the payload it asks for) changes
+# so enrichments produced by the old prompt stop matching.
+ENRICHMENT_PROMPT_VERSION = "enrich-v1"
+ENRICHMENT_CACHE = JsonTtlCache(config.ENRICH_CACHE_PATH, config.ENRICH_CACHE_DAYS)
+
+
+def _record_usage(usage: Optional[Dict[str, int]], key: str, amount: int = 1) -> None:
+    if usage is None:
         return
-    delay = 60 / max(1, config.GROQ_RATE_LIMIT_RPM)
-    time.sleep(delay)
+    with _USAGE_LOCK:
+        usage[key] = usage.get(key, 0) + amount
 
 
 def _extract_retry_after(error: Exception) -> Optional[int]:
@@ -71,6 +93,7 @@ def generate_gemini_text(prompt: str) -> Optional[str]:
     for name in model_names:
         try:
             model = genai.GenerativeModel(name)
+            PROVIDER_LIMITERS["gemini"].acquire()
             response = model.generate_content(prompt)
             return getattr(response, "text", "") or ""
         except Exception:
@@ -98,6 +121,7 @@ def generate_openrouter_text(prompt: str) -> Optional[str]:
             base_url=config.OPENROUTER_BASE_URL,
             timeout=60,
         )
+        PROVIDER_LIMITERS["openrouter"].acquire()
         response = client.chat.completions.create(
             model=config.OPENROUTER_MODEL,
             messages=[{"role": "user", "content": prompt}],
@@ -130,24 +154,22 @@ def generate_groq_text(prompt: str, usage: Optional[Dict[str, int]] = None) -> O
     attempts = len(backoffs) + 1
     for attempt in range(attempts):
         try:
-            _sleep_for_rpm()
+            PROVIDER_LIMITERS["groq"].acquire()
             response = client.chat.completions.create(
                 model=config.GROQ_MODEL,
                 messages=[{"role": "user", "content": prompt}],
                 temperature=0.4,
                 max_tokens=4000,
             )
-            if usage is not None:
-                usage["calls"] = usage.get("calls", 0) + 1
-                tokens = getattr(response, "usage", None)
-                total_tokens = getattr(tokens, "total_tokens", None) if tokens else None
-                if isinstance(total_tokens, int):
-                    usage["tokens"] = usage.get("tokens", 0) + total_tokens
+            _record_usage(usage, "calls")
+            tokens = getattr(response, "usage", None)
+            total_tokens = getattr(tokens, "total_tokens", None) if tokens else None
+            if isinstance(total_tokens, int):
+                _record_usage(usage, "tokens", total_tokens)
             return response.choices[0].message.content or ""
         except Exception as e:
             status = getattr(e, "status_code", None) or getattr(getattr(e, "response", None), "status_code", None)
-            if usage is not None:
-                usage["retries"] = usage.get("retries", 0) + 1
+            _record_usage(usage, "retries")
             if attempt < attempts - 1:
                 retry_after = _extract_retry_after(e) if status == 429 else None
                 # Cap retry-after to 30s to avoid sleeping for hours on daily limit hits
@@ -157,72 +179,6 @@ def generate_groq_text(prompt: str, usage: Optional[Dict[str, int]] = None) -> O
             return None
 
 
-_BLOCKED_DOMAINS = (
-    "linkedin.com",
-    "facebook.com",
-    "instagram.com",
-    "twitter.com",
-    "x.com",
-    "glassdoor.com",
-    "indeed.com",
-    "reed.co.uk",
-    "totaljobs.com",
-    "cwjobs.co.uk",
-    "jobsite.co.uk",
-)
-
-
-def _fetch_job_text_inner(url: str) -> str:
-    import requests as _requests
-    from bs4 import BeautifulSoup as _BS
-    headers = {
-        "User-Agent": (
-            "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) "
-            "AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0 Safari/537.36"
-        )
-    }
-    resp = _requests.get(url, headers=headers, timeout=(8, 15), allow_redirects=True)
-    resp.raise_for_status()
-    html = resp.text
-    soup = _BS(html, "html.parser")
-    for script in soup.find_all("script", type="application/ld+json"):
-        if not script.string:
-            continue
-        try:
-            payload = json.loads(script.string.strip())
-        except ValueError:
-            continue
-        nodes = [payload] if isinstance(payload, dict) else (payload if isinstance(payload, list) else [])
-        for node in nodes:
-            if isinstance(node, dict) and node.get("@type") in ("JobPosting", "jobPosting"):
-                desc = node.get("description") or ""
-                if desc:
-                    return _BS(desc, "html.parser").get_text(" ", strip=True)[:5000]
-    og_desc = soup.find("meta", property="og:description")
-    if og_desc and og_desc.get("content"):
-        return og_desc.get("content", "")[:5000]
-    meta_desc = soup.find("meta", attrs={"name": "description"})
-    if meta_desc and meta_desc.get("content"):
-        return meta_desc.get("content", "")[:5000]
-    return ""
-
-
-def fetch_job_text(url: str) -> str:
-    """Fetch job description text from the posting URL for LLM enrichment."""
-    if not url:
-        return ""
-    # Skip domains that block scraping
-    lower_url = url.lower()
-    if any(domain in lower_url for domain in _BLOCKED_DOMAINS):
-        return ""
-    with ThreadPoolExecutor(max_workers=1) as executor:
-        future = executor.submit(_fetch_job_text_inner, url)
-        try:
-            return future.result(timeout=20) or ""
-        except Exception:
-            return ""
-
-
 def build_enhancement_prompt(record: JobRecord, job_text: str = "") -> str:
     text = job_text or record.notes or ""
     if text:
@@ -274,67 +230,183 @@ def build_enhancement_prompt(record: JobRecord, job_text: str = "") -> str:
     )
 
 
+class _GroqTokenBudget:
+    """Daily-token guard shared by the enrichment workers.
+
+    Sequentially the rule was "stop using Groq once usage reaches the warn
+    threshold". With several calls in flight, usage lags behind what has been
+    committed, so each call reserves an estimate until its real usage lands.
+    """
+
+    def __init__(self, usage: Dict[str, int], threshold: int) -> None:
+        self.usage = usage
+        self.threshold = threshold
+        self._lock = threading.Lock()
+        self._reserved = 0
+        self._warned = False
+
+    def reserve(self, estimate: int) -> bool:
+        with self._lock:
+            if self.threshold and self.usage.get("tokens", 0) + self._reserved >= self.threshold:
+                if not self._warned:
+                    print("Groq token usage nearing daily limit; falling back to Gemini for remaining jobs.")
+                    self._warned = True
+                return False
+            self._reserved += estimate
+            return True
+
+    def release(self, estimate: int) -> None:
+        with self._lock:
+            self._reserved = max(0, self._reserved - estimate)
+
+
+def enrichment_cache_key(record: JobRecord, job_text: str = "") -> str:
+    """Hash of everything the enrichment prompt depends on for this posting."""
+    identity = canonical_job_link(record.link) or f"{record.role}|{record.company}"
+    raw = "\x1f".join(
+        [identity, job_text or record.notes or "", config.JOB_DIGEST_PROFILE_TEXT, config.PREFERENCES, ENRICHMENT_PROMPT_VERSION]
+    )
+    return hashlib.sha256(raw.encode("utf-8", "surrogatepass")).hexdigest()
+
+
+def cached_enrichment(key: str) -> Optional[Dict[str, object]]:
+    """Return the cached entry (`payload` plus the `tokens` it cost) for `key`."""
+    if not key or not config.ENRICH_CACHE_ENABLED:
+        return None
+    entry = ENRICHMENT_CACHE.get(key)
+    if not entry or not isinstance(entry.get("payload"), dict):
+        return None
+    return entry
+
+
+def store_enrichment(key: str, payload: Dict[str, object], tokens: int) -> None:
+    if key and config.ENRICH_CACHE_ENABLED:
+        ENRICHMENT_CACHE.put(key, {"payload": payload, "tokens": int(tokens)})
+
+
+def _job_text_for(record: JobRecord) -> str:
+    job_text = record.notes
+    if not job_text and record.link:
+        job_text = fetch_job_text(record.link)
+    return job_text
+
+
+def _generate_enrichment(
+    record: JobRecord, job_text: "Future[str]", budget: _GroqTokenBudget
+) -> Optional[Dict[str, object]]:
+    text_for_prompt = job_text.result()
+    cache_key = enrichment_cache_key(record, text_for_prompt)
+    cached = cached_enrichment(cache_key)
+    if cached:
+        _record_usage(budget.usage, "cache_hits")
+        _record_usage(budget.usage, "tokens_saved", int(cached.get("tokens", 0) or 0))
+        return dict(cached["payload"])
+    if config.ENRICH_CACHE_ENABLED:
+        _record_usage(budget.usage, "cache_misses")
+
+    prompt = build_enhancement_prompt(record, job_text=text_for_prompt)
+    tokens = 0
+    text = generate_openrouter_text(prompt) if config.OPENROUTER_API_KEY else None
+    if not text:
+        estimate = len(prompt) // 4 + GROQ_COMPLETION_TOKEN_ESTIMATE
+        if budget.reserve(estimate):
+            call_usage: Dict[str, int] = {}
+            try:
+                text = generate_groq_text(prompt, usage=call_usage)
+            finally:
+                for key, amount in call_usage.items():
+                    _record_usage(budget.usage, key, amount)
+                budget.release(estimate)
+            tokens = call_usage.get("tokens", 0)
+    if not text and config.GEMINI_API_KEY and genai is not None:
+        text = generate_gemini_text_with_timeout(prompt, config.GEMINI_TIMEOUT_SECONDS)
+    data = parse_gemini_payload(text or "")
+    if data:
+        # OpenRouter and Gemini do not report usage here; approximate at ~4 chars a token.
+        store_enrichment(cache_key, data, tokens or (len(prompt) + len(text or "")) // 4)
+    return data
+
+
+def _apply_enrichment(record: JobRecord, data: Dict[str, object]) -> None:
+    try:
+        fit_score = int(data.get("fit_score", record.fit_score))
+    except (TypeError, ValueError):
+        fit_score = record.fit_score
+    record.fit_score = max(0, min(100, fit_score))
+    record.why_fit = data.get("why_fit", record.why_fit) or record.why_fit
+    record.cv_gap = data.get("cv_gap", record.cv_gap) or record.cv_gap
+    verdict = str(data.get("fit_verdict", "")).strip().upper()
+    if verdict in ("STRONG", "PARTIAL", "STRETCH"):
+        record.fit_verdict = verdict
+    record.role_summary = data.get("role_summary", record.role_summary) or record.role_summary
+    record.tailored_summary = data.get("tailored_summary", record.tailored_summary) or record.tailored_summary
+    record.quick_pitch = data.get("quick_pitch", record.quick_pitch) or record.quick_pitch
+    record.interview_focus = data.get("interview_focus", record.interview_focus) or record.interview_focus
+    record.match_notes = data.get("match_notes", record.match_notes) or record.match_notes
+    record.company_insights = data.get("company_insights", record.company_insights) or record.company_insights
+    record.cover_letter = data.get("cover_letter", record.cover_letter) or record.cover_letter
+    record.apply_tips = data.get("apply_tips", record.apply_tips) or record.apply_tips
+
+    for list_key in (
+        "tailored_cv_bullets",
+        "key_requirements",
+        "key_talking_points",
+        "star_stories",
+        "prep_questions",
+        "prep_answers",
+        "scorecard",
+    ):
+        val = data.get(list_key)
+        if isinstance(val, list) and val:
+            setattr(record, list_key, [str(v) for v in val])
+
+
 def enhance_records_with_groq(records: List[JobRecord]) -> List[JobRecord]:
+    """Enrich the top records via OpenRouter -> Groq -> Gemini, concurrently.
+
+    Job-text downloads run on their own pool and feed the LLM workers as they
+    land, so page fetches overlap with generation. Postings already enriched
+    with the same text, profile and prompt version are served from
+    `ENRICHMENT_CACHE` without an LLM call. Providers are paced by
+    `PROVIDER_LIMITERS` rather than a fixed sleep, Groq stops once the daily
+    token warn threshold is committed, and payloads are applied to the
+    records on this thread in list order.
+    """
     if not config.GROQ_API_KEY or GroqClient is None:
         return records
 
     limit = min(config.GROQ_MAX_JOBS, len(records))
+    targets = records[:limit]
     usage = config.GROQ_USAGE
-    warn_threshold = int(config.GROQ_DAILY_TOKEN_LIMIT * config.GROQ_TOKEN_WARN_RATIO)
-    allow_groq = True
-    for record in records[:limit]:
-        if allow_groq and warn_threshold and usage.get("tokens", 0) >= warn_threshold:
-            print("Groq token usage nearing daily limit; falling back to Gemini for remaining jobs.")
-            allow_groq = False
-        job_text = record.notes
-        if not job_text and record.link:
-            job_text = fetch_job_text(record.link)
-        prompt = build_enhancement_prompt(record, job_text=job_text)
-        text = generate_openrouter_text(prompt) if config.OPENROUTER_API_KEY else None
-        if not text:
-            text = generate_groq_text(prompt, usage=usage) if allow_groq else None
-        if not text and config.GEMINI_API_KEY and genai is not None:
-            text = generate_gemini_text_with_timeout(prompt, config.GEMINI_TIMEOUT_SECONDS)
-        data = parse_gemini_payload(text or "")
-        if not data:
-            continue
-
-        try:
-            fit_score = int(data.get("fit_score", record.fit_score))
-        except (TypeError, ValueError):
-            fit_score = record.fit_score
-        record.fit_score = max(0, min(100, fit_score))
-        record.why_fit = data.get("why_fit", record.why_fit) or record.why_fit
-        record.cv_gap = data.get("cv_gap", record.cv_gap) or record.cv_gap
-        verdict = str(data.get("fit_verdict", "")).strip().upper()
-        if verdict in ("STRONG", "PARTIAL", "STRETCH"):
-            record.fit_verdict = verdict
-        record.role_summary = data.get("role_summary", record.role_summary) or record.role_summary
-        record.tailored_summary = data.get("tailored_summary", record.tailored_summary) or record.tailored_summary
-        record.quick_pitch = data.get("quick_pitch", record.quick_pitch) or record.quick_pitch
-        record.interview_focus = data.get("interview_focus", record.interview_focus) or record.interview_focus
-        record.match_notes = data.get("match_notes", record.match_notes) or record.match_notes
-        record.company_insights = data.get("company_insights", record.company_insights) or record.company_insights
-        record.cover_letter = data.get("cover_letter", record.cover_letter) or record.cover_letter
-        record.apply_tips = data.get("apply_tips", record.apply_tips) or record.apply_tips
-
-        for list_key in (
-            "tailored_cv_bullets",
-            "key_requirements",
-            "key_talking_points",
-            "star_stories",
-            "prep_questions",
-            "prep_answers",
-            "scorecard",
-        ):
-            val = data.get(list_key)
-            if isinstance(val, list) and val:
-                setattr(record, list_key, [str(v) for v in val])
-
-    if usage.get("calls", 0) or usage.get("retries", 0):
+    budget = _GroqTokenBudget(usage, int(config.GROQ_DAILY_TOKEN_LIMIT * config.GROQ_TOKEN_WARN_RATIO))
+    if targets:
+        fetch_workers = max(1, min(config.ENRICH_FETCH_WORKERS, len(targets)))
+        llm_workers = max(1, min(config.ENRICH_LLM_WORKERS, len(targets)))
+        with ThreadPoolExecutor(max_workers=fetch_workers, thread_name_prefix="enrich-fetch") as fetch_pool:
+            job_texts = [fetch_pool.submit(_job_text_for, record) for record in targets]
+            with ThreadPoolExecutor(max_workers=llm_workers, thread_name_prefix="enrich-llm") as llm_pool:
+                payloads = [
+                    llm_pool.submit(_generate_enrichment, record, job_text, budget)
+                    for record, job_text in zip(targets, job_texts)
+                ]
+                for record, payload in zip(targets, payloads):
+                    data = payload.result()
+                    if data:
+                        _apply_enrichment(record, data)
+
+    ENRICHMENT_CACHE.save()
+    save_job_text_cache()
+    hits = usage.get("cache_hits", 0)
+    lookups = hits + usage.get("cache_misses", 0)
+    if usage.get("calls", 0) or usage.get("retries", 0) or lookups:
+        cache_note = (
+            f"; enrichment cache {hits}/{lookups} hits ({hits / lookups:.0%}), ~{usage.get('tokens_saved', 0)} tokens saved"
+            if lookups
+            else ""
+        )
         print(
             "Groq summary:",
-            f"{usage.get('calls', 0)} calls, {usage.get('retries', 0)} retries, {usage.get('tokens', 0)} tokens",
+            f"{usage.get('calls', 0)} calls, {usage.get('retries', 0)} retries, {usage.get('tokens', 0)} tokens{cache_note}",
         )
 
     return records
@@ -0,0 +1,112 @@
+"""One-pass multi-term substring matcher (Aho-Corasick).
+
+Scoring asks the same question hundreds of times per posting: "does this
+lowered text contain term X?" for every term in the keyword catalogues.
+`TermMatcher` compiles all of those terms into a single automaton once, then
+reports every catalogue term present in a text in one left-to-right pass.
+
+Semantics are exactly Python's `term in text` for each term: matches may
+overlap, nest or share prefixes. The automaton runs over UTF-8 bytes (UTF-8 is
+self-synchronising, so byte matches of a valid encoding are character
+matches). Bytes are first folded into the small alphabet the terms actually
+use via `bytes.translate`, which keeps the transition table compact enough to
+be a flat list indexed by `state + symbol`.
+"""
+from __future__ import annotations
+
+from collections import deque
+from typing import Dict, FrozenSet, Iterable, List
+
+
+def _encode(text: str) -> bytes:
+    return text.encode("utf-8", "surrogatepass")
+
+
+class TermMatcher:
+    def __init__(self, terms: Iterable[str]) -> None:
+        self.terms: FrozenSet[str] = frozenset(term for term in terms if term)
+        encoded = {term: _encode(term) for term in self.terms}
+        self.max_term_length = max((len(term) for term in self.terms), default=0)
+
+        alphabet = sorted({byte for raw in encoded.values() for byte in raw})
+        symbol_table = bytearray(256)
+        for index, byte in enumerate(alphabet, start=1):
+            symbol_table[byte] = index
+        width = len(alphabet) + 1  # symbol 0 = any byte no term uses
+        self._symbols = bytes(symbol_table)
+        self._width = width
+
+        goto: List[Dict[int, int]] = [{}]
+        outputs: List[set[str]] = [set()]
+        for term, raw in encoded.items():
+            state = 0
+            for byte in raw:
+                symbol = symbol_table[byte]
+                nxt = goto[state].get(symbol)
+                if nxt is None:
+                    goto.append({})
+                    outputs.append(set())
+                    nxt = len(goto) - 1
+                    goto[state][symbol] = nxt
+                state = nxt
+            outputs[state].add(term)
+
+        # Breadth-first fill of the full DFA: missing transitions follow the
+        # failure link, and each state inherits its failure state's outputs.
+        states = len(goto)
+        fail = [0] * states
+        delta = [0] * (states * width)
+        queue: deque[int] = deque()
+        for symbol in range(width):
+            nxt = goto[0].get(symbol, 0)
+            delta[symbol] = nxt * width
+            if nxt:
+                queue.append(nxt)
+        while queue:
+            state = queue.popleft()
+            outputs[state] |= outputs[fail[state]]
+            base = state * width
+            fail_base = fail[state] * width
+            for symbol in range(width):
+                nxt = goto[state].get(symbol)
+                if nxt is None:
+                    delta[base + symbol] = delta[fail_base + symbol]
+                    continue
+                fail[nxt] = delta[fail_base + symbol] // width
+                delta[base + symbol] = nxt * width
+                queue.append(nxt)
+        self._delta = delta
+        self._accepting: Dict[int, FrozenSet[str]] = {
+            state * width: frozenset(found) for state, found in enumerate(outputs) if found
+        }
+
+    def scan(self, text: str) -> FrozenSet[str]:
+        """Return every term that occurs in `text` (as `term in text` would)."""
+        if not text:
+            return frozenset()
+        delta = self._delta
+        accepting = self._accepting
+        state = 0
+        reached: set[int] = set()
+        for symbol in _encode(text).translate(self._symbols):
+            state = delta[state + symbol]
+            if state in accepting:
+                reached.add(state)
+        if not reached:
+            return frozenset()
+        found: set[str] = set()
+        for state in reached:
+            found |= accepting[state]
+        return frozenset(found)
+
+    def scan_joined(self, head: str, head_hits: FrozenSet[str], tail: str, tail_hits: FrozenSet[str]) -> FrozenSet[str]:
+        """Hits for `f"{head} {tail}"` given the hits already found in each part.
+
+        Only the few characters either side of the joining space can form new
+        matches, so just that window is scanned.
+        """
+        if not head:
+            return tail_hits
+        reach = max(self.max_term_length - 1, 0)
+        window = f"{head[-reach:] if reach else ''} {tail[:reach]}"
+        return head_hits | tail_hits | self.scan(window)
@@ -0,0 +1,111 @@
+"""Thread-safe request pacing for rate-limited APIs.
+
+Providers publish their limits as requests per minute. A fixed `sleep(60/rpm)`
+before every call honours that when calls are strictly sequential, but it
+also serialises the sleep with the (much longer) request itself, and it does
+nothing useful once several threads share one provider. `TokenBucket` hands
+out permits at the configured rate across every thread that shares it, so
+workers only wait when the provider's budget is actually spent.
+"""
+from __future__ import annotations
+
+import threading
+import time
+from typing import Callable
+
+
+class TokenBucket:
+    """Refills `rate_per_minute` permits a minute, holding at most `capacity`.
+
+    A rate of zero or less disables the limiter. `clock` and `sleep` are
+    injectable so tests can drive the bucket without waiting.
+    """
+
+    def __init__(
+        self,
+        rate_per_minute: float,
+        capacity: float = 1.0,
+        *,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep,
+    ) -> None:
+        self.rate_per_second = max(0.0, rate_per_minute) / 60.0
+        self.capacity = max(1.0, capacity)
+        self._clock = clock
+        self._sleep = sleep
+        self._lock = threading.Lock()
+        self._tokens = self.capacity
+        self._updated = clock()
+
+    def _refill(self) -> None:
+        now = self._clock()
+        elapsed = max(0.0, now - self._updated)
+        self._tokens = min(self.capacity, self._tokens + elapsed * self.rate_per_second)
+        self._updated = now
+
+    def acquire(self) -> float:
+        """Block until a permit is available; return the seconds spent waiting."""
+        if self.rate_per_second <= 0:
+            return 0.0
+        waited = 0.0
+        while True:
+            with self._lock:
+                self._refill()
+                if self._tokens >= 1.0:
+                    self._tokens -= 1.0
+                    return waited
+                delay = (1.0 - self._tokens) / self.rate_per_second
+            self._sleep(delay)
+            waited += delay
+
+
+class AdaptivePacer:
+    """Spaces request starts across threads and widens the gap under pushback.
+
+    Every `wait()` reserves the next start slot, `interval` seconds after the
+    previous one. `backoff()` multiplies the interval (capped at
+    `max_interval`) and pushes the next slot out by the new interval, so every
+    worker sharing the pacer pauses after a 429; `success()` eases the
+    interval back towards its base. `clock` and `sleep` are injectable as for
+    `TokenBucket`.
+    """
+
+    def __init__(
+        self,
+        interval: float,
+        max_interval: float = 10.0,
+        *,
+        factor: float = 2.0,
+        recovery: float = 0.8,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep,
+    ) -> None:
+        self.base_interval = max(0.0, interval)
+        self.interval = self.base_interval
+        self.max_interval = max(self.base_interval, max_interval)
+        self.factor = factor
+        self.recovery = recovery
+        self._clock = clock
+        self._sleep = sleep
+        self._lock = threading.Lock()
+        self._next_start = clock()
+
+    def wait(self) -> float:
+        """Block until this caller's start slot; return the seconds spent waiting."""
+        with self._lock:
+            now = self._clock()
+            start = max(now, self._next_start)
+            self._next_start = start + self.interval
+        delay = start - now
+        if delay > 0:
+            self._sleep(delay)
+        return delay
+
+    def backoff(self) -> None:
+        with self._lock:
+            self.interval = min(self.max_interval, max(self.interval * self.factor, 1.0))
+            self._next_start = max(self._next_start, self._clock() + self.interval)
+
+    def success(self) -> None:
+        with self._lock:
+            self.interval = max(self.base_interval, self.interval * self.recovery)
@@ -2,7 +2,7 @@ from __future__ import annotations
 
 import json
 import re
-from typing import List
+from typing import Dict, List
 
 from .config import dedupe_keep_order
 from .models import JobRecord
@@ -88,32 +88,50 @@ def merge_records(primary: JobRecord, secondary: JobRecord) -> JobRecord:
     return primary
 
 
+TITLE_MATCH_THRESHOLD = 0.85
+
+
+def _title_similarity(tokens_a: frozenset[str], tokens_b: frozenset[str]) -> float:
+    return 1.0 - (len(tokens_a ^ tokens_b) / max(1, len(tokens_a | tokens_b)))
+
+
 def dedupe_records(records: List[JobRecord]) -> List[JobRecord]:
+    """Merge records for the same role at the same company.
+
+    A record matches the first kept record whose normalised company is equal
+    and whose normalised title tokens have a Jaccard similarity of at least
+    `TITLE_MATCH_THRESHOLD`. Kept records are bucketed by normalised company
+    and carry their title token set, so each record is only compared against
+    its own company's roles and the normalisation regexes run once per record
+    rather than once per pair. Token sets whose sizes alone rule out the
+    threshold are skipped before any set arithmetic.
+    """
     deduped: List[JobRecord] = []
+    kept_tokens: List[frozenset[str]] = []
+    company_buckets: Dict[str, List[int]] = {}
     for record in records:
-        matched_index = None
         record_company = normalise_company(record.company)
-        record_title = normalise_title(record.role)
-        for idx, existing in enumerate(deduped):
-            existing_company = normalise_company(existing.company)
-            if existing_company != record_company:
-                continue
-            existing_title = normalise_title(existing.role)
-            similarity = 0.0
-            if existing_title and record_title:
-                similarity = (
-                    1.0
-                    - (
-                        len(set(record_title.split()) ^ set(existing_title.split()))
-                        / max(1, len(set(record_title.split()) | set(existing_title.split())))
-                    )
-                )
-            if similarity >= 0.85:
-                matched_index = idx
-                break
+        record_tokens = frozenset(normalise_title(record.role).split())
+        bucket = company_buckets.setdefault(record_company, [])
+        matched_index = None
+        if record_tokens:
+            record_size = len(record_tokens)
+            for idx in bucket:
+                existing_tokens = kept_tokens[idx]
+                if not existing_tokens:
+                    continue
+                existing_size = len(existing_tokens)
+                small, large = min(record_size, existing_size), max(record_size, existing_size)
+                if small * 100 < large * 85:
+                    continue
+                if _title_similarity(record_tokens, existing_tokens) >= TITLE_MATCH_THRESHOLD:
+                    matched_index = idx
+                    break
 
         if matched_index is None:
+            bucket.append(len(deduped))
             deduped.append(record)
+            kept_tokens.append(record_tokens)
             continue
 
         existing = deduped[matched_index]
@@ -132,5 +150,7 @@ def dedupe_records(records: List[JobRecord]) -> List[JobRecord]:
         merged.alternate_links = [json.loads(item) for item in merged.alternate_links]
 
         deduped[matched_index] = merged
+        if merged is record:
+            kept_tokens[matched_index] = record_tokens
 
     return deduped
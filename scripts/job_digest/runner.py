@@ -1,21 +1,26 @@
 from __future__ import annotations
 
 import argparse
+import copy
 import csv
 import json
 import os
 import re
 import signal
 import statistics
+import threading
 import time
 from collections import Counter
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
 from datetime import datetime, timezone
 from pathlib import Path
+from typing import Callable
 
 import pandas as pd
 import requests
 
 from . import config
+from .board_fetch import BOARD_CACHE, board_cache_scope
 from .boards import JOB_BOARD_SOURCES
 from .company_coverage import read_registry
 from .firestore import (
@@ -36,24 +41,25 @@ from .firestore import (
 from .llm import enhance_records_with_groq
 from .models import JobRecord
 from .records import dedupe_records
+from .sessions import StageDeadlineExceeded, build_source_session
 from .scoring import (
-    assess_fit,
-    build_gaps,
-    build_preference_match,
-    build_reasons,
     classify_target_role_bucket,
     is_relevant_location,
     is_relevant_title,
     is_relevant_title_direct,
+    reset_scoring_cache,
     score_fit,
+    score_posting,
+    scoring_cache_stats,
 )
-from .custom_careers import custom_careers_search as direct_custom_careers_search
+from .custom_careers import custom_careers_search
 from .sources import (
+    CUSTOM_CAREERS_FAILED_STATUSES,
+    abandon_source_runtime_events,
     adzuna_search,
     ashby_search,
     build_manual_record,
     builtin_london_search,
-    custom_careers_search,
     cvlibrary_search,
     efinancialcareers_search,
     greenhouse_search,
@@ -67,6 +73,7 @@ from .sources import (
     linkedin_job_details,
     linkedin_search,
     meetfrank_search,
+    get_custom_careers_crawl_outcomes,
     get_source_runtime_events,
     reed_search,
     remotive_search,
@@ -80,7 +87,6 @@ from .sources import (
     web_discovery_search,
     weloveproduct_search,
     workable_search,
-    workday_search,
     workinstartups_search,
 )
 from .summary import build_email_html, build_sources_summary, send_email
@@ -107,6 +113,7 @@ from .utils import (
     select_top_pick,
     should_keep_role_company,
 )
+from .workday import workday_search
 
 
 def normalize_posted(job: dict) -> tuple[str, str, str]:
@@ -196,6 +203,7 @@ def canonical_company(company: str) -> str:
 
 
 SOURCE_STAGE_TIMEOUT_SECONDS = int(os.getenv("JOB_DIGEST_SOURCE_STAGE_TIMEOUT", "180"))
+SOURCE_STAGE_WORKERS = int(os.getenv("JOB_DIGEST_SOURCE_STAGE_WORKERS", "4") or "4")
 RUNNER_TRACE_LOG = config.DIGEST_DIR / "runner_trace.log"
 CUSTOM_CAREERS_MIN_SCORE = int(os.getenv("JOB_DIGEST_CUSTOM_CAREERS_MIN_SCORE", "60") or "60")
 SOURCE_DIAGNOSTICS_ENABLED = os.getenv("JOB_DIGEST_CUSTOM_DIAGNOSTICS", "false").lower() == "true"
@@ -210,6 +218,10 @@ LINKEDIN_MAX_DETAIL_JOBS = int(os.getenv("JOB_DIGEST_LINKEDIN_MAX_DETAIL_JOBS",
 SOURCE_DIAGNOSTICS: dict[str, dict] = {}
 CUSTOM_CAREERS_TARGET_DIAGNOSTICS: dict[str, dict] = {}
 RUN_SUMMARY: dict[str, object] = {}
+# A stage on a worker thread writes its diagnostics into its own dicts, not the
+# shared ones above; run_source_stages folds them in once the stage returns, so
+# a stage it stopped waiting for never touches what is being merged and saved.
+_STAGE_DIAGNOSTICS = threading.local()
 
 CUSTOM_CAREERS_TITLE_HINTS = (
     "product",
@@ -256,6 +268,8 @@ SOURCE_STAGE_NAME_MAP = {
     "workable": "Workable",
     "workday": "Workday",
     "recruiter_pages": "RecruiterPages",
+    "custom_careers": "CustomCareers",
+    "web_discovery": "WebDiscovery",
 }
 
 
@@ -296,7 +310,12 @@ def reset_source_diagnostics() -> None:
 
 
 def init_source_diagnostic(source_name: str, raw_count: int) -> dict:
-    diag = SOURCE_DIAGNOSTICS.setdefault(
+    diagnostics = getattr(_STAGE_DIAGNOSTICS, "sources", None)
+    if diagnostics is None:
+        diagnostics = SOURCE_DIAGNOSTICS
+    elif source_name not in diagnostics and source_name in SOURCE_DIAGNOSTICS:
+        diagnostics[source_name] = copy.deepcopy(SOURCE_DIAGNOSTICS[source_name])
+    diag = diagnostics.setdefault(
         source_name,
         {
             "source_name": source_name,
@@ -372,6 +391,8 @@ def merge_runtime_source_events() -> None:
         diag["raw"] = max(int(diag.get("raw", 0) or 0), int(event.get("raw", 0) or 0))
         if event.get("mode"):
             diag["mode"] = event.get("mode")
+        if event.get("schedule"):
+            diag["schedule"] = event.get("schedule")
         diag["query_count"] = max(int(diag.get("query_count", 0) or 0), int(event.get("query_count", 0) or 0))
         diag["page_count"] = max(int(diag.get("page_count", 0) or 0), int(event.get("page_count", 0) or 0))
         diag["company_query_count"] = max(
@@ -427,7 +448,8 @@ def _init_custom_target_diagnostic(job: dict, company: str) -> dict | None:
     careers_url = (job.get("target_careers_url") or "").strip()
     if not careers_url:
         return None
-    stats = CUSTOM_CAREERS_TARGET_DIAGNOSTICS.setdefault(
+    targets = getattr(_STAGE_DIAGNOSTICS, "targets", None)
+    stats = (CUSTOM_CAREERS_TARGET_DIAGNOSTICS if targets is None else targets).setdefault(
         careers_url,
         {
             "firm": (job.get("target_firm") or company or "").strip(),
@@ -446,10 +468,25 @@ def _init_custom_target_diagnostic(job: dict, company: str) -> dict | None:
 def finalize_custom_target_diagnostics() -> dict[str, dict]:
     finalized: dict[str, dict] = {}
     stamped_at = datetime.now(timezone.utc).isoformat()
+    # Crawled targets that produced no jobs never reach the filters, so seed
+    # them from the crawl outcomes; that is how failures build a streak.
+    crawl_outcomes = get_custom_careers_crawl_outcomes()
+    for careers_url, outcome in crawl_outcomes.items():
+        _init_custom_target_diagnostic(
+            {
+                "target_careers_url": careers_url,
+                "target_firm": outcome.get("firm", ""),
+                "target_category": outcome.get("primary_category", ""),
+            },
+            str(outcome.get("firm", "")),
+        )
     for careers_url, stats in CUSTOM_CAREERS_TARGET_DIAGNOSTICS.items():
         raw = int(stats.get("raw", 0) or 0)
         kept = int(stats.get("kept", 0) or 0)
-        if raw <= 0:
+        crawl_status = str((crawl_outcomes.get(careers_url) or {}).get("status", ""))
+        if raw <= 0 and crawl_status in CUSTOM_CAREERS_FAILED_STATUSES:
+            status = crawl_status
+        elif raw <= 0:
             status = "empty"
         elif raw >= SOURCE_HEALTH_WEAK_YIELD_MIN_RAW and (kept / raw) < SOURCE_HEALTH_WEAK_YIELD_RATIO:
             status = "weak_yield"
@@ -500,6 +537,8 @@ def print_source_health_summary() -> None:
             parts.append(f"blocked={diag['blocked']}")
         if diag.get("timed_out"):
             parts.append(f"timed_out={diag['timed_out']}")
+        if (diag.get("schedule") or {}).get("skipped"):
+            parts.append(f"backoff_skipped={len(diag['schedule']['skipped'])}")
         dropped = diag.get("dropped", {})
         for key in ("title", "location", "company", "window", "score"):
             value = int(dropped.get(key, 0) or 0)
@@ -555,7 +594,7 @@ def min_score_for_fit(fit: dict, source_family: str, source: str) -> int:
     return min_score
 
 
-DIRECT_ATS_SOURCES = {"Greenhouse", "Lever", "Ashby", "SmartRecruiters", "Workable", "Workday", "DirectCareers"}
+DIRECT_ATS_SOURCES = {"Greenhouse", "Lever", "Ashby", "SmartRecruiters", "Workable", "Workday"}
 
 
 def keep_score_threshold(source_family: str, source: str) -> int:
@@ -667,6 +706,7 @@ def write_source_diagnostics(suffix: str = "") -> Path | None:
         RUN_SUMMARY["stage_timeout_hit"] = any(
             int(diag.get("timed_out", 0) or 0) > 0 for diag in SOURCE_DIAGNOSTICS.values()
         )
+        RUN_SUMMARY["scoring_cache"] = scoring_cache_stats()
         payload = dict(SOURCE_DIAGNOSTICS)
         payload["__run__"] = dict(RUN_SUMMARY)
         with output_path.open("w", encoding="utf-8") as handle:
@@ -759,38 +799,142 @@ def _timeout_handler(_signum, _frame):
     raise SourceStageTimeoutError
 
 
+def _source_stage_diagnostic(label: str) -> dict:
+    source_name = normalize_source_name(label)
+    return init_source_diagnostic(source_name, SOURCE_DIAGNOSTICS.get(source_name, {}).get("raw", 0))
+
+
+def _record_stage_complete(label: str, records: list[JobRecord], elapsed: float) -> None:
+    diag = _source_stage_diagnostic(label)
+    diag["kept"] = max(int(diag.get("kept", 0) or 0), len(records))
+    log_trace(f"[source] {label} complete in {elapsed:.1f}s with {len(records)} kept roles")
+
+
+def _record_stage_timeout(label: str, elapsed: float) -> None:
+    diag = _source_stage_diagnostic(label)
+    diag["timed_out"] += 1
+    add_source_note(diag, f"{label} exceeded source stage timeout")
+    log_trace(f"[source] {label} timed out after {elapsed:.1f}s; skipping")
+
+
+def _record_stage_failure(label: str, exc: BaseException, elapsed: float) -> None:
+    diag = _source_stage_diagnostic(label)
+    diag["failed"] += 1
+    add_source_note(diag, f"{label} failed: {type(exc).__name__}")
+    log_trace(f"[source] {label} failed after {elapsed:.1f}s: {type(exc).__name__}: {exc}")
+
+
 def run_source_stage(label: str, fn):
     started = time.perf_counter()
     log_trace(f"[source] {label} starting...")
-    source_name = normalize_source_name(label)
-    previous_handler = signal.getsignal(signal.SIGALRM)
+    use_alarm = SOURCE_STAGE_TIMEOUT_SECONDS > 0 and threading.current_thread() is threading.main_thread()
+    previous_handler = signal.getsignal(signal.SIGALRM) if use_alarm else None
     try:
-        if SOURCE_STAGE_TIMEOUT_SECONDS > 0:
+        if use_alarm:
             signal.signal(signal.SIGALRM, _timeout_handler)
             signal.alarm(SOURCE_STAGE_TIMEOUT_SECONDS)
         records = fn()
-        elapsed = time.perf_counter() - started
-        diag = init_source_diagnostic(source_name, SOURCE_DIAGNOSTICS.get(source_name, {}).get("raw", 0))
-        diag["kept"] = max(int(diag.get("kept", 0) or 0), len(records))
-        log_trace(f"[source] {label} complete in {elapsed:.1f}s with {len(records)} kept roles")
+        _record_stage_complete(label, records, time.perf_counter() - started)
         return records
-    except SourceStageTimeoutError:
-        elapsed = time.perf_counter() - started
-        diag = init_source_diagnostic(source_name, SOURCE_DIAGNOSTICS.get(source_name, {}).get("raw", 0))
-        diag["timed_out"] += 1
-        add_source_note(diag, f"{label} exceeded source stage timeout")
-        log_trace(f"[source] {label} timed out after {elapsed:.1f}s; skipping")
+    except (SourceStageTimeoutError, StageDeadlineExceeded):
+        _record_stage_timeout(label, time.perf_counter() - started)
         return []
     except Exception as exc:  # noqa: BLE001
-        elapsed = time.perf_counter() - started
-        diag = init_source_diagnostic(source_name, SOURCE_DIAGNOSTICS.get(source_name, {}).get("raw", 0))
-        diag["failed"] += 1
-        add_source_note(diag, f"{label} failed: {type(exc).__name__}")
-        log_trace(f"[source] {label} failed after {elapsed:.1f}s: {type(exc).__name__}: {exc}")
+        _record_stage_failure(label, exc, time.perf_counter() - started)
         return []
     finally:
-        signal.alarm(0)
-        signal.signal(signal.SIGALRM, previous_handler)
+        if use_alarm:
+            signal.alarm(0)
+            signal.signal(signal.SIGALRM, previous_handler)
+
+
+SourceStage = tuple[str, Callable[[requests.Session], list[JobRecord]]]
+
+
+def run_source_stages(stages: list[SourceStage], *, max_workers: int | None = None) -> list[JobRecord]:
+    """Run independent source stages, concurrently when more than one worker is allowed.
+
+    Every stage gets its own session. Off the main thread the per-stage
+    deadline is enforced twice: the stage's `DeadlineSession` refuses new
+    requests once it expires, and the scheduler stops waiting for the stage at
+    the same moment (its late results are discarded, exactly as the `SIGALRM`
+    path would). A stage's diagnostics are folded into `SOURCE_DIAGNOSTICS`
+    only once it returns, and an abandoned stage's runtime events are dropped,
+    so its still-running thread cannot race the merge. Records are merged back
+    in the order the stages were listed, so downstream dedupe and ranking see
+    the same sequence as a serial run.
+    """
+    workers = SOURCE_STAGE_WORKERS if max_workers is None else max_workers
+    if workers <= 1 or len(stages) <= 1:
+        serial_records: list[JobRecord] = []
+        for label, fn in stages:
+            session = build_source_session()
+            try:
+                serial_records.extend(run_source_stage(label, lambda fn=fn, session=session: fn(session)))
+            finally:
+                session.close()
+        return serial_records
+
+    timeout = SOURCE_STAGE_TIMEOUT_SECONDS
+    results: list[list[JobRecord]] = [[] for _ in stages]
+    started_at: dict[int, float] = {}
+    sessions = [build_source_session() for _ in stages]
+    diagnostics: list[tuple[dict[str, dict], dict[str, dict]]] = [({}, {}) for _ in stages]
+
+    def run(index: int) -> list[JobRecord]:
+        label, fn = stages[index]
+        started_at[index] = time.monotonic()
+        if timeout > 0:
+            sessions[index].deadline = started_at[index] + timeout
+        _STAGE_DIAGNOSTICS.sources, _STAGE_DIAGNOSTICS.targets = diagnostics[index]
+        log_trace(f"[source] {label} starting...")
+        try:
+            return fn(sessions[index])
+        finally:
+            _STAGE_DIAGNOSTICS.sources = _STAGE_DIAGNOSTICS.targets = None
+
+    executor = ThreadPoolExecutor(max_workers=min(workers, len(stages)), thread_name_prefix="source-stage")
+    futures = {executor.submit(run, index): index for index in range(len(stages))}
+    pending = set(futures)
+    abandoned: set[int] = set()
+    log_trace(f"[source] running {len(stages)} source stages with {min(workers, len(stages))} workers")
+    try:
+        while pending:
+            done, pending = wait(pending, timeout=1.0, return_when=FIRST_COMPLETED)
+            now = time.monotonic()
+            for future in done:
+                index = futures[future]
+                label = stages[index][0]
+                elapsed = now - started_at.get(index, now)
+                SOURCE_DIAGNOSTICS.update(diagnostics[index][0])
+                CUSTOM_CAREERS_TARGET_DIAGNOSTICS.update(diagnostics[index][1])
+                try:
+                    records = future.result()
+                except (SourceStageTimeoutError, StageDeadlineExceeded):
+                    _record_stage_timeout(label, elapsed)
+                except Exception as exc:  # noqa: BLE001
+                    _record_stage_failure(label, exc, elapsed)
+                else:
+                    results[index] = records
+                    _record_stage_complete(label, records, elapsed)
+            if timeout <= 0:
+                continue
+            for future in list(pending):
+                index = futures[future]
+                started = started_at.get(index)
+                if started is None or now - started < timeout:
+                    continue
+                pending.discard(future)
+                abandoned.add(index)
+                # The thread keeps running: drop whatever it reports from now on.
+                abandon_source_runtime_events(normalize_source_name(stages[index][0]))
+                _record_stage_timeout(stages[index][0], now - started)
+    finally:
+        executor.shutdown(wait=False, cancel_futures=True)
+        for index, session in enumerate(sessions):
+            if index not in abandoned:
+                session.close()
+    return [record for stage_records in results for record in stage_records]
 
 
 def write_digest_outputs(records: list[JobRecord], *, suffix: str = "") -> tuple[Path, Path]:
@@ -1100,8 +1244,8 @@ def collect_linkedin_records(session: requests.Session) -> list[JobRecord]:
             continue
 
         summary = desc_text[:2500]
-        full_text = f"{title} {company} {summary}"
-        fit = assess_fit(full_text, company, "Aggregator", "LinkedIn", title=title)
+        scored = score_posting(title, company, summary, location, source_family="Aggregator", source="LinkedIn")
+        fit = scored["fit"]
         score = int(fit["score"])
         min_score = min_score_for_fit(fit, "Aggregator", "LinkedIn")
         if is_target_firm(company) or is_linkedin_included_company(company):
@@ -1135,9 +1279,9 @@ def collect_linkedin_records(session: requests.Session) -> list[JobRecord]:
                 email_bucket="main" if score >= min_score else "borderline",
                 fit_score=score,
                 fit_verdict=str(fit["fit_verdict"]),
-                preference_match=build_preference_match(full_text, company, location),
-                why_fit=build_reasons(full_text),
-                cv_gap=build_gaps(full_text),
+                preference_match=str(scored["preference_match"]),
+                why_fit=str(scored["why_fit"]),
+                cv_gap=str(scored["cv_gap"]),
                 notes=summary,
                 applicant_count=applicant_text,
             )
@@ -1181,8 +1325,8 @@ def collect_greenhouse_records(session: requests.Session) -> list[JobRecord]:
             continue
 
         summary = job.get("summary", "")
-        full_text = f"{title} {company} {summary}"
-        fit = assess_fit(full_text, company, "ATS", "Greenhouse", title=title)
+        scored = score_posting(title, company, summary, location, source_family="ATS", source="Greenhouse")
+        fit = scored["fit"]
         score = int(fit["score"])
         min_score = min_score_for_fit(fit, "ATS", "Greenhouse")
         if score < keep_score_threshold("ATS", "Greenhouse"):
@@ -1206,9 +1350,9 @@ def collect_greenhouse_records(session: requests.Session) -> list[JobRecord]:
                 email_bucket="main" if score >= min_score else "borderline",
                 fit_score=score,
                 fit_verdict=str(fit["fit_verdict"]),
-                preference_match=build_preference_match(full_text, company, location),
-                why_fit=build_reasons(full_text),
-                cv_gap=build_gaps(full_text),
+                preference_match=str(scored["preference_match"]),
+                why_fit=str(scored["why_fit"]),
+                cv_gap=str(scored["cv_gap"]),
                 notes=summary,
             )
         )
@@ -1249,8 +1393,8 @@ def collect_lever_records(session: requests.Session) -> list[JobRecord]:
             continue
 
         summary = job.get("summary", "")
-        full_text = f"{title} {company} {summary}"
-        fit = assess_fit(full_text, company, "ATS", "Lever", title=title)
+        scored = score_posting(title, company, summary, location, source_family="ATS", source="Lever")
+        fit = scored["fit"]
         score = int(fit["score"])
         min_score = min_score_for_fit(fit, "ATS", "Lever")
         if score < keep_score_threshold("ATS", "Lever"):
@@ -1274,9 +1418,9 @@ def collect_lever_records(session: requests.Session) -> list[JobRecord]:
                 email_bucket="main" if score >= min_score else "borderline",
                 fit_score=score,
                 fit_verdict=str(fit["fit_verdict"]),
-                preference_match=build_preference_match(full_text, company, location),
-                why_fit=build_reasons(full_text),
-                cv_gap=build_gaps(full_text),
+                preference_match=str(scored["preference_match"]),
+                why_fit=str(scored["why_fit"]),
+                cv_gap=str(scored["cv_gap"]),
                 notes=summary,
             )
         )
@@ -1317,8 +1461,8 @@ def collect_smartrecruiters_records(session: requests.Session) -> list[JobRecord
             continue
 
         summary = job.get("summary", "")
-        full_text = f"{title} {company} {summary}"
-        fit = assess_fit(full_text, company, "ATS", "SmartRecruiters", title=title)
+        scored = score_posting(title, company, summary, location, source_family="ATS", source="SmartRecruiters")
+        fit = scored["fit"]
         score = int(fit["score"])
         min_score = min_score_for_fit(fit, "ATS", "SmartRecruiters")
         if score < keep_score_threshold("ATS", "SmartRecruiters"):
@@ -1342,9 +1486,9 @@ def collect_smartrecruiters_records(session: requests.Session) -> list[JobRecord
                 email_bucket="main" if score >= min_score else "borderline",
                 fit_score=score,
                 fit_verdict=str(fit["fit_verdict"]),
-                preference_match=build_preference_match(full_text, company, location),
-                why_fit=build_reasons(full_text),
-                cv_gap=build_gaps(full_text),
+                preference_match=str(scored["preference_match"]),
+                why_fit=str(scored["why_fit"]),
+                cv_gap=str(scored["cv_gap"]),
                 notes=summary,
             )
         )
@@ -1385,8 +1529,8 @@ def collect_ashby_records(session: requests.Session) -> list[JobRecord]:
             continue
 
         summary = job.get("summary", "")
-        full_text = f"{title} {company} {summary}"
-        fit = assess_fit(full_text, company, "ATS", "Ashby", title=title)
+        scored = score_posting(title, company, summary, location, source_family="ATS", source="Ashby")
+        fit = scored["fit"]
         score = int(fit["score"])
         min_score = min_score_for_fit(fit, "ATS", "Ashby")
         if score < keep_score_threshold("ATS", "Ashby"):
@@ -1410,9 +1554,9 @@ def collect_ashby_records(session: requests.Session) -> list[JobRecord]:
                 email_bucket="main" if score >= min_score else "borderline",
                 fit_score=score,
                 fit_verdict=str(fit["fit_verdict"]),
-                preference_match=build_preference_match(full_text, company, location),
-                why_fit=build_reasons(full_text),
-                cv_gap=build_gaps(full_text),
+                preference_match=str(scored["preference_match"]),
+                why_fit=str(scored["why_fit"]),
+                cv_gap=str(scored["cv_gap"]),
                 notes=summary,
             )
         )
@@ -1453,8 +1597,8 @@ def collect_workable_records(session: requests.Session) -> list[JobRecord]:
             diag["dropped"]["window"] += 1
             continue
 
-        full_text = f"{title} {company} {summary}"
-        fit = assess_fit(full_text, company, "ATS", "Workable", title=title)
+        scored = score_posting(title, company, summary, location, source_family="ATS", source="Workable")
+        fit = scored["fit"]
         score = int(fit["score"])
         min_score = min_score_for_fit(fit, "ATS", "Workable")
         if score < keep_score_threshold("ATS", "Workable"):
@@ -1478,9 +1622,9 @@ def collect_workable_records(session: requests.Session) -> list[JobRecord]:
                 email_bucket="main" if score >= min_score else "borderline",
                 fit_score=score,
                 fit_verdict=str(fit["fit_verdict"]),
-                preference_match=build_preference_match(full_text, company, location),
-                why_fit=build_reasons(full_text),
-                cv_gap=build_gaps(full_text),
+                preference_match=str(scored["preference_match"]),
+                why_fit=str(scored["why_fit"]),
+                cv_gap=str(scored["cv_gap"]),
                 notes=summary,
                 job_status=job.get("job_status", ""),
             )
@@ -1517,8 +1661,8 @@ def collect_workday_records(session: requests.Session) -> list[JobRecord]:
         if not is_direct_ats_within_window(posted_display, posted_raw, posted_date, company):
             diag["dropped"]["window"] += 1
             continue
-        full_text = f"{title} {company} {summary}"
-        fit = assess_fit(full_text, company, "ATS", "Workday", title=title)
+        scored = score_posting(title, company, summary, location, source_family="ATS", source="Workday")
+        fit = scored["fit"]
         score = int(fit["score"])
         min_score = min_score_for_fit(fit, "ATS", "Workday")
         if score < keep_score_threshold("ATS", "Workday"):
@@ -1541,9 +1685,9 @@ def collect_workday_records(session: requests.Session) -> list[JobRecord]:
                 email_bucket="main" if score >= min_score else "borderline",
                 fit_score=score,
                 fit_verdict=str(fit["fit_verdict"]),
-                preference_match=build_preference_match(full_text, company, location),
-                why_fit=build_reasons(full_text),
-                cv_gap=build_gaps(full_text),
+                preference_match=str(scored["preference_match"]),
+                why_fit=str(scored["why_fit"]),
+                cv_gap=str(scored["cv_gap"]),
                 notes=summary,
                 job_status=job.get("job_status", ""),
             )
@@ -1607,72 +1751,10 @@ def collect_job_board_source(session: requests.Session, source: dict) -> list[di
 
 
 def collect_custom_careers_records(session: requests.Session) -> list[JobRecord]:
-    """Scrape the 196 bespoke careers pages (uk_firm_feeds.csv platform=Custom)
-    in parallel via JSON-LD or generic href patterns."""
-    records: list[JobRecord] = []
-    raw_jobs = direct_custom_careers_search(session)
-    diag = init_source_diagnostic("DirectCareers", len(raw_jobs))
-    for job in raw_jobs:
-        title = job.get("title", "")
-        company = canonical_company(job.get("company", ""))
-        location = job.get("location", "") or "Remote"
-        if not is_relevant_title_direct(title):
-            diag["dropped"]["title"] += 1
-            add_source_diagnostic_example(diag, "title", {"company": company, "title": title, "location": location, "link": job.get("link", "")})
-            continue
-        if not is_direct_ats_relevant_location(location, job.get("summary", ""), company):
-            diag["dropped"]["location"] += 1
-            add_source_diagnostic_example(diag, "location", {"company": company, "title": title, "location": location, "link": job.get("link", "")})
-            continue
-        if not should_keep_role_company(company, "ATS", "DirectCareers"):
-            diag["dropped"]["company"] += 1
-            add_source_diagnostic_example(diag, "company", {"company": company, "title": title, "location": location, "link": job.get("link", "")})
-            continue
-
-        # Posted date is often missing in custom careers JSON-LD; treat as fresh.
-        posted_raw = job.get("posted_date", "")
-        posted_display = posted_raw or "Recent"
-        posted_date = posted_raw
-
-        summary = job.get("summary", "")
-        full_text = f"{title} {company} {summary}"
-        fit = assess_fit(full_text, company, "ATS", "DirectCareers", title=title)
-        score = int(fit["score"])
-        min_score = min_score_for_fit(fit, "ATS", "DirectCareers")
-        if score < keep_score_threshold("ATS", "DirectCareers"):
-            diag["dropped"]["score"] += 1
-            add_source_diagnostic_example(diag, "score", {"company": company, "title": title, "score": score, "link": job.get("link", "")})
-            continue
-
-        records.append(
-            JobRecord(
-                role=title,
-                company=company,
-                location=location,
-                link=job.get("link", ""),
-                posted=posted_display,
-                posted_raw=posted_raw,
-                posted_date=posted_date,
-                source="DirectCareers",
-                source_family="ATS",
-                ats_family="DirectCareers",
-                ats_account=job.get("source_firm", ""),
-                email_bucket="main" if score >= min_score else "borderline",
-                fit_score=score,
-                fit_verdict=str(fit["fit_verdict"]),
-                preference_match=build_preference_match(full_text, company, location),
-                why_fit=build_reasons(full_text),
-                cv_gap=build_gaps(full_text),
-                notes=summary,
-            )
-        )
-        diag["kept"] += 1
-        add_source_diagnostic_example(
-            diag,
-            "kept",
-            {"company": company, "title": title, "location": location, "score": score, "link": job.get("link", "")},
-        )
-    return records
+    """Crawl the bespoke careers pages (uk_firm_feeds.csv platform=Custom) with
+    the shared custom careers engine and filter them as CustomCareers records."""
+    source = next(item for item in JOB_BOARD_SOURCES if item["name"] == "CustomCareers")
+    return collect_job_board_records(session, source)
 
 
 def collect_recruiter_page_records(session: requests.Session) -> list[JobRecord]:
@@ -1717,8 +1799,10 @@ def collect_recruiter_page_records(session: requests.Session) -> list[JobRecord]
             diag["dropped"]["window"] += 1
             continue
 
-        full_text = f"{title} {company} {location} {summary}"
-        fit = assess_fit(full_text, company, "JobBoard", "RecruiterPages", title=title)
+        scored = score_posting(
+            title, company, summary, location, source_family="JobBoard", source="RecruiterPages", location_in_text=True
+        )
+        fit = scored["fit"]
         score = int(fit["score"])
         min_score = min_score_for_fit(fit, "JobBoard", "RecruiterPages")
         keep_threshold = min(min_score, keep_score_threshold("JobBoard", "RecruiterPages"))
@@ -1752,9 +1836,9 @@ def collect_recruiter_page_records(session: requests.Session) -> list[JobRecord]
                 email_bucket="main" if score >= min_score else "borderline",
                 fit_score=score,
                 fit_verdict=str(fit["fit_verdict"]),
-                preference_match=build_preference_match(full_text, company, location),
-                why_fit=build_reasons(full_text),
-                cv_gap=build_gaps(full_text),
+                preference_match=str(scored["preference_match"]),
+                why_fit=str(scored["why_fit"]),
+                cv_gap=str(scored["cv_gap"]),
                 notes=summary,
             )
         )
@@ -1820,8 +1904,8 @@ def collect_web_discovery_records(session: requests.Session) -> list[JobRecord]:
             )
             continue
 
-        full_text = f"{title} {company} {summary}"
-        fit = assess_fit(full_text, company, source_family, source, title=title)
+        scored = score_posting(title, company, summary, location, source_family=source_family, source=source)
+        fit = scored["fit"]
         score = int(fit["score"])
         min_score = min_score_for_fit(fit, source_family, source)
         if score < min(min_score, keep_score_threshold(source_family, source)):
@@ -1849,9 +1933,9 @@ def collect_web_discovery_records(session: requests.Session) -> list[JobRecord]:
                 email_bucket="main" if score >= min_score else "borderline",
                 fit_score=score,
                 fit_verdict=str(fit["fit_verdict"]),
-                preference_match=build_preference_match(full_text, company, location),
-                why_fit=build_reasons(full_text),
-                cv_gap=build_gaps(full_text),
+                preference_match=str(scored["preference_match"]),
+                why_fit=str(scored["why_fit"]),
+                cv_gap=str(scored["cv_gap"]),
                 notes=summary,
             )
         )
@@ -1955,8 +2039,8 @@ def collect_job_board_records(session: requests.Session, source: dict) -> list[J
                 target_stats["dropped"]["window"] += 1
             continue
 
-        full_text = f"{title} {company} {summary}"
-        fit = assess_fit(full_text, company, "JobBoard", effective_source_name, title=title)
+        scored = score_posting(title, company, summary, location, source_family="JobBoard", source=effective_source_name)
+        fit = scored["fit"]
         score = int(fit["score"])
         min_score = min_score_for_fit(fit, "JobBoard", effective_source_name)
         if score < min(min_score, keep_score_threshold("JobBoard", effective_source_name)):
@@ -1992,9 +2076,9 @@ def collect_job_board_records(session: requests.Session, source: dict) -> list[J
                 email_bucket="main" if score >= min_score else "borderline",
                 fit_score=score,
                 fit_verdict=str(fit["fit_verdict"]),
-                preference_match=build_preference_match(full_text, company, location),
-                why_fit=build_reasons(full_text),
-                cv_gap=build_gaps(full_text),
+                preference_match=str(scored["preference_match"]),
+                why_fit=str(scored["why_fit"]),
+                cv_gap=str(scored["cv_gap"]),
                 notes=summary,
                 salary_min=job.get("salary_min", 0),
                 salary_max=job.get("salary_max", 0),
@@ -2060,80 +2144,106 @@ def run_hot_scan() -> int:
 
     from .notify_telegram import is_configured, send_alert
 
-    session = requests.Session()
-    session.headers.update({"User-Agent": config.USER_AGENT})
     reset_source_diagnostics()
     reset_source_runtime_events()
-
-    records: list[JobRecord] = []
-    records.extend(run_source_stage("greenhouse", lambda: collect_greenhouse_records(session)))
-    records.extend(run_source_stage("lever", lambda: collect_lever_records(session)))
-    records.extend(run_source_stage("ashby", lambda: collect_ashby_records(session)))
-    records.extend(run_source_stage("workable", lambda: collect_workable_records(session)))
+    reset_scoring_cache()
+
+    # Boards whose ETag/body hash is unchanged since the last hot scan cannot
+    # hold new postings, so they are skipped before parsing and scoring. Their
+    # validators stay in memory until the alerts below have gone out: a scan
+    # that dies first leaves the previous validators on disk.
+    with board_cache_scope("hot_scan", skip_unchanged=True, defer_save=True):
+        records = run_source_stages(
+            [
+                ("greenhouse", collect_greenhouse_records),
+                ("lever", collect_lever_records),
+                ("ashby", collect_ashby_records),
+                ("workable", collect_workable_records),
+            ]
+        )
 
     records = dedupe_records(records)
     for record in records:
         compute_priority_score(record)
 
-    candidates = select_hot_lane(
-        records, min_fit=config.HOT_SCAN_MIN_FIT, limit=config.HOT_SCAN_MAX_ALERTS, require_fresh=False
-    )
+    eligible = select_hot_lane(records, min_fit=config.HOT_SCAN_MIN_FIT, limit=None, require_fresh=False)
+    candidates = eligible[: config.HOT_SCAN_MAX_ALERTS] if config.HOT_SCAN_MAX_ALERTS else eligible
+    # Roles past the alert cap carry to the next scan, so their boards must be
+    # re-read even if unchanged by then.
+    for rec in eligible[len(candidates):]:
+        if rec.ats_account:
+            BOARD_CACHE.forget_board(rec.ats_account)
     print(f"hot-scan: {len(records)} ATS records, {len(candidates)} fresh high-fit candidates")
     if not candidates:
+        BOARD_CACHE.save()
         return 0
 
-    # Upsert so the portal's #apply-now deep link resolves to a real doc.
-    try:
-        write_records_to_firestore(candidates)
-    except Exception as exc:  # noqa: BLE001
-        print(f"hot-scan firestore upsert failed: {type(exc).__name__}: {exc}")
-
-    client = init_firestore_client()
-    # File cache keeps local runs (no Firestore) non-spammy; the durable guard
-    # in CI is the Firestore `hot_alerted_at` flag (the file doesn't persist there).
-    file_cache = prune_seen_cache(load_seen_cache(config.HOT_ALERTED_CACHE_PATH), config.SEEN_CACHE_DAYS)
-    now_iso = now_utc().isoformat()
+    # A candidate that is not delivered on this scan (Telegram unconfigured,
+    # send failed, or the loop raised) must have its board re-read next time,
+    # so its validators are dropped before the cache is committed.
+    undelivered = {id(rec): rec for rec in candidates}
     alerts = 0
-
-    for rec in filter_new_records(candidates, file_cache):
-        doc_id = record_document_id(rec)
-        already_alerted = False
-        if client is not None:
-            try:
-                snap = client.collection(config.FIREBASE_COLLECTION).document(doc_id).get()
-                already_alerted = snap.exists and bool((snap.to_dict() or {}).get("hot_alerted_at"))
-            except Exception:
-                already_alerted = False
-        if already_alerted:
-            if rec.link:
-                file_cache[rec.link] = now_iso
-            continue
-
-        sent_ok = False
-        if not is_configured():
-            print(f"hot-scan: would alert {rec.company} / {rec.role} (fit {rec.fit_score}) — Telegram not configured")
-        elif send_alert(rec):
-            alerts += 1
-            sent_ok = True
-            print(f"hot-scan alert sent: {rec.company} / {rec.role} (fit {rec.fit_score})")
-        else:
-            print(f"hot-scan: alert FAILED to send for {rec.company} / {rec.role} — will retry next scan")
-
-        # Only mark as alerted once it has ACTUALLY been delivered. Marking on a
-        # failed/blocked/unconfigured send would permanently suppress a role the
-        # user never received (the bug that silenced alerts).
-        if sent_ok:
-            if rec.link:
-                file_cache[rec.link] = now_iso
+    try:
+        # Upsert so the portal's #apply-now deep link resolves to a real doc.
+        try:
+            write_records_to_firestore(candidates)
+        except Exception as exc:  # noqa: BLE001
+            print(f"hot-scan firestore upsert failed: {type(exc).__name__}: {exc}")
+
+        client = init_firestore_client()
+        # File cache keeps local runs (no Firestore) non-spammy; the durable guard
+        # in CI is the Firestore `hot_alerted_at` flag (the file doesn't persist there).
+        file_cache = prune_seen_cache(load_seen_cache(config.HOT_ALERTED_CACHE_PATH), config.SEEN_CACHE_DAYS)
+        now_iso = now_utc().isoformat()
+        fresh = filter_new_records(candidates, file_cache)
+        undelivered = {id(rec): rec for rec in fresh}  # the rest were alerted on an earlier scan
+
+        for rec in fresh:
+            doc_id = record_document_id(rec)
+            already_alerted = False
             if client is not None:
                 try:
-                    client.collection(config.FIREBASE_COLLECTION).document(doc_id).set(
-                        {"hot_alerted_at": now_iso}, merge=True
-                    )
+                    snap = client.collection(config.FIREBASE_COLLECTION).document(doc_id).get()
+                    already_alerted = snap.exists and bool((snap.to_dict() or {}).get("hot_alerted_at"))
                 except Exception:
-                    pass
+                    already_alerted = False
+            if already_alerted:
+                undelivered.pop(id(rec), None)
+                if rec.link:
+                    file_cache[rec.link] = now_iso
+                continue
+
+            sent_ok = False
+            if not is_configured():
+                print(f"hot-scan: would alert {rec.company} / {rec.role} (fit {rec.fit_score}) — Telegram not configured")
+            elif send_alert(rec):
+                alerts += 1
+                sent_ok = True
+                print(f"hot-scan alert sent: {rec.company} / {rec.role} (fit {rec.fit_score})")
+            else:
+                print(f"hot-scan: alert FAILED to send for {rec.company} / {rec.role} — will retry next scan")
+
+            # Only mark as alerted once it has ACTUALLY been delivered. Marking on a
+            # failed/blocked/unconfigured send would permanently suppress a role the
+            # user never received (the bug that silenced alerts).
+            if sent_ok:
+                undelivered.pop(id(rec), None)
+                if rec.link:
+                    file_cache[rec.link] = now_iso
+                if client is not None:
+                    try:
+                        client.collection(config.FIREBASE_COLLECTION).document(doc_id).set(
+                            {"hot_alerted_at": now_iso}, merge=True
+                        )
+                    except Exception:
+                        pass
 
-    save_seen_cache(config.HOT_ALERTED_CACHE_PATH, file_cache)
+        save_seen_cache(config.HOT_ALERTED_CACHE_PATH, file_cache)
+    finally:
+        for rec in undelivered.values():
+            if rec.ats_account:
+                BOARD_CACHE.forget_board(rec.ats_account)
+        BOARD_CACHE.save()
     print(f"hot-scan: {alerts} new alert(s) sent")
     return alerts
 
@@ -2153,6 +2263,7 @@ def main(
     session.headers.update({"User-Agent": config.USER_AGENT})
     reset_source_diagnostics()
     reset_source_runtime_events()
+    reset_scoring_cache()
 
     all_jobs: list[JobRecord] = []
     firestore_client = init_firestore_client()
@@ -2190,38 +2301,48 @@ def main(
                     except Exception:
                         pass
 
+    stages: list[SourceStage] = []
     if not skip_linkedin:
-        all_jobs.extend(run_source_stage("linkedin", lambda: collect_linkedin_records(session)))
+        stages.append(("linkedin", collect_linkedin_records))
     else:
         diag = init_source_diagnostic("LinkedIn", 0)
         add_source_note(diag, "skipped by CLI flag")
-    all_jobs.extend(run_source_stage("greenhouse", lambda: collect_greenhouse_records(session)))
-    all_jobs.extend(run_source_stage("lever", lambda: collect_lever_records(session)))
-    all_jobs.extend(run_source_stage("smartrecruiters", lambda: collect_smartrecruiters_records(session)))
-    all_jobs.extend(run_source_stage("ashby", lambda: collect_ashby_records(session)))
-    all_jobs.extend(run_source_stage("workable", lambda: collect_workable_records(session)))
-    all_jobs.extend(run_source_stage("workday", lambda: collect_workday_records(session)))
-    all_jobs.extend(run_source_stage("custom_careers", lambda: collect_custom_careers_records(session)))
+    stages.extend(
+        [
+            ("greenhouse", collect_greenhouse_records),
+            ("lever", collect_lever_records),
+            ("smartrecruiters", collect_smartrecruiters_records),
+            ("ashby", collect_ashby_records),
+            ("workable", collect_workable_records),
+            ("workday", collect_workday_records),
+        ]
+    )
+    if fast_email and "CustomCareers" not in config.FAST_EMAIL_JOB_BOARD_SOURCES:
+        diag = init_source_diagnostic("CustomCareers", 0)
+        add_source_note(diag, "skipped by --fast-email")
+    else:
+        stages.append(("custom_careers", collect_custom_careers_records))
     if should_run_recruiter_pages(scrape_only=scrape_only, validation_digest=validation_digest):
-        all_jobs.extend(run_source_stage("recruiter_pages", lambda: collect_recruiter_page_records(session)))
+        stages.append(("recruiter_pages", collect_recruiter_page_records))
     else:
         diag = init_source_diagnostic("RecruiterPages", 0)
         add_source_note(diag, "skipped by recruiter page cadence")
     if not fast_email:
-        all_jobs.extend(run_source_stage("web_discovery", lambda: collect_web_discovery_records(session)))
+        stages.append(("web_discovery", collect_web_discovery_records))
     for source in JOB_BOARD_SOURCES:
-        if source["name"] == "Workday":
+        if source["name"] in {"Workday", "CustomCareers"}:
             continue
         if fast_email and source["name"] not in config.FAST_EMAIL_JOB_BOARD_SOURCES:
             diag = init_source_diagnostic(source["name"], 0)
             add_source_note(diag, "skipped by --fast-email")
             continue
-        all_jobs.extend(
-            run_source_stage(
+        stages.append(
+            (
                 f"job_board:{source['name']}",
-                lambda source=source: collect_job_board_records(session, source),
+                lambda stage_session, source=source: collect_job_board_records(stage_session, source),
             )
         )
+    all_jobs.extend(run_source_stages(stages))
 
     records = run_step("dedupe_records", lambda: dedupe_records(sorted(all_jobs, key=lambda x: x.fit_score, reverse=True)))
     records = stamp_record_quality(records)
@@ -1,8 +1,13 @@
 from __future__ import annotations
 
-from typing import Dict, List, Tuple
+import hashlib
+import threading
+from collections import OrderedDict
+from functools import lru_cache
+from typing import Callable, Dict, FrozenSet, Iterable, List, Mapping, Optional, Sequence, Tuple
 
 from . import config
+from .matcher import TermMatcher
 
 CORE_ROLE_PATTERNS = (
     "product manager",
@@ -202,6 +207,160 @@ OFFLANE_PRODUCT_TITLES = (
 )
 
 
+BUCKET_SCREENING_TERMS = ("sanctions", "transaction monitoring")
+BUCKET_PRODUCT_COMPLIANCE_TERMS = ("product compliance", "compliance product")
+BUCKET_REGTECH_TERMS = ("regtech", "aml platform", "compliance automation")
+BUCKET_CONTRACT_ROLE_TERMS = ("business analyst", "implementation", "transformation", "product owner")
+BUCKET_TRANSFORMATION_ROLE_TERMS = ("business analyst", "implementation manager", "implementation lead", "product owner")
+BUCKET_SELECTIVE_TITLE_TERMS = (
+    "head of kyc", "head of onboarding", "head of financial crime",
+    "financial crime senior manager", "financial crime manager",
+    "fraud and financial crime senior manager", "risk product manager",
+    "payments product manager", "payment risk product manager",
+    "payments compliance product manager", "transformation lead",
+    "transformation manager", "controls lead", "controls manager",
+)
+PROCESS_TERMS = ("process", "operational", "operations", "transformation")
+ATS_SECTOR_TERMS = ("cards", "payments", "banking", "servicing")
+PREFERENCE_LOCATION_TERMS = ("london", "remote", "united kingdom", "hybrid")
+PREFERENCE_DOMAIN_TERMS = ("kyc", "aml", "screening", "onboarding", "financial crime", "sanctions")
+PRODUCT_BUCKETS = {"core_product", "product_compliance", "screening_sanctions_product", "clm_product_owner", "regtech_product"}
+
+
+def _catalogue_terms() -> Iterable[str]:
+    """Every literal the fit classifiers test for, so one scan answers them all."""
+    yield from CORE_ROLE_PATTERNS
+    yield from ADJACENT_ROLE_PATTERNS
+    yield from COMPLIANCE_BARE_TOKENS
+    yield from RISK_BARE_TOKENS
+    yield from FINCRIME_ANCHORS
+    for terms in TARGET_ANCHOR_GROUPS.values():
+        yield from terms
+    yield from TARGET_BOOST_TERMS
+    yield from SELECTIVE_SCOPE_TERMS
+    yield from CONTRACT_TERMS
+    yield from NEGATIVE_ROLE_PATTERNS
+    yield from OFFLANE_TITLE_PATTERNS
+    yield from PRODUCT_TITLE_PATTERNS
+    yield from OFFLANE_PRODUCT_TITLES
+    yield from BUCKET_SCREENING_TERMS
+    yield from BUCKET_PRODUCT_COMPLIANCE_TERMS
+    yield from BUCKET_REGTECH_TERMS
+    yield from BUCKET_CONTRACT_ROLE_TERMS
+    yield from BUCKET_TRANSFORMATION_ROLE_TERMS
+    yield from BUCKET_SELECTIVE_TITLE_TERMS
+    yield from PROCESS_TERMS
+    yield from ATS_SECTOR_TERMS
+    yield from PREFERENCE_LOCATION_TERMS
+    yield from PREFERENCE_DOMAIN_TERMS
+    yield from ("product", "manager", "platform", "business architect", "onboarding", "kyc", "api")
+    yield from config.DOMAIN_TERMS
+    yield from config.EXTRA_TERMS
+    yield from config.VENDOR_COMPANIES
+    yield from config.FINTECH_COMPANIES
+    yield from config.BANK_COMPANIES
+    yield from config.TECH_COMPANIES
+    yield from config.REASON_HINTS
+    yield from config.GAP_TERMS
+
+
+FIT_MATCHER = TermMatcher(_catalogue_terms())
+# scan_joined() relies on no term starting or ending in whitespace, which is
+# what makes hits("a b".strip()) == hits("a b").
+assert all(term == term.strip() for term in FIT_MATCHER.terms)
+
+
+class ScoringMemo:
+    """Bounded LRU of scoring results keyed by a hash of the inputs.
+
+    Keys are 16-byte digests, so memory is bounded by the entry count rather
+    than by how long the job descriptions are. Collectors run in parallel
+    stages, hence the lock.
+    """
+
+    def __init__(self, max_size: int) -> None:
+        self.max_size = max(0, max_size)
+        self._lock = threading.Lock()
+        self._entries: "OrderedDict[bytes, object]" = OrderedDict()
+        self._counts: Dict[str, Dict[str, int]] = {}
+
+    @staticmethod
+    def key(kind: str, *parts: object) -> bytes:
+        raw = "\x1f".join([kind, *(str(part) for part in parts)])
+        return hashlib.blake2b(raw.encode("utf-8", "surrogatepass"), digest_size=16).digest()
+
+    def _count(self, kind: str, outcome: str) -> None:
+        counts = self._counts.setdefault(kind, {"hits": 0, "misses": 0})
+        counts[outcome] += 1
+
+    def get(self, kind: str, key: bytes) -> Optional[object]:
+        with self._lock:
+            value = self._entries.get(key)
+            if value is None:
+                self._count(kind, "misses")
+                return None
+            self._entries.move_to_end(key)
+            self._count(kind, "hits")
+            return value
+
+    def put(self, key: bytes, value: object) -> None:
+        if not self.max_size:
+            return
+        with self._lock:
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._counts.clear()
+
+    def stats(self) -> Dict[str, object]:
+        with self._lock:
+            counts = {kind: dict(values) for kind, values in sorted(self._counts.items())}
+            size = len(self._entries)
+        hits = sum(values["hits"] for values in counts.values())
+        misses = sum(values["misses"] for values in counts.values())
+        return {
+            "hits": hits,
+            "misses": misses,
+            "hit_rate": round(hits / (hits + misses), 3) if hits + misses else 0.0,
+            "size": size,
+            "max_size": self.max_size,
+            "by_kind": counts,
+        }
+
+
+SCORING_MEMO = ScoringMemo(config.SCORING_CACHE_SIZE)
+
+
+def reset_scoring_cache() -> None:
+    SCORING_MEMO.clear()
+
+
+def scoring_cache_stats() -> Dict[str, object]:
+    return SCORING_MEMO.stats()
+
+
+def _copy_fit(fit: Dict[str, object]) -> Dict[str, object]:
+    # Callers get their own lists so nothing can edit a cached result.
+    return {key: list(value) if isinstance(value, list) else value for key, value in fit.items()}
+
+
+def _any_hit(hits: FrozenSet[str], terms: Iterable[str]) -> bool:
+    return not hits.isdisjoint(terms)
+
+
+def _is_offlane_title(title_hits: FrozenSet[str]) -> bool:
+    if _any_hit(title_hits, OFFLANE_PRODUCT_TITLES):
+        return True
+    if _any_hit(title_hits, PRODUCT_TITLE_PATTERNS):
+        return False
+    return _any_hit(title_hits, OFFLANE_TITLE_PATTERNS)
+
+
 def is_offlane_title(title_l: str) -> bool:
     """True if the TITLE is a role type Ade does not want (analyst/MLRO/etc.).
 
@@ -209,63 +368,44 @@ def is_offlane_title(title_l: str) -> bool:
     off-lane words (analyst, manager) are ignored when the title is a genuine
     product/owner role.
     """
-    if any(p in title_l for p in OFFLANE_PRODUCT_TITLES):
-        return True
-    if any(p in title_l for p in PRODUCT_TITLE_PATTERNS):
-        return False
-    return any(p in title_l for p in OFFLANE_TITLE_PATTERNS)
+    return _is_offlane_title(FIT_MATCHER.scan(title_l))
 
 
-def target_anchor_hits(text: str) -> List[str]:
-    text_l = text.lower()
-    hits: List[str] = []
-    for label, terms in TARGET_ANCHOR_GROUPS.items():
-        if any(term in text_l for term in terms):
-            hits.append(label)
-    return hits
+def _target_anchor_labels(hits: FrozenSet[str]) -> List[str]:
+    return [label for label, terms in TARGET_ANCHOR_GROUPS.items() if _any_hit(hits, terms)]
 
 
-def classify_target_role_bucket(text: str) -> str:
-    """Map a role into Ade's job-search lanes.
+def target_anchor_hits(text: str) -> List[str]:
+    return _target_anchor_labels(FIT_MATCHER.scan(text.lower()))
 
-    The bucket is intentionally stricter than generic relevance. It keeps the
-    feed centred on financial crime product/controls/workflow roles while still
-    allowing the user's requested Part 4 adjacent roles.
-    """
-    text_l = text.lower()
-    anchors = set(target_anchor_hits(text_l))
+
+def _classify_target_role_bucket(hits: FrozenSet[str], anchors: Iterable[str]) -> str:
+    anchors = set(anchors)
     has_product = "Product" in anchors
     has_domain = bool(anchors & {"Financial Crime", "KYC", "KYB", "AML", "Screening", "Onboarding", "CLM"})
-    has_screening = bool(anchors & {"Screening"}) or any(term in text_l for term in ("sanctions", "transaction monitoring"))
+    has_screening = bool(anchors & {"Screening"}) or _any_hit(hits, BUCKET_SCREENING_TERMS)
     has_clm = "CLM" in anchors
-    has_scope = any(term in text_l for term in SELECTIVE_SCOPE_TERMS)
-    has_contract = any(term in text_l for term in CONTRACT_TERMS)
+    has_scope = _any_hit(hits, SELECTIVE_SCOPE_TERMS)
+    has_contract = _any_hit(hits, CONTRACT_TERMS)
 
     if has_product and has_domain:
-        if "product compliance" in text_l or "compliance product" in text_l:
+        if _any_hit(hits, BUCKET_PRODUCT_COMPLIANCE_TERMS):
             return "product_compliance"
         if has_screening:
             return "screening_sanctions_product"
         if has_clm:
             return "clm_product_owner"
-        if "regtech" in text_l or "aml platform" in text_l or "compliance automation" in text_l:
+        if _any_hit(hits, BUCKET_REGTECH_TERMS):
             return "regtech_product"
         return "core_product"
 
-    if has_contract and has_domain and any(term in text_l for term in ("business analyst", "implementation", "transformation", "product owner")):
+    if has_contract and has_domain and _any_hit(hits, BUCKET_CONTRACT_ROLE_TERMS):
         return "contract_ba_transformation"
 
-    if has_domain and any(term in text_l for term in ("business analyst", "implementation manager", "implementation lead", "product owner")):
+    if has_domain and _any_hit(hits, BUCKET_TRANSFORMATION_ROLE_TERMS):
         return "contract_ba_transformation" if has_contract else "selective_transformation"
 
-    if has_domain and any(term in text_l for term in (
-        "head of kyc", "head of onboarding", "head of financial crime",
-        "financial crime senior manager", "financial crime manager",
-        "fraud and financial crime senior manager", "risk product manager",
-        "payments product manager", "payment risk product manager",
-        "payments compliance product manager", "transformation lead",
-        "transformation manager", "controls lead", "controls manager",
-    )) and has_scope:
+    if has_domain and _any_hit(hits, BUCKET_SELECTIVE_TITLE_TERMS) and has_scope:
         return "selective_transformation"
 
     if has_domain and has_scope:
@@ -277,45 +417,87 @@ def classify_target_role_bucket(text: str) -> str:
     return "out_of_scope"
 
 
+def classify_target_role_bucket(text: str) -> str:
+    """Map a role into Ade's job-search lanes.
+
+    The bucket is intentionally stricter than generic relevance. It keeps the
+    feed centred on financial crime product/controls/workflow roles while still
+    allowing the user's requested Part 4 adjacent roles.
+    """
+    hits = FIT_MATCHER.scan(text.lower())
+    return _classify_target_role_bucket(hits, _target_anchor_labels(hits))
+
+
 def has_domain_anchor(text: str) -> bool:
-    text_l = text.lower()
-    return any(term in text_l for term in config.DOMAIN_TERMS)
+    return _any_hit(FIT_MATCHER.scan(text.lower()), config.DOMAIN_TERMS)
 
 
-def classify_role_family(text: str) -> str:
-    text_l = text.lower()
-    if any(pattern in text_l for pattern in CORE_ROLE_PATTERNS):
+def _classify_role_family(hits: FrozenSet[str]) -> str:
+    if _any_hit(hits, CORE_ROLE_PATTERNS):
         return "core"
-    if any(pattern in text_l for pattern in ADJACENT_ROLE_PATTERNS):
+    if _any_hit(hits, ADJACENT_ROLE_PATTERNS):
         return "adjacent"
     # Bare "risk manager" / "compliance officer" only count as adjacent when
     # paired with a tight fincrime anchor. DOMAIN_TERMS would let "Marketing
     # Risk Manager" through because bare "risk" is in there.
-    if any(tok in text_l for tok in COMPLIANCE_BARE_TOKENS + RISK_BARE_TOKENS):
-        if any(anchor in text_l for anchor in FINCRIME_ANCHORS):
+    if _any_hit(hits, COMPLIANCE_BARE_TOKENS) or _any_hit(hits, RISK_BARE_TOKENS):
+        if _any_hit(hits, FINCRIME_ANCHORS):
             return "adjacent"
-    if "product" in text_l and "manager" in text_l:
+    if "product" in hits and "manager" in hits:
         return "core"
-    if "product" in text_l or "platform" in text_l:
+    if "product" in hits or "platform" in hits:
         return "adjacent"
     return "stretch"
 
 
+def classify_role_family(text: str) -> str:
+    return _classify_role_family(FIT_MATCHER.scan(text.lower()))
+
+
 def assess_fit(text: str, company: str, source_family: str = "", source: str = "", title: str = "") -> Dict[str, object]:
+    key = SCORING_MEMO.key("assess_fit", text, company, source_family, source, title)
+    fit = SCORING_MEMO.get("assess_fit", key)
+    if fit is None:
+        fit = _assess_fit(text, company, source_family, source, title)
+        SCORING_MEMO.put(key, fit)
+    return _copy_fit(fit)
+
+
+def _assess_fit(text: str, company: str, source_family: str, source: str, title: str) -> Dict[str, object]:
     text_l = text.lower()
     title_l = (title or "").lower()
-    classification_text = f"{title_l} {text_l}".strip()
+    # One automaton pass per string: the body, the (short) title and company.
+    # The classification text is title + body, so its hits are the union of
+    # both plus anything spanning the joining space.
+    text_hits = FIT_MATCHER.scan(text_l)
+    title_hits = FIT_MATCHER.scan(title_l)
+    classification_hits = FIT_MATCHER.scan_joined(title_l, title_hits, text_l, text_hits)
+    company_hits = FIT_MATCHER.scan(company.lower())
+    return _fit_from_hits(
+        text_hits, title_hits, classification_hits, company_hits, bool(title), source_family, source
+    )
+
+
+def _fit_from_hits(
+    text_hits: FrozenSet[str],
+    title_hits: FrozenSet[str],
+    classification_hits: FrozenSet[str],
+    company_hits: FrozenSet[str],
+    has_title: bool,
+    source_family: str,
+    source: str,
+) -> Dict[str, object]:
     # Role TYPE is judged from the title only (when provided); domain anchors
     # still come from the full text. No title given -> no off-lane gate (keeps
     # the lighter score_fit() helper behaving as before).
-    offlane_title = bool(title) and is_offlane_title(title_l)
-    matched_domain = [t for t in config.DOMAIN_TERMS if t in text_l]
-    matched_extra = [t for t in config.EXTRA_TERMS if t in text_l]
-    negative_hits = [term for term in NEGATIVE_ROLE_PATTERNS if term in text_l]
-    role_family = classify_role_family(classification_text)
-    target_anchors = target_anchor_hits(classification_text)
+    offlane_title = has_title and _is_offlane_title(title_hits)
+    matched_domain = [t for t in config.DOMAIN_TERMS if t in text_hits]
+    matched_extra = [t for t in config.EXTRA_TERMS if t in text_hits]
+    negative_hits = [term for term in NEGATIVE_ROLE_PATTERNS if term in text_hits]
+    role_family = _classify_role_family(classification_hits)
+    target_anchors = _target_anchor_labels(classification_hits)
     target_anchor_count = len(target_anchors)
-    role_bucket = classify_target_role_bucket(classification_text)
+    role_bucket = _classify_target_role_bucket(classification_hits, target_anchors)
     if role_bucket in {"contract_ba_transformation", "selective_transformation"}:
         offlane_title = False
     domain_anchor = bool(matched_domain) or target_anchor_count >= 2
@@ -326,7 +508,7 @@ def assess_fit(text: str, company: str, source_family: str = "", source: str = "
         score += 22
     elif role_family == "adjacent":
         score += 16
-    elif "product" in text_l:
+    elif "product" in text_hits:
         score += 4
 
     if matched_domain:
@@ -339,7 +521,7 @@ def assess_fit(text: str, company: str, source_family: str = "", source: str = "
     if target_anchor_count:
         score += min(20, 4 * target_anchor_count)
 
-    if role_bucket in {"core_product", "product_compliance", "screening_sanctions_product", "clm_product_owner", "regtech_product"}:
+    if role_bucket in PRODUCT_BUCKETS:
         score += 12
     elif role_bucket == "contract_ba_transformation":
         score += 8
@@ -352,31 +534,30 @@ def assess_fit(text: str, company: str, source_family: str = "", source: str = "
     elif role_bucket == "out_of_scope":
         score -= 14
 
-    boost_hits = [term for term in TARGET_BOOST_TERMS if term in text_l]
+    boost_hits = [term for term in TARGET_BOOST_TERMS if term in text_hits]
     if boost_hits:
         score += min(12, 2 * len(boost_hits))
 
-    if domain_anchor and any(term in text_l for term in ("process", "operational", "operations", "transformation")):
+    if domain_anchor and _any_hit(text_hits, PROCESS_TERMS):
         score += 4
-    elif any(term in text_l for term in ("process", "operational", "operations", "transformation")):
+    elif _any_hit(text_hits, PROCESS_TERMS):
         score += 1
 
-    if domain_anchor and "business architect" in text_l:
+    if domain_anchor and "business architect" in text_hits:
         score += 8
 
-    company_l = company.lower()
-    if any(v in company_l for v in config.VENDOR_COMPANIES):
+    if _any_hit(company_hits, config.VENDOR_COMPANIES):
         score += 8
-    if any(f in company_l for f in config.FINTECH_COMPANIES):
+    if _any_hit(company_hits, config.FINTECH_COMPANIES):
         score += 4
-    if any(b in company_l for b in config.BANK_COMPANIES):
+    if _any_hit(company_hits, config.BANK_COMPANIES):
         score += 3
-    if any(t in company_l for t in config.TECH_COMPANIES):
+    if _any_hit(company_hits, config.TECH_COMPANIES):
         score += 2
 
-    if "onboarding" in text_l or "kyc" in text_l:
+    if "onboarding" in text_hits or "kyc" in text_hits:
         score += 4
-    if "api" in text_l or "platform" in text_l:
+    if "api" in text_hits or "platform" in text_hits:
         score += 2 if domain_anchor else 1
 
     if negative_hits:
@@ -407,7 +588,7 @@ def assess_fit(text: str, company: str, source_family: str = "", source: str = "
         score += 12
     elif source_family == "ATS" and role_family == "adjacent":
         score += 6
-    if source_family == "ATS" and any(term in text_l for term in ("cards", "payments", "banking", "servicing")):
+    if source_family == "ATS" and _any_hit(text_hits, ATS_SECTOR_TERMS):
         score += 3
 
     # Title is a role type Ade doesn't want (analyst/MLRO/investigator/FP&A/BA/
@@ -422,7 +603,7 @@ def assess_fit(text: str, company: str, source_family: str = "", source: str = "
         fit_verdict = "STRETCH"
     elif negative_hits and not domain_anchor:
         fit_verdict = "STRETCH"
-    elif role_bucket in {"core_product", "product_compliance", "screening_sanctions_product", "clm_product_owner", "regtech_product"} and score >= 78:
+    elif role_bucket in PRODUCT_BUCKETS and score >= 78:
         fit_verdict = "STRONG"
     elif role_bucket in {"contract_ba_transformation", "selective_transformation"} and score >= 68:
         fit_verdict = "PARTIAL"
@@ -464,63 +645,215 @@ def score_fit(text: str, company: str) -> Tuple[int, List[str], List[str]]:
     return int(result["score"]), list(result["matched_domain"]), list(result["matched_extra"])
 
 
-def build_reasons(text: str) -> str:
-    text_l = text.lower()
-    reasons = []
-    for key, reason in config.REASON_HINTS.items():
-        if key in text_l:
-            reasons.append(reason)
+def _reasons_from_hits(text_hits: FrozenSet[str]) -> str:
+    reasons = [reason for key, reason in config.REASON_HINTS.items() if key in text_hits]
     if not reasons:
-        if has_domain_anchor(text):
+        if _any_hit(text_hits, config.DOMAIN_TERMS):
             reasons.append("Direct overlap with your CLM, onboarding, screening, and financial crime delivery background.")
         else:
             reasons.append("Some structural overlap, but the role is less specific to your core CLM, onboarding, and financial crime experience.")
     return " ".join(reasons[:3])
 
 
-def build_gaps(text: str) -> str:
-    text_l = text.lower()
-    gaps = []
-    for key, hint in config.GAP_TERMS.items():
-        if key in text_l:
-            gaps.append(hint)
+def build_reasons(text: str) -> str:
+    key = SCORING_MEMO.key("build_reasons", text)
+    reasons = SCORING_MEMO.get("build_reasons", key)
+    if reasons is None:
+        reasons = _reasons_from_hits(FIT_MATCHER.scan(text.lower()))
+        SCORING_MEMO.put(key, reasons)
+    return str(reasons)
+
+
+def _gaps_from_hits(text_hits: FrozenSet[str]) -> str:
+    gaps = [hint for key, hint in config.GAP_TERMS.items() if key in text_hits]
     if not gaps:
-        if has_domain_anchor(text):
+        if _any_hit(text_hits, config.DOMAIN_TERMS):
             gaps.append("No major domain gap; emphasize direct regulated workflow, platform, and cross-functional delivery experience.")
         else:
             gaps.append("Main gap is domain specificity; the role reads broader than your strongest CLM, onboarding, and financial crime track record.")
     return " ".join(gaps[:2])
 
 
-def build_preference_match(text: str, company: str, location: str) -> str:
-    text_l = text.lower()
-    company_l = company.lower()
-    location_l = location.lower()
-    role_family = classify_role_family(text)
+def build_gaps(text: str) -> str:
+    key = SCORING_MEMO.key("build_gaps", text)
+    gaps = SCORING_MEMO.get("build_gaps", key)
+    if gaps is None:
+        gaps = _gaps_from_hits(FIT_MATCHER.scan(text.lower()))
+        SCORING_MEMO.put(key, gaps)
+    return str(gaps)
+
+
+def _preference_from_hits(text_hits: FrozenSet[str], company_hits: FrozenSet[str], location_hits: FrozenSet[str]) -> str:
+    role_family = _classify_role_family(text_hits)
 
     parts = []
-    if any(term in location_l for term in ["london", "remote", "united kingdom", "hybrid"]):
+    if _any_hit(location_hits, PREFERENCE_LOCATION_TERMS):
         parts.append("London/Remote UK")
     if role_family == "core":
         parts.append("Core role family")
     elif role_family == "adjacent":
         parts.append("Adjacent role family")
-    if any(term in text_l for term in ["kyc", "aml", "screening", "onboarding", "financial crime", "sanctions"]):
+    if _any_hit(text_hits, PREFERENCE_DOMAIN_TERMS):
         parts.append("KYC/AML/Onboarding")
-    if any(vendor in company_l for vendor in config.VENDOR_COMPANIES):
+    if _any_hit(company_hits, config.VENDOR_COMPANIES):
         parts.append("RegTech/Vendor")
-    if any(fintech in company_l for fintech in config.FINTECH_COMPANIES):
+    if _any_hit(company_hits, config.FINTECH_COMPANIES):
         parts.append("Fintech/Payments")
-    if any(bank in company_l for bank in config.BANK_COMPANIES):
+    if _any_hit(company_hits, config.BANK_COMPANIES):
         parts.append("Bank/FS")
-    if any(tech in company_l for tech in config.TECH_COMPANIES):
+    if _any_hit(company_hits, config.TECH_COMPANIES):
         parts.append("Big Tech")
-    if "api" in text_l or "platform" in text_l:
+    if "api" in text_hits or "platform" in text_hits:
         parts.append("Platform/API")
 
     return " · ".join(parts) if parts else "General product fit"
 
 
+def build_preference_match(text: str, company: str, location: str) -> str:
+    return _preference_from_hits(
+        FIT_MATCHER.scan(text.lower()), FIT_MATCHER.scan(company.lower()), FIT_MATCHER.scan(location.lower())
+    )
+
+
+BATCH_COLUMNS = ("score", "fit_verdict", "role_family", "role_bucket", "preference_match", "why_fit", "cv_gap", "fit")
+
+
+def _joined_hits(parts: Sequence[Tuple[str, FrozenSet[str]]]) -> FrozenSet[str]:
+    """Hits for `" ".join(texts)` from each part's own hits (see scan_joined)."""
+    reach = FIT_MATCHER.max_term_length
+    head, hits = parts[0]
+    for text, part_hits in parts[1:]:
+        hits = FIT_MATCHER.scan_joined(head, hits, text, part_hits)
+        head = f"{head[-reach:]} {text[-reach:]}" if len(text) < reach else text[-reach:]
+    return hits
+
+
+def _score_posting(
+    title: str,
+    company: str,
+    summary: str,
+    location: str,
+    source_family: str,
+    source: str,
+    location_in_text: bool,
+    scan_field: Callable[[str], FrozenSet[str]],
+) -> Dict[str, object]:
+    title_l = title.lower()
+    company_l = company.lower()
+    location_l = location.lower()
+    title_hits = scan_field(title_l)
+    company_hits = scan_field(company_l)
+    location_hits = scan_field(location_l)
+    summary_hits = FIT_MATCHER.scan(summary.lower())
+    # The scoring text is "title company [location] summary" and the
+    # classification text prefixes the title again; both are assembled from
+    # the per-field hits instead of lowering and rescanning the whole posting.
+    parts = [(title_l, title_hits), (company_l, company_hits)]
+    if location_in_text:
+        parts.append((location_l, location_hits))
+    parts.append((summary.lower(), summary_hits))
+    text_hits = _joined_hits(parts)
+    classification_hits = _joined_hits([(title_l, title_hits)] + parts)
+    fit = _fit_from_hits(text_hits, title_hits, classification_hits, company_hits, bool(title), source_family, source)
+    return {
+        "score": int(fit["score"]),
+        "fit_verdict": str(fit["fit_verdict"]),
+        "role_family": str(fit["role_family"]),
+        "role_bucket": str(fit["role_bucket"]),
+        "preference_match": _preference_from_hits(text_hits, company_hits, location_hits),
+        "why_fit": _reasons_from_hits(text_hits),
+        "cv_gap": _gaps_from_hits(text_hits),
+        "fit": fit,
+    }
+
+
+def score_posting(
+    title: str,
+    company: str,
+    summary: str,
+    location: str = "",
+    *,
+    source_family: str = "",
+    source: str = "",
+    location_in_text: bool = False,
+) -> Dict[str, object]:
+    """Everything a collector needs for one posting from a single scan of each field.
+
+    Equivalent to `assess_fit(full_text, company, source_family, source,
+    title=title)` plus `build_preference_match(full_text, company, location)`,
+    `build_reasons(full_text)` and `build_gaps(full_text)`, where `full_text`
+    is `f"{title} {company} {summary}"` (with the location before the summary
+    when `location_in_text` is set). The `fit` key holds the assess_fit dict.
+    """
+    return _memo_score_posting(
+        title or "", company or "", summary or "", location or "", source_family, source, location_in_text, FIT_MATCHER.scan
+    )
+
+
+def _memo_score_posting(
+    title: str,
+    company: str,
+    summary: str,
+    location: str,
+    source_family: str,
+    source: str,
+    location_in_text: bool,
+    scan_field: Callable[[str], FrozenSet[str]],
+) -> Dict[str, object]:
+    key = SCORING_MEMO.key("score_posting", title, company, summary, location, source_family, source, location_in_text)
+    scored = SCORING_MEMO.get("score_posting", key)
+    if scored is None:
+        scored = _score_posting(title, company, summary, location, source_family, source, location_in_text, scan_field)
+        SCORING_MEMO.put(key, scored)
+    return {**scored, "fit": _copy_fit(scored["fit"])}
+
+
+def _cell(row: Mapping[str, object], key: str, default: str = "") -> str:
+    value = row.get(key)
+    return value if isinstance(value, str) else default
+
+
+def assess_fit_batch(
+    jobs: Iterable[Mapping[str, object]],
+    *,
+    source_family: str = "",
+    source: str = "",
+    location_in_text: bool = False,
+):
+    """Score many postings at once and return the results as columns.
+
+    `jobs` is a list of dicts or a pandas DataFrame with `title`, `company`,
+    `summary` and optionally `location`, `source_family` and `source` (the
+    keyword arguments are the defaults for rows that leave those out). The
+    result is a dict of equal-length lists keyed by `BATCH_COLUMNS`, or a
+    DataFrame on the input's index when a DataFrame was passed in. Titles,
+    companies and locations repeat heavily within a run, so their scans are
+    shared across the batch.
+    """
+    frame = jobs if hasattr(jobs, "to_dict") and hasattr(jobs, "columns") else None
+    rows = frame.to_dict("records") if frame is not None else list(jobs)
+    scan_field = lru_cache(maxsize=4096)(FIT_MATCHER.scan)
+    columns: Dict[str, List[object]] = {name: [] for name in BATCH_COLUMNS}
+    for row in rows:
+        scored = _memo_score_posting(
+            _cell(row, "title"),
+            _cell(row, "company"),
+            _cell(row, "summary"),
+            _cell(row, "location"),
+            _cell(row, "source_family", source_family),
+            _cell(row, "source", source),
+            location_in_text,
+            scan_field,
+        )
+        for name in BATCH_COLUMNS:
+            columns[name].append(scored[name])
+    if frame is None:
+        return columns
+    import pandas as pd
+
+    return pd.DataFrame(columns, index=frame.index)
+
+
 def is_relevant_title(title: str) -> bool:
     title_l = title.lower()
     if any(term in title_l for term in config.EXCLUDE_TITLE_TERMS):
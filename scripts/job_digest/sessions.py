@@ -0,0 +1,56 @@
+"""HTTP session helpers shared by the source stages.
+
+Each source stage gets its own `requests.Session` so connection pools, cookies
+and header tweaks made by one collector never leak into another stage running
+alongside it. `DeadlineSession` carries the stage deadline with it: once the
+deadline passes, every further request raises instead of starting a new
+network wait. That gives stages running on worker threads the same cut-off the
+`SIGALRM` timeout provides on the main thread.
+"""
+from __future__ import annotations
+
+import time
+
+import requests
+
+from . import config
+
+
+class StageDeadlineExceeded(TimeoutError):
+    """Raised by `DeadlineSession` once its stage deadline has passed."""
+
+
+class DeadlineSession(requests.Session):
+    """`requests.Session` that refuses to start requests after `deadline`.
+
+    `deadline` is a `time.monotonic()` timestamp (or None for no limit). While
+    the deadline is live, numeric request timeouts are clamped to the time that
+    remains so a single slow host cannot overrun the stage.
+    """
+
+    def __init__(self, deadline: float | None = None) -> None:
+        super().__init__()
+        self.deadline = deadline
+
+    def remaining(self) -> float | None:
+        if self.deadline is None:
+            return None
+        return self.deadline - time.monotonic()
+
+    def request(self, method, url, *args, **kwargs):  # noqa: ANN001, ANN201
+        remaining = self.remaining()
+        if remaining is not None:
+            if remaining <= 0:
+                raise StageDeadlineExceeded(f"stage deadline passed before {method} {url}")
+            timeout = kwargs.get("timeout")
+            if timeout is None:
+                kwargs["timeout"] = remaining
+            elif isinstance(timeout, (int, float)):
+                kwargs["timeout"] = max(0.5, min(float(timeout), remaining))
+        return super().request(method, url, *args, **kwargs)
+
+
+def build_source_session(deadline: float | None = None) -> DeadlineSession:
+    session = DeadlineSession(deadline)
+    session.headers.update({"User-Agent": config.USER_AGENT})
+    return session
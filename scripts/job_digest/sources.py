@@ -1,14 +1,18 @@
 from __future__ import annotations
 
 import csv
+import heapq
+import html as html_lib
 import json
 import os
 import re
 import subprocess
 import tempfile
+import threading
 import time
 import xml.etree.ElementTree as ET
-from datetime import datetime, timezone
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
 from email.utils import parsedate_to_datetime
 from pathlib import Path
 from typing import Dict, Iterable, List, Optional, Tuple
@@ -21,6 +25,14 @@ try:
 except Exception:  # noqa: BLE001
     FieldFilter = None
 
+from .board_fetch import board_cache_note, fetch_board_jobs, reset_board_cache_stats
+from .detail_cache import (
+    cached_job_details,
+    detail_cache_note,
+    job_details_from_response,
+    reset_detail_cache_stats,
+    save_detail_page_cache,
+)
 from .boards import (
     ASHBY_BOARDS,
     GREENHOUSE_BOARDS,
@@ -29,7 +41,6 @@ from .boards import (
     LEVER_BOARDS,
     SMARTRECRUITERS_COMPANIES,
     WORKABLE_ACCOUNTS,
-    WORKDAY_SITES,
 )
 from . import config
 from .config import (
@@ -50,8 +61,10 @@ from .config import (
     select_company_batch,
 )
 from .models import JobRecord
+from .rate_limit import AdaptivePacer
 from .indeed_jobspy import jobspy_indeed_search
-from .scoring import assess_fit, build_gaps, build_preference_match, build_reasons, score_fit
+from .job_text import read_jsonld_node
+from .scoring import assess_fit, build_gaps, build_preference_match, build_reasons, score_fit, score_posting
 from .utils import canonicalize_posted_fields, clean_link, extract_relative_posted_text, normalize_text, trim_summary
 
 try:
@@ -60,7 +73,17 @@ except Exception:  # noqa: BLE001
     feedparser = None
 
 SOURCE_RUNTIME_EVENTS: Dict[str, Dict[str, object]] = {}
+# Source stages can run on worker threads (runner.run_source_stages), so the
+# read-modify-write counter updates below are serialised.
+SOURCE_RUNTIME_EVENTS_LOCK = threading.Lock()
 CUSTOM_CAREERS_HEALTH_PATH = config.DIGEST_DIR / "custom_careers_health.json"
+CUSTOM_CAREERS_FAILED_STATUSES = {"blocked", "broken", "timed_out"}
+# Per-target crawl outcomes for this run, keyed by careers_url; the runner folds
+# them into the health state so targets that never yield a job are still seen.
+CUSTOM_CAREERS_CRAWL_OUTCOMES: Dict[str, Dict[str, object]] = {}
+# Sources whose stage the runner stopped waiting for. Their threads may still be
+# running, so any event they report after that point is dropped.
+ABANDONED_SOURCES: set = set()
 CUSTOM_CAREERS_GENERIC_PAGE_PATTERN = re.compile(
     r"job openings at|job opportunities at|search\s*&\s*apply|search and apply|careers?$|career opportunities|"
     r"campus events|all jobs|open roles|join our team|join us|students|graduates|internships|military spouses|veterans|"
@@ -79,7 +102,12 @@ CUSTOM_CAREERS_NON_UK_PATH_PATTERN = re.compile(
 
 
 def reset_source_runtime_events() -> None:
-    SOURCE_RUNTIME_EVENTS.clear()
+    with SOURCE_RUNTIME_EVENTS_LOCK:
+        SOURCE_RUNTIME_EVENTS.clear()
+        CUSTOM_CAREERS_CRAWL_OUTCOMES.clear()
+        ABANDONED_SOURCES.clear()
+    reset_board_cache_stats()
+    reset_detail_cache_stats()
 
 
 def mark_source_runtime_event(
@@ -94,55 +122,73 @@ def mark_source_runtime_event(
     query_count: int | None = None,
     company_query_count: int | None = None,
     adjacent_query_count: int | None = None,
+    schedule: Dict[str, object] | None = None,
 ) -> None:
-    state = SOURCE_RUNTIME_EVENTS.setdefault(
-        source_name,
-        {
-            "blocked": 0,
-            "timed_out": 0,
-            "failed": 0,
-            "raw": 0,
-            "notes": [],
-            "mode": "",
-            "query_count": 0,
-            "company_query_count": 0,
-            "adjacent_query_count": 0,
-        },
-    )
-    state["blocked"] = int(state.get("blocked", 0) or 0) + blocked
-    state["timed_out"] = int(state.get("timed_out", 0) or 0) + timed_out
-    state["failed"] = int(state.get("failed", 0) or 0) + failed
-    if raw is not None:
-        state["raw"] = max(int(state.get("raw", 0) or 0), int(raw))
-    if mode:
-        state["mode"] = mode
-    if query_count is not None:
-        state["query_count"] = max(int(state.get("query_count", 0) or 0), int(query_count))
-    if company_query_count is not None:
-        state["company_query_count"] = max(int(state.get("company_query_count", 0) or 0), int(company_query_count))
-    if adjacent_query_count is not None:
-        state["adjacent_query_count"] = max(int(state.get("adjacent_query_count", 0) or 0), int(adjacent_query_count))
-    if note:
-        notes = state.setdefault("notes", [])
-        if note not in notes:
-            notes.append(note)
+    with SOURCE_RUNTIME_EVENTS_LOCK:
+        if source_name in ABANDONED_SOURCES:
+            return
+        state = SOURCE_RUNTIME_EVENTS.setdefault(
+            source_name,
+            {
+                "blocked": 0,
+                "timed_out": 0,
+                "failed": 0,
+                "raw": 0,
+                "notes": [],
+                "mode": "",
+                "query_count": 0,
+                "company_query_count": 0,
+                "adjacent_query_count": 0,
+            },
+        )
+        state["blocked"] = int(state.get("blocked", 0) or 0) + blocked
+        state["timed_out"] = int(state.get("timed_out", 0) or 0) + timed_out
+        state["failed"] = int(state.get("failed", 0) or 0) + failed
+        if raw is not None:
+            state["raw"] = max(int(state.get("raw", 0) or 0), int(raw))
+        if mode:
+            state["mode"] = mode
+        if query_count is not None:
+            state["query_count"] = max(int(state.get("query_count", 0) or 0), int(query_count))
+        if company_query_count is not None:
+            state["company_query_count"] = max(int(state.get("company_query_count", 0) or 0), int(company_query_count))
+        if adjacent_query_count is not None:
+            state["adjacent_query_count"] = max(int(state.get("adjacent_query_count", 0) or 0), int(adjacent_query_count))
+        if schedule is not None:
+            state["schedule"] = schedule
+        if note:
+            notes = state.setdefault("notes", [])
+            if note not in notes:
+                notes.append(note)
+
+
+def abandon_source_runtime_events(source_name: str) -> None:
+    with SOURCE_RUNTIME_EVENTS_LOCK:
+        ABANDONED_SOURCES.add(source_name)
 
 
 def get_source_runtime_events() -> Dict[str, Dict[str, object]]:
-    return {
-        name: {
-            "blocked": int(payload.get("blocked", 0) or 0),
-            "timed_out": int(payload.get("timed_out", 0) or 0),
-            "failed": int(payload.get("failed", 0) or 0),
-            "raw": int(payload.get("raw", 0) or 0),
-            "notes": list(payload.get("notes", []) or []),
-            "mode": str(payload.get("mode", "") or ""),
-            "query_count": int(payload.get("query_count", 0) or 0),
-            "company_query_count": int(payload.get("company_query_count", 0) or 0),
-            "adjacent_query_count": int(payload.get("adjacent_query_count", 0) or 0),
+    with SOURCE_RUNTIME_EVENTS_LOCK:
+        return {
+            name: {
+                "blocked": int(payload.get("blocked", 0) or 0),
+                "timed_out": int(payload.get("timed_out", 0) or 0),
+                "failed": int(payload.get("failed", 0) or 0),
+                "raw": int(payload.get("raw", 0) or 0),
+                "notes": list(payload.get("notes", []) or []),
+                "mode": str(payload.get("mode", "") or ""),
+                "query_count": int(payload.get("query_count", 0) or 0),
+                "company_query_count": int(payload.get("company_query_count", 0) or 0),
+                "adjacent_query_count": int(payload.get("adjacent_query_count", 0) or 0),
+                "schedule": dict(payload.get("schedule", {}) or {}),
+            }
+            for name, payload in list(SOURCE_RUNTIME_EVENTS.items())
         }
-        for name, payload in SOURCE_RUNTIME_EVENTS.items()
-    }
+
+
+def get_custom_careers_crawl_outcomes() -> Dict[str, Dict[str, object]]:
+    with SOURCE_RUNTIME_EVENTS_LOCK:
+        return {url: dict(outcome) for url, outcome in CUSTOM_CAREERS_CRAWL_OUTCOMES.items()}
 
 
 def load_custom_careers_health_state() -> Dict[str, Dict[str, object]]:
@@ -160,13 +206,86 @@ def save_custom_careers_health_state(state: Dict[str, Dict[str, object]]) -> Non
         return
     existing = load_custom_careers_health_state()
     merged = dict(existing)
-    merged.update(state)
+    for careers_url, entry in state.items():
+        merged[careers_url] = roll_custom_careers_health(existing.get(careers_url) or {}, entry)
     try:
         CUSTOM_CAREERS_HEALTH_PATH.write_text(json.dumps(merged, indent=2, ensure_ascii=False), encoding="utf-8")
     except Exception:
         return
 
 
+def _parse_health_time(value: object) -> Optional[datetime]:
+    try:
+        parsed = datetime.fromisoformat(str(value or ""))
+    except ValueError:
+        return None
+    return parsed if parsed.tzinfo else parsed.replace(tzinfo=timezone.utc)
+
+
+def _recent_kept(entry: Dict[str, object]) -> List[int]:
+    recent = entry.get("recent_kept")
+    if isinstance(recent, list):
+        return [int(value or 0) for value in recent]
+    # Entries written before the rolling window only know their last run.
+    return [int(entry.get("last_kept", 0) or 0)] if entry.get("last_seen_at") else []
+
+
+def custom_careers_backoff_hours(failure_streak: int, dry_streak: int) -> float:
+    if failure_streak >= config.CUSTOM_CAREERS_FAILURES_BEFORE_BACKOFF:
+        excess = failure_streak - config.CUSTOM_CAREERS_FAILURES_BEFORE_BACKOFF
+    elif dry_streak >= config.CUSTOM_CAREERS_DRY_RUNS_BEFORE_BACKOFF:
+        excess = dry_streak - config.CUSTOM_CAREERS_DRY_RUNS_BEFORE_BACKOFF
+    else:
+        return 0.0
+    return min(config.CUSTOM_CAREERS_MAX_BACKOFF_HOURS, config.CUSTOM_CAREERS_BACKOFF_HOURS * (2 ** min(excess, 16)))
+
+
+def roll_custom_careers_health(previous: Dict[str, object], current: Dict[str, object]) -> Dict[str, object]:
+    """Fold one run's outcome into a target's history: streaks, recent yield, backoff."""
+    seen_at = _parse_health_time(current.get("last_seen_at")) or datetime.now(timezone.utc)
+    kept = int(current.get("last_kept", 0) or 0)
+    failed = str(current.get("last_status", "")) in CUSTOM_CAREERS_FAILED_STATUSES
+    failure_streak = int(previous.get("failure_streak", 0) or 0) + 1 if failed else 0
+    dry_streak = 0 if kept > 0 else int(previous.get("dry_streak", 0) or 0) + 1
+    backoff_hours = custom_careers_backoff_hours(failure_streak, dry_streak)
+    return {
+        **current,
+        "failure_streak": failure_streak,
+        "dry_streak": dry_streak,
+        "recent_kept": (_recent_kept(previous) + [kept])[-max(1, config.CUSTOM_CAREERS_HEALTH_WINDOW):],
+        "last_success_at": seen_at.isoformat() if kept > 0 else str(previous.get("last_success_at", "") or ""),
+        "retry_after": (seen_at + timedelta(hours=backoff_hours)).isoformat() if backoff_hours else "",
+    }
+
+
+def custom_careers_health_rank(entry: Dict[str, object], now: datetime) -> Tuple[int, int, float]:
+    """(band, -recent kept, hours since last success); lower crawls first.
+
+    Bands: 0 recent yield, 1 no history yet, 2 dry or recovering, 3 failing.
+    """
+    if not entry:
+        return 1, 0, float("inf")
+    recent_yield = sum(_recent_kept(entry))
+    failing = int(entry.get("failure_streak", 0) or 0) > 0
+    if recent_yield > 0:
+        band = 2 if failing else 0
+    else:
+        band = 3 if failing else 2
+    last_success = _parse_health_time(entry.get("last_success_at"))
+    since_success = (now - last_success).total_seconds() / 3600 if last_success else float("inf")
+    return band, -recent_yield, since_success
+
+
+def custom_careers_backoff_reason(entry: Dict[str, object], now: datetime) -> str:
+    retry_after = _parse_health_time(entry.get("retry_after")) if entry else None
+    if retry_after is None or retry_after <= now:
+        return ""
+    failure_streak = int(entry.get("failure_streak", 0) or 0)
+    if failure_streak:
+        return f"{failure_streak} failed runs ({entry.get('last_status', '')})"
+    return f"{int(entry.get('dry_streak', 0) or 0)} runs without a kept role"
+
+
 def is_generic_custom_careers_title(title: str) -> bool:
     return bool(CUSTOM_CAREERS_GENERIC_PAGE_PATTERN.search(normalize_text(title or "")))
 
@@ -624,142 +743,335 @@ def web_discovery_search(session: requests.Session) -> List[Dict[str, str]]:
     return jobs
 
 
-def linkedin_search(session: requests.Session) -> List[Dict[str, str]]:
-    base_url = "https://www.linkedin.com/jobs-guest/jobs/api/seeMoreJobPostings/search"
-    headers = {"User-Agent": USER_AGENT}
-    jobs: Dict[str, Dict[str, str]] = {}
-    deadline_seconds = int(os.getenv("JOB_DIGEST_LINKEDIN_DEADLINE_SECONDS", "120") or "120")
-    started = time.monotonic()
+LINKEDIN_SEARCH_URL = "https://www.linkedin.com/jobs-guest/jobs/api/seeMoreJobPostings/search"
+LINKEDIN_PAGE_SIZE = 25
+# 999 is LinkedIn's own "slow down" status for unauthenticated traffic.
+LINKEDIN_THROTTLE_STATUSES = {429, 999}
 
-    def deadline_reached() -> bool:
-        return deadline_seconds > 0 and (time.monotonic() - started) >= deadline_seconds
+# (priority, keywords, location, start, attempts). Priorities sort generic
+# terms in plan order ahead of company queries, and a term's second page right
+# after its first, so the heap always hands out the most valuable query left.
+LinkedInQuery = Tuple[Tuple[int, int, int, int], str, str, int, int]
 
-    def request_timeout() -> int:
-        if deadline_seconds <= 0:
-            return 20
-        remaining = deadline_seconds - int(time.monotonic() - started)
-        return max(5, min(20, remaining))
 
-    generic_terms = linkedin_search_terms()
-    for term_index, keywords in enumerate(generic_terms):
-        for location in SEARCH_LOCATIONS:
-            starts = [0, 25] if term_index < 12 else [0]
-            for start in starts:
-                if deadline_reached():
-                    return list(jobs.values())
-                params = {
-                    "keywords": keywords,
-                    "location": location,
-                    "f_TPR": "r604800",
-                    "start": start,
-                }
-                try:
-                    resp = session.get(base_url, params=params, headers=headers, timeout=request_timeout())
-                except requests.RequestException:
-                    continue
-                if resp.status_code != 200:
-                    continue
+# Card fields: (tag, class token or "" for the first such tag, keeps text, attribute)
+LINKEDIN_CARD_FIELDS = {
+    "title": ("h3", "base-search-card__title", True, ""),
+    "company": ("h4", "base-search-card__subtitle", True, ""),
+    "location": ("span", "job-search-card__location", True, ""),
+    "time": ("time", "", True, "datetime"),
+    "link": ("a", "base-card__full-link", False, "href"),
+}
 
-                soup = BeautifulSoup(resp.text, "html.parser")
-                for card in soup.select("div.base-search-card"):
-                    job_urn = card.get("data-entity-urn", "")
-                    job_id = job_urn.split(":")[-1]
-                    if not job_id:
-                        continue
 
-                    title_el = card.select_one("h3.base-search-card__title")
-                    company_el = card.select_one("h4.base-search-card__subtitle")
-                    location_el = card.select_one("span.job-search-card__location")
-                    time_el = card.select_one("time")
-                    link_el = card.select_one("a.base-card__full-link")
+# One token per tag; comments and script/style bodies are matched whole so
+# nothing inside them is mistaken for markup. Quoted attribute values may
+# contain ">".
+_HTML_TOKEN_RE = re.compile(
+    r"<!--.*?-->|<(script|style)\b.*?</\1\s*>|<(/?)([a-zA-Z][^\s/>]*)((?:[^>\"']|\"[^\"]*\"|'[^']*')*)>",
+    re.DOTALL | re.IGNORECASE,
+)
+_HTML_ATTR_RE = re.compile(r"""([^\s=/>"']+)(\s*=\s*(?:"([^"]*)"|'([^']*)'|([^\s>]+)))?""")
 
-                    title = normalize_text(title_el.get_text()) if title_el else ""
-                    company = normalize_text(company_el.get_text()) if company_el else ""
-                    location_text = normalize_text(location_el.get_text()) if location_el else ""
-                    posted_text = normalize_text(time_el.get_text()) if time_el else ""
-                    posted_date = time_el.get("datetime") if time_el else ""
-                    link = link_el.get("href") if link_el else ""
 
-                    if not title or not company:
-                        continue
-                    if company.lower() in EXCLUDE_COMPANIES:
-                        continue
+def _html_attrs(text: str) -> Dict[str, Optional[str]]:
+    """Attribute values, entity-decoded; None for a valueless attribute."""
+    return {
+        name.lower(): html_lib.unescape(double or single or bare) if assigned else None
+        for name, assigned, double, single, bare in _HTML_ATTR_RE.findall(text)
+    }
 
-                    jobs[job_id] = _merge_linkedin_card(jobs.get(job_id, {}), {
-                        "job_id": job_id,
-                        "title": title,
-                        "company": company,
-                        "location": location_text,
-                        "posted_text": posted_text,
-                        "posted_date": posted_date,
-                        "link": clean_link(link),
-                    })
 
-                if deadline_reached():
-                    return list(jobs.values())
-                time.sleep(0.3)
+class _LinkedInCardParser:
+    """Scans guest-API search markup into raw card fields.
+
+    Equivalent to `soup.select("div.base-search-card")` plus a `select_one`
+    per field, without building a tree: a single regex walks the tags, each
+    `div.base-search-card` opens a card, the first matching element per field
+    inside it is captured (text and/or one attribute), and the card closes
+    with its div or when the next card opens. Attributes are only parsed for
+    div tags and tags a field could match.
+    """
+
+    def __init__(self) -> None:
+        self.cards: List[Dict[str, object]] = []
+        self._card: Optional[Dict[str, object]] = None
+        self._card_depth = 0
+        self._open: List[List[object]] = []  # [field, tag, depth, raw text chunks]
+
+    def feed(self, html: str) -> List[Dict[str, object]]:
+        pos = 0
+        for match in _HTML_TOKEN_RE.finditer(html):
+            if self._open and match.start() > pos:
+                self._data(html[pos:match.start()])
+            pos = match.end()
+            tag = match.group(3)
+            if tag is None:
+                continue  # comment, script or style
+            tag = tag.lower()
+            if match.group(2):
+                self._end(tag)
+                continue
+            attr_text = match.group(4)
+            self._start(tag, attr_text)
+            if attr_text.endswith("/"):
+                self._end(tag)
+        if self._open:
+            self._data(html[pos:])
+        if self._card is not None:
+            self._close_card()
+        return self.cards
+
+    def _start(self, tag: str, attr_text: str) -> None:
+        if tag == "div":
+            attrs = _html_attrs(attr_text)
+            if "base-search-card" in (attrs.get("class") or "").split():
+                # A new card also ends the current one, so a stray or missing
+                # </div> inside a card never swallows the rest of the page.
+                if self._card is not None:
+                    self._close_card()
+                self._card = {"urn": attrs.get("data-entity-urn") or ""}
+                self._card_depth = 1
+                return
+            if self._card is not None:
+                self._card_depth += 1
+        if self._card is None:
+            return
+        for capture in self._open:
+            if capture[1] == tag:
+                capture[2] += 1
+        attrs = None
+        for field, (field_tag, class_token, keeps_text, attribute) in LINKEDIN_CARD_FIELDS.items():
+            if tag != field_tag or field in self._card:
+                continue
+            if attrs is None:
+                attrs = _html_attrs(attr_text)
+            if class_token and class_token not in (attrs.get("class") or "").split():
+                continue
+            # Like bs4: a valueless attribute reads as "", a missing one as None.
+            self._card[field] = {"attr": (attrs[attribute] or "") if attribute in attrs else None, "text": ""}
+            if keeps_text:
+                self._open.append([field, tag, 1, []])
 
-    # Company-focused searches (narrower paging to reduce load)
+    def _end(self, tag: str) -> None:
+        if self._card is None:
+            return
+        for capture in list(self._open):
+            if capture[1] == tag:
+                capture[2] -= 1
+                if capture[2] == 0:
+                    self._finish(capture)
+                    self._open.remove(capture)
+        if tag == "div":
+            self._card_depth -= 1
+            if self._card_depth == 0:
+                self._close_card()
+
+    def _data(self, chunk: str) -> None:
+        for capture in self._open:
+            capture[3].append(chunk)
+
+    def _finish(self, capture: List[object]) -> None:
+        self._card[capture[0]]["text"] = html_lib.unescape("".join(capture[3]))
+
+    def _close_card(self) -> None:
+        for capture in self._open:
+            self._finish(capture)
+        self._open = []
+        self.cards.append(self._card)
+        self._card = None
+
+
+def _linkedin_card_text(raw: Dict[str, object], field: str) -> str:
+    node = raw.get(field)
+    return normalize_text(node["text"]) if node else ""
+
+
+def _parse_linkedin_cards(html: str) -> List[Dict[str, str]]:
+    """Job cards from one guest-API search page, in page order."""
+    return _parse_linkedin_page(html)[0]
+
+
+def _parse_linkedin_page(html: str) -> Tuple[List[Dict[str, str]], int]:
+    """`_parse_linkedin_cards` plus how many cards the page held before filtering."""
+    raw_cards = _LinkedInCardParser().feed(html)
+    cards: List[Dict[str, str]] = []
+    for raw in raw_cards:
+        job_id = str(raw["urn"]).split(":")[-1]
+        if not job_id:
+            continue
+
+        time_node = raw.get("time")
+        link_node = raw.get("link")
+        title = _linkedin_card_text(raw, "title")
+        company = _linkedin_card_text(raw, "company")
+        posted_date = time_node["attr"] if time_node else ""
+        link = link_node["attr"] if link_node else ""
+
+        if not title or not company:
+            continue
+        if company.lower() in EXCLUDE_COMPANIES:
+            continue
+
+        cards.append({
+            "job_id": job_id,
+            "title": title,
+            "company": company,
+            "location": _linkedin_card_text(raw, "location"),
+            "posted_text": _linkedin_card_text(raw, "time"),
+            "posted_date": posted_date,
+            "link": clean_link(link),
+        })
+    return cards, len(raw_cards)
+
+
+def _linkedin_query_plan() -> List[LinkedInQuery]:
+    """First-page queries, best first: generic terms, then company-focused searches."""
+    plan: List[LinkedInQuery] = []
+    for term_index, keywords in enumerate(linkedin_search_terms()):
+        for location_index, location in enumerate(SEARCH_LOCATIONS):
+            plan.append(((0, term_index, location_index, 0), keywords, location, 0, 0))
     company_terms = linkedin_company_search_terms()
+    order = 0
     for company in select_company_batch(SEARCH_COMPANIES)[: config.LINKEDIN_COMPANY_LIMIT]:
         for base_term in company_terms:
-            keywords = f"{base_term} {company}"
-            for location in SEARCH_LOCATIONS:
-                for start in [0]:
-                    if deadline_reached():
-                        return list(jobs.values())
-                    params = {
-                        "keywords": keywords,
-                        "location": location,
-                        "f_TPR": "r604800",
-                        "start": start,
-                    }
-                    try:
-                        resp = session.get(base_url, params=params, headers=headers, timeout=request_timeout())
-                    except requests.RequestException:
-                        continue
-                    if resp.status_code != 200:
-                        continue
-
-                    soup = BeautifulSoup(resp.text, "html.parser")
-                    for card in soup.select("div.base-search-card"):
-                        job_urn = card.get("data-entity-urn", "")
-                        job_id = job_urn.split(":")[-1]
-                        if not job_id:
-                            continue
+            for location_index, location in enumerate(SEARCH_LOCATIONS):
+                plan.append(((1, order, location_index, 0), f"{base_term} {company}", location, 0, 0))
+            order += 1
+    return plan
 
-                        title_el = card.select_one("h3.base-search-card__title")
-                        company_el = card.select_one("h4.base-search-card__subtitle")
-                        location_el = card.select_one("span.job-search-card__location")
-                        time_el = card.select_one("time")
-                        link_el = card.select_one("a.base-card__full-link")
 
-                        title = normalize_text(title_el.get_text()) if title_el else ""
-                        company_name = normalize_text(company_el.get_text()) if company_el else ""
-                        location_text = normalize_text(location_el.get_text()) if location_el else ""
-                        posted_text = normalize_text(time_el.get_text()) if time_el else ""
-                        posted_date = time_el.get("datetime") if time_el else ""
-                        link = link_el.get("href") if link_el else ""
+def linkedin_search(session: requests.Session) -> List[Dict[str, str]]:
+    """Run the LinkedIn guest search plan on a small, adaptively paced pool.
+
+    Workers pull the highest-priority query left, so whatever the deadline
+    cuts off is the tail of the plan. A second page is queued only for the
+    leading generic terms, and only when their first page came back full.
+    That decision reads nothing but the page itself, and pages are merged and
+    deduplicated in plan order, so the result does not depend on which worker
+    finished first.
+    """
+    headers = {"User-Agent": USER_AGENT}
+    deadline_seconds = int(os.getenv("JOB_DIGEST_LINKEDIN_DEADLINE_SECONDS", "120") or "120")
+    started = time.monotonic()
 
-                        if not title or not company_name:
-                            continue
-                        if company_name.lower() in EXCLUDE_COMPANIES:
-                            continue
+    def deadline_reached() -> bool:
+        return deadline_seconds > 0 and (time.monotonic() - started) >= deadline_seconds
 
-                        jobs[job_id] = _merge_linkedin_card(jobs.get(job_id, {}), {
-                            "job_id": job_id,
-                            "title": title,
-                            "company": company_name,
-                            "location": location_text,
-                            "posted_text": posted_text,
-                            "posted_date": posted_date,
-                            "link": clean_link(link),
-                        })
+    def request_timeout() -> int:
+        if deadline_seconds <= 0:
+            return 20
+        remaining = deadline_seconds - int(time.monotonic() - started)
+        return max(5, min(20, remaining))
 
-                    if deadline_reached():
-                        return list(jobs.values())
-                    time.sleep(0.2)
+    plan = _linkedin_query_plan()
+    queue = list(plan)
+    heapq.heapify(queue)
+    ready = threading.Condition()
+    in_flight = [0]
+    errors: List[BaseException] = []
+    pages: Dict[Tuple[int, int, int, int], List[Dict[str, str]]] = {}
+    stats = {"requests": 0, "throttled": 0, "abandoned": 0, "next_pages": 0, "stopped_early": 0}
+    pacer = AdaptivePacer(config.LINKEDIN_SEARCH_INTERVAL_SECONDS)
+
+    def next_query() -> Optional[LinkedInQuery]:
+        with ready:
+            while not errors and not deadline_reached():
+                if queue:
+                    in_flight[0] += 1
+                    return heapq.heappop(queue)
+                if not in_flight[0]:
+                    return None
+                ready.wait(0.5)
+            return None
+
+    def fetch(query: LinkedInQuery) -> List[LinkedInQuery]:
+        priority, keywords, location, start, attempts = query
+        pacer.wait()
+        if deadline_reached():
+            return [query]
+        params = {
+            "keywords": keywords,
+            "location": location,
+            "f_TPR": "r604800",
+            "start": start,
+        }
+        with ready:
+            stats["requests"] += 1
+        try:
+            resp = session.get(LINKEDIN_SEARCH_URL, params=params, headers=headers, timeout=request_timeout())
+        except requests.RequestException:
+            return []
+        if resp.status_code in LINKEDIN_THROTTLE_STATUSES:
+            pacer.backoff()
+            with ready:
+                stats["throttled"] += 1
+                if attempts < config.LINKEDIN_THROTTLE_RETRIES:
+                    return [(priority, keywords, location, start, attempts + 1)]
+                stats["abandoned"] += 1
+            return []
+        if resp.status_code != 200:
+            return []
+        pacer.success()
+
+        cards, card_count = _parse_linkedin_page(resp.text)
+        with ready:
+            pages[priority] = cards
+            if start or priority[0] != 0 or priority[1] >= config.LINKEDIN_PAGINATED_TERMS:
+                return []
+            if card_count < LINKEDIN_PAGE_SIZE:
+                stats["stopped_early"] += 1
+                return []
+            stats["next_pages"] += 1
+        next_start = start + LINKEDIN_PAGE_SIZE
+        return [(priority[:3] + (next_start,), keywords, location, next_start, 0)]
+
+    def worker() -> None:
+        while True:
+            query = next_query()
+            if query is None:
+                return
+            try:
+                follow_ups = fetch(query)
+            except BaseException as exc:  # noqa: BLE001 - re-raised on the calling thread
+                follow_ups = []
+                with ready:
+                    errors.append(exc)
+            with ready:
+                in_flight[0] -= 1
+                for item in follow_ups:
+                    heapq.heappush(queue, item)
+                ready.notify_all()
+
+    workers = max(1, min(config.LINKEDIN_SEARCH_WORKERS, len(plan)))
+    if workers == 1:
+        worker()
+    else:
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="linkedin-search") as executor:
+            for _ in range(workers):
+                executor.submit(worker)
+    if errors:
+        raise errors[0]
 
+    jobs: Dict[str, Dict[str, str]] = {}
+    for key in sorted(pages):
+        for card in pages[key]:
+            jobs[card["job_id"]] = _merge_linkedin_card(jobs.get(card["job_id"], {}), card)
+
+    first_pages = sum(1 for key in pages if key[3] == 0)
+    note = (
+        f"search pool: {first_pages}/{len(plan)} first pages, {stats['next_pages']} next pages, "
+        f"{stats['stopped_early']} stopped early, {stats['throttled']} throttled"
+    )
+    if queue:
+        note += f", deadline left {len(queue)} queued"
+    mark_source_runtime_event(
+        "LinkedIn",
+        blocked=1 if stats["abandoned"] else 0,
+        note=note,
+        query_count=len(plan),
+        company_query_count=sum(1 for query in plan if query[0][0] == 1),
+    )
     return list(jobs.values())
 
 
@@ -812,131 +1124,144 @@ def linkedin_job_details(session: requests.Session, job_id: str, timeout: int =
     }
 
 
-def greenhouse_search(session: requests.Session) -> List[Dict[str, str]]:
+def _note_board_cache(source_name: str) -> None:
+    note = board_cache_note(source_name)
+    if note:
+        mark_source_runtime_event(source_name, note=note)
+
+
+def _parse_greenhouse_board(board: str, data: object) -> List[Dict[str, str]]:
     jobs: List[Dict[str, str]] = []
-    for board in GREENHOUSE_BOARDS:
-        url = f"https://boards-api.greenhouse.io/v1/boards/{board}/jobs"
-        try:
-            resp = session.get(url, timeout=20)
-        except requests.RequestException:
+    if not isinstance(data, dict):
+        return jobs
+    for job in data.get("jobs", []):
+        title = job.get("title", "")
+        if not title:
             continue
-        if resp.status_code != 200:
+        company = board.replace("-", " ").title()
+        location = (job.get("location") or {}).get("name", "")
+        link = job.get("absolute_url", "")
+        updated_at = job.get("updated_at", "")
+        jobs.append(
+            {
+                "title": title,
+                "company": company,
+                "location": location,
+                "link": link,
+                "posted_text": "",
+                "posted_date": updated_at,
+                "ats_account": board,
+            }
+        )
+    return jobs
+
+
+def greenhouse_search(session: requests.Session) -> List[Dict[str, str]]:
+    jobs = fetch_board_jobs(
+        session,
+        GREENHOUSE_BOARDS,
+        lambda board: f"https://boards-api.greenhouse.io/v1/boards/{board}/jobs",
+        _parse_greenhouse_board,
+        source_name="Greenhouse",
+    )
+    _note_board_cache("Greenhouse")
+    return jobs
+
+
+def _parse_lever_board(board: str, data: object) -> List[Dict[str, str]]:
+    jobs: List[Dict[str, str]] = []
+    if not isinstance(data, list):
+        return jobs
+    for job in data:
+        title = job.get("text", "") or job.get("title", "")
+        if not title:
             continue
-        data = resp.json()
-        for job in data.get("jobs", []):
-            title = job.get("title", "")
-            if not title:
-                continue
-            company = board.replace("-", " ").title()
-            location = (job.get("location") or {}).get("name", "")
-            link = job.get("absolute_url", "")
-            updated_at = job.get("updated_at", "")
-            jobs.append(
-                {
-                    "title": title,
-                    "company": company,
-                    "location": location,
-                    "link": link,
-                    "posted_text": "",
-                    "posted_date": updated_at,
-                    "ats_account": board,
-                }
-            )
+        company = board.replace("-", " ").title()
+        location = ""
+        if isinstance(job.get("categories"), dict):
+            location = job["categories"].get("location", "") or ""
+        link = job.get("hostedUrl") or job.get("applyUrl") or ""
+        posted_ms = job.get("createdAt")
+        posted_date = ""
+        if posted_ms:
+            try:
+                posted_date = datetime.fromtimestamp(posted_ms / 1000, tz=timezone.utc).isoformat()
+            except (OSError, ValueError):
+                posted_date = ""
+        jobs.append(
+            {
+                "title": title,
+                "company": company,
+                "location": location,
+                "link": link,
+                "posted_text": "",
+                "posted_date": posted_date,
+                "ats_account": board,
+            }
+        )
     return jobs
 
 
 def lever_search(session: requests.Session) -> List[Dict[str, str]]:
+    jobs = fetch_board_jobs(
+        session,
+        LEVER_BOARDS,
+        lambda board: f"https://api.lever.co/v0/postings/{board}?mode=json",
+        _parse_lever_board,
+        source_name="Lever",
+    )
+    _note_board_cache("Lever")
+    return jobs
+
+
+def _parse_ashby_board(board: str, data: object) -> List[Dict[str, str]]:
     jobs: List[Dict[str, str]] = []
-    for board in LEVER_BOARDS:
-        url = f"https://api.lever.co/v0/postings/{board}?mode=json"
-        try:
-            resp = session.get(url, timeout=20)
-        except requests.RequestException:
-            continue
-        if resp.status_code != 200:
-            continue
-        try:
-            data = resp.json()
-        except ValueError:
-            continue
-        if not isinstance(data, list):
+    if not isinstance(data, dict):
+        return jobs
+    postings = data.get("jobs") or data.get("postings") or []
+    if not isinstance(postings, list):
+        return jobs
+    for job in postings:
+        title = job.get("title", "")
+        if not title:
             continue
-        for job in data:
-            title = job.get("text", "") or job.get("title", "")
-            if not title:
-                continue
-            company = board.replace("-", " ").title()
-            location = ""
-            if isinstance(job.get("categories"), dict):
-                location = job["categories"].get("location", "") or ""
-            link = job.get("hostedUrl") or job.get("applyUrl") or ""
-            posted_ms = job.get("createdAt")
-            posted_date = ""
-            if posted_ms:
-                try:
-                    posted_date = datetime.fromtimestamp(posted_ms / 1000, tz=timezone.utc).isoformat()
-                except (OSError, ValueError):
-                    posted_date = ""
-            jobs.append(
-                {
-                    "title": title,
-                    "company": company,
-                    "location": location,
-                    "link": link,
-                    "posted_text": "",
-                    "posted_date": posted_date,
-                    "ats_account": board,
-                }
-            )
+        company = job.get("companyName") or board.replace("-", " ").title()
+        location = (
+            job.get("location")
+            or job.get("locationText")
+            or job.get("locationName")
+            or ""
+        )
+        link = (
+            job.get("jobUrl")
+            or job.get("jobPageUrl")
+            or job.get("applyUrl")
+            or ""
+        )
+        posted_date = job.get("publishedAt") or job.get("createdAt") or ""
+        jobs.append(
+            {
+                "title": title,
+                "company": company,
+                "location": location,
+                "link": link,
+                "posted_text": "",
+                "posted_date": posted_date,
+                "ats_account": board,
+            }
+        )
     return jobs
 
 
 def ashby_search(session: requests.Session) -> List[Dict[str, str]]:
-    jobs: List[Dict[str, str]] = []
-    for board in ASHBY_BOARDS:
-        url = f"https://api.ashbyhq.com/posting-api/job-board/{board}"
-        try:
-            resp = session.get(url, timeout=20)
-        except requests.RequestException:
-            continue
-        if resp.status_code != 200:
-            continue
-        try:
-            data = resp.json()
-        except ValueError:
-            continue
-        postings = data.get("jobs") or data.get("postings") or []
-        if not isinstance(postings, list):
-            continue
-        for job in postings:
-            title = job.get("title", "")
-            if not title:
-                continue
-            company = job.get("companyName") or board.replace("-", " ").title()
-            location = (
-                job.get("location")
-                or job.get("locationText")
-                or job.get("locationName")
-                or ""
-            )
-            link = (
-                job.get("jobUrl")
-                or job.get("jobPageUrl")
-                or job.get("applyUrl")
-                or ""
-            )
-            posted_date = job.get("publishedAt") or job.get("createdAt") or ""
-            jobs.append(
-                {
-                    "title": title,
-                    "company": company,
-                    "location": location,
-                    "link": link,
-                    "posted_text": "",
-                    "posted_date": posted_date,
-                    "ats_account": board,
-                }
-            )
+    jobs = fetch_board_jobs(
+        session,
+        ASHBY_BOARDS,
+        lambda board: f"https://api.ashbyhq.com/posting-api/job-board/{board}",
+        _parse_ashby_board,
+        source_name="Ashby",
+    )
+    _note_board_cache("Ashby")
     return jobs
 
 
@@ -990,111 +1315,110 @@ def iter_workable_jobs(data: object) -> Iterable[Dict[str, object]]:
             yield from iter_workable_jobs(item)
 
 
-def workable_search(session: requests.Session) -> List[Dict[str, str]]:
+def _parse_workable_account(account: str, payload: object) -> List[Dict[str, str]]:
     jobs: List[Dict[str, str]] = []
-    seen_links: set[str] = set()
+    if not isinstance(payload, dict):
+        return jobs
+    default_company = account.replace("-", " ").title()
+    company_name = (
+        payload.get("name")
+        or payload.get("company")
+        or payload.get("companyName")
+        or default_company
+    )
 
-    for account in WORKABLE_ACCOUNTS:
-        payload = None
-        urls = [
-            f"https://www.workable.com/api/accounts/{account}?details=true",
-            f"https://apply.workable.com/api/v1/widget/accounts/{account}",
-            f"https://apply.workable.com/api/v1/widget/accounts/{account}?details=true",
-        ]
-        for url in urls:
-            try:
-                resp = session.get(url, timeout=20)
-            except requests.RequestException:
-                continue
-            if resp.status_code != 200:
-                continue
-            try:
-                payload = resp.json()
-            except ValueError:
-                payload = None
-            if payload:
-                break
-        if not payload:
+    for job in iter_workable_jobs(payload):
+        title = str(job.get("title") or job.get("name") or "").strip()
+        if not title:
             continue
 
-        default_company = account.replace("-", " ").title()
-        company_name = (
-            payload.get("name")
-            or payload.get("company")
-            or payload.get("companyName")
-            or default_company
-        )
-
-        for job in iter_workable_jobs(payload):
-            title = str(job.get("title") or job.get("name") or "").strip()
-            if not title:
-                continue
-
-            status = str(job.get("state") or job.get("status") or job.get("jobStatus") or "").lower()
-            if status and status not in {"active", "live", "open", "published"}:
-                continue
+        status = str(job.get("state") or job.get("status") or job.get("jobStatus") or "").lower()
+        if status and status not in {"active", "live", "open", "published"}:
+            continue
 
-            shortcode = str(job.get("shortcode") or job.get("shortCode") or job.get("code") or "").strip()
-            link = (
-                job.get("url")
-                or job.get("shortlink")
-                or job.get("applyUrl")
-                or job.get("application_url")
-                or job.get("jobUrl")
+        shortcode = str(job.get("shortcode") or job.get("shortCode") or job.get("code") or "").strip()
+        link = (
+            job.get("url")
+            or job.get("shortlink")
+            or job.get("applyUrl")
+            or job.get("application_url")
+            or job.get("jobUrl")
+            or ""
+        )
+        if not link and shortcode:
+            link = f"https://apply.workable.com/{account}/j/{shortcode}/"
+        link = clean_link(str(link))
+        if not link:
+            continue
+
+        city = str(job.get("city") or "").strip()
+        country = str(job.get("country") or "").strip()
+        location = (
+            _workable_text(job.get("location"))
+            or _workable_text(job.get("locations"))
+            or _workable_text(job.get("locationStr"))
+            or _workable_text(job.get("locationName"))
+            or _workable_text(job.get("workplaceType"))
+            or _workable_text(job.get("workplace_type"))
+            or ", ".join(p for p in [city, country] if p)
+            or ""
+        )
+        posted_date = (
+            str(
+                job.get("published")
+                or job.get("publishedAt")
+                or job.get("published_at")
+                or job.get("updated_at")
+                or job.get("created_at")
+                or job.get("datePublished")
                 or ""
-            )
-            if not link and shortcode:
-                link = f"https://apply.workable.com/{account}/j/{shortcode}/"
-            link = clean_link(str(link))
-            if not link or link in seen_links:
-                continue
-            seen_links.add(link)
+            ).strip()
+        )
+        summary = _workable_text(
+            job.get("description")
+            or job.get("descriptionHtml")
+            or job.get("description_html")
+            or job.get("job")
+            or job.get("content")
+        )
 
-            city = str(job.get("city") or "").strip()
-            country = str(job.get("country") or "").strip()
-            location = (
-                _workable_text(job.get("location"))
-                or _workable_text(job.get("locations"))
-                or _workable_text(job.get("locationStr"))
-                or _workable_text(job.get("locationName"))
-                or _workable_text(job.get("workplaceType"))
-                or _workable_text(job.get("workplace_type"))
-                or ", ".join(p for p in [city, country] if p)
-                or ""
-            )
-            posted_date = (
-                str(
-                    job.get("published")
-                    or job.get("publishedAt")
-                    or job.get("published_at")
-                    or job.get("updated_at")
-                    or job.get("created_at")
-                    or job.get("datePublished")
-                    or ""
-                ).strip()
-            )
-            summary = _workable_text(
-                job.get("description")
-                or job.get("descriptionHtml")
-                or job.get("description_html")
-                or job.get("job")
-                or job.get("content")
-            )
+        jobs.append(
+            {
+                "title": title,
+                "company": str(job.get("company") or job.get("companyName") or company_name),
+                "location": location,
+                "link": link,
+                "posted_text": "",
+                "posted_date": posted_date,
+                "summary": trim_summary(summary),
+                "source": "Workable",
+                "job_status": status,
+                "ats_account": account,
+            }
+        )
+    return jobs
 
-            jobs.append(
-                {
-                    "title": title,
-                    "company": str(job.get("company") or job.get("companyName") or company_name),
-                    "location": location,
-                    "link": link,
-                    "posted_text": "",
-                    "posted_date": posted_date,
-                    "summary": trim_summary(summary),
-                    "source": "Workable",
-                    "job_status": status,
-                    "ats_account": account,
-                }
-            )
+
+def workable_search(session: requests.Session) -> List[Dict[str, str]]:
+    account_jobs = fetch_board_jobs(
+        session,
+        WORKABLE_ACCOUNTS,
+        lambda account: [
+            f"https://www.workable.com/api/accounts/{account}?details=true",
+            f"https://apply.workable.com/api/v1/widget/accounts/{account}",
+            f"https://apply.workable.com/api/v1/widget/accounts/{account}?details=true",
+        ],
+        _parse_workable_account,
+        source_name="Workable",
+    )
+    _note_board_cache("Workable")
+    jobs: List[Dict[str, str]] = []
+    seen_links: set[str] = set()
+    for job in account_jobs:
+        if job["link"] in seen_links:
+            continue
+        seen_links.add(job["link"])
+        jobs.append(job)
     return jobs
 
 
@@ -1671,8 +1995,13 @@ def slugify(text: str) -> str:
     return cleaned.strip("-")
 
 
-def extract_job_links(html: str, base_url: str) -> List[Tuple[str, str]]:
-    soup = BeautifulSoup(html, "html.parser")
+def as_soup(html: str | BeautifulSoup) -> BeautifulSoup:
+    """Parse `html` unless the caller already did; page helpers share one tree."""
+    return html if isinstance(html, BeautifulSoup) else BeautifulSoup(html, "html.parser")
+
+
+def extract_job_links(html: str | BeautifulSoup, base_url: str) -> List[Tuple[str, str]]:
+    soup = as_soup(html)
     links: List[Tuple[str, str]] = []
     seen: set[str] = set()
     job_path_pattern = re.compile(r"/job/|/jobs/|jobid=|vacanc|opening|opportunit|position", re.IGNORECASE)
@@ -1722,8 +2051,10 @@ def iter_jobposting_nodes(data: object) -> Iterable[Dict[str, object]]:
             yield from iter_jobposting_nodes(item)
 
 
-def extract_jobpostings_from_jsonld(html: str, base_url: str, default_company: str = "") -> List[Dict[str, str]]:
-    soup = BeautifulSoup(html, "html.parser")
+def extract_jobpostings_from_jsonld(
+    html: str | BeautifulSoup, base_url: str, default_company: str = ""
+) -> List[Dict[str, str]]:
+    soup = as_soup(html)
     jobs: List[Dict[str, str]] = []
     seen: set[str] = set()
     scripts = soup.find_all("script", type="application/ld+json")
@@ -1786,8 +2117,49 @@ def extract_jobpostings_from_jsonld(html: str, base_url: str, default_company: s
     return jobs
 
 
-def parse_job_detail_jsonld(html: str, fallback_title: str = "") -> Dict[str, str]:
-    soup = BeautifulSoup(html, "html.parser")
+def _jsonld_address_part(value: object) -> str:
+    if isinstance(value, str):
+        return value
+    if isinstance(value, list):
+        return ", ".join(str(item) for item in value if item)
+    return str(value) if value else ""
+
+
+def jobposting_details(node: Dict[str, object], fallback_title: str = "") -> Dict[str, str]:
+    title = node.get("title") if isinstance(node.get("title"), str) else ""
+    company = ""
+    hiring_org = node.get("hiringOrganization")
+    if isinstance(hiring_org, dict):
+        company = hiring_org.get("name") or ""
+    location = ""
+    job_location = node.get("jobLocation")
+    if isinstance(job_location, list) and job_location:
+        job_location = job_location[0]
+    if isinstance(job_location, dict):
+        address = job_location.get("address")
+        if isinstance(address, dict):
+            location = ", ".join(
+                part
+                for part in [
+                    _jsonld_address_part(address.get("addressLocality")),
+                    _jsonld_address_part(address.get("addressRegion")),
+                    _jsonld_address_part(address.get("addressCountry")),
+                ]
+                if part
+            )
+    posted_date = node.get("datePosted") if isinstance(node.get("datePosted"), str) else ""
+    description = node.get("description") if isinstance(node.get("description"), str) else ""
+    return {
+        "title": title or fallback_title,
+        "company": company,
+        "location": location,
+        "posted_date": posted_date,
+        "summary": trim_summary(description),
+    }
+
+
+def parse_job_detail_jsonld(html: str | BeautifulSoup, fallback_title: str = "") -> Dict[str, str]:
+    soup = as_soup(html)
     scripts = soup.find_all("script", type="application/ld+json")
     for script in scripts:
         if not script.string:
@@ -1797,48 +2169,12 @@ def parse_job_detail_jsonld(html: str, fallback_title: str = "") -> Dict[str, st
         except ValueError:
             continue
         for node in iter_jobposting_nodes(payload):
-            title = node.get("title") if isinstance(node.get("title"), str) else ""
-            company = ""
-            hiring_org = node.get("hiringOrganization")
-            if isinstance(hiring_org, dict):
-                company = hiring_org.get("name") or ""
-            location = ""
-            job_location = node.get("jobLocation")
-            if isinstance(job_location, list) and job_location:
-                job_location = job_location[0]
-            def address_part(value: object) -> str:
-                if isinstance(value, str):
-                    return value
-                if isinstance(value, list):
-                    return ", ".join(str(item) for item in value if item)
-                return str(value) if value else ""
-
-            if isinstance(job_location, dict):
-                address = job_location.get("address")
-                if isinstance(address, dict):
-                    location = ", ".join(
-                        part
-                        for part in [
-                            address_part(address.get("addressLocality")),
-                            address_part(address.get("addressRegion")),
-                            address_part(address.get("addressCountry")),
-                        ]
-                        if part
-                    )
-            posted_date = node.get("datePosted") if isinstance(node.get("datePosted"), str) else ""
-            description = node.get("description") if isinstance(node.get("description"), str) else ""
-            return {
-                "title": title or fallback_title,
-                "company": company,
-                "location": location,
-                "posted_date": posted_date,
-                "summary": trim_summary(description),
-            }
+            return jobposting_details(node, fallback_title)
     return {}
 
 
-def parse_job_detail_fallback(html: str) -> Dict[str, str]:
-    soup = BeautifulSoup(html, "html.parser")
+def parse_job_detail_fallback(html: str | BeautifulSoup) -> Dict[str, str]:
+    soup = as_soup(html)
     title = ""
     h1 = soup.find("h1")
     if h1:
@@ -1911,15 +2247,20 @@ def fetch_manual_link_requests(client: "firestore.Client") -> List[Dict[str, str
 
 def build_manual_record(session: requests.Session, link: str) -> Optional[JobRecord]:
     try:
-        resp = session.get(link, timeout=30)
+        resp = session.get(link, timeout=30, stream=True)
     except Exception:
         return None
     if resp.status_code != 200:
+        resp.close()
         return None
 
-    details = parse_job_detail_jsonld(resp.text)
-    if not details:
-        details = parse_job_detail_fallback(resp.text)
+    # Stop reading at the first JSON-LD JobPosting; only pages without one
+    # are read to the end for the meta-tag fallback.
+    try:
+        node, html = read_jsonld_node(resp, lambda _node: True, iter_jobposting_nodes)
+    except Exception:
+        return None
+    details = jobposting_details(node) if node is not None else parse_job_detail_fallback(html)
 
     title = details.get("title") or ""
     company = details.get("company") or ""
@@ -1931,11 +2272,12 @@ def build_manual_record(session: requests.Session, link: str) -> Optional[JobRec
         return None
 
     full_text = f"{title} {company} {summary}"
-    fit = assess_fit(full_text, company, "Manual", "Manual", title=title)
+    scored = score_posting(title, company, summary, location, source_family="Manual", source="Manual")
+    fit = scored["fit"]
     score = int(fit["score"])
-    why_fit = build_reasons(full_text)
-    cv_gap = build_gaps(full_text)
-    preference_match = build_preference_match(full_text, company, location)
+    why_fit = str(scored["why_fit"])
+    cv_gap = str(scored["cv_gap"])
+    preference_match = str(scored["preference_match"])
     posted_value, posted_raw, normalized_posted_date = canonicalize_posted_fields(posted_text, posted_date)
 
     return JobRecord(
@@ -1957,84 +2299,6 @@ def build_manual_record(session: requests.Session, link: str) -> Optional[JobRec
     )
 
 
-def parse_workday_entry(entry: str) -> Tuple[str, str, str, str]:
-    entry = entry.strip()
-    name = ""
-    url = entry
-    if "|" in entry:
-        name, url = [part.strip() for part in entry.split("|", 1)]
-    parsed = urlparse(url if "://" in url else f"https://{url}")
-    host = parsed.netloc
-    path = parsed.path.strip("/")
-    segments = [seg for seg in path.split("/") if seg]
-    filtered = [seg for seg in segments if not re.match(r"^[a-z]{2}-[A-Z]{2}$", seg)]
-    site = filtered[-1] if filtered else (segments[-1] if segments else "")
-    tenant = host.split(".")[0] if host else ""
-    scheme = parsed.scheme or "https"
-    if not name:
-        name = tenant.replace("-", " ").title() if tenant else "Workday"
-    return scheme, host, tenant, site, name
-
-
-def workday_search(session: requests.Session) -> List[Dict[str, str]]:
-    jobs: List[Dict[str, str]] = []
-    if not WORKDAY_SITES:
-        return jobs
-    for entry in WORKDAY_SITES:
-        scheme, host, tenant, site, company_name = parse_workday_entry(entry)
-        if not host or not tenant or not site:
-            continue
-        api_url = f"{scheme}://{host}/wday/cxs/{tenant}/{site}/jobs"
-        for keyword in financial_services_board_search_terms()[:12]:
-            payload = {
-                "limit": 20,
-                "offset": 0,
-                "searchText": f"{keyword}",
-            }
-            try:
-                resp = session.post(api_url, json=payload, timeout=30)
-            except requests.RequestException:
-                continue
-            if resp.status_code != 200:
-                continue
-            try:
-                data = resp.json()
-            except ValueError:
-                continue
-            postings = data.get("jobPostings") or data.get("jobs") or []
-            for posting in postings:
-                if not isinstance(posting, dict):
-                    continue
-                title = posting.get("title") or posting.get("jobTitle") or ""
-                if not title:
-                    continue
-                link = posting.get("externalPath") or posting.get("applyUrl") or ""
-                if link and link.startswith("/"):
-                    link = f"{scheme}://{host}{link}"
-                link = clean_link(link)
-                location = posting.get("locationsText") or posting.get("location") or "United Kingdom"
-                posted_date = posting.get("postedOn") or ""
-                summary = posting.get("description") or ""
-                if not summary and isinstance(posting.get("bulletFields"), list):
-                    for field in posting.get("bulletFields"):
-                        if isinstance(field, dict) and field.get("name") == "jobDescription":
-                            summary = field.get("value") or ""
-                jobs.append(
-                    {
-                        "title": normalize_text(title),
-                        "company": company_name,
-                        "location": normalize_text(location),
-                        "link": link,
-                        "posted_text": "",
-                        "posted_date": posted_date,
-                        "summary": trim_summary(summary),
-                        "source": "Workday",
-                    }
-                )
-            time.sleep(0.2)
-    return jobs
-
-
 def html_board_search(
     session: requests.Session,
     source_name: str,
@@ -2513,12 +2777,24 @@ def recruiter_pages_search(session: requests.Session) -> List[Dict[str, str]]:
             link = job.get("link", "")
             if not link or link in seen:
                 continue
-            try:
-                detail_resp = session.get(link, timeout=10)
-            except requests.RequestException:
-                detail_resp = None
-            if detail_resp is not None and detail_resp.status_code == 200:
-                details = parse_job_detail_jsonld(detail_resp.text, job.get("title", "")) or parse_job_detail_fallback(detail_resp.text)
+            details, headers = cached_job_details(link, "RecruiterPages")
+            if details is None:
+                try:
+                    if headers:
+                        detail_resp = session.get(link, timeout=10, headers=headers)
+                    else:
+                        detail_resp = session.get(link, timeout=10)
+                except requests.RequestException:
+                    detail_resp = None
+                if detail_resp is not None:
+                    fallback_title = job.get("title", "")
+                    details = job_details_from_response(
+                        link,
+                        detail_resp,
+                        lambda html: parse_job_detail_jsonld(html, fallback_title) or parse_job_detail_fallback(html),
+                        "RecruiterPages",
+                    )
+            if details:
                 if details.get("title"):
                     job["title"] = details["title"]
                 if details.get("company"):
@@ -2541,6 +2817,10 @@ def recruiter_pages_search(session: requests.Session) -> List[Dict[str, str]]:
                 seen.add(link)
         mark_source_runtime_event("RecruiterPages", raw=len(jobs), query_count=len(urls), note=f"{name} extracted {len(extracted)}")
         time.sleep(0.25)
+    save_detail_page_cache()
+    cache_note = detail_cache_note("RecruiterPages")
+    if cache_note:
+        mark_source_runtime_event("RecruiterPages", note=cache_note)
     return jobs
 
 
@@ -3539,18 +3819,42 @@ def load_custom_careers_targets(path: Path) -> List[Dict[str, str]]:
                 "last_dropped_title": int((((health_state.get(careers_url, {}) or {}).get("dropped", {}) or {}).get("title", 0) or 0)),
             }
         )
+    # Targets still inside a health backoff window are skipped so their slot
+    # (and deadline share) goes to firms that answer; the rest are ranked on
+    # recent yield, failure streak and time since their last kept role.
+    now = datetime.now(timezone.utc)
+    skipped: List[Dict[str, str]] = []
+    scheduled: List[Dict[str, str]] = []
+    for item in targets:
+        entry = health_state.get(item["careers_url"], {}) or {}
+        reason = custom_careers_backoff_reason(entry, now)
+        if reason:
+            skipped.append(
+                {
+                    "firm": item["firm"],
+                    "careers_url": item["careers_url"],
+                    "reason": reason,
+                    "retry_after": str(entry.get("retry_after", "")),
+                }
+            )
+            continue
+        scheduled.append(item)
+    targets = scheduled
+    health_rank = {
+        item["careers_url"]: custom_careers_health_rank(health_state.get(item["careers_url"], {}) or {}, now)
+        for item in targets
+    }
     tier_rank = {"Tier1": 0, "Tier2": 1, "Tier3": 2}
     fit_rank = {"Core": 0, "Adjacent": 1, "Low": 2}
-    status_rank = {"healthy": 0, "weak_yield": 1, "empty": 2, "timed_out": 3, "broken": 4, "blocked": 5}
     uk_rank = {"UK-HQ": 0, "UK-Presence": 1, "UK-Hiring-Remote": 2}
     targets.sort(
         key=lambda item: (
             tier_rank.get(item["priority_tier"], 9),
+            health_rank[item["careers_url"]][0],
             0 if item.get("primary_category") == "Bank" else 1,
             uk_rank.get(item.get("uk_relevance", ""), 3),
             custom_careers_url_penalty(item.get("careers_url", "")),
-            status_rank.get(item.get("last_status", ""), 6),
-            -int(item.get("last_kept", 0) or 0),
+            health_rank[item["careers_url"]][1:],
             -int(item.get("last_raw", 0) or 0),
             int(item.get("last_dropped_location", 0) or 0),
             int(item.get("last_dropped_title", 0) or 0),
@@ -3561,22 +3865,29 @@ def load_custom_careers_targets(path: Path) -> List[Dict[str, str]]:
 
     target_limit = int(os.getenv("JOB_DIGEST_CUSTOM_CAREERS_TARGET_LIMIT", "36") or "36")
     if target_limit <= 0 or len(targets) <= target_limit:
-        return targets
-
-    tier1_targets = [item for item in targets if item["priority_tier"] == "Tier1"]
-    remaining = [item for item in targets if item["priority_tier"] != "Tier1"]
-    remaining_slots = max(0, target_limit - len(tier1_targets))
-    if remaining_slots == 0:
-        return tier1_targets[:target_limit]
-
-    rotation_seed = int(time.time() // (8 * 3600))
-    offset = rotation_seed % len(remaining) if remaining else 0
-    rotated = remaining[offset:] + remaining[:offset]
-    return tier1_targets + rotated[:remaining_slots]
+        selected = targets
+    else:
+        tier1_targets = [item for item in targets if item["priority_tier"] == "Tier1"]
+        remaining = [item for item in targets if item["priority_tier"] != "Tier1"]
+        remaining_slots = max(0, target_limit - len(tier1_targets))
+        if remaining_slots == 0:
+            selected = tier1_targets[:target_limit]
+        else:
+            rotation_seed = int(time.time() // (8 * 3600))
+            offset = rotation_seed % len(remaining) if remaining else 0
+            rotated = remaining[offset:] + remaining[:offset]
+            selected = tier1_targets + rotated[:remaining_slots]
+
+    mark_source_runtime_event(
+        "CustomCareers",
+        note=f"schedule: {len(selected)} targets, {len(skipped)} in backoff",
+        schedule={"order": [item["firm"] for item in selected], "skipped": skipped},
+    )
+    return selected
 
 
-def discover_custom_job_hubs(html: str, base_url: str) -> List[str]:
-    soup = BeautifulSoup(html, "html.parser")
+def discover_custom_job_hubs(html: str | BeautifulSoup, base_url: str) -> List[str]:
+    soup = as_soup(html)
     discovered: List[str] = []
     seen = set()
     base_netloc = urlparse(base_url).netloc
@@ -3598,147 +3909,6 @@ def discover_custom_job_hubs(html: str, base_url: str) -> List[str]:
     return discovered[:6]
 
 
-def custom_careers_search(session: requests.Session) -> List[Dict[str, str]]:
-    jobs: List[Dict[str, str]] = []
-    targets = load_custom_careers_targets(UK_FEEDS_PATH)
-    if not targets:
-        return jobs
-    deadline_seconds = int(os.getenv("JOB_DIGEST_CUSTOM_CAREERS_DEADLINE_SECONDS", "60") or "60")
-    target_timeout_seconds = int(os.getenv("JOB_DIGEST_CUSTOM_CAREERS_TARGET_TIMEOUT_SECONDS", "8") or "8")
-    max_pages_per_target = int(os.getenv("JOB_DIGEST_CUSTOM_CAREERS_MAX_PAGES_PER_TARGET", "3") or "3")
-    max_detail_links_per_target = int(os.getenv("JOB_DIGEST_CUSTOM_CAREERS_MAX_DETAIL_LINKS_PER_TARGET", "10") or "10")
-    started = time.monotonic()
-
-    def deadline_reached() -> bool:
-        return deadline_seconds > 0 and (time.monotonic() - started) >= deadline_seconds
-
-    def request_timeout() -> int:
-        if deadline_seconds <= 0:
-            return 25
-        remaining = deadline_seconds - int(time.monotonic() - started)
-        return max(5, min(25, remaining))
-
-    for target in targets:
-        if deadline_reached():
-            mark_source_runtime_event("CustomCareers", timed_out=1, note="custom careers deadline reached")
-            return jobs
-        target_started = time.monotonic()
-        def target_deadline_reached() -> bool:
-            if target_timeout_seconds <= 0:
-                return False
-            return (time.monotonic() - target_started) >= target_timeout_seconds
-        careers_url = target["careers_url"]
-        target_raw = 0
-        try:
-            resp = session.get(careers_url, timeout=request_timeout())
-        except requests.RequestException:
-            mark_source_runtime_event("CustomCareers", failed=1, note=f"request failed for {target['firm']}")
-            continue
-        if resp.status_code != 200:
-            if resp.status_code in {403, 429}:
-                mark_source_runtime_event("CustomCareers", blocked=1, note=f"{target['firm']} returned {resp.status_code}")
-            else:
-                mark_source_runtime_event("CustomCareers", failed=1, note=f"{target['firm']} returned {resp.status_code}")
-            continue
-
-        pages_to_visit = [careers_url]
-        pages_to_visit.extend(discover_custom_job_hubs(resp.text, careers_url))
-        job_map: Dict[str, Dict[str, str]] = {}
-        for payload in extract_jobpostings_from_jsonld(resp.text, careers_url, target["firm"]):
-            if should_skip_custom_careers_page(payload.get("title", ""), payload.get("link", ""), payload.get("summary", "")):
-                continue
-            payload["target_firm"] = target["firm"]
-            payload["target_careers_url"] = careers_url
-            payload["target_category"] = target.get("primary_category", "")
-            job_map.setdefault(payload["link"], payload)
-
-        for page_url in pages_to_visit[:max_pages_per_target]:
-            if deadline_reached():
-                mark_source_runtime_event("CustomCareers", timed_out=1, note="custom careers deadline reached")
-                return jobs
-            if target_deadline_reached():
-                mark_source_runtime_event("CustomCareers", timed_out=1, note=f"{target['firm']} target time slice exhausted")
-                break
-            try:
-                page_resp = session.get(page_url, timeout=request_timeout())
-            except requests.RequestException:
-                continue
-            if page_resp.status_code != 200:
-                continue
-            for payload in extract_jobpostings_from_jsonld(page_resp.text, page_url, target["firm"]):
-                if should_skip_custom_careers_page(payload.get("title", ""), payload.get("link", ""), payload.get("summary", "")):
-                    continue
-                payload["target_firm"] = target["firm"]
-                payload["target_careers_url"] = careers_url
-                payload["target_category"] = target.get("primary_category", "")
-                job_map.setdefault(payload["link"], payload)
-            for link, title in extract_job_links(page_resp.text, page_url):
-                if should_skip_custom_careers_page(title, link, ""):
-                    continue
-                if is_obvious_non_uk_custom_link(link):
-                    continue
-                job_map.setdefault(
-                    link,
-                    {
-                        "title": title,
-                        "company": target["firm"],
-                        "location": "",
-                        "link": link,
-                        "posted_text": "",
-                        "posted_date": "",
-                        "summary": "",
-                        "source": "CustomCareers",
-                        "target_firm": target["firm"],
-                        "target_careers_url": careers_url,
-                        "target_category": target.get("primary_category", ""),
-                    },
-                )
-            time.sleep(0.15)
-
-        for link, job in list(job_map.items())[:max_detail_links_per_target]:
-            if deadline_reached():
-                mark_source_runtime_event("CustomCareers", timed_out=1, note="custom careers deadline reached")
-                return jobs
-            if target_deadline_reached():
-                mark_source_runtime_event("CustomCareers", timed_out=1, note=f"{target['firm']} target time slice exhausted")
-                break
-            if is_obvious_non_uk_custom_link(link):
-                job_map.pop(link, None)
-                continue
-            try:
-                detail_resp = session.get(link, timeout=request_timeout())
-            except requests.RequestException:
-                continue
-            if detail_resp.status_code != 200:
-                continue
-            details = parse_job_detail_jsonld(detail_resp.text, job.get("title", "")) or parse_job_detail_fallback(detail_resp.text)
-            if details.get("title"):
-                job["title"] = details["title"]
-            if details.get("company"):
-                job["company"] = details["company"]
-            if details.get("location"):
-                job["location"] = details["location"]
-            if details.get("posted_date"):
-                job["posted_date"] = details["posted_date"]
-            elif details.get("posted_text"):
-                job["posted_text"] = details["posted_text"]
-            if details.get("summary"):
-                job["summary"] = details["summary"]
-            if should_skip_custom_careers_page(job.get("title", ""), link, job.get("summary", "")):
-                job_map.pop(link, None)
-                continue
-            time.sleep(0.15)
-
-        target_raw = len(job_map)
-        mark_source_runtime_event("CustomCareers", raw=len(jobs) + target_raw)
-        jobs.extend(job_map.values())
-        if deadline_reached():
-            mark_source_runtime_event("CustomCareers", timed_out=1, note="custom careers deadline reached")
-            return jobs
-        time.sleep(0.2)
-    return jobs
-
-
 def job_board_search(session: requests.Session) -> List[Dict[str, str]]:
     jobs: List[Dict[str, str]] = []
     for source in JOB_BOARD_SOURCES:
@@ -3763,6 +3933,8 @@ def job_board_search(session: requests.Session) -> List[Dict[str, str]]:
             elif source["name"] == "CVLibrary":
                 jobs.extend(cvlibrary_search(session))
             elif source["name"] == "Workday":
+                from .workday import workday_search
+
                 jobs.extend(workday_search(session))
         elif source["type"] == "html":
             if source["name"] == "JobServe":
@@ -3784,6 +3956,8 @@ def job_board_search(session: requests.Session) -> List[Dict[str, str]]:
             elif source["name"] == "IndeedUK":
                 jobs.extend(indeed_search(session))
             elif source["name"] == "CustomCareers":
+                from .custom_careers import custom_careers_search
+
                 jobs.extend(custom_careers_search(session))
             elif source["name"] == "WorkInStartups":
                 jobs.extend(workinstartups_search(session))
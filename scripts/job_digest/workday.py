@@ -0,0 +1,247 @@
+"""Search Workday tenants through their public CXS jobs API.
+
+Every `WORKDAY_SITES` entry is a tenant careers site, searched with POSTs to
+`/wday/cxs/{tenant}/{site}/jobs`. The old loop sent one POST per board term
+(12 per tenant), one tenant after another with a sleep between requests, and
+most terms came back with the same postings. This engine instead:
+
+- coalesces the board terms: terms sharing a role suffix ("... product
+  manager") become one query for the suffix alone, and the postings it
+  returns are filtered locally on the terms' other words ("sanctions",
+  "screening", ...). Searching the suffix is at least as broad as any one
+  term whether CXS matches all words of `searchText` or any of them;
+- pages each query with `offset` until a page holds nothing posted inside
+  `WINDOW_HOURS`, the results run out, or its page budget is spent:
+  `WORKDAY_PAGES_PER_TERM` pages per merged term (the old loop read one);
+- runs every (tenant, query) chain on one pool, with a per-host semaphore in
+  place of the old fixed sleep;
+- dedupes postings per tenant by `externalPath` (or `applyUrl`) before any
+  job dict is built, in tenant and query order, so the output is stable
+  whatever the threads do. Postings with neither are kept as they come.
+
+The runtime note records how many requests this took against the old
+per-term loop.
+"""
+from __future__ import annotations
+
+import re
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Tuple
+from urllib.parse import urlparse
+
+import requests
+
+from . import config
+from .board_fetch import HostLimiter
+from .boards import WORKDAY_SITES
+from .sources import financial_services_board_search_terms, mark_source_runtime_event
+from .utils import clean_link, normalize_text, parse_posted_within_window, trim_summary
+
+WORKDAY_TERM_LIMIT = 12
+ROLE_WORDS = {
+    "analyst",
+    "associate",
+    "consultant",
+    "director",
+    "head",
+    "lead",
+    "manager",
+    "owner",
+    "principal",
+    "product",
+    "senior",
+    "specialist",
+}
+
+HOST_LIMITER = HostLimiter(config.WORKDAY_PER_HOST)
+
+
+def parse_workday_entry(entry: str) -> Tuple[str, str, str, str, str]:
+    entry = entry.strip()
+    name = ""
+    url = entry
+    if "|" in entry:
+        name, url = [part.strip() for part in entry.split("|", 1)]
+    parsed = urlparse(url if "://" in url else f"https://{url}")
+    host = parsed.netloc
+    path = parsed.path.strip("/")
+    segments = [seg for seg in path.split("/") if seg]
+    filtered = [seg for seg in segments if not re.match(r"^[a-z]{2}-[A-Z]{2}$", seg)]
+    site = filtered[-1] if filtered else (segments[-1] if segments else "")
+    tenant = host.split(".")[0] if host else ""
+    scheme = parsed.scheme or "https"
+    if not name:
+        name = tenant.replace("-", " ").title() if tenant else "Workday"
+    return scheme, host, tenant, site, name
+
+
+def coalesce_workday_terms(terms: List[str]) -> List[Tuple[str, Tuple[str, ...], int]]:
+    """(searchText, anchor words, terms merged) per query, merging terms that share a role suffix.
+
+    "name screening product manager" and "payment screening product manager"
+    become ("product manager", ("name", "screening", "payment"), 2): the suffix
+    is searched and postings must mention an anchor word. A term alone in its
+    group, or made only of role words, is searched as it is, unfiltered.
+    """
+    groups: Dict[str, List[List[str]]] = {}
+    for term in terms:
+        words = normalize_text(term).lower().split()
+        if not words:
+            continue
+        split = len(words)
+        while split > 1 and words[split - 1] in ROLE_WORDS:
+            split -= 1
+        if split == len(words) or words[split - 1] in ROLE_WORDS:
+            split = 0
+        groups.setdefault(" ".join(words[split:]), []).append(words[:split])
+    queries: List[Tuple[str, Tuple[str, ...], int]] = []
+    for suffix, anchors in groups.items():
+        if len(anchors) == 1 or not all(anchors):
+            # A lone term, or one that is the bare suffix: nothing to filter on.
+            query = " ".join(anchors[0] + [suffix]) if len(anchors) == 1 else suffix
+            queries.append((query, (), len(anchors)))
+            continue
+        merged: List[str] = []
+        for words in anchors:
+            merged.extend(word for word in words if word not in merged)
+        queries.append((suffix, tuple(merged), len(anchors)))
+    return queries
+
+
+def _mentions_anchor(posting: Dict[str, object], anchors: Tuple[str, ...]) -> bool:
+    if not anchors:
+        return True
+    parts = [str(posting.get("title") or posting.get("jobTitle") or ""), str(posting.get("description") or "")]
+    if isinstance(posting.get("bulletFields"), list):
+        parts.extend(str(field.get("value") or "") for field in posting["bulletFields"] if isinstance(field, dict))
+    text = " ".join(parts).lower()
+    return any(re.search(rf"\b{re.escape(word)}", text) for word in anchors)
+
+
+def _posted_in_window(posting: Dict[str, object]) -> bool:
+    posted_on = str(posting.get("postedOn") or "")
+    if not posted_on:
+        return True  # unknown age: keep paging rather than stop early
+    return parse_posted_within_window(posted_on, "", config.WINDOW_HOURS)
+
+
+def _query_chain(session: requests.Session, api_url: str, query: str, max_pages: int) -> Dict[str, object]:
+    """Page one query against one tenant; return its postings, request count and error."""
+    postings: List[Dict[str, object]] = []
+    requests_made = 0
+    total = None
+    page_size = max(1, config.WORKDAY_PAGE_SIZE)
+    for page in range(max(1, max_pages)):
+        payload = {"appliedFacets": {}, "limit": page_size, "offset": page * page_size, "searchText": query}
+        requests_made += 1
+        with HOST_LIMITER.for_url(api_url):
+            try:
+                resp = session.post(api_url, json=payload, timeout=config.WORKDAY_TIMEOUT_SECONDS)
+            except requests.RequestException:
+                return {"postings": postings, "requests": requests_made, "error": "request failed"}
+        if resp.status_code != 200:
+            return {"postings": postings, "requests": requests_made, "error": f"returned {resp.status_code}"}
+        try:
+            data = resp.json()
+        except ValueError:
+            return {"postings": postings, "requests": requests_made, "error": "returned invalid JSON"}
+        batch = [item for item in (data.get("jobPostings") or data.get("jobs") or []) if isinstance(item, dict)]
+        postings.extend(batch)
+        if total is None:
+            # Workday reports the total on the first page only.
+            total = int(data.get("total") or 0) if str(data.get("total") or "").isdigit() else 0
+        if len(batch) < page_size or (total and (page + 1) * page_size >= total):
+            break
+        if not any(_posted_in_window(item) for item in batch):
+            break
+    return {"postings": postings, "requests": requests_made, "error": ""}
+
+
+def _posting_key(posting: Dict[str, object]) -> str:
+    return str(posting.get("externalPath") or posting.get("applyUrl") or "").strip().lower()
+
+
+def _posting_to_job(posting: Dict[str, object], scheme: str, host: str, company_name: str) -> Dict[str, str]:
+    title = posting.get("title") or posting.get("jobTitle") or ""
+    link = str(posting.get("externalPath") or posting.get("applyUrl") or "")
+    if link and link.startswith("/"):
+        link = f"{scheme}://{host}{link}"
+    location = posting.get("locationsText") or posting.get("location") or "United Kingdom"
+    summary = posting.get("description") or ""
+    if not summary and isinstance(posting.get("bulletFields"), list):
+        for field in posting.get("bulletFields"):
+            if isinstance(field, dict) and field.get("name") == "jobDescription":
+                summary = field.get("value") or ""
+    return {
+        "title": normalize_text(str(title)),
+        "company": company_name,
+        "location": normalize_text(str(location)),
+        "link": clean_link(link),
+        "posted_text": "",
+        "posted_date": str(posting.get("postedOn") or ""),
+        "summary": trim_summary(str(summary)),
+        "source": "Workday",
+    }
+
+
+def workday_search(session: requests.Session) -> List[Dict[str, str]]:
+    tenants: List[Tuple[str, str, str, str]] = []
+    seen_urls: set = set()
+    for entry in WORKDAY_SITES:
+        scheme, host, tenant, site, company_name = parse_workday_entry(entry)
+        if not host or not tenant or not site:
+            continue
+        api_url = f"{scheme}://{host}/wday/cxs/{tenant}/{site}/jobs"
+        if api_url.lower() in seen_urls:
+            continue
+        seen_urls.add(api_url.lower())
+        tenants.append((api_url, scheme, host, company_name))
+    if not tenants:
+        return []
+    terms = financial_services_board_search_terms()[:WORKDAY_TERM_LIMIT]
+    queries = coalesce_workday_terms(terms)
+    chains = [
+        (tenant[0], query, merged * config.WORKDAY_PAGES_PER_TERM) for tenant in tenants for query, _, merged in queries
+    ]
+    workers = max(1, min(config.WORKDAY_WORKERS, len(chains)))
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        results = list(pool.map(lambda chain: _query_chain(session, *chain), chains))
+
+    jobs: List[Dict[str, str]] = []
+    requests_made = 0
+    failed = 0
+    for index, (api_url, scheme, host, company_name) in enumerate(tenants):
+        tenant_results = results[index * len(queries) : (index + 1) * len(queries)]
+        seen_postings: set = set()
+        errors = [str(result["error"]) for result in tenant_results if result["error"]]
+        for (_, anchors, _), result in zip(queries, tenant_results):
+            requests_made += int(result["requests"])
+            for posting in result["postings"]:
+                if not (posting.get("title") or posting.get("jobTitle")) or not _mentions_anchor(posting, anchors):
+                    continue
+                key = _posting_key(posting)
+                if key and key in seen_postings:
+                    continue
+                seen_postings.add(key)
+                jobs.append(_posting_to_job(posting, scheme, host, company_name))
+        if errors:
+            failed += len(errors)
+            mark_source_runtime_event(
+                "Workday", note=f"{company_name}: {len(errors)}/{len(queries)} queries failed ({errors[0]})"
+            )
+    legacy_requests = len(terms) * len(tenants)
+    # Paging through broad coalesced queries can cost more than per-term
+    # first pages did, so the difference is reported with its sign.
+    delta = legacy_requests - requests_made
+    comparison = f"{abs(delta)} {'fewer' if delta >= 0 else 'more'}"
+    mark_source_runtime_event(
+        "Workday",
+        failed=failed,
+        raw=len(jobs),
+        query_count=requests_made,
+        note=(
+            f"coalesced {len(terms)} terms into {len(queries)} queries: {requests_made} requests for "
+            f"{len(tenants)} tenants vs {legacy_requests} per-term ({comparison})"
+        ),
+    )
+    return jobs
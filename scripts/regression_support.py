@@ -0,0 +1,101 @@
+"""Shared plumbing for the standalone regression checks in scripts/test_*.py.
+
+The repo has no Python test runner: every check file runs directly
+
+    python scripts/test_<name>.py
+    for check in scripts/test_*.py; do python "$check" || break; done
+
+and exits non-zero on the first failed assertion. These helpers stand in for
+the fixtures a runner would otherwise provide. In particular, every on-disk
+cache a check touches is pointed at a throwaway directory, so no check ever
+writes to the real DIGEST_DIR.
+"""
+
+from __future__ import annotations
+
+import os
+import sys
+import tempfile
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Dict, Iterator, Optional, Type
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+_MISSING = object()
+
+
+@contextmanager
+def patched(target: object, **attrs: object) -> Iterator[None]:
+    """Set attributes on `target` for the duration of the block, then restore them."""
+    previous = {name: getattr(target, name, _MISSING) for name in attrs}
+    for name, value in attrs.items():
+        setattr(target, name, value)
+    try:
+        yield
+    finally:
+        for name, value in previous.items():
+            if value is _MISSING:
+                delattr(target, name)
+            else:
+                setattr(target, name, value)
+
+
+@contextmanager
+def patched_env(**values: Optional[str]) -> Iterator[None]:
+    """Set environment variables for the block; None unsets one."""
+    previous: Dict[str, Optional[str]] = {name: os.environ.get(name) for name in values}
+    for name, value in values.items():
+        if value is None:
+            os.environ.pop(name, None)
+        else:
+            os.environ[name] = value
+    try:
+        yield
+    finally:
+        for name, value in previous.items():
+            if value is None:
+                os.environ.pop(name, None)
+            else:
+                os.environ[name] = value
+
+
+@contextmanager
+def isolated_cache(module: object, *names: str) -> Iterator[Path]:
+    """Point the on-disk caches `module.<name>` at an empty temporary directory.
+
+    Each name is a `JsonTtlCache` (rebuilt with the same class, file name and
+    max age) or a plain file `Path`. Yields the directory; the originals are
+    restored when the block exits.
+    """
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp)
+        replacements: Dict[str, object] = {}
+        for name in names:
+            current = getattr(module, name)
+            if isinstance(current, Path):
+                replacements[name] = path / current.name
+            else:
+                replacements[name] = type(current)(path / current.path.name, current.max_age_days)
+        with patched(module, **replacements):
+            yield path
+
+
+@contextmanager
+def raises(exc_type: Type[BaseException]) -> Iterator[None]:
+    """Fail unless the block raises `exc_type`."""
+    try:
+        yield
+    except exc_type:
+        return
+    raise AssertionError(f"{exc_type.__name__} was not raised")
+
+
+def run_checks(namespace: Dict[str, object], label: str) -> None:
+    """Run every `test_*` function in `namespace` in definition order."""
+    for name, check in list(namespace.items()):
+        if name.startswith("test_") and callable(check):
+            check()
+    print(f"OK: {label} passed")
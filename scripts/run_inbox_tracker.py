@@ -21,6 +21,11 @@ def main() -> int:
     parser.add_argument("--dry-run", action="store_true", help="Skip all Firestore writes; only emit the artefact and summary.")
     parser.add_argument("--commit-writes", action="store_true", help="Explicit opt-in to Firestore writes (default is dry-run).")
     parser.add_argument("--max-messages", type=int, default=0, help="Cap on UIDs to process (0 = no cap).")
+    parser.add_argument(
+        "--full-rescan",
+        action="store_true",
+        help="Ignore the saved UID high-water mark and rescan all mail since --since (backfills).",
+    )
     args = parser.parse_args()
 
     dry_run = True
@@ -35,6 +40,7 @@ def main() -> int:
         out_path=out_path,
         dry_run=dry_run,
         max_messages=args.max_messages,
+        full_rescan=args.full_rescan,
     )
     return 0 if result.events or result.candidates_fetched == 0 else 0
 
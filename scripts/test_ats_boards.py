@@ -0,0 +1,185 @@
+"""Regression checks for the parallel ATS board fetch engine."""
+
+from __future__ import annotations
+
+import sys
+import threading
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+import requests  # noqa: E402
+
+from scripts.job_digest import board_fetch, config, notify_telegram, runner, sources  # noqa: E402
+from scripts.job_digest.models import JobRecord  # noqa: E402
+from scripts.regression_support import isolated_cache, patched, run_checks  # noqa: E402
+
+
+def _board_cache():
+    return isolated_cache(board_fetch, "BOARD_CACHE")
+
+
+class _Resp:
+    def __init__(self, status_code: int, payload: object) -> None:
+        self.status_code = status_code
+        self._payload = payload
+        self.headers: dict[str, str] = {}
+        self.content = repr(payload).encode()
+
+    def json(self) -> object:
+        if isinstance(self._payload, Exception):
+            raise self._payload
+        return self._payload
+
+
+class _FakeSession:
+    """Answers board URLs from a dict, tracking peak concurrency per host."""
+
+    def __init__(self, responses: dict[str, _Resp], delay: float = 0.0) -> None:
+        self.responses = responses
+        self.delay = delay
+        self.calls: list[str] = []
+        self.in_flight = 0
+        self.peak = 0
+        self._lock = threading.Lock()
+
+    def get(self, url: str, timeout: int = 0, headers: dict | None = None) -> _Resp:
+        with self._lock:
+            self.calls.append(url)
+            self.in_flight += 1
+            self.peak = max(self.peak, self.in_flight)
+        time.sleep(self.delay)
+        with self._lock:
+            self.in_flight -= 1
+        resp = self.responses.get(url)
+        if resp is None:
+            raise requests.ConnectionError(url)
+        return resp
+
+
+def _gh_url(board: str) -> str:
+    return f"https://boards-api.greenhouse.io/v1/boards/{board}/jobs"
+
+
+def _gh_payload(*titles: str) -> dict:
+    return {"jobs": [{"title": t, "absolute_url": f"https://x/{t}", "location": {"name": "London"}} for t in titles]}
+
+
+def test_greenhouse_fan_out_dedupes_and_keeps_board_order() -> None:
+    session = _FakeSession(
+        {
+            _gh_url("monzo"): _Resp(200, _gh_payload("A", "B")),
+            _gh_url("tide"): _Resp(200, _gh_payload("C")),
+            _gh_url("broken"): _Resp(200, ValueError("bad json")),
+        },
+        delay=0.02,
+    )
+    boards = ["monzo", "tide", "Monzo", "broken", "missing", "tide"]
+    with _board_cache(), patched(sources, GREENHOUSE_BOARDS=boards):
+        jobs = sources.greenhouse_search(session)
+    assert [(j["ats_account"], j["title"]) for j in jobs] == [("monzo", "A"), ("monzo", "B"), ("tide", "C")]
+    assert jobs[0]["company"] == "Monzo" and jobs[0]["location"] == "London"
+    assert sorted(session.calls) == sorted(_gh_url(b) for b in ("monzo", "tide", "broken", "missing"))
+
+
+def test_per_host_limit_caps_concurrency() -> None:
+    boards = [f"b{i}" for i in range(8)]
+    session = _FakeSession({_gh_url(b): _Resp(200, _gh_payload(b)) for b in boards}, delay=0.05)
+    with _board_cache(), patched(board_fetch, HOST_LIMITER=board_fetch.HostLimiter(2)):
+        jobs = board_fetch.fetch_board_jobs(session, boards, _gh_url, sources._parse_greenhouse_board, max_workers=8)
+    assert [j["title"] for j in jobs] == boards
+    assert session.peak == 2
+
+
+class _ValidatingSession(_FakeSession):
+    """Returns 304 when the caller presents the board's current ETag."""
+
+    def __init__(self, responses: dict[str, _Resp], etags: dict[str, str]) -> None:
+        super().__init__(responses)
+        self.etags = etags
+        self.conditional = 0
+
+    def get(self, url: str, timeout: int = 0, headers: dict | None = None) -> _Resp:
+        resp = super().get(url, timeout=timeout, headers=headers)
+        if headers and headers.get("If-None-Match"):
+            self.conditional += 1
+            if headers["If-None-Match"] == self.etags.get(url):
+                return _Resp(304, None)
+        if url in self.etags:
+            resp.headers = {"ETag": self.etags[url]}
+        return resp
+
+
+def test_unchanged_boards_reuse_or_skip_cached_jobs() -> None:
+    with _board_cache() as tmp:
+        boards = ["monzo", "tide"]
+        session = _ValidatingSession(
+            {_gh_url("monzo"): _Resp(200, _gh_payload("A")), _gh_url("tide"): _Resp(200, _gh_payload("B"))},
+            etags={_gh_url("monzo"): '"v1"'},  # tide sends no validators: content hash fallback
+        )
+
+        def fetch() -> list[str]:
+            jobs = board_fetch.fetch_board_jobs(session, boards, _gh_url, sources._parse_greenhouse_board, source_name="GH")
+            return [j["title"] for j in jobs]
+
+        board_fetch.reset_board_cache_stats()
+        assert fetch() == ["A", "B"]
+        assert fetch() == ["A", "B"]  # digest scope reuses the cached parse
+        assert session.conditional == 1
+        assert board_fetch.BOARD_CACHE_STATS["GH"] == {"changed": 2, "not_modified": 1, "same_hash": 1, "failed": 0}
+        assert board_fetch.BOARD_CACHE.path.exists()
+
+        with board_fetch.board_cache_scope("hot_scan", skip_unchanged=True):
+            assert fetch() == ["A", "B"]  # first hot scan has nothing cached in its scope
+            assert fetch() == []
+            session.responses[_gh_url("tide")] = _Resp(200, _gh_payload("B", "C"))
+            assert fetch() == ["B", "C"]
+            board_fetch.BOARD_CACHE.forget_board("monzo")
+            assert fetch() == ["A"]
+
+
+
+def test_empty_boards_are_cached_not_counted_as_failures() -> None:
+    boards = ["quiet", "gone"]
+    session = _ValidatingSession({_gh_url("quiet"): _Resp(200, {})}, etags={_gh_url("quiet"): '"empty"'})
+    with _board_cache():
+        board_fetch.reset_board_cache_stats()
+        for _ in range(2):
+            board_fetch.fetch_board_jobs(session, boards, _gh_url, sources._parse_greenhouse_board, source_name="GH")
+        stats = dict(board_fetch.BOARD_CACHE_STATS["GH"])
+    assert session.conditional == 1  # the empty board revalidated instead of downloading again
+    assert stats == {"changed": 1, "not_modified": 1, "same_hash": 0, "failed": 2}
+
+
+def test_deferred_scope_leaves_validators_uncommitted() -> None:
+    session = _ValidatingSession({_gh_url("monzo"): _Resp(200, _gh_payload("A"))}, etags={_gh_url("monzo"): '"v1"'})
+    with _board_cache():
+        with board_fetch.board_cache_scope("hot_scan", skip_unchanged=True, defer_save=True):
+            board_fetch.fetch_board_jobs(session, ["monzo"], _gh_url, sources._parse_greenhouse_board)
+        assert not board_fetch.BOARD_CACHE.path.exists()  # a scan dying here keeps the old validators
+        board_fetch.BOARD_CACHE.save()
+        assert board_fetch.BOARD_CACHE.path.exists()
+
+
+def test_hot_scan_rereads_boards_whose_roles_were_not_alerted() -> None:
+    role = JobRecord(
+        role="KYC Product Manager", company="Monzo", location="London", link="https://x/kyc", posted="", source="Greenhouse",
+        fit_score=90, preference_match="", why_fit="", cv_gap="", notes="", ats_account="monzo",
+    )
+    with isolated_cache(runner, "BOARD_CACHE"), isolated_cache(config, "HOT_ALERTED_CACHE_PATH"), patched(
+        runner,
+        run_source_stages=lambda stages: [role],
+        select_hot_lane=lambda records, **kwargs: records,
+        write_records_to_firestore=lambda records: None,
+        init_firestore_client=lambda: None,
+    ), patched(notify_telegram, is_configured=lambda: False):
+        runner.BOARD_CACHE.put("hot_scan|monzo", {"board": "monzo", "etag": '"v1"'})
+        assert runner.run_hot_scan() == 0
+        assert runner.BOARD_CACHE.get("hot_scan|monzo") is None  # Telegram unconfigured: nothing delivered
+
+
+if __name__ == "__main__":
+    run_checks(globals(), "ATS board fetch checks")
@@ -0,0 +1,192 @@
+"""Regression checks for the concurrent, round-robin custom careers crawler."""
+
+from __future__ import annotations
+
+import sys
+import threading
+import time
+from contextlib import contextmanager
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from scripts.job_digest import config, custom_careers, detail_cache, sources  # noqa: E402
+from scripts.job_digest.board_fetch import HostLimiter  # noqa: E402
+from scripts.regression_support import isolated_cache, patched, patched_env, run_checks  # noqa: E402
+
+
+def _landing(host: str, slugs: list) -> str:
+    links = "".join(f'<a href="https://{host}/jobs/{slug}">Product Manager {slug}</a>' for slug in slugs)
+    return f'<html><body><a href="https://{host}/careers/all-jobs">All jobs</a>{links}</body></html>'
+
+
+def _detail(title: str) -> str:
+    return f"<html><head><title>{title}</title></head><body><h1>{title}</h1><p>London, UK</p></body></html>"
+
+
+class FakeResponse:
+    def __init__(self, status_code: int, text: str = "") -> None:
+        self.status_code = status_code
+        self.text = text
+
+
+class FakeSession:
+    """Serves canned pages by URL, tracking call order and peak concurrency per host."""
+
+    def __init__(self, pages: dict, delay: float = 0.0) -> None:
+        self.pages = pages
+        self.delay = delay
+        self.calls: list = []
+        self.active: dict = {}
+        self.peak: dict = {}
+        self.lock = threading.Lock()
+
+    def get(self, url, timeout=None, **kwargs):  # noqa: ANN001
+        host = url.split("/")[2]
+        with self.lock:
+            self.calls.append(url)
+            self.active[host] = self.active.get(host, 0) + 1
+            self.peak[host] = max(self.peak.get(host, 0), self.active[host])
+        time.sleep(self.delay)
+        with self.lock:
+            self.active[host] -= 1
+        if url not in self.pages:
+            return FakeResponse(404)
+        return FakeResponse(200, self.pages[url])
+
+
+TARGETS = [
+    {"firm": "Alpha Bank", "careers_url": "https://alpha.example/careers", "primary_category": "Bank"},
+    {"firm": "Beta Pay", "careers_url": "https://beta.example/careers", "primary_category": "Fintech"},
+    {"firm": "Gamma", "careers_url": "https://gamma.example/careers", "primary_category": "Fintech"},
+]
+PAGES = {
+    "https://alpha.example/careers": _landing("alpha.example", ["a1", "a2"]),
+    "https://alpha.example/careers/all-jobs": _landing("alpha.example", ["a2", "a3"]),
+    "https://alpha.example/jobs/a1": _detail("Senior Product Manager - KYC"),
+    "https://alpha.example/jobs/a2": _detail("Product Owner - Onboarding"),
+    "https://alpha.example/jobs/a3": _detail("Product Manager - Screening"),
+    "https://beta.example/careers": _landing("beta.example", ["b1"]),
+    "https://beta.example/jobs/b1": _detail("Business Analyst - Payments"),
+    # gamma's landing page 404s
+}
+
+
+@contextmanager
+def _crawl(workers: int, targets: list = TARGETS, **env: str):
+    """Crawl `targets` over the canned pages with `workers` threads and an empty detail cache."""
+    loader = lambda path: [dict(target) for target in targets]  # noqa: E731
+    env = {"JOB_DIGEST_CUSTOM_CAREERS_TARGET_TIMEOUT_SECONDS": None, **env}
+    with isolated_cache(detail_cache, "DETAIL_PAGE_CACHE"):
+        with patched(custom_careers, load_custom_careers_targets=loader, HOST_LIMITER=HostLimiter(2)):
+            with patched(config, CUSTOM_CAREERS_WORKERS=workers), patched_env(**env):
+                sources.reset_source_runtime_events()
+                yield
+
+
+def test_pool_matches_serial_crawl_and_records_coverage() -> None:
+    results = {}
+    for workers in (1, 6):
+        with _crawl(workers):
+            session = FakeSession(PAGES, delay=0.01)
+            results[workers] = custom_careers.custom_careers_search(session)
+            events = sources.get_source_runtime_events()["CustomCareers"]
+        assert session.calls.count("https://alpha.example/careers") == 1  # landing page reused as first hub
+        assert max(session.peak.values()) <= 2
+    assert results[1] == results[6]
+    assert [job["link"] for job in results[6]] == [
+        "https://alpha.example/jobs/a1",
+        "https://alpha.example/jobs/a2",
+        "https://alpha.example/jobs/a3",
+        "https://beta.example/jobs/b1",
+    ]
+    assert results[6][3]["target_careers_url"] == "https://beta.example/careers"
+    assert events["failed"] == 1
+    assert events["notes"][-1] == "coverage: 3/3 targets visited"
+
+
+def test_round_robin_reaches_every_landing_page_first() -> None:
+    session = FakeSession(PAGES)
+    with _crawl(1):
+        custom_careers.custom_careers_search(session)
+    assert session.calls[:3] == [target["careers_url"] for target in TARGETS]
+
+
+def test_exhausted_time_slice_skips_remaining_requests() -> None:
+    session = FakeSession(PAGES)
+    real_get = session.get
+
+    def slow_alpha(url, timeout=None, **kwargs):  # noqa: ANN001
+        if url == "https://alpha.example/careers":
+            time.sleep(1.05)
+        return real_get(url, timeout=timeout)
+
+    session.get = slow_alpha
+    with _crawl(1, JOB_DIGEST_CUSTOM_CAREERS_TARGET_TIMEOUT_SECONDS="1"):
+        jobs = custom_careers.custom_careers_search(session)
+        notes = sources.get_source_runtime_events()["CustomCareers"]["notes"]
+    assert not any(url.startswith("https://alpha.example/jobs/") for url in session.calls)
+    assert "https://alpha.example/careers/all-jobs" not in session.calls
+    alpha = [job["link"] for job in jobs if job["target_firm"] == "Alpha Bank"]
+    assert alpha == ["https://alpha.example/jobs/a1", "https://alpha.example/jobs/a2"]  # landing-page links kept
+    assert "Alpha Bank target time slice exhausted" in notes
+
+
+def test_recorded_fixtures_match_legacy_serial_crawl() -> None:
+    from scripts import bench_custom_careers as bench
+
+    targets = bench.fixture_targets(5)
+    legacy_session, session = bench.FixtureSession(0.0), bench.FixtureSession(0.0)
+    with _crawl(4), patched(bench.time, sleep=lambda seconds: None):
+        legacy = bench.legacy_serial_crawl(legacy_session, targets)
+        unified = bench.unified_crawl(session, targets)  # _crawl restores the target loader afterwards
+    assert [(job["link"], job["title"], job["summary"]) for job in unified] == [
+        (job["link"], job["title"], job.get("summary", "")) for job in legacy
+    ]
+    assert session.requests == legacy_session.requests - 4  # landing pages of the 4 reachable firms fetched once
+
+
+def test_second_crawl_serves_detail_pages_from_cache() -> None:
+    cold, warm = FakeSession(PAGES), FakeSession(PAGES)
+    with _crawl(4):
+        first = custom_careers.custom_careers_search(cold)
+        second = custom_careers.custom_careers_search(warm)
+        notes = sources.get_source_runtime_events()["CustomCareers"]["notes"]
+    assert second == first
+    assert len(warm.calls) == len(cold.calls) - 4  # only hub/landing pages refetched
+    assert "detail cache: 4 fresh, 0 not modified, 0 unchanged, 4 fetched" in notes
+
+
+def test_deadline_cutoff_is_not_recorded_as_a_target_failure() -> None:
+    delta = {"firm": "Delta", "careers_url": "https://delta.example/careers", "primary_category": "Fintech"}
+    pages = dict(PAGES)
+    pages[delta["careers_url"]] = '<html><body><a href="https://delta.example/careers/all-jobs">All jobs</a></body></html>'
+    session = FakeSession(pages)
+    real_get = session.get
+
+    def slow_alpha_hub(url, timeout=None, **kwargs):  # noqa: ANN001
+        if url == "https://alpha.example/careers/all-jobs":
+            time.sleep(1.05)
+        return real_get(url, timeout=timeout)
+
+    session.get = slow_alpha_hub
+    with _crawl(
+        1,
+        TARGETS + [delta],
+        JOB_DIGEST_CUSTOM_CAREERS_DEADLINE_SECONDS="1",
+        JOB_DIGEST_CUSTOM_CAREERS_TARGET_TIMEOUT_SECONDS="0",
+    ):
+        custom_careers.custom_careers_search(session)
+        outcomes = sources.get_custom_careers_crawl_outcomes()
+        notes = sources.get_source_runtime_events()["CustomCareers"]["notes"]
+    assert "https://delta.example/careers/all-jobs" not in session.calls
+    assert delta["careers_url"] not in outcomes  # cut off empty-handed: health untouched
+    assert outcomes["https://alpha.example/careers"]["status"] == "ok"  # landing links kept
+    assert "custom careers deadline reached" in notes
+    assert notes[-1] == "coverage: 4/4 targets visited"
+
+
+if __name__ == "__main__":
+    run_checks(globals(), "custom careers crawl checks")
@@ -0,0 +1,111 @@
+"""Regression checks for health-driven custom careers scheduling and backoff."""
+
+from __future__ import annotations
+
+import json
+import sys
+from contextlib import contextmanager
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from scripts.job_digest import config, runner, sources  # noqa: E402
+from scripts.regression_support import isolated_cache, patched, patched_env, run_checks  # noqa: E402
+
+NOW = datetime.now(timezone.utc)
+
+
+def _run(status: str, kept: int, hours_ago: float = 0.0) -> dict:
+    return {"last_status": status, "last_kept": kept, "last_seen_at": (NOW - timedelta(hours=hours_ago)).isoformat()}
+
+
+@contextmanager
+def _health_state():
+    with isolated_cache(sources, "CUSTOM_CAREERS_HEALTH_PATH"), patched(
+        config,
+        CUSTOM_CAREERS_FAILURES_BEFORE_BACKOFF=2,
+        CUSTOM_CAREERS_DRY_RUNS_BEFORE_BACKOFF=3,
+        CUSTOM_CAREERS_BACKOFF_HOURS=8.0,
+        CUSTOM_CAREERS_MAX_BACKOFF_HOURS=20.0,
+        CUSTOM_CAREERS_HEALTH_WINDOW=3,
+    ):
+        sources.reset_source_runtime_events()
+        runner.reset_source_diagnostics()
+        yield
+
+
+@_health_state()
+def test_failure_streak_backs_off_exponentially_and_success_resets() -> None:
+    entry: dict = {}
+    retries = []
+    for _ in range(4):
+        entry = sources.roll_custom_careers_health(entry, _run("blocked", 0))
+        retry_after = entry["retry_after"]
+        retries.append(round((datetime.fromisoformat(retry_after) - NOW).total_seconds() / 3600) if retry_after else 0)
+    assert retries == [0, 8, 16, 20]  # capped at the max
+    assert entry["failure_streak"] == 4
+    assert sources.custom_careers_backoff_reason(entry, NOW) == "4 failed runs (blocked)"
+
+    entry = sources.roll_custom_careers_health(entry, _run("healthy", 2))
+    assert (entry["failure_streak"], entry["dry_streak"], entry["retry_after"]) == (0, 0, "")
+    assert entry["recent_kept"] == [0, 0, 2]
+    assert entry["last_success_at"] == entry["last_seen_at"]
+
+
+@_health_state()
+def test_dry_targets_back_off_after_the_dry_run_count() -> None:
+    entry: dict = {"last_kept": 4, "last_seen_at": NOW.isoformat()}  # legacy entry, no rolling fields
+    for backed_off in (False, False, True):
+        entry = sources.roll_custom_careers_health(entry, _run("empty", 0))
+        assert bool(entry["retry_after"]) == backed_off
+    assert entry["recent_kept"] == [0, 0, 0]
+    assert sources.custom_careers_backoff_reason(entry, NOW) == "3 runs without a kept role"
+
+
+@_health_state()
+@patched_env(JOB_DIGEST_CUSTOM_CAREERS_TARGET_LIMIT="0")
+def test_loader_skips_backed_off_targets_and_ranks_by_health() -> None:
+    feeds = sources.CUSTOM_CAREERS_HEALTH_PATH.parent / "feeds.csv"
+    rows = ["firm,platform,careers_url,source"]
+    rows += [f"Zz Test {name},Custom,https://{name}.example/careers,Custom" for name in ("fresh", "dry", "failing", "productive", "parked")]
+    feeds.write_text("\n".join(rows) + "\n", encoding="utf-8")
+    health = {
+        "https://dry.example/careers": {**_run("empty", 0, 30), "dry_streak": 1, "recent_kept": [0]},
+        "https://failing.example/careers": {**_run("broken", 0, 30), "failure_streak": 1, "recent_kept": [0]},
+        "https://productive.example/careers": {**_run("healthy", 3, 30), "recent_kept": [1, 3], "last_success_at": NOW.isoformat()},
+        "https://parked.example/careers": {
+            **_run("blocked", 0, 1), "failure_streak": 3, "retry_after": (NOW + timedelta(hours=5)).isoformat(),
+        },
+    }
+    sources.CUSTOM_CAREERS_HEALTH_PATH.write_text(json.dumps(health), encoding="utf-8")
+
+    targets = sources.load_custom_careers_targets(feeds)
+    assert [item["firm"] for item in targets] == ["Zz Test productive", "Zz Test fresh", "Zz Test dry", "Zz Test failing"]
+    schedule = sources.get_source_runtime_events()["CustomCareers"]["schedule"]
+    assert [item["firm"] for item in schedule["skipped"]] == ["Zz Test parked"]
+    assert schedule["skipped"][0]["reason"] == "3 failed runs (blocked)"
+
+
+@_health_state()
+def test_crawl_failures_reach_the_health_file() -> None:
+    sources.CUSTOM_CAREERS_CRAWL_OUTCOMES.update(
+        {
+            "https://blocked.example/careers": {"firm": "Blocked Ltd", "primary_category": "Bank", "status": "blocked", "raw": 0},
+            "https://quiet.example/careers": {"firm": "Quiet Ltd", "primary_category": "", "status": "ok", "raw": 0},
+        }
+    )
+    for _ in range(2):
+        sources.save_custom_careers_health_state(runner.finalize_custom_target_diagnostics())
+    saved = sources.load_custom_careers_health_state()
+    assert saved["https://blocked.example/careers"]["last_status"] == "blocked"
+    assert saved["https://blocked.example/careers"]["failure_streak"] == 2
+    assert saved["https://blocked.example/careers"]["retry_after"]
+    assert saved["https://quiet.example/careers"]["last_status"] == "empty"
+    assert saved["https://quiet.example/careers"]["dry_streak"] == 2
+
+
+if __name__ == "__main__":
+    run_checks(globals(), "custom careers health checks")
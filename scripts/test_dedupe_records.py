@@ -0,0 +1,34 @@
+"""Regression checks for the indexed records.dedupe_records engine."""
+
+from __future__ import annotations
+
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from scripts.bench_dedupe_records import fingerprint, legacy_dedupe_records, synthetic_records  # noqa: E402
+from scripts.job_digest.records import dedupe_records  # noqa: E402
+from scripts.regression_support import run_checks  # noqa: E402
+
+
+def test_indexed_dedupe_matches_quadratic_scan() -> None:
+    for seed in (1, 2, 3):
+        indexed = dedupe_records(synthetic_records(600, seed=seed))
+        legacy = legacy_dedupe_records(synthetic_records(600, seed=seed))
+        assert fingerprint(indexed) == fingerprint(legacy)
+
+
+def test_seniority_and_punctuation_variants_merge() -> None:
+    records = synthetic_records(2)
+    records[0].role, records[0].company = "Senior Product Manager, KYC", "Monzo"
+    records[1].role, records[1].company = "Product Manager - KYC", "monzo"
+    merged = dedupe_records(records)
+    assert len(merged) == 1
+    assert {alt["link"] for alt in merged[0].alternate_links} <= {records[0].link, records[1].link}
+
+
+if __name__ == "__main__":
+    run_checks(globals(), "dedupe checks")
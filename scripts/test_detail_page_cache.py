@@ -0,0 +1,84 @@
+"""Regression checks for the persistent job-detail page cache."""
+
+from __future__ import annotations
+
+import sys
+from contextlib import contextmanager
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from scripts.job_digest import config, detail_cache  # noqa: E402
+from scripts.job_digest.disk_cache import JsonTtlCache  # noqa: E402
+from scripts.regression_support import isolated_cache, patched, run_checks  # noqa: E402
+
+URL = "https://careers.example.com/jobs/kyc-lead/?utm_source=feed"
+
+
+class FakeResponse:
+    def __init__(self, status_code: int, text: str = "", headers: dict | None = None) -> None:
+        self.status_code = status_code
+        self.text = text
+        self.headers = headers or {}
+
+
+@contextmanager
+def _detail_cache():
+    with isolated_cache(detail_cache, "DETAIL_PAGE_CACHE"), patched(
+        config, DETAIL_PAGE_CACHE_ENABLED=True, DETAIL_PAGE_CACHE_FRESH_HOURS=72.0
+    ):
+        detail_cache.reset_detail_cache_stats()
+        yield
+
+
+def _parser(calls: list):
+    def parse(html: str) -> dict:
+        calls.append(html)
+        return {"title": f"KYC Lead ({html})", "location": "London", "summary": "Own onboarding."}
+
+    return parse
+
+
+@_detail_cache()
+def test_fresh_entries_skip_the_request_and_stale_ones_revalidate() -> None:
+    calls: list = []
+    assert detail_cache.cached_job_details(URL, "CustomCareers") == (None, {})
+    first = detail_cache.job_details_from_response(
+        URL, FakeResponse(200, "v1", {"ETag": '"abc"', "Last-Modified": "Mon, 12 Oct 2026 09:00:00 GMT"}), _parser(calls), "CustomCareers"
+    )
+    assert first == {"title": "KYC Lead (v1)", "company": "", "location": "London", "posted_date": "", "posted_text": "", "summary": "Own onboarding."}
+
+    # Same canonical link, different tracking parameters: still a fresh hit.
+    assert detail_cache.cached_job_details("https://careers.example.com/jobs/kyc-lead", "CustomCareers") == (first, {})
+
+    config.DETAIL_PAGE_CACHE_FRESH_HOURS = 0.0  # restored by _detail_cache
+    details, headers = detail_cache.cached_job_details(URL, "CustomCareers")
+    assert details is None
+    assert headers == {"If-None-Match": '"abc"', "If-Modified-Since": "Mon, 12 Oct 2026 09:00:00 GMT"}
+    assert detail_cache.job_details_from_response(URL, FakeResponse(304), _parser(calls), "CustomCareers") == first
+    assert detail_cache.job_details_from_response(URL, FakeResponse(200, "v1"), _parser(calls), "CustomCareers") == first
+    assert calls == ["v1"]  # neither the 304 nor the identical body was re-parsed
+
+    changed = detail_cache.job_details_from_response(URL, FakeResponse(200, "v2"), _parser(calls), "CustomCareers")
+    assert changed["title"] == "KYC Lead (v2)"
+    assert detail_cache.detail_cache_note("CustomCareers") == "detail cache: 1 fresh, 1 not modified, 1 unchanged, 2 fetched"
+
+
+@_detail_cache()
+def test_failures_are_not_cached_and_survive_a_reload() -> None:
+    calls: list = []
+    assert detail_cache.job_details_from_response(URL, FakeResponse(503), _parser(calls)) is None
+    assert detail_cache.job_details_from_response(URL, FakeResponse(304), _parser(calls)) is None
+    assert detail_cache.cached_job_details(URL) == (None, {})
+
+    detail_cache.job_details_from_response(URL, FakeResponse(200, "v1"), _parser(calls))
+    detail_cache.save_detail_page_cache()
+    detail_cache.DETAIL_PAGE_CACHE = JsonTtlCache(detail_cache.DETAIL_PAGE_CACHE.path, 21)
+    details, _ = detail_cache.cached_job_details(URL)
+    assert details["title"] == "KYC Lead (v1)"
+
+
+if __name__ == "__main__":
+    run_checks(globals(), "detail page cache checks")
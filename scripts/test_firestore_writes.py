@@ -0,0 +1,181 @@
+"""Regression checks for the batched Firestore job upsert, against an in-memory fake client."""
+
+from __future__ import annotations
+
+import sys
+from contextlib import contextmanager
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from scripts.job_digest import config, firestore  # noqa: E402
+from scripts.job_digest.models import JobRecord  # noqa: E402
+from scripts.regression_support import patched, run_checks  # noqa: E402
+
+
+class FakeSnapshot:
+    def __init__(self, doc_id: str, data):
+        self.id = doc_id
+        self.exists = data is not None
+        self._data = data
+
+    def to_dict(self):
+        return dict(self._data) if self._data is not None else None
+
+
+class FakeRef:
+    def __init__(self, client: "FakeClient", path: str):
+        self.client = client
+        self.path = path
+        self.id = path.rsplit("/", 1)[-1]
+
+    def collection(self, name: str) -> "FakeCollection":
+        return FakeCollection(self.client, f"{self.path}/{name}")
+
+    def get(self) -> FakeSnapshot:
+        self.client.calls.append("get")
+        return FakeSnapshot(self.id, self.client.docs.get(self.path))
+
+    def set(self, data, merge: bool = False) -> None:
+        self.client.calls.append("set")
+        self.client.apply(self.path, data, merge)
+
+
+class FakeCollection:
+    def __init__(self, client: "FakeClient", path: str):
+        self.client = client
+        self.path = path
+
+    def document(self, doc_id: str) -> FakeRef:
+        return FakeRef(self.client, f"{self.path}/{doc_id}")
+
+
+class FakeBatch:
+    def __init__(self, client: "FakeClient"):
+        self.client = client
+        self.ops = []
+
+    def set(self, ref: FakeRef, data, merge: bool = False) -> None:
+        self.ops.append((ref.path, data, merge))
+
+    def commit(self) -> None:
+        self.client.calls.append(f"commit:{len(self.ops)}")
+        if self.client.fail_commits:
+            raise RuntimeError("batch rejected")
+        for path, data, merge in self.ops:
+            self.client.apply(path, data, merge)
+
+
+class FakeClient:
+    def __init__(self) -> None:
+        self.docs: dict = {}
+        self.calls: list = []
+        self.fail_commits = False
+
+    def apply(self, path: str, data, merge: bool) -> None:
+        self.docs[path] = {**self.docs.get(path, {}), **data} if merge else dict(data)
+
+    def collection(self, name: str) -> FakeCollection:
+        return FakeCollection(self, name)
+
+    def get_all(self, refs):
+        self.calls.append(f"get_all:{len(refs)}")
+        return [FakeSnapshot(ref.id, self.docs.get(ref.path)) for ref in refs]
+
+    def batch(self) -> FakeBatch:
+        return FakeBatch(self)
+
+
+@contextmanager
+def _client():
+    fake = FakeClient()
+    with patched(firestore, init_firestore_client=lambda: fake), patched(config, AUTO_DISMISS_BELOW=40):
+        yield fake
+
+
+def _rec(idx: int, fit_score: int = 60, applicant_count: str = "") -> JobRecord:
+    return JobRecord(
+        role=f"Role {idx}", company="C", location="London", link=f"https://jobs.example/{idx}", posted="",
+        source="S", fit_score=fit_score, preference_match="", why_fit="", cv_gap="", notes="",
+        applicant_count=applicant_count,
+    )
+
+
+def _doc(client: FakeClient, record: JobRecord) -> dict:
+    return client.docs[f"{config.FIREBASE_COLLECTION}/{firestore.record_document_id(record)}"]
+
+
+def test_upsert_keeps_created_at_status_and_auto_dismisses_new_docs() -> None:
+    with _client() as client:
+        kept, low = _rec(1), _rec(2, fit_score=10)
+        client.docs[f"{config.FIREBASE_COLLECTION}/{firestore.record_document_id(kept)}"] = {
+            "created_at": "2024-01-01T00:00:00+00:00",
+            "application_status": "applied",
+        }
+        firestore.write_records_to_firestore([kept, low])
+        assert _doc(client, kept)["created_at"] == "2024-01-01T00:00:00+00:00"
+        assert _doc(client, kept)["application_status"] == "applied"
+        assert _doc(client, low)["application_status"] == "dismissed"
+        assert _doc(client, low)["dismiss_reason"] == "auto_low_fit_40"
+        assert client.calls == ["get_all:2", "commit:2"]
+
+
+def test_applicant_history_written_when_count_changes() -> None:
+    with _client() as client:
+        record = _rec(1, applicant_count="120 applicants")
+        client.docs[f"{config.FIREBASE_COLLECTION}/{firestore.record_document_id(record)}"] = {
+            "applicant_count_numeric": 80,
+            "application_status": "saved",
+        }
+        firestore.write_records_to_firestore([record])
+        assert _doc(client, record)["applicant_count_prev"] == 80
+        history = [path for path in client.docs if "/applicant_history/" in path]
+        assert len(history) == 1 and history[0].endswith("_120")
+
+
+def test_duplicate_records_see_their_earlier_write() -> None:
+    with _client() as client:
+        first, again = _rec(1, fit_score=10), _rec(1, fit_score=90)
+        firestore.write_records_to_firestore([first, again])
+        # The second copy is no longer a new doc, so it neither re-dismisses nor resets created_at.
+        assert _doc(client, again)["application_status"] == "dismissed"
+        assert _doc(client, again)["fit_score"] == 90
+        assert client.calls == ["get_all:1", "commit:2"]
+
+
+def test_writes_chunk_at_batch_limit_and_fall_back_on_failed_commit() -> None:
+    with _client() as client, patched(firestore, FIRESTORE_BATCH_LIMIT=3):
+        records = [_rec(idx) for idx in range(7)]
+        firestore.write_records_to_firestore(records)
+        assert client.calls == ["get_all:3", "get_all:3", "get_all:1", "commit:3", "commit:3", "commit:1"]
+
+        client.calls.clear()
+        client.fail_commits = True
+        firestore.write_records_to_firestore(records[:2])
+        assert client.calls == ["get_all:2", "commit:2", "set", "set"]
+        assert all(_doc(client, record)["application_status"] == "saved" for record in records[:2])
+
+
+def test_client_provider_builds_once_and_retries_after_failure() -> None:
+    built: list = []
+    results = iter([None, "client"])
+
+    def build():
+        built.append(1)
+        return next(results)
+
+    firestore.reset_firestore_client()
+    try:
+        with patched(firestore, _build_firestore_client=build):
+            assert firestore.init_firestore_client() is None
+            assert firestore.init_firestore_client() == "client"
+            assert firestore.init_firestore_client() == "client"
+        assert len(built) == 2
+    finally:
+        firestore.reset_firestore_client()
+
+
+if __name__ == "__main__":
+    run_checks(globals(), "Firestore write checks")
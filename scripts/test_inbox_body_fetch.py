@@ -0,0 +1,129 @@
+"""Regression checks for the batched, text-parts-only IMAP body fetch."""
+
+from __future__ import annotations
+
+import email
+import re
+import sys
+from email.message import EmailMessage
+from email.mime.application import MIMEApplication
+from email.mime.multipart import MIMEMultipart
+from email.mime.text import MIMEText
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from scripts.job_digest import config, inbox_tracker  # noqa: E402
+from scripts.regression_support import patched, run_checks  # noqa: E402
+
+
+def _bodystructure(part) -> str:
+    if part.is_multipart():
+        children = "".join(_bodystructure(child) for child in part.get_payload())
+        return f'({children} "{part.get_content_subtype().upper()}" NIL NIL NIL)'
+    charset = part.get_content_charset()
+    params = f'("CHARSET" "{charset}")' if charset else "NIL"
+    encoding = (part.get("Content-Transfer-Encoding") or "7BIT").upper()
+    payload = part.get_payload(decode=False)
+    fields = (
+        f'"{part.get_content_maintype().upper()}" "{part.get_content_subtype().upper()}" {params} NIL NIL '
+        f'"{encoding}" {len(payload)}'
+    )
+    if part.get_content_maintype() == "text":
+        fields += f" {payload.count(chr(10))}"
+    return f"({fields} NIL NIL NIL)"
+
+
+def _section(msg, section: str):
+    node = msg
+    for idx in section.split("."):
+        if not node.is_multipart():
+            return node
+        node = node.get_payload()[int(idx) - 1]
+    return node
+
+
+class FakeImap:
+    """Answers UID FETCH the way Gmail/imaplib do: literals as (prefix, bytes) tuples."""
+
+    def __init__(self, messages: dict):
+        self.messages = {uid: email.message_from_bytes(raw) for uid, raw in messages.items()}
+        self.raw = messages
+        self.commands: list = []
+
+    def uid(self, command: str, uid_set: bytes, spec: str):
+        self.commands.append(spec)
+        data: list = []
+        for seq, uid in enumerate(uid_set.split(b","), start=1):
+            msg = self.messages[uid]
+            if spec == "(BODYSTRUCTURE)":
+                data.append(f"{seq} (UID {uid.decode()} BODYSTRUCTURE {_bodystructure(msg)})".encode())
+            elif spec == "(BODY.PEEK[])":
+                data += [(f"{seq} (UID {uid.decode()} BODY[] {{{len(self.raw[uid])}}}".encode(), self.raw[uid]), b")"]
+            else:
+                prefix = f"{seq} (UID {uid.decode()}"
+                for section, cap in re.findall(r"BODY\.PEEK\[([0-9.]+)\]<0\.(\d+)>", spec):
+                    payload = _section(msg, section).as_bytes().split(b"\n\n", 1)[1][: int(cap)]
+                    data.append((f"{prefix} BODY[{section}]<0> {{{len(payload)}}}".encode(), payload))
+                    prefix = ""
+                data.append(b")")
+        return "OK", data
+
+
+def _alternative(plain: str, html: str) -> MIMEMultipart:
+    msg = MIMEMultipart("alternative")
+    msg.attach(MIMEText(plain, "plain", "utf-8"))
+    msg.attach(MIMEText(html, "html", "utf-8"))
+    return msg
+
+
+def _messages() -> dict:
+    mixed = MIMEMultipart("mixed")
+    mixed.attach(_alternative("", "<p>Your application for <b>Product Manager</b> at Monzo was received.</p>"))
+    mixed.attach(MIMEApplication(b"%PDF-1.4" + b"\0" * 50000, Name="cv.pdf"))
+    single_html = MIMEText("<html><head><style>p{}</style></head><body>Thanks &amp; regards, Wise</body></html>", "html")
+    latin = EmailMessage()
+    latin.set_content("Merci d'avoir postulé chez Société Générale pour le poste Analyste KYC.", charset="latin-1")
+    qp = MIMEText("Thank you for applying to Barclays — we will review your application shortly. " * 3, "plain", "utf-8")
+    return {
+        b"11": _alternative("Thank you for applying to Acme for the Senior Product Manager role.", "<p>x</p>").as_bytes(),
+        b"12": mixed.as_bytes(),
+        b"13": single_html.as_bytes(),
+        b"14": latin.as_bytes(),
+        b"15": qp.as_bytes(),
+    }
+
+
+@patched(config, INBOX_BODY_FETCH_BATCH=50)
+def test_batched_text_parts_match_full_message_fetch() -> None:
+    imap = FakeImap(_messages())
+    uids = list(imap.messages)
+    expected = {uid: inbox_tracker._fetch_body_text(imap, uid) for uid in uids}
+    imap.commands.clear()
+    bodies, commands = inbox_tracker._fetch_body_texts(imap, uids)
+    assert bodies == expected
+    assert all(bodies.values())
+    assert commands == len(imap.commands) < len(uids)
+    assert all("BODY.PEEK[]" not in spec for spec in imap.commands)  # never the whole message (or the PDF)
+
+
+@patched(config, INBOX_BODY_MAX_BYTES=61)
+def test_part_cap_truncates_without_breaking_decoding() -> None:
+    imap = FakeImap(_messages())
+    bodies, _ = inbox_tracker._fetch_body_texts(imap, [b"13", b"15"])
+    assert bodies[b"15"].startswith("Thank you for applying")
+    assert len(bodies[b"15"]) < 61
+    assert bodies[b"13"] == "Thanks & regar"
+
+
+def test_parse_imap_values_handles_literals_nil_and_sections() -> None:
+    data = [(b"1 (UID 7 BODY[1]<0> {5}", b"he)lo"), b' FLAGS (\\Seen) X "a\\"b" Y NIL)']
+    assert inbox_tracker._fetch_items(data) == [
+        {"UID": b"7", "BODY[1]<0>": b"he)lo", "FLAGS": [b"\\Seen"], "X": b'a"b', "Y": None}
+    ]
+
+
+if __name__ == "__main__":
+    run_checks(globals(), "inbox body fetch checks")
@@ -0,0 +1,83 @@
+"""Regression checks for the per-Message-ID inbox classification cache."""
+
+from __future__ import annotations
+
+import sys
+from contextlib import contextmanager
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from scripts.job_digest import config, inbox_tracker  # noqa: E402
+from scripts.regression_support import isolated_cache, patched, run_checks  # noqa: E402
+
+MSG = ("<abc@mail.greenhouse.io>", "Thank you for applying to Monzo", "We received your application.", "no-reply@greenhouse.io")
+
+
+@contextmanager
+def _classification_cache():
+    with isolated_cache(inbox_tracker, "INBOX_CLASSIFICATION_CACHE"), patched(config, INBOX_CLASSIFICATION_CACHE_ENABLED=True):
+        yield
+
+
+def _classify(calls: list, llm_answer=None) -> tuple:
+    msg_id, subject, body, sender = MSG
+    entry = inbox_tracker._load_classification(msg_id, subject, body, sender)
+
+    def rules():
+        calls.append("rules")
+        return list(inbox_tracker._classify_by_rules(subject, body, sender))
+
+    def llm():
+        calls.append("llm")
+        return llm_answer
+
+    result = (
+        inbox_tracker._cached_component(entry, "rules", rules),
+        inbox_tracker._cached_component(entry, "llm", llm),
+    )
+    inbox_tracker._store_classification(msg_id, entry)
+    return result
+
+
+@_classification_cache()
+def test_rerun_reuses_rules_and_llm() -> None:
+    calls: list = []
+    answer = {"event_type": "application_confirmation", "confidence": 0.9, "company": "Monzo", "role": ""}
+    first = _classify(calls, answer)
+    assert first == ((["application_confirmation", 0.92], False), (answer, False))
+    assert _classify(calls, answer) == ((["application_confirmation", 0.92], True), (answer, True))
+    assert calls == ["rules", "llm"]
+
+
+@_classification_cache()
+def test_rule_change_recomputes_rules_only() -> None:
+    calls: list = []
+    _classify(calls, {"event_type": "noise", "confidence": 0.2, "company": "", "role": ""})
+    versions = dict(inbox_tracker._classification_versions())
+    with patched(inbox_tracker, _classification_versions=lambda: {**versions, "rules": "changed"}):
+        _classify(calls)
+    assert calls == ["rules", "llm", "rules"]
+
+
+@_classification_cache()
+def test_failed_llm_calls_and_uid_ids_are_not_cached() -> None:
+    calls: list = []
+    _classify(calls, None)
+    _classify(calls, None)
+    assert calls.count("llm") == 2
+    assert inbox_tracker._load_classification("uid:42", *MSG[1:]) is None
+
+
+@_classification_cache()
+def test_changed_body_invalidates_entry() -> None:
+    _classify([])
+    msg_id, subject, body, sender = MSG
+    assert set(inbox_tracker._load_classification(msg_id, subject, body, sender)) == {"input", "rules", "seen_at"}
+    assert set(inbox_tracker._load_classification(msg_id, subject, "different body", sender)) == {"input"}
+
+
+if __name__ == "__main__":
+    run_checks(globals(), "inbox classification cache checks")
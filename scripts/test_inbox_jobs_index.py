@@ -0,0 +1,200 @@
+"""Regression checks for the indexed inbox reconciliation and its incremental refresh."""
+
+from __future__ import annotations
+
+import random
+import re
+import sys
+from datetime import datetime
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from scripts.job_digest import config, inbox_tracker  # noqa: E402
+from scripts.job_digest.inbox_tracker import Event, JobsIndex, _reconcile  # noqa: E402
+from scripts.regression_support import isolated_cache, patched, run_checks  # noqa: E402
+
+
+def _linear_reconcile(event: Event, rows: list) -> None:
+    """The pre-index implementation: a scan of every row per event."""
+    if not rows:
+        return
+    if "jobserve" in (event.sender or "").lower() and event.event_type == "application_confirmation":
+        ev_date = datetime.fromisoformat(event.received_at[:10]).date()
+        same_day = []
+        for row in rows:
+            if (row.get("application_status") or "").lower() != "applied":
+                continue
+            app_iso = str(row.get("application_date") or "")[:10]
+            try:
+                app_date = datetime.fromisoformat(app_iso).date()
+            except Exception:
+                continue
+            if abs((app_date - ev_date).days) <= 1:
+                same_day.append(row)
+        if len(same_day) == 1:
+            event.matched_job_id, event.match_status = str(same_day[0]["id"]), "matched"
+            event.company = str(same_day[0]["company"]) or event.company
+            event.role = str(same_day[0]["role"]) or event.role
+            return
+        if len(same_day) > 1:
+            event.candidate_doc_ids, event.match_status = [str(r["id"]) for r in same_day[:5]], "ambiguous"
+    if event.job_url:
+        url_l = event.job_url.lower()
+        req_id_match = re.search(r"(?:job/|/jobs/|/view/|/openings/|requisition[/=])(\d{4,})", url_l)
+        req_id = req_id_match.group(1) if req_id_match else ""
+        link_matches = []
+        for row in rows:
+            link = (row["link"] or "").lower()
+            if link and (url_l in link or link in url_l or (req_id and req_id in link)):
+                link_matches.append(row["id"])
+        if len(link_matches) == 1:
+            event.matched_job_id, event.match_status = link_matches[0], "matched"
+            return
+        if len(link_matches) > 1:
+            event.matched_job_id, event.candidate_doc_ids, event.match_status = "", link_matches[:5], "ambiguous"
+            return
+    if not event.company:
+        event.match_status = "no_match"
+        return
+    company_norm = inbox_tracker._norm_company(event.company)
+    candidates = []
+    role_tokens = inbox_tracker._tokens(event.role)
+    for row in rows:
+        rc = inbox_tracker._norm_company(row["company"])
+        if rc and company_norm and (rc == company_norm or rc in company_norm or company_norm in rc):
+            score = inbox_tracker._jaccard(role_tokens, inbox_tracker._tokens(row["role"])) if role_tokens else 0.5
+            if score >= 0.6 or (not role_tokens and score >= 0.5):
+                candidates.append((row["id"], score))
+    if not candidates:
+        event.match_status = "no_match"
+        return
+    candidates.sort(key=lambda x: x[1], reverse=True)
+    if len(candidates) == 1 or candidates[0][1] - candidates[1][1] >= 0.2:
+        event.matched_job_id, event.match_status = candidates[0][0], "matched"
+    else:
+        event.candidate_doc_ids, event.match_status = [c[0] for c in candidates[:5]], "ambiguous"
+
+
+HOSTS = ["https://boards.greenhouse.io/acme", "https://jobs.lever.co/monzo", "https://acme.wd3.myworkdayjobs.com/en-GB"]
+COMPANIES = ["Acme Ltd", "Monzo", "Monzo Bank", "Barclays plc", "The Barclays Group", "Wise", "JobServe", ""]
+ROLES = ["Product Manager", "Senior Product Manager KYC", "Business Analyst", "Product Owner", ""]
+
+
+def _rows(rng: random.Random, count: int) -> list:
+    rows = []
+    for idx in range(count):
+        path = rng.choice(["jobs/", "job/", "view/", "openings/", ""]) + str(rng.randint(1000, 1200))
+        rows.append({
+            "id": f"doc{rng.randint(0, 10**6):07d}{idx}",
+            "company": rng.choice(COMPANIES),
+            "role": rng.choice(ROLES),
+            "link": rng.choice(["", f"{rng.choice(HOSTS)}/{path}", f"{rng.choice(HOSTS)}/{path}?src=li", "12"]),
+            "application_status": rng.choice(["applied", "saved", "interview"]),
+            "application_date": rng.choice(["", "2026-06-01T00:00:00.000Z", "2026-06-02", "2026-06-05", "bad"]),
+        })
+    return rows
+
+
+def _event(rng: random.Random, rows: list) -> Event:
+    link = rng.choice(rows)["link"] or "https://jobs.lever.co/monzo/jobs/1100"
+    job_url = rng.choice(["", link, link[: rng.randint(1, len(link))], link + "/apply", link.upper(), "https://x.io/requisition=1105"])
+    return Event(
+        message_id="m", received_at=rng.choice(["2026-06-01T09:00:00+00:00", "2026-06-03T09:00:00+00:00"]),
+        event_type=rng.choice(["application_confirmation", "rejection"]), confidence=0.9,
+        company=rng.choice(COMPANIES), role=rng.choice(ROLES), job_url=job_url, ats_family="",
+        sender=rng.choice(["noreply@jobserve.com", "no-reply@greenhouse.io"]), subject_redacted="",
+        detection_source="rules",
+    )
+
+
+def test_indexed_reconcile_matches_linear_scan() -> None:
+    rng = random.Random(7)
+    for _ in range(20):
+        rows = _rows(rng, rng.randint(1, 60))
+        index = JobsIndex(rows)
+        ordered = sorted(rows, key=lambda row: row["id"])
+        for _ in range(60):
+            event = _event(rng, rows)
+            expected = Event(**vars(event))
+            _reconcile(event, index)
+            _linear_reconcile(expected, ordered)
+            assert vars(event) == vars(expected)
+
+
+class FakeSnapshot:
+    def __init__(self, doc_id: str, data: dict):
+        self.id = doc_id
+        self._data = data
+
+    def to_dict(self) -> dict:
+        return dict(self._data)
+
+
+class FakeQuery:
+    def __init__(self, docs: dict, log: list, cursor: str = ""):
+        self.docs, self.log, self.cursor = docs, log, cursor
+
+    def where(self, filter):  # noqa: A002 - mirrors the Firestore API
+        return FakeQuery(self.docs, self.log, filter.value)
+
+    def select(self, fields):
+        return self
+
+    def stream(self):
+        self.log.append(self.cursor or "full")
+        for doc_id, data in self.docs.items():
+            if not self.cursor or str(data.get("updated_at", "")) >= self.cursor:
+                yield FakeSnapshot(doc_id, data)
+
+
+class FakeClient:
+    def __init__(self) -> None:
+        self.docs: dict = {}
+        self.log: list = []
+
+    def collection(self, name: str) -> FakeQuery:
+        return FakeQuery(self.docs, self.log)
+
+
+class FakeFieldFilter:
+    def __init__(self, field: str, op: str, value: str):
+        self.value = value
+
+
+@isolated_cache(config, "INBOX_JOBS_INDEX_PATH")
+@patched(config, INBOX_JOBS_INDEX_ENABLED=True)
+@patched(inbox_tracker, FieldFilter=FakeFieldFilter)
+def test_index_refreshes_incrementally_from_updated_at() -> None:
+    client = FakeClient()
+    client.docs["a"] = {"company": "Monzo", "role": "PM", "updated_at": "2026-06-10T08:00:00+00:00"}
+    client.docs["b"] = {"company": "Wise", "role": "BA", "updated_at": "2026-06-01T08:00:00+00:00"}
+
+    first = inbox_tracker._load_jobs_index(client)
+    assert first.refresh == "full reload" and len(first) == 2
+
+    client.docs["b"] = {"company": "Wise", "role": "BA", "application_status": "Applied", "updated_at": "2026-06-11"}
+    client.docs["c"] = {"company": "Acme", "role": "PO", "updated_at": "2026-06-10T09:00:00.000Z"}
+    second = inbox_tracker._load_jobs_index(client)
+    assert client.log == ["full", "2026-06-09"]
+    assert second.refresh.startswith("incremental: 3 docs")
+    assert sorted(second.by_id) == ["a", "b", "c"]
+    assert second.by_id["b"]["application_status"] == "applied"
+
+    inbox_tracker._load_jobs_index(client)
+    assert client.log[-1] == "2026-06-10"
+
+
+def test_no_client_means_empty_index() -> None:
+    assert len(inbox_tracker._load_jobs_index(None)) == 0
+
+
+def test_interior_tokens_skip_edges() -> None:
+    for text, expected in [("https://a.io/jobs/12", ["a", "io", "jobs"]), ("12", [])]:
+        assert inbox_tracker._interior_tokens(text) == expected, text
+
+
+if __name__ == "__main__":
+    run_checks(globals(), "inbox jobs index checks")
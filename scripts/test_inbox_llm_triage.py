@@ -0,0 +1,66 @@
+"""Regression checks for the concurrent LLM triage of ambiguous inbox messages."""
+
+from __future__ import annotations
+
+import sys
+import threading
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from scripts.job_digest import config, inbox_tracker  # noqa: E402
+from scripts.regression_support import isolated_cache, patched, run_checks  # noqa: E402
+
+
+def _message(idx: int) -> tuple:
+    hdrs = {
+        "subject": f"Update regarding your candidacy #{idx}",
+        "from": "talent@mail.example.com",
+        "message_id": f"<m{idx}@example>",
+        "date": "Mon, 01 Jun 2026 09:00:00 +0000",
+    }
+    return str(idx).encode(), hdrs, "We would like to discuss the opportunity with you."
+
+
+@isolated_cache(inbox_tracker, "INBOX_CLASSIFICATION_CACHE")
+@patched(config, INBOX_LLM_WORKERS=4)
+def test_llm_candidates_run_concurrently_and_merge_in_order() -> None:
+    active, peak = [0], [0]
+    lock = threading.Lock()
+
+    def fake_llm(subject: str, body: str, sender: str):
+        with lock:
+            active[0] += 1
+            peak[0] = max(peak[0], active[0])
+        time.sleep(0.05)
+        with lock:
+            active[0] -= 1
+        idx = subject.rsplit("#", 1)[1]
+        return {"event_type": "interview_invite", "confidence": 0.8, "company": f"Firm {idx}", "role": "Product Manager"}
+
+    triaged = [inbox_tracker._triage_message(*_message(idx)) for idx in range(8)]
+    assert all(item.needs_llm for item in triaged)
+    with patched(inbox_tracker, _llm_classify=fake_llm):
+        inbox_tracker._run_llm_triage(triaged)
+    events = [inbox_tracker._event_from_triage(item) for item in triaged]
+
+    assert peak[0] > 1
+    assert [event.company for event in events] == [f"Firm {idx}" for idx in range(8)]
+    assert {event.detection_source for event in events} == {"llm"}
+    assert all(event.event_type == "interview_invite" for event in events)
+
+
+@isolated_cache(inbox_tracker, "INBOX_CLASSIFICATION_CACHE")
+@patched(inbox_tracker, _llm_classify=lambda *args: None)
+def test_failed_llm_call_leaves_rules_result() -> None:
+    item = inbox_tracker._triage_message(*_message(1))
+    inbox_tracker._run_llm_triage([item])
+    assert item.llm is None and not item.llm_hit
+    assert inbox_tracker._event_from_triage(item) is None  # rules said noise
+
+
+if __name__ == "__main__":
+    run_checks(globals(), "inbox LLM triage checks")
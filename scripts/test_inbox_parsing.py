@@ -0,0 +1,40 @@
+"""Regression checks for the inbox tracker's precompiled parsing layer."""
+
+from __future__ import annotations
+
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from scripts.bench_inbox_parsing import legacy_strip_html, synthetic_emails  # noqa: E402
+from scripts.job_digest import inbox_tracker  # noqa: E402
+from scripts.regression_support import run_checks  # noqa: E402
+
+EDGE_CASES = [
+    "<HEAD><STYLE>p { color: red }</STYLE><title>x</title></HEAD><body>Role: <b>PM</b></body>",
+    "<style>a<b</style>keep<style>unterminated <p>tail",
+    "<script>if (a < b) { x = '</scr' + 'ipt>'; }</script>Hi<br/>there",
+    "<!-- a --->one<!---->two<!-- unterminated <p>three",
+    "We&rsquo;re hiring &ndash; Monzo &amp; Co.&nbsp;&nbsp;&ldquo;PM&rdquo;<br><br>\t<p>Thanks</p>",
+]
+
+
+def test_strip_html_matches_legacy_stripper() -> None:
+    for html in EDGE_CASES:
+        assert inbox_tracker._strip_html(html) == legacy_strip_html(html), html
+
+
+def test_synthetic_corpus_matches_legacy_stripper() -> None:
+    for _, html, _ in synthetic_emails(200):
+        assert inbox_tracker._strip_html(html) == legacy_strip_html(html)
+
+
+def test_entities_decode_in_one_pass() -> None:
+    assert inbox_tracker._strip_html("A&#160;B &#8217; &lt;b&gt; &amp;nbsp; &copy &bogus;") == "A B ’ <b> &nbsp; &copy &bogus;"
+
+
+if __name__ == "__main__":
+    run_checks(globals(), "inbox parsing checks")
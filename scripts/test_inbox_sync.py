@@ -0,0 +1,91 @@
+"""Regression checks for the inbox tracker's UID high-water-mark sync."""
+
+from __future__ import annotations
+
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from scripts.job_digest import inbox_tracker  # noqa: E402
+from scripts.regression_support import run_checks  # noqa: E402
+
+
+class FakeImap:
+    def __init__(self, uids: bytes):
+        self.uids = uids
+        self.calls: list = []
+
+    def uid(self, *args):
+        self.calls.append(args)
+        return "OK", [self.uids]
+
+    def response(self, code: str):
+        return code, [b"6123"]
+
+
+def test_sync_start_uid_falls_back_to_full_rescan() -> None:
+    state = {"uidvalidity": "6123", "last_uid": 900}
+    assert inbox_tracker._sync_start_uid(state, "6123", False) == (901, "incremental: UIDs above 900")
+    assert inbox_tracker._sync_start_uid(state, "6123", True)[0] == 0
+    assert inbox_tracker._sync_start_uid(state, "7000", False) == (0, "full rescan: UIDVALIDITY changed")
+    assert inbox_tracker._sync_start_uid({}, "6123", False)[0] == 0
+
+
+def test_incremental_search_uses_uid_range_and_drops_the_star_uid() -> None:
+    imap = FakeImap(b"850 901 950")
+    assert inbox_tracker._x_gm_search(imap, "from:greenhouse.io", 901) == [b"901", b"950"]
+    assert imap.calls[-1][:3] == ("SEARCH", "UID", "901:*")
+    assert inbox_tracker._uid_validity(imap) == "6123"
+
+
+class FakeFirestore:
+    def __init__(self) -> None:
+        self.docs: dict = {}
+
+    def collection(self, name: str):
+        return self
+
+    def document(self, doc_id: str):
+        store = self.docs
+
+        class Doc:
+            def get(self):
+                class Snap:
+                    exists = doc_id in store
+
+                    def to_dict(self):
+                        return store.get(doc_id)
+
+                return Snap()
+
+            def set(self, state):
+                store[doc_id] = dict(state)
+
+        return Doc()
+
+
+def test_sync_state_round_trip_and_no_client_rescans() -> None:
+    client = FakeFirestore()
+    assert inbox_tracker._load_sync_state(client, '"[Gmail]/All Mail"') == {}
+    inbox_tracker._save_sync_state(client, '"[Gmail]/All Mail"', {"uidvalidity": "6123", "last_uid": 950})
+    inbox_tracker._save_sync_state(client, "INBOX", {"uidvalidity": "1", "last_uid": 3})
+    assert inbox_tracker._load_sync_state(client, '"[Gmail]/All Mail"') == {"uidvalidity": "6123", "last_uid": 950}
+    # Without a client nothing is stored, so there is no mark to resume from.
+    assert inbox_tracker._load_sync_state(None, '"[Gmail]/All Mail"') == {}
+
+
+def test_truncation_never_moves_the_mark_past_unfetched_mail() -> None:
+    found = [b"950", b"1002", b"901", b"1001", b"960"]  # search-bucket order, not UID order
+    assert inbox_tracker._select_uids(found, 901, 0) == ([b"901", b"950", b"960", b"1001", b"1002"], 1002)
+    # incremental: oldest first, the mark stops at the last UID fetched
+    assert inbox_tracker._select_uids(found, 901, 3) == ([b"901", b"950", b"960"], 960)
+    # full rescan: newest kept, the mark stays put
+    assert inbox_tracker._select_uids(found, 0, 3) == ([b"960", b"1001", b"1002"], None)
+    assert inbox_tracker._select_uids([], 901, 3) == ([], 900)
+
+
+if __name__ == "__main__":
+    run_checks(globals(), "inbox sync checks")
@@ -0,0 +1,75 @@
+"""Regression checks for the streamed, cached job-description fetcher."""
+
+from __future__ import annotations
+
+import json
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from scripts.job_digest import job_text  # noqa: E402
+from scripts.regression_support import isolated_cache, patched, run_checks  # noqa: E402
+
+
+class _StreamResp:
+    def __init__(self, chunks: list[str], encoding: str = "utf-8") -> None:
+        self.chunks = [chunk.encode(encoding) for chunk in chunks]
+        self.encoding = encoding
+        self.read = 0
+        self.closed = False
+
+    def iter_content(self, chunk_size: int = 0):
+        for chunk in self.chunks:
+            self.read += 1
+            yield chunk
+
+    def close(self) -> None:
+        self.closed = True
+
+
+def test_stops_reading_once_the_jobposting_arrives() -> None:
+    posting = json.dumps({"@type": "JobPosting", "description": "<p>Own KYC &amp; onboarding</p><ul><li>Roadmap</li></ul>"})
+    page = '<html><head><meta property="og:description" content="ignored"></head><body>'
+    page += '<script type="application/ld+json">{"@type": "Organization"}</script>'
+    page += f'<script type="application/ld+json">{posting}</script>'
+    chunks = [page[:70], page[70:150], page[150:], *["<div>filler</div>" * 500] * 50]
+    resp = _StreamResp(chunks)
+    assert job_text.extract_job_text(resp) == "Own KYC & onboarding Roadmap"
+    assert resp.read == 3 and resp.closed
+
+
+def test_falls_back_to_meta_description_after_full_read() -> None:
+    page = (
+        '<html><head><meta name="description" content="Plain &amp; simple">'
+        "<meta content='Screening product lead' property='og:description'></head>"
+        '<script type="application/ld+json">{"@type": "JobPosting", "description": ""}</script></html>'
+    )
+    resp = _StreamResp([page[:40], page[40:]], encoding="iso-8859-1")
+    assert job_text.extract_job_text(resp) == "Screening product lead"
+    assert resp.read == 2
+
+
+@isolated_cache(job_text, "JOB_TEXT_CACHE")
+def test_fetch_job_text_caches_by_canonical_link() -> None:
+    downloads: list[str] = []
+
+    def fake_download(url: str) -> str:
+        downloads.append(url)
+        if "broken" in url:
+            raise OSError("connection reset")
+        return f"text for {url}"
+
+    with patched(job_text, _download_job_text=fake_download):
+        first = job_text.fetch_job_text("https://jobs.example/123?utm_source=x")
+        assert job_text.fetch_job_text("https://jobs.example/123/") == first
+        assert job_text.fetch_job_text("https://www.linkedin.com/jobs/view/1") == ""
+        assert job_text.fetch_job_text("https://jobs.example/broken") == ""
+        assert job_text.fetch_job_text("https://jobs.example/broken") == ""
+    assert downloads == ["https://jobs.example/123?utm_source=x", "https://jobs.example/broken", "https://jobs.example/broken"]
+
+
+if __name__ == "__main__":
+    run_checks(globals(), "job text checks")
@@ -0,0 +1,53 @@
+"""Regression checks for the streaming LinkedIn search-card parser."""
+
+from __future__ import annotations
+
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from scripts.bench_linkedin_cards import fixture_pages, soup_parse_linkedin_cards  # noqa: E402
+from scripts.job_digest.sources import _parse_linkedin_cards  # noqa: E402
+from scripts.regression_support import run_checks  # noqa: E402
+
+EDGE_CASES = [
+    # valueless datetime, no link, comment and nested tag inside the title
+    '<DIV class="base-search-card" data-entity-urn="urn:li:jobPosting:1"><H3 class="base-search-card__title">'
+    'KYC <!-- x --><b>Lead</b> &amp; PO</H3><h4 class="base-search-card__subtitle">Acme</h4><time datetime>now</time></DIV>',
+    # ">" inside a quoted attribute, entity in href, self-closing tags, single quotes
+    "<div data-x='a>b' class='job-search-card base-search-card' data-entity-urn='urn:li:jobPosting:2'><img src=x/>"
+    '<a class="base-card__full-link" href="https://uk.linkedin.com/jobs/view/2?a=1&amp;b=2#frag">x</a>'
+    '<h3 class="base-search-card__title">Analyst</h3><h4 class="base-search-card__subtitle"><a>Monzo</a></h4></div>',
+    # card without an urn, second title ignored, unclosed card at end of page
+    '<div class="base-search-card"><h3 class="base-search-card__title">A</h3><h4 class="base-search-card__subtitle">B</h4></div>'
+    '<div class="base-search-card" data-entity-urn="urn:li:jobPosting:3"><h3 class="base-search-card__title">First</h3>'
+    '<h3 class="base-search-card__title">Second</h3><h4 class="base-search-card__subtitle">Barclays<span class="job-search-card__location">UK',
+    "<script>var s = '<div class=\"base-search-card\">';</script><p>no cards</p>",
+    # an inner div missing its </div>: the next card still opens a card of its own
+    '<div class="base-search-card" data-entity-urn="urn:li:jobPosting:4"><div class="base-search-card__info">'
+    '<h3 class="base-search-card__title">Ops</h3><h4 class="base-search-card__subtitle">Wise</h4></div>'
+    '<div class="base-search-card" data-entity-urn="urn:li:jobPosting:5"><h3 class="base-search-card__title">PM</h3>'
+    '<h4 class="base-search-card__subtitle">Revolut</h4></div><div class="base-search-card" data-entity-urn="urn:li:jobPosting:6">'
+    '<h3 class="base-search-card__title">BA</h3><h4 class="base-search-card__subtitle">Starling</h4></div>',
+]
+
+
+def test_fixture_pages_match_beautifulsoup() -> None:
+    pages = fixture_pages()
+    assert pages
+    for page in pages:
+        cards = _parse_linkedin_cards(page)
+        assert cards == soup_parse_linkedin_cards(page)
+        assert len(cards) == 8  # one card has no company, one is an excluded company
+
+
+def test_edge_cases_match_beautifulsoup() -> None:
+    for html in EDGE_CASES:
+        assert _parse_linkedin_cards(html) == soup_parse_linkedin_cards(html), html
+
+
+if __name__ == "__main__":
+    run_checks(globals(), "LinkedIn card parser checks")
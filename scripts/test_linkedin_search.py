@@ -0,0 +1,127 @@
+"""Regression checks for the pooled, adaptively paced LinkedIn guest search."""
+
+from __future__ import annotations
+
+import sys
+import threading
+from contextlib import contextmanager
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from scripts.job_digest import config, sources  # noqa: E402
+from scripts.job_digest.rate_limit import AdaptivePacer  # noqa: E402
+from scripts.regression_support import patched, run_checks  # noqa: E402
+
+
+def _card(job_id: str, title: str, company: str) -> str:
+    return (
+        f'<li><div class="base-card base-search-card" data-entity-urn="urn:li:jobPosting:{job_id}">'
+        f'<a class="base-card__full-link" href="https://uk.linkedin.com/jobs/view/{job_id}?refId=x"></a>'
+        f'<h3 class="base-search-card__title">\n  {title}\n</h3>'
+        f'<h4 class="base-search-card__subtitle"><a>{company}</a></h4>'
+        f'<span class="job-search-card__location">London</span>'
+        f'<time datetime="2026-06-01">1 day ago</time></div></li>'
+    )
+
+
+class FakeResponse:
+    def __init__(self, status_code: int, text: str = "") -> None:
+        self.status_code = status_code
+        self.text = text
+
+
+class FakeSession:
+    """Serves pages keyed by (keywords, start); `throttle` maps a key to 999s to send first."""
+
+    def __init__(self, pages: dict, throttle: dict | None = None) -> None:
+        self.pages = pages
+        self.throttle = dict(throttle or {})
+        self.calls: list = []
+        self.lock = threading.Lock()
+
+    def get(self, url, params=None, headers=None, timeout=None):  # noqa: ANN001
+        key = (params["keywords"], params["start"])
+        with self.lock:
+            self.calls.append(key)
+            if self.throttle.get(key):
+                self.throttle[key] -= 1
+                return FakeResponse(999)
+        return FakeResponse(200, "".join(self.pages.get(key, [])))
+
+
+@contextmanager
+def _small_plan(**settings):
+    with patched(
+        sources,
+        linkedin_search_terms=lambda: ["kyc pm", "aml pm", "sanctions ba"],
+        linkedin_company_search_terms=lambda: ["product manager"],
+        select_company_batch=lambda companies: ["Monzo"],
+        SEARCH_LOCATIONS=["London"],
+        AdaptivePacer=lambda interval: AdaptivePacer(interval, sleep=lambda _: None),
+    ), patched(config, LINKEDIN_SEARCH_INTERVAL_SECONDS=0.0, LINKEDIN_PAGINATED_TERMS=2, **settings):
+        sources.reset_source_runtime_events()
+        yield
+
+
+FILLER = [_card(f"1{n:02d}", "KYC Analyst", "Revolut") for n in range(22)] + [_card("199", "Untitled", "")]
+
+PAGES = {
+    # a full first page (the untitled card still counts towards the 25) earns a second page
+    ("kyc pm", 0): [_card("1", "KYC Product Manager", "Starling"), _card("2", "Product Owner", "Monzo")] + FILLER,
+    ("kyc pm", 25): [_card("3", "KYC Lead", "Barclays")],
+    ("aml pm", 0): [_card("2", "Product Owner KYC", "Monzo")],  # short page: no second page
+    ("sanctions ba", 0): [_card("4", "Sanctions BA", "HSBC")],  # beyond PAGINATED_TERMS
+    ("product manager Monzo", 0): [_card("5", "Product Manager", "Monzo"), _card("6", "Bad", "")],
+}
+
+
+def test_pool_matches_serial_run_and_paginates_only_full_pages() -> None:
+    results = {}
+    for workers in (1, 4):
+        session = FakeSession(PAGES)
+        with _small_plan(LINKEDIN_SEARCH_WORKERS=workers):
+            results[workers] = sources.linkedin_search(session)
+            note = sources.get_source_runtime_events()["LinkedIn"]["notes"][-1]
+        assert sorted(session.calls) == sorted(
+            [("kyc pm", 0), ("kyc pm", 25), ("aml pm", 0), ("sanctions ba", 0), ("product manager Monzo", 0)]
+        )
+    assert results[1] == results[4]
+    assert [job["job_id"] for job in results[4]] == ["1", "2", *(f"1{n:02d}" for n in range(22)), "3", "4", "5"]
+    assert results[4][1]["title"] == "Product Owner"  # first sighting in plan order wins the title
+    assert note.startswith("search pool: 4/4 first pages, 1 next pages, 1 stopped early")
+
+
+def test_throttled_queries_back_off_and_retry() -> None:
+    session = FakeSession(PAGES, throttle={("aml pm", 0): 2, ("sanctions ba", 0): 5})
+    with _small_plan(LINKEDIN_SEARCH_WORKERS=2, LINKEDIN_THROTTLE_RETRIES=2):
+        jobs = sources.linkedin_search(session)
+        blocked = sources.get_source_runtime_events()["LinkedIn"]["blocked"]
+    assert session.calls.count(("aml pm", 0)) == 3
+    assert session.calls.count(("sanctions ba", 0)) == 3  # gave up after two retries
+    assert "4" not in {job["job_id"] for job in jobs}
+    assert blocked == 1
+
+
+def test_pacer_widens_then_recovers() -> None:
+    now = [0.0]
+    slept: list = []
+    pacer = AdaptivePacer(0.5, max_interval=4.0, clock=lambda: now[0], sleep=slept.append)
+    assert pacer.wait() == 0.0
+    assert pacer.wait() == 0.5
+    pacer.backoff()
+    pacer.backoff()
+    assert pacer.interval == 2.0
+    pacer.backoff()
+    pacer.backoff()
+    assert pacer.interval == 4.0
+    for _ in range(20):
+        pacer.success()
+    assert pacer.interval == 0.5
+    assert slept == [0.5]
+
+
+if __name__ == "__main__":
+    run_checks(globals(), "LinkedIn search checks")
@@ -0,0 +1,122 @@
+"""Regression checks for the concurrent, rate-paced LLM enrichment pipeline."""
+
+from __future__ import annotations
+
+import json
+import sys
+import threading
+import time
+from contextlib import contextmanager
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from scripts.job_digest import config, llm  # noqa: E402
+from scripts.job_digest.models import JobRecord  # noqa: E402
+from scripts.job_digest.rate_limit import TokenBucket  # noqa: E402
+from scripts.regression_support import isolated_cache, patched, run_checks  # noqa: E402
+
+
+def _rec(idx: int, notes: str = "") -> JobRecord:
+    return JobRecord(
+        role=f"Role {idx}", company="C", location="London", link=f"https://jobs.example/{idx}", posted="",
+        source="S", fit_score=50, preference_match="", why_fit="", cv_gap="", notes=notes,
+    )
+
+
+def test_token_bucket_paces_after_burst() -> None:
+    now = [0.0]
+    sleeps: list[float] = []
+
+    def sleep(seconds: float) -> None:
+        sleeps.append(seconds)
+        now[0] += seconds
+
+    bucket = TokenBucket(30, capacity=2, clock=lambda: now[0], sleep=sleep)
+    waits = [bucket.acquire() for _ in range(4)]
+    assert waits[:2] == [0.0, 0.0]
+    assert waits[2:] == [2.0, 2.0]
+    assert TokenBucket(0).acquire() == 0.0
+
+
+@contextmanager
+def _fake_llm(generate_groq_text):
+    """Route enrichment to `generate_groq_text`, with an empty enrichment cache."""
+    with isolated_cache(llm, "ENRICHMENT_CACHE"), patched(
+        config,
+        GROQ_API_KEY="test",
+        OPENROUTER_API_KEY="",
+        GEMINI_API_KEY="",
+        ENRICH_LLM_WORKERS=4,
+        GROQ_USAGE={"tokens": 0, "calls": 0, "retries": 0},
+    ), patched(
+        llm, GroqClient=object, fetch_job_text=lambda url: f"fetched {url}", generate_groq_text=generate_groq_text
+    ):
+        yield
+
+
+def test_enrichment_overlaps_calls_and_applies_in_record_order() -> None:
+    lock = threading.Lock()
+    active = {"now": 0, "peak": 0}
+
+    def fake_groq(prompt: str, usage=None) -> str:
+        with lock:
+            active["now"] += 1
+            active["peak"] = max(active["peak"], active["now"])
+        time.sleep(0.05)
+        with lock:
+            active["now"] -= 1
+        llm._record_usage(usage, "calls")
+        llm._record_usage(usage, "tokens", 10)
+        role = prompt.split("Title: ", 1)[1].split("\n", 1)[0]
+        return json.dumps({"fit_score": 80, "why_fit": f"{role} via {'fetched' if 'fetched' in prompt else 'notes'}"})
+
+    records = [_rec(0, notes="inline"), _rec(1), _rec(2), _rec(3), _rec(4)]
+    with _fake_llm(fake_groq):
+        llm.enhance_records_with_groq(records)
+        calls = config.GROQ_USAGE["calls"]
+    assert [r.why_fit for r in records] == [
+        "Role 0 via notes", "Role 1 via fetched", "Role 2 via fetched", "Role 3 via fetched", "Role 4 via fetched",
+    ]
+    assert all(r.fit_score == 80 for r in records)
+    assert active["peak"] > 1
+    assert calls == 5
+
+
+def test_token_budget_stops_groq_once_committed() -> None:
+    usage = {"tokens": 90}
+    budget = llm._GroqTokenBudget(usage, threshold=100)
+    assert budget.reserve(50)
+    assert not budget.reserve(1)  # 90 used + 50 in flight already crosses the threshold
+    budget.release(50)
+    usage["tokens"] = 99
+    assert budget.reserve(5)
+
+
+def test_reenriching_a_posting_is_served_from_the_cache() -> None:
+    prompts: list[str] = []
+
+    def fake_groq(prompt: str, usage=None) -> str:
+        prompts.append(prompt)
+        llm._record_usage(usage, "calls")
+        llm._record_usage(usage, "tokens", 700)
+        return json.dumps({"fit_score": 77, "role_summary": f"summary {len(prompts)}"})
+
+    with _fake_llm(fake_groq):
+        first = llm.enhance_records_with_groq([_rec(1), _rec(2)])
+        again = llm.enhance_records_with_groq([_rec(1), _rec(2), _rec(3, notes="new text")])
+        assert len(prompts) == 3
+        assert [r.role_summary for r in again[:2]] == [r.role_summary for r in first]
+        assert again[0].fit_score == 77
+        usage = config.GROQ_USAGE
+        assert (usage["cache_hits"], usage["cache_misses"], usage["tokens_saved"]) == (2, 3, 1400)
+
+        with patched(config, JOB_DIGEST_PROFILE_TEXT=config.JOB_DIGEST_PROFILE_TEXT + " updated"):
+            llm.enhance_records_with_groq([_rec(1)])
+    assert len(prompts) == 4  # a new profile invalidates the cached enrichment
+
+
+if __name__ == "__main__":
+    run_checks(globals(), "LLM enrichment checks")
@@ -0,0 +1,51 @@
+"""Regression checks for the batch scoring API shared by the collectors."""
+
+from __future__ import annotations
+
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+import pandas as pd  # noqa: E402
+
+from scripts.bench_scoring_batch import per_job_columns, synthetic_jobs  # noqa: E402
+from scripts.job_digest.scoring import (  # noqa: E402
+    assess_fit,
+    assess_fit_batch,
+    build_preference_match,
+    score_posting,
+)
+from scripts.regression_support import run_checks  # noqa: E402
+
+
+def test_batch_columns_match_per_job_scoring() -> None:
+    jobs = synthetic_jobs(300)
+    assert assess_fit_batch(jobs) == per_job_columns(jobs)
+
+
+def test_score_posting_can_include_location_in_the_text() -> None:
+    title, company, location, summary = "Product Manager", "Acme", "Remote - Sanctions team", "Own the roadmap."
+    full_text = f"{title} {company} {location} {summary}"
+    scored = score_posting(title, company, summary, location, source_family="JobBoard", source="X", location_in_text=True)
+    assert scored["fit"] == assess_fit(full_text, company, "JobBoard", "X", title=title)
+    assert scored["preference_match"] == build_preference_match(full_text, company, location)
+    assert "KYC/AML/Onboarding" in str(scored["preference_match"])
+
+
+def test_dataframe_in_dataframe_out() -> None:
+    frame = pd.DataFrame(synthetic_jobs(20)).drop(columns=["source_family"]).set_index(pd.RangeIndex(100, 120))
+    frame.loc[105, "summary"] = None
+    result = assess_fit_batch(frame, source_family="ATS")
+    assert list(result.index) == list(frame.index)
+    expected = assess_fit_batch(
+        [{**row, "summary": row["summary"] or ""} for row in frame.to_dict("records")], source_family="ATS"
+    )
+    assert result["score"].tolist() == expected["score"]
+    assert result["why_fit"].tolist() == expected["why_fit"]
+
+
+if __name__ == "__main__":
+    run_checks(globals(), "batch scoring checks")
@@ -0,0 +1,46 @@
+"""Regression checks for the per-run scoring memo."""
+
+from __future__ import annotations
+
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from scripts.job_digest import scoring  # noqa: E402
+from scripts.regression_support import run_checks  # noqa: E402
+
+
+def test_repeat_scoring_hits_the_memo_and_returns_private_copies() -> None:
+    scoring.reset_scoring_cache()
+    text = "Senior Product Manager Monzo KYC onboarding and sanctions screening platform"
+    first = scoring.assess_fit(text, "Monzo", "ATS", "Greenhouse", title="Senior Product Manager")
+    first["matched_domain"].append("mutated")
+    second = scoring.assess_fit(text, "Monzo", "ATS", "Greenhouse", title="Senior Product Manager")
+    assert "mutated" not in second["matched_domain"]
+    assert scoring.assess_fit(text, "Monzo", "Aggregator", "LinkedIn", title="Senior Product Manager") != second
+
+    scoring.build_reasons(text)
+    scoring.build_reasons(text)
+    stats = scoring.scoring_cache_stats()
+    assert stats["by_kind"]["assess_fit"] == {"hits": 1, "misses": 2}
+    assert stats["by_kind"]["build_reasons"] == {"hits": 1, "misses": 1}
+    assert stats["size"] == 3
+
+
+def test_memo_is_bounded_lru() -> None:
+    memo = scoring.ScoringMemo(2)
+    keys = [memo.key("k", idx) for idx in range(3)]
+    memo.put(keys[0], "a")
+    memo.put(keys[1], "b")
+    assert memo.get("k", keys[0]) == "a"  # keys[0] becomes most recent
+    memo.put(keys[2], "c")
+    assert memo.get("k", keys[1]) is None
+    assert memo.get("k", keys[0]) == "a" and memo.get("k", keys[2]) == "c"
+    assert memo.stats()["size"] == 2
+
+
+if __name__ == "__main__":
+    run_checks(globals(), "scoring memo checks")
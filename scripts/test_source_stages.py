@@ -0,0 +1,107 @@
+"""Regression checks for the concurrent source-stage scheduler."""
+
+from __future__ import annotations
+
+import sys
+import threading
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from scripts.job_digest import runner, sources  # noqa: E402
+from scripts.job_digest.models import JobRecord  # noqa: E402
+from scripts.job_digest.sessions import DeadlineSession, StageDeadlineExceeded  # noqa: E402
+from scripts.regression_support import patched, raises, run_checks  # noqa: E402
+
+
+def _rec(role: str) -> JobRecord:
+    return JobRecord(
+        role=role, company="C", location="L", link=f"https://example.com/{role}", posted="", source="S",
+        fit_score=70, preference_match="", why_fit="", cv_gap="", notes="",
+    )
+
+
+def _stage(name: str, delay: float):
+    def collect(session):
+        assert isinstance(session, DeadlineSession)
+        time.sleep(delay)
+        return [_rec(f"{name}-1"), _rec(f"{name}-2")]
+
+    return name, collect
+
+
+def test_merge_order_follows_stage_order_not_completion_order() -> None:
+    runner.reset_source_diagnostics()
+    stages = [_stage("slow", 0.3), _stage("medium", 0.15), _stage("fast", 0.0)]
+    records = runner.run_source_stages(stages, max_workers=3)
+    assert [r.role for r in records] == ["slow-1", "slow-2", "medium-1", "medium-2", "fast-1", "fast-2"]
+    assert runner.SOURCE_DIAGNOSTICS["slow"]["kept"] == 2
+
+
+@patched(runner, SOURCE_STAGE_TIMEOUT_SECONDS=1)
+def test_failures_and_timeouts_are_isolated() -> None:
+    runner.reset_source_diagnostics()
+
+    def broken(_session):
+        raise ValueError("bad payload")
+
+    def hung(_session):
+        time.sleep(3)
+        return [_rec("late")]
+
+    records = runner.run_source_stages(
+        [("broken", broken), ("hung", hung), _stage("ok", 0.0)], max_workers=3
+    )
+    assert [r.role for r in records] == ["ok-1", "ok-2"]
+    assert runner.SOURCE_DIAGNOSTICS["broken"]["failed"] == 1
+    assert runner.SOURCE_DIAGNOSTICS["hung"]["timed_out"] == 1
+
+
+@patched(runner, SOURCE_STAGE_TIMEOUT_SECONDS=1)
+def test_abandoned_stage_cannot_write_diagnostics_after_its_deadline() -> None:
+    runner.reset_source_diagnostics()
+    sources.reset_source_runtime_events()
+    release = threading.Event()
+    finished = threading.Event()
+
+    def hung(_session):
+        diag = runner.init_source_diagnostic("Hung", 5)
+        sources.mark_source_runtime_event("Hung", note="before deadline")
+        release.wait(5)
+        diag["raw"] = 99
+        runner.add_source_note(diag, "late")
+        runner.init_source_diagnostic("Late", 3)
+        sources.mark_source_runtime_event("Hung", failed=1, note="after deadline")
+        finished.set()
+        return []
+
+    def ok(_session):
+        runner.add_source_note(runner.init_source_diagnostic("Ok", 2), "done")
+        return [_rec("ok-1")]
+
+    records = runner.run_source_stages([("job_board:Hung", hung), ("job_board:Ok", ok)], max_workers=2)
+    release.set()
+    assert finished.wait(5)
+
+    assert [r.role for r in records] == ["ok-1"]
+    assert runner.SOURCE_DIAGNOSTICS["Ok"]["notes"] == ["done"]
+    assert runner.SOURCE_DIAGNOSTICS["Hung"]["timed_out"] == 1
+    assert runner.SOURCE_DIAGNOSTICS["Hung"]["raw"] == 0
+    assert runner.SOURCE_DIAGNOSTICS["Hung"]["notes"] == ["job_board:Hung exceeded source stage timeout"]
+    assert "Late" not in runner.SOURCE_DIAGNOSTICS
+    events = sources.get_source_runtime_events()["Hung"]
+    assert events["failed"] == 0
+    assert events["notes"] == ["before deadline"]
+
+
+def test_deadline_session_refuses_requests_after_deadline() -> None:
+    session = DeadlineSession(deadline=time.monotonic() - 1)
+    with raises(StageDeadlineExceeded):
+        session.get("https://example.com", timeout=5)
+
+
+if __name__ == "__main__":
+    run_checks(globals(), "source stage checks")
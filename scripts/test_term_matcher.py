@@ -0,0 +1,45 @@
+"""Regression checks for the one-pass keyword matcher behind assess_fit."""
+
+from __future__ import annotations
+
+import random
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from scripts.job_digest.matcher import TermMatcher  # noqa: E402
+from scripts.job_digest.scoring import FIT_MATCHER  # noqa: E402
+from scripts.regression_support import run_checks  # noqa: E402
+
+
+def _brute(matcher: TermMatcher, text: str) -> frozenset[str]:
+    return frozenset(term for term in matcher.terms if term in text)
+
+
+def test_overlapping_nested_and_unicode_terms() -> None:
+    matcher = TermMatcher(["aml", "hamlet", "money laundering", "anti-money laundering", "kyc", "kyc/kyb", "café"])
+    text = "hamlet runs anti-money laundering and kyc/kyb at the café"
+    assert matcher.scan(text) == _brute(matcher, text)
+    assert matcher.scan("") == frozenset()
+
+
+def test_catalogue_scan_matches_substring_checks() -> None:
+    rng = random.Random(11)
+    vocab = sorted(FIT_MATCHER.terms) + ["x", "-", "/", "é", " ", "risk", "product"]
+    for _ in range(300):
+        text = "".join(rng.choice(vocab) + rng.choice(["", " ", "/"]) for _ in range(rng.randint(0, 40)))
+        assert FIT_MATCHER.scan(text) == _brute(FIT_MATCHER, text)
+
+
+def test_scan_joined_finds_terms_spanning_the_join() -> None:
+    head, tail = "senior product", "manager for kyc"
+    joined = FIT_MATCHER.scan_joined(head, FIT_MATCHER.scan(head), tail, FIT_MATCHER.scan(tail))
+    assert joined == _brute(FIT_MATCHER, f"{head} {tail}")
+    assert "product manager" in joined
+
+
+if __name__ == "__main__":
+    run_checks(globals(), "term matcher checks")
@@ -0,0 +1,121 @@
+"""Regression checks for the coalesced, paginated Workday CXS engine."""
+
+from __future__ import annotations
+
+import sys
+import threading
+from contextlib import contextmanager
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from scripts.job_digest import config, sources, workday  # noqa: E402
+from scripts.regression_support import patched, run_checks  # noqa: E402
+
+TERMS = [
+    "sanctions screening product manager",
+    "payment screening product manager",
+    "kyc product owner",
+    "product compliance lead",
+]
+
+
+def _posting(slug: str, posted_on: str = "Posted Today", title: str = "Sanctions Screening Product Manager") -> dict:
+    return {
+        "title": title,
+        "externalPath": f"/job/London/{slug}",
+        "locationsText": "London",
+        "postedOn": posted_on,
+    }
+
+
+class FakeResponse:
+    def __init__(self, status_code: int, payload: dict | None = None) -> None:
+        self.status_code = status_code
+        self.payload = payload or {}
+
+    def json(self) -> dict:
+        return self.payload
+
+
+class FakeSession:
+    """Serves CXS pages per (tenant, searchText, offset) and records each POST."""
+
+    def __init__(self, pages: dict) -> None:
+        self.pages = pages
+        self.calls: list = []
+        self.lock = threading.Lock()
+
+    def post(self, url, json=None, timeout=None, **kwargs):  # noqa: ANN001
+        tenant = url.split("/")[2].split(".")[0]
+        with self.lock:
+            self.calls.append((tenant, json["searchText"], json["offset"]))
+        if tenant == "broken":
+            return FakeResponse(500)
+        postings = self.pages.get((tenant, json["searchText"], json["offset"]), [])
+        total = sum(len(page) for key, page in self.pages.items() if key[:2] == (tenant, json["searchText"]))
+        return FakeResponse(200, {"total": total if json["offset"] == 0 else 0, "jobPostings": postings})
+
+
+@contextmanager
+def _tenants():
+    sites = [
+        "Alpha Bank|https://alpha.wd3.myworkdayjobs.com/en-GB/Alpha_Careers",
+        "https://broken.wd3.myworkdayjobs.com/External",
+    ]
+    with patched(workday, WORKDAY_SITES=sites, financial_services_board_search_terms=lambda: list(TERMS)), patched(
+        config, WORKDAY_PAGE_SIZE=2, WORKDAY_PAGES_PER_TERM=2
+    ):
+        sources.reset_source_runtime_events()
+        yield
+
+
+def test_terms_sharing_a_role_suffix_search_the_suffix_and_filter_locally() -> None:
+    assert workday.coalesce_workday_terms(TERMS) == [
+        ("product manager", ("sanctions", "screening", "payment"), 2),
+        ("kyc product owner", (), 1),
+        ("product compliance lead", (), 1),
+    ]
+    assert workday.coalesce_workday_terms(TERMS[:1]) == [(TERMS[0], (), 1)]
+    # the bare suffix is itself a term, so nothing narrower may filter it
+    assert workday.coalesce_workday_terms(TERMS[:2] + ["product manager"]) == [("product manager", (), 3)]
+
+
+@_tenants()
+def test_pages_until_out_of_window_and_dedupes_by_external_path() -> None:
+    no_path = {"title": "Payments Product Manager", "locationsText": "Leeds", "postedOn": "Posted Today"}
+    session = FakeSession(
+        {
+            ("alpha", "product manager", 0): [_posting("a1"), _posting("a2", "Posted 3 Days Ago")],
+            ("alpha", "product manager", 2): [
+                _posting("a3", "Posted 30+ Days Ago", title="Growth Product Manager"),  # no anchor word
+                _posting("a4", "Posted 30+ Days Ago"),
+            ],
+            ("alpha", "product manager", 4): [_posting("a5")],  # never reached: page 2 was all out of window
+            ("alpha", "kyc product owner", 0): [_posting("a2"), _posting("a6", title="KYC Product Owner")],
+            ("alpha", "kyc product owner", 2): [no_path, dict(no_path, locationsText="London")],
+        }
+    )
+    jobs = workday.workday_search(session)
+
+    assert [job["link"] for job in jobs] == [
+        f"https://alpha.wd3.myworkdayjobs.com/job/London/{slug}" for slug in ("a1", "a2", "a4", "a6")
+    ] + ["", ""]
+    assert [job["location"] for job in jobs[-2:]] == ["Leeds", "London"]  # same title, no path: both kept
+    assert jobs[0]["company"] == "Alpha Bank"
+    assert jobs[0]["posted_date"] == "Posted Today"
+    assert ("alpha", "product manager", 4) not in session.calls
+    assert ("alpha", "product compliance lead", 2) not in session.calls  # empty first page ends the query
+
+    events = sources.get_source_runtime_events()["Workday"]
+    # alpha: 2 + 2 + 1 requests, broken: one failed request per query
+    assert events["query_count"] == 8
+    assert events["failed"] == 3
+    assert "Broken: 3/3 queries failed (returned 500)" in events["notes"]
+    assert events["notes"][-1] == "coalesced 4 terms into 3 queries: 8 requests for 2 tenants vs 8 per-term (0 fewer)"
+
+
+if __name__ == "__main__":
+    run_checks(globals(), "Workday search checks")